@@ -0,0 +1,85 @@
+"""
+Modül 6: Alembic Ortamı - Göçler hangi veritabanında, hangi modellere göre çalışır?
+
+- Adres `DATABASE_URL_SYNC` ortam değişkeninden (yoksa `alembic.ini`'deki
+  `sqlalchemy.url`'den) okunur. Alembic senkron çalışır; üretimde `postgresql://...`
+  (psycopg2), yerelde `sqlite:///./kitaplik_backend.db`.
+- `target_metadata = Base.metadata`: `alembic revision --autogenerate` modelleri
+  veritabanıyla bu metadata üzerinden karşılaştırır.
+- Her göç dosyası kendi işleminde çalışır (`transaction_per_migration`): çevrimiçi
+  göç işlemleri (`op.toplu_doldur`, `op.cevrimici_sutun_ekle`, `op.cevrimici_indeks_olustur`,
+  bkz. `backend/core/cevrimici_goc.py`) o ana kadarki işlemi commit edip kısa işlemlerle sürer.
+- SQLite `ALTER TABLE`'ın çoğunu desteklemez; autogenerate orada "batch" kipinde
+  (tabloyu yeniden kurarak) göç yazar.
+"""
+
+import os
+from logging.config import fileConfig
+
+from alembic import context
+from dotenv import load_dotenv
+from sqlalchemy import engine_from_config, event, pool
+
+from backend.core import cevrimici_goc  # içe aktarılınca op.* çevrimiçi işlemlerini kaydeder
+from backend.models import Base
+
+load_dotenv()
+
+config = context.config
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name, disable_existing_loggers=False)
+
+target_metadata = Base.metadata
+
+# Göç araçlarının kendi tabloları; modellerde olmadıkları için autogenerate onları silmeye kalkmasın.
+_YARDIMCI_ONEKLER = (cevrimici_goc.GOC_ILERLEME_TABLOSU, cevrimici_goc.GOLGE_ONEKI, cevrimici_goc.ESKI_ONEKI)
+
+
+def veritabani_adresi():
+    return os.getenv("DATABASE_URL_SYNC") or config.get_main_option("sqlalchemy.url")
+
+
+def nesneyi_dahil_et(nesne, ad, tur, yansitildi, karsilik):
+    return not (tur == "table" and yansitildi and ad.startswith(_YARDIMCI_ONEKLER))
+
+
+def _baglam_ayarlari(url):
+    return {
+        "target_metadata": target_metadata,
+        "include_object": nesneyi_dahil_et,
+        "render_as_batch": url.startswith("sqlite"),
+        "transaction_per_migration": True,
+        "compare_type": True,
+    }
+
+
+def run_migrations_offline() -> None:
+    """SQL'i veritabanına bağlanmadan üretir (`alembic upgrade head --sql`)."""
+    url = veritabani_adresi()
+    context.configure(url=url, literal_binds=True, dialect_opts={"paramstyle": "named"}, **_baglam_ayarlari(url))
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    url = veritabani_adresi()
+    motor = engine_from_config(
+        config.get_section(config.config_ini_section, {}), prefix="sqlalchemy.", url=url, poolclass=pool.NullPool
+    )
+    if motor.dialect.name == "sqlite":
+        @event.listens_for(motor, "connect")
+        def _sqlite_pragmalari(dbapi_conn, _kayit):
+            # Uygulamanın kısa yazmaları sürerken göçün parçaları hata vermek yerine sırasını bekler.
+            dbapi_conn.execute("PRAGMA busy_timeout = 5000")
+            dbapi_conn.execute("PRAGMA foreign_keys = ON")
+
+    with motor.connect() as baglanti:
+        context.configure(connection=baglanti, **_baglam_ayarlari(url))
+        with context.begin_transaction():
+            context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
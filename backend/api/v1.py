@@ -0,0 +1,416 @@
+"""
+Modül 3, 5, 11: API v1 - Kitap, Yazar ve Okuma Kaydı Uç Noktaları
+
+N+1 problemi: 50 kitabı listeleyip her birinin yazarına `kitap.yazar` ile
+erişmek, 1 liste sorgusu + 50 yazar sorgusu = 51 sorgu demektir. Bu yüzden
+modellerdeki tüm ilişkiler `lazy="raise"` ile tanımlıdır ve her uç nokta
+ihtiyaç duyduğu ilişkileri AÇIKÇA yükler:
+
+- Çoka-bir (kitap -> yazar): `joinedload`, tek sorguda JOIN ile gelir.
+- Bire-çok (yazar -> kitaplar): `selectinload`, ikinci bir `WHERE yazar_id IN (...)` sorgusuyla gelir.
+
+Her uç noktanın en fazla kaç SQL ifadesi çalıştırabileceği `tests/test_api.py`
+içinde `sorgu_sayaci` fikstürüyle test edilir.
+
+Kitap detayı ve yazarın kitapları okuma yolları `backend/core/cache.py`
+önbelleğinden okunur; yazma uç noktaları ilgili anahtarları geçersiz kılar.
+
+`.../akis` uç noktaları tüm listeyi tek bir JSON dizisi yerine NDJSON (her satırda
+bir JSON nesnesi) olarak akıtır. Sonuç `AKIS_SAYFASI` satırlık keyset sorgularıyla
+okunur ve her sorgu `AsyncSession.stream()` ile parça parça gönderilir: istek
+başına bellek sabittir, ilk bayt sonucun boyutundan bağımsız olarak hemen gelir.
+Bağlantı koparsa istemci son aldığı satırın `id`'siyle (`son_id`) kaldığı yerden devam eder.
+
+Liste ve akış uç noktaları `get_okuma_session` ile okuma kopyalarından okunur.
+Önbellekli okuma yolları birincilde kalır: gecikmeli bir kopyadan okunan veri,
+bir yazmanın az önce geçersiz kıldığı anahtarı eski değerle yeniden doldururdu.
+
+`PUT /kitaplar/{id}/video` istek gövdesini (ham video baytları) belleğe ya da
+diske toplamadan `backend/core/storage.py` hattıyla parça parça depolamaya akıtır.
+Baytlar yoldayken hiçbir veritabanı oturumu açık değildir.
+
+`/istatistikler/...` uç noktaları okuma kayıtlarını saymaz; `backend/core/ozetler.py`
+içindeki özet (sayaç) tablolarından okur. Özetler her eklemede güncellenir ve arka
+planda periyodik olarak uzlaştırılır; tazelikleri `/istatistikler/durum`'dadır.
+"""
+
+import json
+import uuid
+from datetime import date
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import and_, delete, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload
+
+from backend.core.cache import KitapOnbellegi, onbellek_olustur
+from backend.core.database import get_okuma_session, get_oturum_fabrikasi, get_session
+from backend.core.ozetler import (
+    OzetUzlastirici,
+    en_cok_okunan_kitaplar,
+    en_cok_okunan_yazarlar,
+    get_ozet_uzlastirici,
+    gunluk_okumalar,
+)
+from backend.core.storage import AkisOkuyucu, YuklemeHatasi, get_depolama, parcali_yukle
+from backend.models import KitapDB, KullaniciDB, OkumaKaydiDB, YazarDB
+from backend.schemas.kitap_schema import (
+    KitapCreate,
+    KitapOut,
+    KitapOzet,
+    KitapUpdate,
+    VideoOut,
+    YazarCreate,
+    YazarOut,
+)
+from backend.schemas.okuma_kaydi_schema import (
+    GunlukOkumaOut,
+    KitapOkumaSayisiOut,
+    OkumaGecmisiOut,
+    OkumaKaydiCreate,
+    OkumaKaydiOut,
+    OzetDurumuOut,
+    YazarOkumaSayisiOut,
+)
+
+router = APIRouter(prefix="/api/v1", tags=["v1"])
+
+# --- Uç Nokta Başına Yükleme Stratejileri ---
+KITAP_YUKLEME = (joinedload(KitapDB.yazar),)
+YAZAR_YUKLEME = (selectinload(YazarDB.kitaplar),)
+OKUMA_GECMISI_YUKLEME = (joinedload(OkumaKaydiDB.kitap).joinedload(KitapDB.yazar),)
+
+# --- Akış (NDJSON) Ayarları ---
+NDJSON = "application/x-ndjson"
+AKIS_SAYFASI = 5_000  # Tek keyset sorgusunun en fazla satırı
+AKIS_PARCASI = 500  # Ağa tek seferde yazılan satır sayısı
+
+_kitap_onbellegi = KitapOnbellegi(onbellek_olustur())
+
+
+def get_kitap_onbellegi() -> KitapOnbellegi:
+    """Önbellek bağımlılığı; testlerde `dependency_overrides` ile değiştirilebilir."""
+    return _kitap_onbellegi
+
+
+async def _yazar_bul(session: AsyncSession, yazar_id: int) -> YazarDB:
+    yazar = await session.get(YazarDB, yazar_id)
+    if yazar is None:
+        raise HTTPException(status.HTTP_404_NOT_FOUND, "Yazar bulunamadı")
+    return yazar
+
+
+_json = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+
+def _ndjson(nesneler):
+    return ("\n".join(map(_json, nesneler)) + "\n").encode()
+
+
+async def _keyset_akisi(session: AsyncSession, sorgu_kur, satir_sozlugu, imlec):
+    """`sorgu_kur(imlec)` ile keyset sayfalarını sırayla okuyup NDJSON parçaları üretir.
+
+    Her sayfa kısa bir salt okunur işlemdir; sayfalar arasında bağlantı havuza döner,
+    böylece uzun bir akış bir bağlantıyı ve veritabanı anlık görüntüsünü (snapshot) tutmaz.
+    """
+    while True:
+        sonuc = await session.stream(sorgu_kur(imlec).execution_options(yield_per=AKIS_PARCASI))
+        okunan = 0
+        async for satirlar in sonuc.partitions():
+            yield _ndjson(map(satir_sozlugu, satirlar))
+            okunan += len(satirlar)
+            imlec = satirlar[-1]
+        await session.rollback()
+        if okunan < AKIS_SAYFASI:
+            return
+
+
+# --- Kitaplar ---
+
+@router.get("/kitaplar/akis", response_class=StreamingResponse)
+async def kitaplari_akit(
+    son_id: int = Query(0, ge=0, description="Bu id'den sonraki kitaplar (kopan akışı sürdürmek için)"),
+    session: AsyncSession = Depends(get_okuma_session),
+):
+    """Tüm kitapları (yazarıyla) `KitapOut` biçiminde, satır başına bir nesne olarak akıtır."""
+
+    def sorgu_kur(son):
+        return (
+            select(KitapDB.id, KitapDB.baslik, YazarDB.id, YazarDB.ad, KitapDB.video_url)
+            .join(KitapDB.yazar)
+            .where(KitapDB.id > son[0])
+            .order_by(KitapDB.id)
+            .limit(AKIS_SAYFASI)
+        )
+
+    def satir_sozlugu(s):
+        return {"id": s[0], "baslik": s[1], "yazar": {"id": s[2], "ad": s[3]}, "video_url": s[4]}
+
+    return StreamingResponse(_keyset_akisi(session, sorgu_kur, satir_sozlugu, (son_id,)), media_type=NDJSON)
+
+
+@router.get("/kitaplar", response_model=list[KitapOut])
+async def kitaplari_listele(
+    son_id: int = Query(0, ge=0, description="Bir önceki sayfanın son kitap id'si (keyset sayfalama)"),
+    limit: int = Query(50, ge=1, le=500),
+    session: AsyncSession = Depends(get_okuma_session),
+):
+    stmt = (
+        select(KitapDB)
+        .options(*KITAP_YUKLEME)
+        .where(KitapDB.id > son_id)
+        .order_by(KitapDB.id)
+        .limit(limit)
+    )
+    return (await session.scalars(stmt)).all()
+
+
+@router.get("/kitaplar/{kitap_id}", response_model=KitapOut)
+async def kitap_getir(
+    kitap_id: int,
+    session: AsyncSession = Depends(get_session),
+    onbellek: KitapOnbellegi = Depends(get_kitap_onbellegi),
+):
+    async def yukle():
+        kitap = await session.scalar(select(KitapDB).options(*KITAP_YUKLEME).where(KitapDB.id == kitap_id))
+        return KitapOut.model_validate(kitap).model_dump(mode="json") if kitap else None
+
+    veri = await onbellek.kitap(kitap_id, yukle)
+    if veri is None:
+        raise HTTPException(status.HTTP_404_NOT_FOUND, "Kitap bulunamadı")
+    return veri
+
+
+@router.post("/kitaplar", response_model=KitapOut, status_code=status.HTTP_201_CREATED)
+async def kitap_ekle(
+    veri: KitapCreate,
+    session: AsyncSession = Depends(get_session),
+    onbellek: KitapOnbellegi = Depends(get_kitap_onbellegi),
+):
+    yazar = await _yazar_bul(session, veri.yazar_id)
+    kitap = KitapDB(baslik=veri.baslik, yazar=yazar)
+    session.add(kitap)
+    await session.commit()
+    # Eklemeden önce bu id için önbelleğe alınmış "bulunamadı" sonucu da silinir.
+    await onbellek.kitap_degisti(kitap.id, yazar.id)
+    return kitap
+
+
+@router.put("/kitaplar/{kitap_id}", response_model=KitapOut)
+async def kitap_guncelle(
+    kitap_id: int,
+    veri: KitapUpdate,
+    session: AsyncSession = Depends(get_session),
+    onbellek: KitapOnbellegi = Depends(get_kitap_onbellegi),
+):
+    kitap = await session.scalar(select(KitapDB).options(*KITAP_YUKLEME).where(KitapDB.id == kitap_id))
+    if kitap is None:
+        raise HTTPException(status.HTTP_404_NOT_FOUND, "Kitap bulunamadı")
+    eski_yazar_id = kitap.yazar_id
+    if veri.baslik is not None:
+        kitap.baslik = veri.baslik
+    if veri.yazar_id is not None and veri.yazar_id != eski_yazar_id:
+        kitap.yazar = await _yazar_bul(session, veri.yazar_id)
+    await session.commit()
+    await onbellek.kitap_degisti(kitap_id, eski_yazar_id, kitap.yazar_id)
+    return kitap
+
+
+@router.delete("/kitaplar/{kitap_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def kitap_sil(
+    kitap_id: int,
+    session: AsyncSession = Depends(get_session),
+    onbellek: KitapOnbellegi = Depends(get_kitap_onbellegi),
+):
+    # Önce SELECT sonra DELETE yerine tek ifade: silinen satırın yazar_id'si RETURNING ile döner.
+    yazar_id = await session.scalar(delete(KitapDB).where(KitapDB.id == kitap_id).returning(KitapDB.yazar_id))
+    if yazar_id is None:
+        raise HTTPException(status.HTTP_404_NOT_FOUND, "Kitap bulunamadı")
+    await session.commit()
+    await onbellek.kitap_degisti(kitap_id, yazar_id)
+
+
+@router.put("/kitaplar/{kitap_id}/video", response_model=VideoOut)
+async def kitap_videosu_yukle(
+    kitap_id: int,
+    request: Request,
+    boyut: int = Header(alias="Content-Length", gt=0),
+    yukleme_id: Optional[str] = Header(None, alias="X-Yukleme-Id", description="Yarıda kalan yüklemeyi sürdürmek için"),
+    oturum_ac=Depends(get_oturum_fabrikasi),
+    depolama=Depends(get_depolama),
+    onbellek: KitapOnbellegi = Depends(get_kitap_onbellegi),
+):
+    """Gövdedeki videoyu depolamaya yükler ve kitabın `video_url`'sini günceller.
+
+    Yükleme yarıda kalırsa yanıt 502'dir ve `X-Yukleme-Id` başlığı döner; aynı
+    dosya bu başlıkla yeniden gönderildiğinde depolamada doğrulanmış parçalar atlanır.
+    """
+    async with oturum_ac() as session:
+        if await session.get(KitapDB, kitap_id) is None:
+            raise HTTPException(status.HTTP_404_NOT_FOUND, "Kitap bulunamadı")
+    # Buradan sonra oturum kapalı: yükleme dakikalar sürse de havuzdan bağlantı tutulmaz
+
+    try:
+        sonuc = await parcali_yukle(
+            depolama, AkisOkuyucu(request.stream()), f"kitaplar/{kitap_id}/{uuid.uuid4().hex}.mp4", boyut,
+            yukleme_id=yukleme_id,
+        )
+    except YuklemeHatasi as hata:
+        basliklar = {"X-Yukleme-Id": hata.yukleme_id} if hata.yukleme_id else None
+        raise HTTPException(status.HTTP_502_BAD_GATEWAY, f"Video yüklenemedi: {hata}", headers=basliklar) from None
+
+    async with oturum_ac() as session:
+        eski_url = await session.scalar(select(KitapDB.video_url).where(KitapDB.id == kitap_id).with_for_update())
+        guncellenen = await session.scalar(
+            update(KitapDB).where(KitapDB.id == kitap_id).values(video_url=sonuc.url).returning(KitapDB.yazar_id)
+        )
+        if guncellenen is None:  # Kitap yükleme sürerken silindi
+            await depolama.sil(sonuc.url)  # Sahipsiz video kalmasın
+            raise HTTPException(status.HTTP_404_NOT_FOUND, "Kitap bulunamadı")
+        await session.commit()
+    # Önceki video yalnızca yenisi commit edildikten sonra silinir; commit başarısız olursa eskisi yerinde kalır
+    if eski_url and eski_url != sonuc.url:
+        await depolama.sil(eski_url)
+    await onbellek.kitap_degisti(kitap_id, guncellenen)
+    return VideoOut(kitap_id=kitap_id, video_url=sonuc.url, **{
+        ad: getattr(sonuc, ad) for ad in ("boyut", "sha256", "parca_sayisi", "gonderilen_parca")
+    })
+
+
+# --- Yazarlar ---
+
+@router.get("/yazarlar", response_model=list[YazarOut])
+async def yazarlari_listele(
+    son_id: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=500),
+    session: AsyncSession = Depends(get_okuma_session),
+):
+    stmt = (
+        select(YazarDB)
+        .options(*YAZAR_YUKLEME)
+        .where(YazarDB.id > son_id)
+        .order_by(YazarDB.id)
+        .limit(limit)
+    )
+    return (await session.scalars(stmt)).all()
+
+
+@router.post("/yazarlar", response_model=YazarOut, status_code=status.HTTP_201_CREATED)
+async def yazar_ekle(veri: YazarCreate, session: AsyncSession = Depends(get_session)):
+    # Yeni yazarın kitabı yoktur; boş koleksiyonu yüklü say ki yanıt şeması sorgu tetiklemesin.
+    yazar = YazarDB(ad=veri.ad, kitaplar=[])
+    session.add(yazar)
+    await session.commit()
+    return yazar
+
+
+@router.get("/yazarlar/{yazar_id}/kitaplar", response_model=list[KitapOzet])
+async def yazarin_kitaplari(
+    yazar_id: int,
+    session: AsyncSession = Depends(get_session),
+    onbellek: KitapOnbellegi = Depends(get_kitap_onbellegi),
+):
+    async def yukle():
+        satirlar = await session.execute(
+            select(KitapDB.id, KitapDB.baslik).where(KitapDB.yazar_id == yazar_id).order_by(KitapDB.id)
+        )
+        return [{"id": s.id, "baslik": s.baslik} for s in satirlar]
+
+    return await onbellek.yazar_kitaplari(yazar_id, yukle)
+
+
+# --- Okuma Kayıtları ---
+
+@router.post("/okuma-kayitlari", response_model=OkumaKaydiOut, status_code=status.HTTP_201_CREATED)
+async def okuma_kaydi_ekle(veri: OkumaKaydiCreate, session: AsyncSession = Depends(get_session)):
+    if await session.get(KullaniciDB, veri.kullanici_id) is None:
+        raise HTTPException(status.HTTP_404_NOT_FOUND, "Kullanıcı bulunamadı")
+    if await session.get(KitapDB, veri.kitap_id) is None:
+        raise HTTPException(status.HTTP_404_NOT_FOUND, "Kitap bulunamadı")
+    kayit = OkumaKaydiDB(kullanici_id=veri.kullanici_id, kitap_id=veri.kitap_id)
+    session.add(kayit)
+    await session.commit()
+    return kayit
+
+
+@router.get("/kullanicilar/{kullanici_id}/okuma-gecmisi", response_model=list[OkumaGecmisiOut])
+async def okuma_gecmisi(
+    kullanici_id: int,
+    limit: int = Query(50, ge=1, le=500),
+    session: AsyncSession = Depends(get_okuma_session),
+):
+    stmt = (
+        select(OkumaKaydiDB)
+        .options(*OKUMA_GECMISI_YUKLEME)
+        .where(OkumaKaydiDB.kullanici_id == kullanici_id)
+        .order_by(OkumaKaydiDB.okuma_tarihi.desc(), OkumaKaydiDB.id.desc())
+        .limit(limit)
+    )
+    return (await session.scalars(stmt)).all()
+
+
+@router.get("/kullanicilar/{kullanici_id}/okuma-gecmisi/akis", response_class=StreamingResponse)
+async def okuma_gecmisini_akit(kullanici_id: int, session: AsyncSession = Depends(get_okuma_session)):
+    """Kullanıcının tüm okuma geçmişini (en yeniden eskiye) `OkumaGecmisiOut` biçiminde akıtır."""
+
+    def sorgu_kur(son):
+        stmt = (
+            select(
+                OkumaKaydiDB.okuma_tarihi, OkumaKaydiDB.id, OkumaKaydiDB.kullanici_id, OkumaKaydiDB.kitap_id,
+                KitapDB.baslik, YazarDB.id, YazarDB.ad, KitapDB.video_url,
+            )
+            .join(OkumaKaydiDB.kitap)
+            .join(KitapDB.yazar)
+            .where(OkumaKaydiDB.kullanici_id == kullanici_id)
+            .order_by(OkumaKaydiDB.okuma_tarihi.desc(), OkumaKaydiDB.id.desc())
+            .limit(AKIS_SAYFASI)
+        )
+        if son is not None:
+            # (okuma_tarihi, id) < (son_tarih, son_id); `ix_okuma_kayitlari_kullanici_tarih` ile sıralı okunur
+            stmt = stmt.where(or_(
+                OkumaKaydiDB.okuma_tarihi < son[0],
+                and_(OkumaKaydiDB.okuma_tarihi == son[0], OkumaKaydiDB.id < son[1]),
+            ))
+        return stmt
+
+    def satir_sozlugu(s):
+        return {
+            "id": s[1], "kullanici_id": s[2], "kitap_id": s[3], "okuma_tarihi": s[0].isoformat(),
+            "kitap": {"id": s[3], "baslik": s[4], "yazar": {"id": s[5], "ad": s[6]}, "video_url": s[7]},
+        }
+
+    return StreamingResponse(_keyset_akisi(session, sorgu_kur, satir_sozlugu, None), media_type=NDJSON)
+
+
+# --- Okuma İstatistikleri (özet tablolarından) ---
+
+@router.get("/istatistikler/kitaplar", response_model=list[KitapOkumaSayisiOut])
+async def en_cok_okunan_kitaplari_getir(
+    limit: int = Query(10, ge=1, le=100),
+    session: AsyncSession = Depends(get_okuma_session),
+):
+    return await en_cok_okunan_kitaplar(session, limit)
+
+
+@router.get("/istatistikler/yazarlar", response_model=list[YazarOkumaSayisiOut])
+async def en_cok_okunan_yazarlari_getir(
+    limit: int = Query(10, ge=1, le=100),
+    session: AsyncSession = Depends(get_okuma_session),
+):
+    return await en_cok_okunan_yazarlar(session, limit)
+
+
+@router.get("/istatistikler/gunluk", response_model=list[GunlukOkumaOut])
+async def gunluk_okumalari_getir(
+    baslangic: Optional[date] = Query(None, description="Bu günden itibaren (UTC, dahil)"),
+    bitis: Optional[date] = Query(None, description="Bu güne kadar (UTC, dahil)"),
+    session: AsyncSession = Depends(get_okuma_session),
+):
+    return await gunluk_okumalar(session, baslangic, bitis)
+
+
+@router.get("/istatistikler/durum", response_model=OzetDurumuOut)
+async def ozet_durumu(uzlastirici: OzetUzlastirici = Depends(get_ozet_uzlastirici)):
+    return uzlastirici.durum()
@@ -0,0 +1,360 @@
+"""
+Modül 13: Analitik İçin Sütunlu (Columnar) Dışa Aktarma ve Toplama
+
+`tum_kitaplari_goster` gibi yollar tüm sonucu belleğe alır ve her satırı ayrı
+bir Python nesnesi olarak gezer. Okuma geçmişi milyonlarca satıra ulaştığında
+bu hem belleği hem zamanı tüketir. Bu modül aynı veriyi PARTİLER halinde akıtır:
+
+- `sutun_partileri()`: İfadeyi `AsyncConnection.stream()` + `yield_per` ile
+  çalıştırır (PostgreSQL'de sunucu taraflı cursor); her partiyi satırlar yerine
+  SÜTUNLAR olarak (`{"kitap_id": [...], ...}` veya bir `pyarrow.RecordBatch`) verir.
+  Bellekte aynı anda en fazla bir parti bulunur.
+- `disa_aktar()`: Partileri Arrow IPC (`.arrow`), Parquet (`.parquet`) veya
+  CSV (`.csv`) dosyasına yazar. Arrow ve Parquet için `pyarrow` gerekir;
+  CSV standart kütüphaneyle yazılır.
+- `OkumaIstatistikleri`: Okuma kayıtlarını kitap, kullanıcı ve gün başına
+  sayar. Her parti tek çağrıyla toplanır (`pyarrow.compute.value_counts` ya da
+  C ile yazılmış `Counter.update`); satır satır Python döngüsü yoktur.
+
+Günler UTC'ye göre hesaplanır (kayıtlar UTC olarak yazılır).
+Kıyaslama için: `python -m backend.core.analytics`
+"""
+
+import asyncio
+import csv
+import os
+import time
+from collections import Counter
+from datetime import date, datetime
+from typing import AsyncIterator
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from backend.models import KitapDB, OkumaKaydiDB
+
+VARSAYILAN_PARTI = 50_000
+
+# Dışa aktarılan sütunlar: ilişkiler değil, düz yabancı anahtarlar (analitik araçlar birleştirir).
+KITAP_SORGUSU = select(KitapDB.id, KitapDB.baslik, KitapDB.yazar_id).order_by(KitapDB.id)
+OKUMA_SORGUSU = select(
+    OkumaKaydiDB.id, OkumaKaydiDB.kullanici_id, OkumaKaydiDB.kitap_id, OkumaKaydiDB.okuma_tarihi
+).order_by(OkumaKaydiDB.id)
+
+BICIMLER = {".arrow": "arrow", ".ipc": "arrow", ".feather": "arrow", ".parquet": "parquet", ".csv": "csv"}
+
+
+# --- Arrow Şeması ---
+
+def arrow_semasi(stmt):
+    """İfadenin seçtiği sütunların SQLAlchemy tiplerinden bir `pyarrow.Schema` kurar.
+
+    Şema ilk partiden tahmin edilmez; ilk partide tamamen NULL olan bir sütun
+    yüzünden sonraki partilerin şemayla uyuşmaması böylece önlenir.
+    """
+    import pyarrow as pa  # Sadece Arrow/Parquet kullanılacaksa yüklensin
+
+    alanlar = []
+    for sutun in stmt.selected_columns:
+        tip = sutun.type
+        python_tipi = tip.python_type
+        if python_tipi is bool:
+            arrow_tipi = pa.bool_()
+        elif python_tipi is int:
+            arrow_tipi = pa.int64()
+        elif python_tipi is float:
+            arrow_tipi = pa.float64()
+        elif python_tipi is datetime:
+            arrow_tipi = pa.timestamp("us", tz="UTC" if getattr(tip, "timezone", False) else None)
+        elif python_tipi is date:
+            arrow_tipi = pa.date32()
+        else:
+            arrow_tipi = pa.string()
+        alanlar.append(pa.field(sutun.name, arrow_tipi, nullable=getattr(sutun, "nullable", True)))
+    return pa.schema(alanlar)
+
+
+# --- Partiler Halinde Okuma ---
+
+async def sutun_partileri(conn: AsyncConnection, stmt, parti_boyutu=VARSAYILAN_PARTI, arrow=False) -> AsyncIterator:
+    """İfadenin sonucunu `parti_boyutu` satırlık sütun partileri olarak akıtır.
+
+    Args:
+        conn: Açık bir `AsyncConnection`.
+        stmt: Sütunları seçen bir `select` (ORM varlığı değil; bkz. `OKUMA_SORGUSU`).
+        arrow: True ise her parti bir `pyarrow.RecordBatch`, değilse `{sütun: liste}` sözlüğüdür.
+    """
+    adlar = [sutun.name for sutun in stmt.selected_columns]
+    sema = arrow_semasi(stmt) if arrow else None
+    if arrow:
+        import pyarrow as pa
+
+    sonuc = await conn.stream(stmt, execution_options={"yield_per": parti_boyutu})
+    async for satirlar in sonuc.partitions():
+        # zip(*satirlar) satırları C seviyesinde sütunlara çevirir (transpose)
+        sutunlar = dict(zip(adlar, map(list, zip(*satirlar))))
+        if arrow:
+            yield pa.record_batch([sutunlar[ad] for ad in adlar], schema=sema)
+        else:
+            yield sutunlar
+
+
+# --- Dosyaya Yazıcılar ---
+
+class _CSVYazici:
+    def __init__(self, hedef, adlar, _sema):
+        self._dosya = open(hedef, "w", encoding="utf-8", newline="")
+        self._yazici = csv.writer(self._dosya)
+        self._yazici.writerow(adlar)
+        self._adlar = adlar
+
+    def yaz(self, parti):
+        self._yazici.writerows(zip(*(parti[ad] for ad in self._adlar)))
+
+    def kapat(self):
+        self._dosya.close()
+
+
+class _ArrowYazici:
+    def __init__(self, hedef, _adlar, sema):
+        import pyarrow as pa
+
+        self._dosya = pa.OSFile(str(hedef), "wb")
+        self._yazici = pa.ipc.new_file(self._dosya, sema)
+
+    def yaz(self, parti):
+        self._yazici.write_batch(parti)
+
+    def kapat(self):
+        self._yazici.close()
+        self._dosya.close()
+
+
+class _ParquetYazici:
+    def __init__(self, hedef, _adlar, sema):
+        import pyarrow.parquet as pq
+
+        # Her parti bir satır grubu (row group) olur; okuyucular da partiler halinde okuyabilir.
+        self._yazici = pq.ParquetWriter(str(hedef), sema, compression="zstd")
+
+    def yaz(self, parti):
+        self._yazici.write_batch(parti)
+
+    def kapat(self):
+        self._yazici.close()
+
+
+_YAZICILAR = {"csv": _CSVYazici, "arrow": _ArrowYazici, "parquet": _ParquetYazici}
+
+
+async def disa_aktar(conn: AsyncConnection, stmt, hedef, bicim=None, parti_boyutu=VARSAYILAN_PARTI,
+                     toplayici=None):
+    """İfadenin sonucunu sabit bellekle bir Arrow IPC / Parquet / CSV dosyasına yazar.
+
+    Args:
+        hedef: Dosya yolu; `bicim` verilmezse uzantısından çıkarılır.
+        toplayici: Verilirse (ör. `OkumaIstatistikleri`) her parti ona da eklenir;
+            dışa aktarma ve toplama tek geçişte yapılır.
+
+    Dosya yazımı olay döngüsünü bekletmesin diye ayrı bir thread'de yapılır.
+    """
+    bicim = bicim or BICIMLER.get(os.path.splitext(str(hedef))[1].lower())
+    if bicim not in _YAZICILAR:
+        raise ValueError(f"Desteklenmeyen biçim: {bicim!r} (arrow, parquet veya csv)")
+    arrow = bicim != "csv"
+    adlar = [sutun.name for sutun in stmt.selected_columns]
+    yazici = _YAZICILAR[bicim](hedef, adlar, arrow_semasi(stmt) if arrow else None)
+
+    satir = parti_sayisi = 0
+    baslangic = time.perf_counter()
+    try:
+        async for parti in sutun_partileri(conn, stmt, parti_boyutu, arrow=arrow):
+            await asyncio.to_thread(yazici.yaz, parti)
+            if toplayici is not None:
+                toplayici.ekle(parti)
+            satir += parti.num_rows if arrow else len(parti[adlar[0]])
+            parti_sayisi += 1
+    finally:
+        yazici.kapat()
+
+    sure = time.perf_counter() - baslangic
+    return {
+        "hedef": str(hedef),
+        "bicim": bicim,
+        "satir": satir,
+        "parti": parti_sayisi,
+        "sure_sn": sure,
+        "satir_per_sn": satir / sure if sure > 0 else 0.0,
+        "bayt": os.path.getsize(hedef),
+    }
+
+
+# --- Vektörel Toplama ---
+
+class OkumaIstatistikleri:
+    """Okuma kaydı partilerinden kitap, kullanıcı ve gün başına okuma sayılarını biriktirir.
+
+    Partiler `sutun_partileri(..., OKUMA_SORGUSU)` çıktısıdır: sözlük veya `RecordBatch`.
+    """
+
+    def __init__(self):
+        self.kitap_basina = Counter()
+        self.kullanici_basina = Counter()
+        self.gun_basina = Counter()
+        self.toplam = 0
+
+    def ekle(self, parti):
+        if isinstance(parti, dict):
+            # Counter.update(iterable) sayımı C ile yapar; `map(datetime.date, ...)` da öyle.
+            self.kitap_basina.update(parti["kitap_id"])
+            self.kullanici_basina.update(parti["kullanici_id"])
+            self.gun_basina.update(map(datetime.date, parti["okuma_tarihi"]))
+            self.toplam += len(parti["kitap_id"])
+        else:
+            import pyarrow as pa
+            import pyarrow.compute as pc
+
+            self._arrow_say(self.kitap_basina, parti.column("kitap_id"))
+            self._arrow_say(self.kullanici_basina, parti.column("kullanici_id"))
+            self._arrow_say(self.gun_basina, pc.cast(parti.column("okuma_tarihi"), pa.date32()))
+            self.toplam += parti.num_rows
+
+    @staticmethod
+    def _arrow_say(sayac, dizi):
+        import pyarrow.compute as pc
+
+        sayimlar = pc.value_counts(dizi)
+        sayac.update(dict(zip(sayimlar.field("values").to_pylist(), sayimlar.field("counts").to_pylist())))
+
+    def en_cok_okunan_kitaplar(self, n=10):
+        return self.kitap_basina.most_common(n)
+
+    def en_aktif_kullanicilar(self, n=10):
+        return self.kullanici_basina.most_common(n)
+
+    def gunluk(self):
+        """Gün başına okuma sayıları, tarihe göre sıralı."""
+        return sorted(self.gun_basina.items())
+
+    def sozluk(self, ilk=10):
+        return {
+            "toplam": self.toplam,
+            "kitap_sayisi": len(self.kitap_basina),
+            "kullanici_sayisi": len(self.kullanici_basina),
+            "en_cok_okunan_kitaplar": self.en_cok_okunan_kitaplar(ilk),
+            "en_aktif_kullanicilar": self.en_aktif_kullanicilar(ilk),
+            "gunluk": [(gun.isoformat(), sayi) for gun, sayi in self.gunluk()],
+        }
+
+
+async def okuma_istatistikleri(conn: AsyncConnection, stmt=OKUMA_SORGUSU, parti_boyutu=VARSAYILAN_PARTI,
+                               arrow=False):
+    """Okuma kayıtlarını partiler halinde okuyup `OkumaIstatistikleri` döndürür.
+
+    Sadece toplama yapılacaksa sözlük partileri daha hızlıdır (Arrow'a çevirme
+    maliyeti yoktur); Arrow partileri dışa aktarmayla birlikte toplarken işe yarar.
+    """
+    istatistikler = OkumaIstatistikleri()
+    async for parti in sutun_partileri(conn, stmt, parti_boyutu, arrow=arrow):
+        istatistikler.ekle(parti)
+    return istatistikler
+
+
+# --- Kıyaslama ---
+
+async def kiyasla(kayit_sayisi=500_000, kitap_sayisi=5_000, kullanici_sayisi=1_000, gun_sayisi=365,
+                  klasor=None, parti_boyutu=VARSAYILAN_PARTI):
+    """Satır satır ORM toplamasıyla partili toplamayı süre ve tepe bellek açısından karşılaştırır."""
+    import random
+    import tempfile
+    import tracemalloc
+    from datetime import timedelta, timezone
+
+    from backend.core.database import motor_olustur
+    from backend.models import Base
+
+    klasor = klasor or tempfile.mkdtemp()
+    db_dosyasi = os.path.join(klasor, "kitaplik_analitik.db")
+    motor = motor_olustur(f"sqlite+aiosqlite:///{db_dosyasi}")
+    async with motor.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.exec_driver_sql("INSERT INTO yazarlar (id, ad) VALUES (1, 'Yazar')")
+        await conn.exec_driver_sql(
+            "INSERT INTO kitaplar (id, baslik, yazar_id) VALUES (?, ?, 1)",
+            [(i, f"Kitap {i}") for i in range(1, kitap_sayisi + 1)],
+        )
+        await conn.exec_driver_sql(
+            "INSERT INTO kullanicilar (id, email, parola_hash, aktif) VALUES (?, ?, 'x', 1)",
+            [(i, f"k{i}@ornek.com") for i in range(1, kullanici_sayisi + 1)],
+        )
+        baslangic_gunu = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        rastgele = random.Random(42)
+        await conn.exec_driver_sql(
+            "INSERT INTO okuma_kayitlari (kullanici_id, kitap_id, okuma_tarihi) VALUES (?, ?, ?)",
+            [
+                (rastgele.randint(1, kullanici_sayisi), rastgele.randint(1, kitap_sayisi),
+                 (baslangic_gunu + timedelta(seconds=rastgele.randrange(gun_sayisi * 86400))).strftime("%Y-%m-%d %H:%M:%S.%f"))
+                for _ in range(kayit_sayisi)
+            ],
+        )
+
+    async def olc(islev):
+        tracemalloc.start()
+        baslangic = time.perf_counter()
+        sonuc = await islev()
+        sure = time.perf_counter() - baslangic
+        tepe = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return sonuc, sure, tepe / 1024 / 1024
+
+    async def satir_satir():
+        # Eski yol: tüm ORM nesnelerini belleğe al, Python döngüsünde say
+        from sqlalchemy.ext.asyncio import AsyncSession
+
+        kitap, kullanici, gun = {}, {}, {}
+        async with AsyncSession(motor) as session:
+            for kayit in (await session.scalars(select(OkumaKaydiDB))).all():
+                kitap[kayit.kitap_id] = kitap.get(kayit.kitap_id, 0) + 1
+                kullanici[kayit.kullanici_id] = kullanici.get(kayit.kullanici_id, 0) + 1
+                g = kayit.okuma_tarihi.date()
+                gun[g] = gun.get(g, 0) + 1
+        return kitap, kullanici, gun
+
+    async def partili(arrow):
+        async with motor.connect() as conn:
+            return await okuma_istatistikleri(conn, parti_boyutu=parti_boyutu, arrow=arrow)
+
+    sonuclar = {}
+    eski, sonuclar["satir_satir_sn"], sonuclar["satir_satir_mb"] = await olc(satir_satir)
+    yeni, sonuclar["partili_sn"], sonuclar["partili_mb"] = await olc(lambda: partili(False))
+    assert dict(yeni.kitap_basina) == eski[0] and dict(yeni.gun_basina) == eski[2]
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        pass
+    else:
+        arrow_sonuc, sonuclar["arrow_sn"], sonuclar["arrow_mb"] = await olc(lambda: partili(True))
+        assert dict(arrow_sonuc.kitap_basina) == eski[0] and dict(arrow_sonuc.gun_basina) == eski[2]
+        for uzanti in ("parquet", "arrow"):
+            async with motor.connect() as conn:
+                rapor = await disa_aktar(conn, OKUMA_SORGUSU, os.path.join(klasor, f"okumalar.{uzanti}"),
+                                         parti_boyutu=parti_boyutu)
+            sonuclar[f"{uzanti}_disa_aktarma"] = rapor
+    async with motor.connect() as conn:
+        sonuclar["csv_disa_aktarma"] = await disa_aktar(conn, OKUMA_SORGUSU, os.path.join(klasor, "okumalar.csv"),
+                                                        parti_boyutu=parti_boyutu)
+    sonuclar["kayit"] = kayit_sayisi
+    await motor.dispose()
+    return sonuclar
+
+
+if __name__ == "__main__":
+    sonuc = asyncio.run(kiyasla())
+    print(f"--- Okuma Kaydı Toplama ({sonuc.pop('kayit'):,} kayıt) ---")
+    for ad, deger in sonuc.items():
+        if isinstance(deger, dict):
+            print(f"  {ad:<22}: {deger['satir']:,} satır, {deger['parti']} parti, "
+                  f"{deger['sure_sn']:.2f} sn, {deger['bayt'] / 1024 / 1024:.1f} MB")
+        else:
+            print(f"  {ad:<22}: {deger:.2f}")
@@ -0,0 +1,268 @@
+"""
+Modül 12: Redis ile Okuma Önbelleği (Read-Through Cache)
+
+En sık okunan iki yol (bir yazarın kitapları ve id ile kitap) her istekte
+veritabanına gitmek zorunda değildir. Bu modül, veriyi önce önbellekte arar;
+yoksa veritabanından yükleyip önbelleğe yazar (read-through).
+
+- İki arka uç aynı arayüzü sunar:
+  `RedisArkaUcu` (docker-compose'daki `redis_cache`) ve `YerelLRUArkaUcu`
+  (süreç içi, Redis sunucusu olmadan test ve kıyaslama için).
+- Her anahtarın bir ömrü (TTL) vardır; aynı anda dolan anahtarlar aynı anda
+  veritabanına yüklenmesin diye TTL'e küçük bir rastgele sapma eklenir.
+- Anahtarlar sürümlüdür (`kitaplik:v1:kitap:42`). Saklanan verinin biçimi
+  değişirse `SEMA_SURUMU` artırılır ve eski anahtarlar kendiliğinden devre dışı kalır.
+- Yazma yolları (ekle/güncelle/sil) ilgili anahtarları `gecersiz_kil()` ile siler.
+- İzdiham koruması (single-flight): Aynı anahtar için aynı anda gelen 100 istekten
+  sadece biri veritabanına gider, diğerleri onun sonucunu bekler.
+- İsabet / ıska / tahliye sayaçları `istatistikler()` ile okunur.
+
+Redis adresi `REDIS_URL` ortam değişkeninden okunur; tanımlı değilse yerel LRU kullanılır.
+Kıyaslama için: `python -m backend.core.cache`
+"""
+
+import asyncio
+import json
+import os
+import random
+import time
+from collections import OrderedDict
+
+SEMA_SURUMU = 2  # 2: KitapOut'a video_url eklendi
+
+
+# --- Arka Uçlar ---
+
+class YerelLRUArkaUcu:
+    """Süreç içi, kapasitesi sınırlı ve TTL destekli LRU önbellek."""
+
+    def __init__(self, kapasite=10_000):
+        self.kapasite = kapasite
+        self._veri = OrderedDict()  # anahtar -> (bitiş zamanı, değer)
+        self.tahliye = 0
+
+    async def get(self, anahtar):
+        kayit = self._veri.get(anahtar)
+        if kayit is None:
+            return None
+        bitis, deger = kayit
+        if bitis is not None and bitis <= time.monotonic():
+            del self._veri[anahtar]
+            return None
+        self._veri.move_to_end(anahtar)
+        return deger
+
+    async def set(self, anahtar, deger, ttl=None):
+        self._veri[anahtar] = (time.monotonic() + ttl if ttl else None, deger)
+        self._veri.move_to_end(anahtar)
+        while len(self._veri) > self.kapasite:
+            self._veri.popitem(last=False)
+            self.tahliye += 1
+
+    async def delete(self, *anahtarlar):
+        for anahtar in anahtarlar:
+            self._veri.pop(anahtar, None)
+
+    async def kapat(self):
+        self._veri.clear()
+
+
+class RedisArkaUcu:
+    """`redis.asyncio` istemcisini önbellek arayüzüne uyarlar."""
+
+    def __init__(self, url):
+        from redis import asyncio as redis_asyncio  # Sadece Redis kullanılacaksa yüklensin
+
+        self._istemci = redis_asyncio.from_url(url)
+        self.tahliye = 0  # Redis kendi tahliyesini INFO içinde `evicted_keys` olarak raporlar
+
+    async def get(self, anahtar):
+        return await self._istemci.get(anahtar)
+
+    async def set(self, anahtar, deger, ttl=None):
+        await self._istemci.set(anahtar, deger, ex=ttl)
+
+    async def delete(self, *anahtarlar):
+        if anahtarlar:
+            await self._istemci.delete(*anahtarlar)
+
+    async def kapat(self):
+        await self._istemci.aclose()
+
+
+# --- Read-Through Önbellek ---
+
+class Onbellek:
+    """Arka uçtan bağımsız read-through önbellek.
+
+    Args:
+        arka_uc: `get/set/delete` yöntemleri olan bir arka uç.
+        onek: Tüm anahtarların başına eklenecek uygulama adı.
+        varsayilan_ttl: Saniye cinsinden varsayılan ömür.
+        ttl_sapmasi: TTL'e eklenecek en fazla rastgele oran (0.1 = %10).
+    """
+
+    def __init__(self, arka_uc, onek="kitaplik", varsayilan_ttl=60, ttl_sapmasi=0.1):
+        self.arka_uc = arka_uc
+        self.onek = onek
+        self.varsayilan_ttl = varsayilan_ttl
+        self.ttl_sapmasi = ttl_sapmasi
+
+        self._ucustakiler = {}  # anahtar -> yükleme Future'ı (single-flight)
+        self._bayatlar = set()  # Yüklenirken geçersiz kılınan (sonucu yazılmayacak) yüklemeler
+        self.isabet = 0
+        self.iska = 0
+        self.birlesen = 0  # Başka bir isteğin yüklemesini bekleyerek karşılanan istekler
+
+    def anahtar(self, ad_alani, kimlik):
+        return f"{self.onek}:v{SEMA_SURUMU}:{ad_alani}:{kimlik}"
+
+    async def getir_veya_yukle(self, ad_alani, kimlik, yukleyici, ttl=None):
+        """Değeri önbellekten döndürür; yoksa `await yukleyici()` ile yükleyip yazar.
+
+        Yükleyicinin döndürdüğü değer JSON'a çevrilebilir olmalıdır. `None` da
+        önbelleğe alınır; böylece olmayan bir kitap için de veritabanı tekrar tekrar sorgulanmaz.
+        """
+        anahtar = self.anahtar(ad_alani, kimlik)
+        ham = await self.arka_uc.get(anahtar)
+        if ham is not None:
+            self.isabet += 1
+            return json.loads(ham)
+
+        ucustaki = self._ucustakiler.get(anahtar)
+        if ucustaki is not None:
+            self.birlesen += 1
+            # asyncio.wait bekleneni iptal etmez ve sonucunu yaymaz; CancelledError yalnızca
+            # bu isteğin kendi iptalinde yükselir. İlk yükleyen iptal edildiyse (ör. istemcisi
+            # koptu) bekleyen istek değeri kendisi yükler.
+            await asyncio.wait({ucustaki})
+            if ucustaki.cancelled():
+                return await self.getir_veya_yukle(ad_alani, kimlik, yukleyici, ttl)
+            return ucustaki.result()
+
+        self.iska += 1
+        gelecek = asyncio.get_running_loop().create_future()
+        self._ucustakiler[anahtar] = gelecek
+        try:
+            deger = await yukleyici()
+            # Yükleme sürerken bir yazma işlemi anahtarı geçersiz kıldıysa eski veriyi yazma
+            if gelecek not in self._bayatlar:
+                await self.arka_uc.set(anahtar, json.dumps(deger, default=str), self._ttl(ttl))
+            gelecek.set_result(deger)
+            return deger
+        except asyncio.CancelledError:
+            gelecek.cancel()
+            raise
+        except Exception as hata:
+            gelecek.set_exception(hata)
+            gelecek.exception()  # Bekleyen yoksa "exception was never retrieved" uyarısı çıkmasın
+            raise
+        finally:
+            self._bayatlar.discard(gelecek)
+            if self._ucustakiler.get(anahtar) is gelecek:
+                del self._ucustakiler[anahtar]
+
+    async def gecersiz_kil(self, ad_alani, *kimlikler):
+        """Yazma yollarından çağrılır: verilen anahtarları siler."""
+        anahtarlar = [self.anahtar(ad_alani, k) for k in kimlikler]
+        for anahtar in anahtarlar:
+            ucustaki = self._ucustakiler.pop(anahtar, None)
+            if ucustaki is not None:
+                self._bayatlar.add(ucustaki)
+        await self.arka_uc.delete(*anahtarlar)
+
+    def _ttl(self, ttl):
+        ttl = ttl or self.varsayilan_ttl
+        return max(1, int(ttl * (1 + random.uniform(0, self.ttl_sapmasi))))
+
+    def istatistikler(self):
+        toplam = self.isabet + self.iska + self.birlesen
+        return {
+            "isabet": self.isabet,
+            "iska": self.iska,
+            "birlesen": self.birlesen,
+            "tahliye": self.arka_uc.tahliye,
+            "isabet_orani": (self.isabet + self.birlesen) / toplam if toplam else 0.0,
+        }
+
+
+# --- Kitap Okuma Yolları İçin Kısayollar ---
+
+class KitapOnbellegi:
+    """Kitap ve yazar okuma yollarının önbellek anahtarlarını tek yerde toplar."""
+
+    KITAP = "kitap"
+    YAZAR_KITAPLARI = "yazar_kitaplari"
+
+    def __init__(self, onbellek):
+        self.onbellek = onbellek
+
+    async def kitap(self, kitap_id, yukleyici):
+        return await self.onbellek.getir_veya_yukle(self.KITAP, kitap_id, yukleyici)
+
+    async def yazar_kitaplari(self, yazar_id, yukleyici):
+        return await self.onbellek.getir_veya_yukle(self.YAZAR_KITAPLARI, yazar_id, yukleyici)
+
+    async def kitap_degisti(self, kitap_id=None, *yazar_idleri):
+        """Ekleme/güncelleme/silme sonrası etkilenen kitap ve yazar listelerini geçersiz kılar.
+
+        Kitap başka bir yazara taşındıysa hem eski hem yeni yazarın id'si verilmelidir.
+        """
+        if kitap_id is not None:
+            await self.onbellek.gecersiz_kil(self.KITAP, kitap_id)
+        if yazar_idleri:
+            await self.onbellek.gecersiz_kil(self.YAZAR_KITAPLARI, *yazar_idleri)
+
+
+def onbellek_olustur(url=None, **ayarlar):
+    """`REDIS_URL` tanımlıysa Redis, değilse süreç içi LRU arka uçlu bir önbellek kurar."""
+    url = url or os.getenv("REDIS_URL")
+    arka_uc = RedisArkaUcu(url) if url else YerelLRUArkaUcu(int(os.getenv("CACHE_LRU_KAPASITE", "10000")))
+    return Onbellek(arka_uc, varsayilan_ttl=int(os.getenv("CACHE_TTL", "60")), **ayarlar)
+
+
+# --- Kıyaslama ---
+
+async def kiyasla(istek_sayisi=20_000, anahtar_sayisi=500, esz_zamanli=100, db_gecikmesi=0.002, onbellek=None):
+    """Önbellekli ve önbelleksiz okuma yolunu yapay bir veritabanı gecikmesiyle karşılaştırır."""
+    onbellek = onbellek or Onbellek(YerelLRUArkaUcu(kapasite=anahtar_sayisi // 2))
+    db_cagrisi = 0
+
+    async def veritabanindan(kimlik):
+        nonlocal db_cagrisi
+        db_cagrisi += 1
+        await asyncio.sleep(db_gecikmesi)
+        return {"id": kimlik, "baslik": f"Kitap {kimlik}"}
+
+    async def calistir(okuyucu):
+        sira = asyncio.Queue()
+        for _ in range(istek_sayisi):
+            sira.put_nowait(random.randrange(anahtar_sayisi))
+
+        async def isci():
+            while not sira.empty():
+                await okuyucu(sira.get_nowait())
+
+        baslangic = time.perf_counter()
+        await asyncio.gather(*(isci() for _ in range(esz_zamanli)))
+        return time.perf_counter() - baslangic
+
+    onbelleksiz = await calistir(veritabanindan)
+    db_cagrisi = 0
+    onbellekli = await calistir(
+        lambda k: onbellek.getir_veya_yukle("kitap", k, lambda: veritabanindan(k))
+    )
+    return {
+        "istek": istek_sayisi,
+        "onbelleksiz_sn": onbelleksiz,
+        "onbellekli_sn": onbellekli,
+        "onbellekli_db_cagrisi": db_cagrisi,
+        **onbellek.istatistikler(),
+    }
+
+
+if __name__ == "__main__":
+    sonuc = asyncio.run(kiyasla(onbellek=onbellek_olustur() if os.getenv("REDIS_URL") else None))
+    print("--- Okuma Önbelleği Kıyaslaması ---")
+    for ad, deger in sonuc.items():
+        print(f"  {ad:<22}: {deger}")
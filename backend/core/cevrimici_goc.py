@@ -0,0 +1,731 @@
+"""
+Modül 6: Alembic - Tabloyu Kilitlemeden (Çevrimiçi) Göç İşlemleri
+
+Büyük bir tabloda sıradan bir göç tek, uzun bir işlemdir: `op.add_column(...)` ardından
+tüm satırları dolduran bir `UPDATE` ve `op.create_index(...)`. İşlem sürdükçe tablo
+yazmalara (SQLite'ta tüm veritabanı) kapanır; yarıda kesilirse her şey geri alınır ve
+baştan başlar. Bu modül Alembic'e, `op.` üzerinden çağrılan üç işlem ekler
+(`alembic/env.py` modülü içe aktararak kaydeder):
+
+- `op.toplu_doldur(tablo, degerler, kosul=None, ...)`: `UPDATE`'i birincil anahtar
+  aralıklarına böler; her aralık ayrı ve kısa bir işlemdir. Aralık süresi `hedef_kilit_ms`
+  civarında tutulacak şekilde parça boyu ayarlanır; parçalar arasında en az o kadar beklenir.
+- `op.cevrimici_sutun_ekle(tablo, sutun, doldur=None, ...)`: Sütunu NULL'a izin veren
+  ve varsayılansız ekler (yalnızca katalog değişikliği), yeni satırların varsayılanını
+  ayrıca tanımlar, mevcut satırları `toplu_doldur` ile doldurur.
+- `op.cevrimici_indeks_olustur(ad, tablo, sutunlar, ...)`: PostgreSQL'de
+  `CREATE INDEX CONCURRENTLY`. SQLite'ta indeksler önceden kurulmuş bir gölge tabloya
+  parça parça kopyalama; kopya sürerken tetikleyiciler yazmaları gölgeye yansıtır,
+  sonunda iki `RENAME` ile tablolar yer değiştirir.
+
+Her parça, nerede kalındığını `goc_ilerlemesi` tablosuna parçanın KENDİ işleminde yazar:
+göç yarıda kesilir ve `alembic upgrade head` yeniden çalıştırılırsa adım kaldığı yerden
+sürer. Biten adımın kaydı silinir. İlerleme, kalan süre ve kilit süresi (bir parçanın ya
+da tek seferlik adımın işlemi = eşzamanlı bir yazıcının en fazla bekleyeceği süre)
+`bildir` geri çağrısına verilir; verilmezse saniyede bir loglanır.
+
+Alembic olmadan da kullanılabilir: modül düzeyindeki `toplu_doldur`, `sutun_ekle` ve
+`indeks_olustur` AUTOCOMMIT yalıtımlı bir bağlantı alır.
+
+Kıyaslama için: `python -m backend.core.cevrimici_goc`
+"""
+
+import logging
+import re
+import threading
+import time
+from contextlib import contextmanager
+
+import sqlalchemy as sa
+from alembic.operations import MigrateOperation, Operations
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.schema import CreateColumn, CreateIndex
+
+logger = logging.getLogger(__name__)
+
+GOC_ILERLEME_TABLOSU = "goc_ilerlemesi"
+GOLGE_ONEKI = "_golge_"
+ESKI_ONEKI = "_eski_"
+
+_metadata = sa.MetaData()
+goc_ilerlemesi = sa.Table(
+    GOC_ILERLEME_TABLOSU, _metadata,
+    sa.Column("adim", sa.String(200), primary_key=True),
+    sa.Column("son_anahtar", sa.BigInteger, nullable=False),
+    sa.Column("islenen", sa.BigInteger, nullable=False),
+    sa.Column("guncellendi", sa.DateTime(timezone=True), nullable=False),
+)
+
+
+class Ilerleme:
+    """Bir göç adımının anlık durumu; `bildir` geri çağrısına verilir."""
+
+    __slots__ = ("adim", "islenen", "oran", "gecen_sn", "kalan_sn", "kilit_ms", "en_uzun_kilit_ms", "tamamlandi")
+
+    def __init__(self, adim, islenen=0, oran=0.0, gecen_sn=0.0, kalan_sn=None, kilit_ms=0.0,
+                 en_uzun_kilit_ms=0.0, tamamlandi=False):
+        self.adim = adim
+        self.islenen = islenen
+        self.oran = oran
+        self.gecen_sn = gecen_sn
+        self.kalan_sn = kalan_sn
+        # Tek seferlik adımlarda, adım başlamadan önce bildirilen değer tahmindir.
+        self.kilit_ms = kilit_ms
+        self.en_uzun_kilit_ms = en_uzun_kilit_ms
+        self.tamamlandi = tamamlandi
+
+    def __str__(self):
+        if self.tamamlandi:
+            kalan = f"bitti, {self.gecen_sn:.1f} sn"
+        else:
+            kalan = "kalan ?" if self.kalan_sn is None else f"kalan ~{self.kalan_sn:.1f} sn"
+        return (f"{self.adim}: %{self.oran * 100:.1f} ({self.islenen} satır, {kalan}) | "
+                f"kilit: son {self.kilit_ms:.0f} ms, en uzun {self.en_uzun_kilit_ms:.0f} ms")
+
+
+class _Bildirici:
+    """`bildir` verildiyse her bildirimi ona iletir; verilmediyse en fazla `aralik` saniyede bir loglar."""
+
+    def __init__(self, bildir=None, aralik=1.0):
+        self.bildir = bildir
+        self.aralik = aralik
+        self._son = 0.0
+
+    def __call__(self, ilerleme):
+        if self.bildir is not None:
+            self.bildir(ilerleme)
+            return
+        simdi = time.monotonic()
+        if ilerleme.tamamlandi or simdi - self._son >= self.aralik:
+            self._son = simdi
+            logger.info("%s", ilerleme)
+
+
+# --- İşlem ve İlerleme Kaydı ---
+
+@contextmanager
+def _kisa_islem(conn):
+    """AUTOCOMMIT bir bağlantıda elle açılan kısa işlem.
+
+    SQLite'ta `BEGIN IMMEDIATE` yazma kilidini baştan alır: okuma kilidini sonradan yazmaya
+    yükseltmeye çalışan bir işlem, meşgul zaman aşımını beklemeden SQLITE_BUSY ile düşebilir.
+    """
+    conn.exec_driver_sql("BEGIN IMMEDIATE" if conn.dialect.name == "sqlite" else "BEGIN")
+    try:
+        yield conn
+    except BaseException:
+        conn.exec_driver_sql("ROLLBACK")
+        raise
+    conn.exec_driver_sql("COMMIT")
+
+
+def _ilerleme_tablosu_hazirla(conn):
+    goc_ilerlemesi.create(conn, checkfirst=True)
+
+
+def _durum_oku(conn, adim):
+    return conn.execute(
+        sa.select(goc_ilerlemesi.c.son_anahtar, goc_ilerlemesi.c.islenen).where(goc_ilerlemesi.c.adim == adim)
+    ).first()
+
+
+def _durum_yaz(conn, adim, son_anahtar, islenen):
+    degerler = {"son_anahtar": son_anahtar, "islenen": islenen, "guncellendi": sa.func.now()}
+    if conn.execute(goc_ilerlemesi.update().where(goc_ilerlemesi.c.adim == adim).values(degerler)).rowcount == 0:
+        conn.execute(goc_ilerlemesi.insert().values(adim=adim, **degerler))
+
+
+def ilerlemeyi_sifirla(conn, adim):
+    """`adim`'ın ve `adim:` ile başlayan alt adımların kaydını siler; adım sonraki çalıştırmada baştan başlar."""
+    _ilerleme_tablosu_hazirla(conn)
+    conn.execute(goc_ilerlemesi.delete().where(
+        sa.or_(goc_ilerlemesi.c.adim == adim, goc_ilerlemesi.c.adim.startswith(f"{adim}:", autoescape=True))
+    ))
+
+
+# --- Parça Parça İşleme ---
+
+def _parti_ayarla(parti, kilit_ms, hedef_kilit_ms, en_az, en_fazla):
+    """Parça boyunu, süre hedefe yaklaşacak şekilde en fazla iki kat büyütür ya da yarıya indirir."""
+    carpan = min(2.0, max(0.5, hedef_kilit_ms / max(kilit_ms, 0.001)))
+    return max(en_az, min(en_fazla, int(parti * carpan)))
+
+
+def _parca_parca(conn, adim, tablo, anahtar, parca, *, parti=1000, hedef_kilit_ms=50, bekleme_ms=None,
+                 en_az=100, en_fazla=50_000, bildir=None, bitince_sil=True):
+    """`tablo`'yu `anahtar` aralıklarına böler; her aralık için `parca(conn, son, sinir)` kısa bir işlemde çalışır.
+
+    `parca` etkilediği satır sayısını döndürür. Aralığın sonu, ilerleme kaydıyla aynı işlemde
+    yazılır. Üst sınır, adım başladığında tablodaki en büyük anahtardır; sonradan eklenen
+    satırlar kapsam dışıdır (onları sütun varsayılanı ya da gölge tablonun tetikleyicileri karşılar).
+    `bitince_sil=False` ise bitişte kayıt silinmez; adımı izleyen işlem siler.
+
+    Parçalar arasında `bekleme_ms` (verilmezse son parçanın kilit süresi kadar) beklenir.
+    Kısa aralıklar yetmez: SQLite'ın meşgul bekleyicisi kilidi 100 ms'ye varan aralıklarla
+    yeniden dener; hemen yeniden kilitlenen bir döngü bekleyen yazıcıyı aç bırakır.
+
+    Returns:
+        Adım boyunca (önceki, yarıda kalan çalıştırmalar dahil) işlenen satır sayısı.
+    """
+    _ilerleme_tablosu_hazirla(conn)
+    bildirici = bildir if isinstance(bildir, _Bildirici) else _Bildirici(bildir)
+    t = sa.table(tablo, sa.column(anahtar))
+    k = t.c[anahtar]
+    alt, ust = conn.execute(sa.select(sa.func.min(k), sa.func.max(k))).one()
+    taban = 0 if alt is None else alt - 1
+
+    durum = _durum_oku(conn, adim)
+    son, islenen = (taban, 0) if durum is None else (durum.son_anahtar, durum.islenen)
+    if durum is not None:
+        logger.info("%s: %s anahtarından devam ediliyor (%d satır işlenmişti)", adim, son, islenen)
+
+    aralik = sa.select(k).where(k > sa.bindparam("son"), k <= sa.bindparam("ust")).order_by(k)
+    sinir_sorgusu = sa.select(sa.func.max(aralik.limit(sa.bindparam("parti")).subquery().c[anahtar]))
+    kapsam = max((ust or 0) - taban, 1)
+    baslangic = time.perf_counter()
+    baslangic_orani = max(0.0, (son - taban) / kapsam)
+    kilit_ms = en_uzun = 0.0
+
+    while True:
+        parca_baslangici = time.perf_counter()
+        with _kisa_islem(conn):
+            sinir = conn.execute(sinir_sorgusu, {"son": son, "ust": ust, "parti": parti}).scalar()
+            if sinir is None:
+                if bitince_sil:
+                    conn.execute(goc_ilerlemesi.delete().where(goc_ilerlemesi.c.adim == adim))
+                break
+            n = parca(conn, son, sinir)
+            _durum_yaz(conn, adim, sinir, islenen + n)
+        kilit_ms = (time.perf_counter() - parca_baslangici) * 1000
+        en_uzun = max(en_uzun, kilit_ms)
+        son, islenen = sinir, islenen + n
+        parti = _parti_ayarla(parti, kilit_ms, hedef_kilit_ms, en_az, en_fazla)
+
+        gecen = time.perf_counter() - baslangic
+        oran = min(1.0, (son - taban) / kapsam)
+        hiz = (oran - baslangic_orani) / gecen if gecen > 0 else 0
+        bildirici(Ilerleme(adim, islenen, oran, gecen, (1 - oran) / hiz if hiz > 0 else None, kilit_ms, en_uzun))
+        time.sleep((kilit_ms if bekleme_ms is None else bekleme_ms) / 1000)
+
+    bildirici(Ilerleme(adim, islenen, 1.0, time.perf_counter() - baslangic, 0.0, kilit_ms, en_uzun, True))
+    return islenen
+
+
+def toplu_doldur(conn, tablo, degerler, kosul=None, *, anahtar="id", adim=None, **ayarlar):
+    """`UPDATE tablo SET degerler [WHERE kosul]` ifadesini kısa, ayrı işlemlere bölerek çalıştırır.
+
+    Args:
+        conn: AUTOCOMMIT yalıtımlı bağlantı.
+        degerler: Sütun adı -> değer ya da SQL ifadesi (ör. `sa.literal_column("'/k/' || id")`).
+        kosul: Ek WHERE koşulu (SQL metni ya da ifade); ör. yalnızca NULL kalanlar.
+        anahtar: Tek sütunlu, sıralanabilir birincil anahtar.
+        adim: İlerleme kaydının adı; aynı göçün yeniden çalıştırılmasında aynı kalmalıdır.
+        **ayarlar: `parti`, `hedef_kilit_ms`, `bekleme_ms`, `en_az`, `en_fazla`, `bildir`.
+
+    Returns:
+        Güncellenen satır sayısı.
+    """
+    t = sa.table(tablo, sa.column(anahtar), *(sa.column(ad) for ad in degerler))
+    k = t.c[anahtar]
+    ifade = sa.update(t).values(degerler).where(k > sa.bindparam("son"), k <= sa.bindparam("sinir"))
+    if kosul is not None:
+        ifade = ifade.where(sa.text(kosul) if isinstance(kosul, str) else kosul)
+
+    def parca(c, son, sinir):
+        return c.execute(ifade, {"son": son, "sinir": sinir}).rowcount
+
+    return _parca_parca(conn, adim or f"toplu_doldur:{tablo}:{','.join(degerler)}", tablo, anahtar, parca, **ayarlar)
+
+
+# --- Kısa DDL ---
+
+def _kilit_bekleme_hatasi_mi(hata):
+    kod = getattr(hata.orig, "pgcode", None) or getattr(hata.orig, "sqlstate", None)
+    return kod == "55P03" or "database is locked" in str(hata.orig)
+
+
+def _kisa_ddl(conn, *ifadeler, kilit_zaman_asimi_ms=2000, deneme=10):
+    """Tabloyu bir anlığına tamamen kilitleyen DDL'i, kilidi uzun süre beklemeden çalıştırır.
+
+    PostgreSQL'de `ALTER TABLE`, ACCESS EXCLUSIVE kilidi için uzun bir işlemin bitmesini
+    beklerken ARKASINA gelen tüm okuma ve yazmaları da bekletir. `lock_timeout` ile kısa
+    süre denenir; alınamazsa geri çekilip artan aralıklarla yeniden denenir.
+    """
+    for i in range(deneme):
+        try:
+            with _kisa_islem(conn):
+                if conn.dialect.name == "postgresql":
+                    conn.exec_driver_sql(f"SET LOCAL lock_timeout = '{int(kilit_zaman_asimi_ms)}ms'")
+                for ifade in ifadeler:
+                    conn.exec_driver_sql(ifade)
+            return
+        except OperationalError as hata:
+            if i == deneme - 1 or not _kilit_bekleme_hatasi_mi(hata):
+                raise
+            logger.warning("DDL için kilit alınamadı, yeniden denenecek (%d/%d)", i + 1, deneme)
+            time.sleep(min(0.1 * 2 ** i, 5.0))
+
+
+def _sutunlar(conn, tablo):
+    return {s["name"] for s in sa.inspect(conn).get_columns(tablo)}
+
+
+def _sutun_kopyasi(tablo, sutun, varsayilanli):
+    """DDL'i derlenebilsin diye geçici bir tabloya bağlı, NULL'a izin veren kopya."""
+    varsayilan = sutun.server_default.arg if varsayilanli and sutun.server_default is not None else None
+    kopya = sa.Column(sutun.name, sutun.type, server_default=varsayilan)
+    sa.Table(tablo, sa.MetaData(), kopya)
+    return kopya
+
+
+def sutun_ekle(conn, tablo, sutun, doldur=None, **ayarlar):
+    """Sütunu tabloyu yeniden yazmadan ekler; mevcut satırları isteğe bağlı olarak parça parça doldurur.
+
+    PostgreSQL'de sütun varsayılansız eklenir, varsayılan `SET DEFAULT` ile yalnızca yeni
+    satırlara tanımlanır; mevcut satırlar `doldur` (verilmezse varsayılan) ile doldurulur.
+    SQLite varsayılanı sonradan değiştiremez: sabit varsayılan `ADD COLUMN` ile birlikte
+    verilir ve mevcut satırlar onu zaten okur; `doldur` yalnızca varsayılansız sütunlar içindir.
+    Sütun zaten varsa yalnızca (yarıda kalmış) doldurma sürdürülür.
+
+    Args:
+        conn: AUTOCOMMIT yalıtımlı bağlantı.
+        sutun: `sa.Column`; NULL'a izin vermelidir. NOT NULL, doldurmadan sonra ayrı bir göçtür.
+        doldur: NULL kalan satırlara yazılacak değer ya da SQL ifadesi.
+        **ayarlar: `toplu_doldur`'a geçer.
+
+    Returns:
+        Doldurulan satır sayısı.
+    """
+    if not sutun.nullable:
+        raise ValueError(f"{sutun.name}: çevrimiçi eklenen sütun NULL'a izin vermeli; NOT NULL doldurmadan sonradır")
+    sqlite = conn.dialect.name == "sqlite"
+    if sqlite and sutun.server_default is not None and doldur is not None:
+        raise ValueError(f"{sutun.name}: SQLite'ta mevcut satırlar varsayılanı zaten okur; doldur verilemez")
+
+    q = conn.dialect.identifier_preparer.quote
+    if sutun.name not in _sutunlar(conn, tablo):
+        kopya = _sutun_kopyasi(tablo, sutun, varsayilanli=sqlite)
+        ifadeler = [f"ALTER TABLE {q(tablo)} ADD COLUMN {CreateColumn(kopya).compile(dialect=conn.dialect)}"]
+        if sqlite:
+            _kisa_ddl(conn, *ifadeler)
+        else:
+            if sutun.server_default is not None:
+                varsayilan = conn.dialect.ddl_compiler(conn.dialect, None).get_column_default_string(
+                    _sutun_kopyasi(tablo, sutun, varsayilanli=True)
+                )
+                ifadeler.append(f"ALTER TABLE {q(tablo)} ALTER COLUMN {q(sutun.name)} SET DEFAULT {varsayilan}")
+                if doldur is None:
+                    doldur = sa.literal_column(varsayilan)
+            # Varsayılansız ADD COLUMN ve SET DEFAULT yalnızca kataloğu değiştirir; tablo yeniden yazılmaz.
+            _kisa_ddl(conn, *ifadeler)
+        ilerlemeyi_sifirla(conn, f"sutun_ekle:{tablo}.{sutun.name}")
+
+    if doldur is None:
+        return 0
+    return toplu_doldur(conn, tablo, {sutun.name: doldur}, sa.column(sutun.name).is_(None),
+                        adim=f"sutun_ekle:{tablo}.{sutun.name}", **ayarlar)
+
+
+# --- Çevrimiçi İndeks: PostgreSQL ---
+
+def _indeks_ddl(ad, tablo, sutunlar, unique=False, **secenekler):
+    t = sa.Table(tablo, sa.MetaData(), *(sa.Column(s) for s in sutunlar))
+    return CreateIndex(sa.Index(ad, *(t.c[s] for s in sutunlar), unique=unique, **secenekler))
+
+
+def _pg_ilerleme_izle(motor, pid, adim, bildirici, dur, aralik=1.0):
+    """`pg_stat_progress_create_index`'i ayrı bir bağlantıdan okuyup bildirir (PostgreSQL 12+)."""
+    sorgu = sa.text(
+        "SELECT phase, blocks_done, blocks_total, tuples_done FROM pg_stat_progress_create_index WHERE pid = :pid"
+    )
+    baslangic = time.perf_counter()
+    with motor.connect() as izleme:
+        while not dur.wait(aralik):
+            satir = izleme.execute(sorgu, {"pid": pid}).first()
+            izleme.rollback()
+            if satir is None:
+                continue
+            oran = satir.blocks_done / satir.blocks_total if satir.blocks_total else 0.0
+            gecen = time.perf_counter() - baslangic
+            kalan = gecen / oran * (1 - oran) if oran > 0 else None
+            bildirici(Ilerleme(f"{adim} ({satir.phase})", satir.tuples_done or 0, oran, gecen, kalan))
+
+
+def _pg_indeks_olustur(conn, ad, tablo, sutunlar, unique, adim, bildirici):
+    gecerli = conn.execute(sa.text(
+        "SELECT i.indisvalid FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid WHERE c.relname = :ad"
+    ), {"ad": ad}).scalar()
+    if gecerli:
+        logger.info("%s zaten var, atlanıyor", ad)
+        return
+    if gecerli is False:
+        # Yarıda kalan CONCURRENTLY geride geçersiz (INVALID) bir indeks bırakır: yazmalarda bakımı
+        # yapılır ama sorgularda kullanılmaz. Kaldırılıp baştan kurulur.
+        logger.info("%s geçersiz (yarıda kalmış), yeniden kurulacak", ad)
+        conn.exec_driver_sql(f"DROP INDEX CONCURRENTLY IF EXISTS {conn.dialect.identifier_preparer.quote(ad)}")
+
+    # SHARE UPDATE EXCLUSIVE: okuma ve yazmalar beklemez; yalnızca başka bir şema değişikliği bekler.
+    bildirici(Ilerleme(adim, kilit_ms=0.0))
+    baslangic = time.perf_counter()
+    pid = conn.exec_driver_sql("SELECT pg_backend_pid()").scalar()
+    dur = threading.Event()
+    izleyici = threading.Thread(
+        target=_pg_ilerleme_izle, args=(conn.engine, pid, adim, bildirici, dur),
+        name="pg-indeks-ilerlemesi", daemon=True,
+    )
+    izleyici.start()
+    try:
+        conn.execute(_indeks_ddl(ad, tablo, sutunlar, unique, postgresql_concurrently=True))
+    finally:
+        dur.set()
+        izleyici.join()
+    bildirici(Ilerleme(adim, oran=1.0, gecen_sn=time.perf_counter() - baslangic, kalan_sn=0.0, tamamlandi=True))
+
+
+# --- Çevrimiçi İndeks: SQLite Gölge Tablo ---
+
+def _nesne_var_mi(conn, tur, ad, tablo=None):
+    sorgu = "SELECT 1 FROM sqlite_schema WHERE type = :tur AND name = :ad"
+    if tablo is not None:
+        sorgu += " AND tbl_name = :tablo"
+    return conn.execute(sa.text(sorgu), {"tur": tur, "ad": ad, "tablo": tablo}).first() is not None
+
+
+def _ad_degistir(sql, onek, eski, yeni):
+    """DDL metninde `onek`'ten hemen sonra gelen (tırnaklı ya da tırnaksız) `eski` tablo adını `yeni` yapar."""
+    e = re.escape(eski)
+    yeni_sql, n = re.subn(rf'({onek})(?:"{e}"|`{e}`|\[{e}\]|{e}\b)', lambda m: f'{m.group(1)}"{yeni}"', sql,
+                          count=1, flags=re.IGNORECASE)
+    if n != 1:
+        raise ValueError(f"DDL içinde {eski!r} bulunamadı: {sql}")
+    return yeni_sql
+
+
+def _sqlite_tablo_bilgisi(conn, tablo):
+    sutunlar = conn.exec_driver_sql(f"PRAGMA table_info({conn.dialect.identifier_preparer.quote(tablo)})").all()
+    anahtarlar = [s.name for s in sorted(sutunlar, key=lambda s: s.pk) if s.pk]
+    if len(anahtarlar) != 1:
+        raise ValueError(f"{tablo}: gölge tablo kopyası tek sütunlu bir birincil anahtar ister")
+    return anahtarlar[0], [s.name for s in sutunlar]
+
+
+def _yansitma_tetikleyicileri(conn, tablo, golge, anahtar, sutunlar):
+    """Kopya sürerken asıl tabloya yapılan yazmaları gölgeye taşıyan tetikleyiciler (ad -> DDL)."""
+    q = conn.dialect.identifier_preparer.quote
+    T, G, K = q(tablo), q(golge), q(anahtar)
+    liste = ", ".join(q(s) for s in sutunlar)
+    yeni = ", ".join(f"NEW.{q(s)}" for s in sutunlar)
+    guncelle = ", ".join(f"{q(s)} = excluded.{q(s)}" for s in sutunlar if s != anahtar)
+    cakisma = f"DO UPDATE SET {guncelle}" if guncelle else "DO NOTHING"
+    yaz = f"INSERT INTO {G} ({liste}) VALUES ({yeni}) ON CONFLICT ({K}) {cakisma};"
+    return {
+        f"{golge}_ekle": f"AFTER INSERT ON {T} BEGIN {yaz} END",
+        f"{golge}_guncelle": (
+            f"AFTER UPDATE ON {T} BEGIN DELETE FROM {G} WHERE {K} = OLD.{K} AND OLD.{K} IS NOT NEW.{K}; {yaz} END"
+        ),
+        f"{golge}_sil": f"AFTER DELETE ON {T} BEGIN DELETE FROM {G} WHERE {K} = OLD.{K}; END",
+    }
+
+
+def _sqlite_golge_hazirla(conn, ad, tablo, golge, sutunlar_yeni, unique):
+    """Boş gölge tabloyu tüm indeksleriyle (yenisi dahil) kurar ve yansıtma tetikleyicilerini ekler.
+
+    İndeksler boş tabloda kurulduğu için anlıktır; satırlar geldikçe artımlı güncellenirler.
+    SQLite'ta indeks adları veritabanı genelinde tekildir: gölgenin mevcut indeksleri aynı
+    adla taşıyabilmesi için asıl tablodaki kopyaları burada kaldırılır. Adım sürerken bu
+    indeksleri kullanan okumalar tam taramaya düşer ama beklemez; benzersizlik kuralları
+    gölgedeki indeksler ve tetikleyiciler üzerinden uygulanmaya devam eder.
+    """
+    q = conn.dialect.identifier_preparer.quote
+    anahtar, sutunlar = _sqlite_tablo_bilgisi(conn, tablo)
+    tablo_sql = conn.execute(sa.text("SELECT sql FROM sqlite_schema WHERE type = 'table' AND name = :ad"),
+                             {"ad": tablo}).scalar()
+    indeksler = conn.execute(sa.text(
+        "SELECT name, sql FROM sqlite_schema WHERE type = 'index' AND tbl_name = :ad AND sql IS NOT NULL"
+    ), {"ad": tablo}).all()
+
+    conn.exec_driver_sql(_ad_degistir(tablo_sql, r"CREATE\s+TABLE\s+", tablo, golge))
+    for indeks_adi, indeks_sql in indeksler:
+        conn.exec_driver_sql(f"DROP INDEX {q(indeks_adi)}")
+        conn.exec_driver_sql(_ad_degistir(indeks_sql, r"\bON\s+", tablo, golge))
+    conn.execute(_indeks_ddl(ad, golge, sutunlar_yeni, unique))
+    for tetikleyici, govde in _yansitma_tetikleyicileri(conn, tablo, golge, anahtar, sutunlar).items():
+        conn.exec_driver_sql(f"CREATE TRIGGER {q(tetikleyici)} {govde}")
+
+
+def _sqlite_takas(conn, tablo, golge, eski, adim, bildirici):
+    """Gölgeyi asıl tablonun yerine koyar: tek kısa işlemde iki RENAME, katalog değişikliğinden ibaret.
+
+    `legacy_alter_table` ve kapalı yabancı anahtarlarla RENAME, başka tablolardaki
+    `REFERENCES tablo` ifadelerini yeni ada çevirmez; çocuk tablolar takastan sonra
+    aynı adı taşıyan gölgeyi gösterir. Tabloya ait tetikleyiciler yeni tabloda yeniden kurulur.
+    """
+    q = conn.dialect.identifier_preparer.quote
+    yabanci_anahtarlar = conn.exec_driver_sql("PRAGMA foreign_keys").scalar()
+    bildirici(Ilerleme(f"{adim}:takas", kilit_ms=0.0))
+    conn.exec_driver_sql("PRAGMA foreign_keys = OFF")
+    conn.exec_driver_sql("PRAGMA legacy_alter_table = ON")
+    baslangic = time.perf_counter()
+    try:
+        with _kisa_islem(conn):
+            tetikleyiciler = conn.execute(sa.text(
+                "SELECT name, sql FROM sqlite_schema WHERE type = 'trigger' AND tbl_name = :ad"
+            ), {"ad": tablo}).all()
+            for tetikleyici, _ in tetikleyiciler:
+                conn.exec_driver_sql(f"DROP TRIGGER {q(tetikleyici)}")
+            conn.exec_driver_sql(f"ALTER TABLE {q(tablo)} RENAME TO {q(eski)}")
+            conn.exec_driver_sql(f"ALTER TABLE {q(golge)} RENAME TO {q(tablo)}")
+            for tetikleyici, sql in tetikleyiciler:
+                if not tetikleyici.startswith(f"{golge}_"):
+                    conn.exec_driver_sql(sql)
+            conn.execute(goc_ilerlemesi.delete().where(goc_ilerlemesi.c.adim == f"{adim}:kopya"))
+    finally:
+        conn.exec_driver_sql("PRAGMA legacy_alter_table = OFF")
+        conn.exec_driver_sql(f"PRAGMA foreign_keys = {int(yabanci_anahtarlar)}")
+    sure = (time.perf_counter() - baslangic) * 1000
+    bildirici(Ilerleme(f"{adim}:takas", oran=1.0, gecen_sn=sure / 1000, kalan_sn=0.0, kilit_ms=sure,
+                       en_uzun_kilit_ms=sure, tamamlandi=True))
+
+
+def _sqlite_indeks_olustur(conn, ad, tablo, sutunlar, unique, adim, bildirici, ayarlar):
+    q = conn.dialect.identifier_preparer.quote
+    golge, eski = f"{GOLGE_ONEKI}{tablo}", f"{ESKI_ONEKI}{tablo}"
+
+    if not _nesne_var_mi(conn, "table", eski):
+        if not _nesne_var_mi(conn, "table", golge):
+            if _nesne_var_mi(conn, "index", ad, tablo):
+                logger.info("%s zaten var, atlanıyor", ad)
+                return
+            ilerlemeyi_sifirla(conn, adim)
+            with _kisa_islem(conn):
+                _sqlite_golge_hazirla(conn, ad, tablo, golge, sutunlar, unique)
+        else:
+            logger.info("%s: gölge tablo %s bulundu, kopyaya devam ediliyor", adim, golge)
+
+        anahtar, tum_sutunlar = _sqlite_tablo_bilgisi(conn, tablo)
+        liste = ", ".join(q(s) for s in tum_sutunlar)
+        kopya = sa.text(
+            f"INSERT INTO {q(golge)} ({liste}) SELECT {liste} FROM {q(tablo)} "
+            f"WHERE {q(anahtar)} > :son AND {q(anahtar)} <= :sinir ON CONFLICT ({q(anahtar)}) DO NOTHING"
+        )
+        # Tetikleyicinin daha önce yazdığı satır güncel olandır; kopya onu ezmez (DO NOTHING).
+        _parca_parca(conn, f"{adim}:kopya", tablo, anahtar,
+                     lambda c, son, sinir: c.execute(kopya, {"son": son, "sinir": sinir}).rowcount,
+                     bildir=bildirici, bitince_sil=False, **ayarlar)
+        _sqlite_takas(conn, tablo, golge, eski, adim, bildirici)
+
+    # Eski tabloyu tek DROP ile silmek, sayfalarını boşaltırken yazma kilidini sayfa sayısıyla
+    # orantılı süre tutar; önce parça parça boşaltılır, boş tablonun DROP'u anlıktır.
+    anahtar, _ = _sqlite_tablo_bilgisi(conn, eski)
+    sil = sa.text(f"DELETE FROM {q(eski)} WHERE {q(anahtar)} > :son AND {q(anahtar)} <= :sinir")
+    _parca_parca(conn, f"{adim}:temizlik", eski, anahtar,
+                 lambda c, son, sinir: c.execute(sil, {"son": son, "sinir": sinir}).rowcount,
+                 bildir=bildirici, **ayarlar)
+    _kisa_ddl(conn, f"DROP TABLE {q(eski)}")
+
+
+def indeks_olustur(conn, ad, tablo, sutunlar, unique=False, *, adim=None, bildir=None, **ayarlar):
+    """İndeksi okuma ve yazmaları uzun süre bekletmeden kurar. Yarıda kalırsa yeniden çağırmak sürdürür.
+
+    Args:
+        conn: AUTOCOMMIT yalıtımlı bağlantı.
+        sutunlar: Sütun adları.
+        **ayarlar: SQLite'ta gölge kopyanın ve temizliğin parça ayarları (`parti`, `hedef_kilit_ms`, ...).
+    """
+    adim = adim or f"indeks:{ad}"
+    bildirici = _Bildirici(bildir)
+    if conn.dialect.name == "postgresql":
+        return _pg_indeks_olustur(conn, ad, tablo, sutunlar, unique, adim, bildirici)
+    if conn.dialect.name == "sqlite":
+        _ilerleme_tablosu_hazirla(conn)
+        return _sqlite_indeks_olustur(conn, ad, tablo, sutunlar, unique, adim, bildirici, ayarlar)
+    raise NotImplementedError(f"Çevrimiçi indeks {conn.dialect.name} için desteklenmiyor")
+
+
+# --- Alembic İşlemleri (op.toplu_doldur, op.cevrimici_sutun_ekle, op.cevrimici_indeks_olustur) ---
+
+@contextmanager
+def _otomatik_commit(operations):
+    """Göçün o ana kadarki işlemini commit eder ve adımı AUTOCOMMIT bağlantıda çalıştırır."""
+    baglam = operations.get_context()
+    if baglam.as_sql:
+        raise NotImplementedError("Çevrimiçi göç işlemleri veri okur; --sql (çevrimdışı) kipinde çalışmaz")
+    with baglam.autocommit_block():
+        yield operations.get_bind()
+
+
+@Operations.register_operation("toplu_doldur")
+class TopluDoldurOp(MigrateOperation):
+    """`op.toplu_doldur(tablo, degerler, kosul=None, **ayarlar)`; bkz. `toplu_doldur`."""
+
+    def __init__(self, tablo, degerler, kosul=None, **ayarlar):
+        self.tablo = tablo
+        self.degerler = degerler
+        self.kosul = kosul
+        self.ayarlar = ayarlar
+
+    @classmethod
+    def toplu_doldur(cls, operations, tablo, degerler, kosul=None, **ayarlar):
+        """Satırları kısa, ayrı işlemlerde ve kaldığı yerden sürdürülebilir biçimde günceller."""
+        return operations.invoke(cls(tablo, degerler, kosul, **ayarlar))
+
+
+@Operations.register_operation("cevrimici_sutun_ekle")
+class CevrimiciSutunEkleOp(MigrateOperation):
+    """`op.cevrimici_sutun_ekle(tablo, sutun, doldur=None, **ayarlar)`; bkz. `sutun_ekle`."""
+
+    def __init__(self, tablo, sutun, doldur=None, **ayarlar):
+        self.tablo = tablo
+        self.sutun = sutun
+        self.doldur = doldur
+        self.ayarlar = ayarlar
+
+    @classmethod
+    def cevrimici_sutun_ekle(cls, operations, tablo, sutun, doldur=None, **ayarlar):
+        """Sütunu tabloyu yeniden yazmadan ekler, mevcut satırları parça parça doldurur."""
+        return operations.invoke(cls(tablo, sutun, doldur, **ayarlar))
+
+
+@Operations.register_operation("cevrimici_indeks_olustur")
+class CevrimiciIndeksOlusturOp(MigrateOperation):
+    """`op.cevrimici_indeks_olustur(ad, tablo, sutunlar, unique=False, **ayarlar)`; bkz. `indeks_olustur`."""
+
+    def __init__(self, ad, tablo, sutunlar, unique=False, **ayarlar):
+        self.ad = ad
+        self.tablo = tablo
+        self.sutunlar = sutunlar
+        self.unique = unique
+        self.ayarlar = ayarlar
+
+    @classmethod
+    def cevrimici_indeks_olustur(cls, operations, ad, tablo, sutunlar, unique=False, **ayarlar):
+        """İndeksi PostgreSQL'de CONCURRENTLY, SQLite'ta gölge tablo kopyasıyla kurar."""
+        return operations.invoke(cls(ad, tablo, sutunlar, unique, **ayarlar))
+
+
+@Operations.implementation_for(TopluDoldurOp)
+def _toplu_doldur_uygula(operations, islem):
+    with _otomatik_commit(operations) as conn:
+        return toplu_doldur(conn, islem.tablo, islem.degerler, islem.kosul, **islem.ayarlar)
+
+
+@Operations.implementation_for(CevrimiciSutunEkleOp)
+def _sutun_ekle_uygula(operations, islem):
+    with _otomatik_commit(operations) as conn:
+        return sutun_ekle(conn, islem.tablo, islem.sutun, islem.doldur, **islem.ayarlar)
+
+
+@Operations.implementation_for(CevrimiciIndeksOlusturOp)
+def _indeks_olustur_uygula(operations, islem):
+    with _otomatik_commit(operations) as conn:
+        return indeks_olustur(conn, islem.ad, islem.tablo, islem.sutunlar, islem.unique, **islem.ayarlar)
+
+
+# --- Kıyaslama ---
+
+def _kiyas_veritabani(yol, satir):
+    import sqlite3
+
+    conn = sqlite3.connect(yol)
+    conn.execute("PRAGMA journal_mode = WAL")
+    with conn:
+        conn.execute("CREATE TABLE yazarlar (id INTEGER PRIMARY KEY, ad VARCHAR(200) NOT NULL)")
+        conn.execute(
+            "CREATE TABLE kitaplar (id INTEGER NOT NULL PRIMARY KEY, baslik VARCHAR(300) NOT NULL, "
+            "yazar_id INTEGER NOT NULL REFERENCES yazarlar (id) ON DELETE CASCADE)"
+        )
+        conn.execute("CREATE INDEX ix_kitaplar_yazar_id ON kitaplar (yazar_id)")
+        conn.executemany("INSERT INTO yazarlar VALUES (?, ?)", ((i, f"Yazar {i}") for i in range(1, 101)))
+        conn.executemany("INSERT INTO kitaplar VALUES (?, ?, ?)", ((i, f"Kitap {i}", i % 100 + 1) for i in range(1, satir + 1)))
+    conn.close()
+
+
+def _kiyas_isci(yol, dur, ifade, sureler, hatalar, satir):
+    import random
+    import sqlite3
+
+    conn = sqlite3.connect(yol, timeout=30, isolation_level=None, check_same_thread=False)
+    rastgele = random.Random(6)
+    while not dur.is_set():
+        baslangic = time.perf_counter()
+        try:
+            conn.execute(ifade, (rastgele.randint(1, satir),)).fetchall()
+        except sqlite3.Error as hata:
+            hatalar.append(hata)
+        sureler.append(time.perf_counter() - baslangic)
+        time.sleep(0.002)
+    conn.close()
+
+
+def _tek_islemde(conn):
+    with _kisa_islem(conn):
+        conn.exec_driver_sql("ALTER TABLE kitaplar ADD COLUMN kapak_url VARCHAR(500)")
+        conn.exec_driver_sql("UPDATE kitaplar SET kapak_url = '/kapaklar/' || id || '.jpg'")
+        conn.exec_driver_sql("CREATE INDEX ix_kitaplar_kapak_url ON kitaplar (kapak_url)")
+
+
+def _cevrimici(conn):
+    sessiz = lambda _ilerleme: None  # noqa: E731
+    sutun_ekle(conn, "kitaplar", sa.Column("kapak_url", sa.String(500)),
+               sa.literal_column("'/kapaklar/' || id || '.jpg'"), bildir=sessiz)
+    indeks_olustur(conn, "ix_kitaplar_kapak_url", "kitaplar", ["kapak_url"], bildir=sessiz)
+
+
+def kiyasla(satir=1_000_000):
+    """Aynı göçü (sütun ekle + doldur + indeks) tek işlemde ve çevrimiçi işlemlerle çalıştırır.
+
+    Göç sürerken ayrı bağlantılardan bir okuyucu (`id` ile kitap) ve bir yazıcı (`baslik`
+    güncellemesi) döner. WAL kipinde okuyucu hiçbir yolda beklemez; fark yazıcıdadır: tek
+    işlemde göç boyunca, çevrimiçi yolda en fazla bir parça (ya da takas) süresince bekler.
+    """
+    import statistics
+    import tempfile
+    from pathlib import Path
+
+    sonuclar = []
+    for ad, goc in (("tek_islem", _tek_islemde), ("cevrimici", _cevrimici)):
+        with tempfile.TemporaryDirectory() as klasor:
+            yol = str(Path(klasor) / "kiyas.db")
+            _kiyas_veritabani(yol, satir)
+            motor = sa.create_engine(f"sqlite:///{yol}", poolclass=sa.pool.NullPool,
+                                     connect_args={"timeout": 30})
+            dur = threading.Event()
+            okuma, yazma, hatalar = [], [], []
+            isciler = [
+                threading.Thread(target=_kiyas_isci, args=(
+                    yol, dur, "SELECT baslik FROM kitaplar WHERE id = ?", okuma, hatalar, satir)),
+                threading.Thread(target=_kiyas_isci, args=(
+                    yol, dur, "UPDATE kitaplar SET baslik = baslik || '.' WHERE id = ?", yazma, hatalar, satir)),
+            ]
+            for isci in isciler:
+                isci.start()
+            time.sleep(0.2)
+            baslangic = time.perf_counter()
+            with motor.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+                goc(conn)
+            sure = time.perf_counter() - baslangic
+            dur.set()
+            for isci in isciler:
+                isci.join()
+            motor.dispose()
+        sonuclar.append({
+            "yol": ad,
+            "sure_sn": round(sure, 2),
+            "okuma_en_uzun_ms": round(max(okuma) * 1000, 1),
+            "yazma_en_uzun_ms": round(max(yazma) * 1000, 1),
+            "yazma_p99_ms": round(statistics.quantiles(yazma, n=100, method="inclusive")[98] * 1000, 1),
+            "yazma_sayisi": len(yazma),
+            "hata": len(hatalar),
+        })
+    return sonuclar
+
+
+if __name__ == "__main__":
+    import argparse
+
+    ayristirici = argparse.ArgumentParser(description="Tek işlemde ve çevrimiçi göç kıyaslaması (SQLite)")
+    ayristirici.add_argument("--satir", type=int, default=1_000_000)
+    secenekler = ayristirici.parse_args()
+    print(f"--- Çevrimiçi Göç Kıyaslaması ({secenekler.satir} kitap; sütun ekle + doldur + indeks) ---")
+    for sonuc in kiyasla(secenekler.satir):
+        print("  " + "  ".join(f"{ad}={deger}" for ad, deger in sonuc.items()))
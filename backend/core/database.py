@@ -0,0 +1,584 @@
+"""
+Modül 2: Asenkron Veritabanı Mimarisi - Engine, Session ve Havuz Metrikleri
+
+Modül 1'deki `engine.connect()` çağrıları ENGELLEYİCİDİR (blocking): sorgu
+beklenirken tüm thread durur. FastAPI'nin olay döngüsünde (event loop) bunu
+yapmak, o sırada gelen diğer tüm istekleri de bekletir. Bu modül aynı işi
+asenkron yapar:
+
+- `engine`: `DATABASE_URL_ASYNC` ortam değişkeninden okunan asenkron motor.
+  Üretimde `postgresql+asyncpg://...`, yerelde/testlerde `sqlite+aiosqlite:///...`.
+- `AsyncSessionLocal`: Her istek için yeni bir `AsyncSession` üreten fabrika.
+- `get_session`: FastAPI bağımlılığı (`Depends(get_session)`). İstek bitince
+  session kapanır, commit edilmemiş her şey geri alınır.
+- Havuz ayarları (`DB_POOL_SIZE`, `DB_MAX_OVERFLOW`, `DB_POOL_PRE_PING`,
+  `DB_POOL_RECYCLE`, `DB_POOL_TIMEOUT`) ortam değişkenleriyle değiştirilebilir.
+- Havuzdan bağlantı alırken beklenen süre ve havuz doluluğu ölçülür;
+  `havuz_metrikleri()` sözlük, `prometheus_metni()` Prometheus metin formatı döndürür.
+- Okuma/yazma ayrımı: `DATABASE_REPLICA_URLS` (virgülle ayrılmış) verilirse
+  `get_okuma_session` okuma oturumlarını sağlıklı ve yeterince güncel bir okuma
+  kopyasına (replica) yönlendirir; `get_session` her zaman birincil sunucuya gider.
+  Yazan istemci bir süre kendi yazısını görebileceği sunucuya yapışır (read-your-writes).
+- `sema_hazirla`: Yerel SQLite şemasını yalnızca modeller değiştiyse kurar; uygulama
+  her açılışta `create_all` çalıştırmaz.
+"""
+
+import asyncio
+import functools
+import itertools
+import logging
+import os
+import threading
+import time
+import zlib
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from dotenv import load_dotenv
+from fastapi import Depends, Request, Response
+from sqlalchemy import event, text
+from sqlalchemy.exc import InterfaceError, InvalidRequestError, OperationalError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+VARSAYILAN_URL = "sqlite+aiosqlite:///./kitaplik_backend.db"
+
+
+def _ortam_bool(ad, varsayilan):
+    return os.getenv(ad, str(varsayilan)).strip().lower() in ("1", "true", "evet", "yes", "on")
+
+
+def havuz_ayarlari_oku():
+    """Havuz ayarlarını ortam değişkenlerinden okur."""
+    return {
+        "pool_size": int(os.getenv("DB_POOL_SIZE", "5")),
+        "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "10")),
+        "pool_timeout": float(os.getenv("DB_POOL_TIMEOUT", "30")),
+        # Uzun süre boşta kalan bağlantıları yeniden açar (Postgres/pgbouncer zaman aşımlarına karşı)
+        "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", "1800")),
+        # Kullanmadan önce bağlantının canlı olduğunu ucuz bir ping ile doğrular
+        "pool_pre_ping": _ortam_bool("DB_POOL_PRE_PING", True),
+    }
+
+
+# --- Havuz Metrikleri ---
+
+class HavuzMetrikleri:
+    """Bağlantı bekleme sürelerini ve havuz doluluğunu toplar."""
+
+    # Bekleme süresi histogramının üst sınırları (saniye)
+    KOVALAR = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+    def __init__(self):
+        self._kilit = threading.Lock()
+        self.checkout_sayisi = 0
+        self.toplam_bekleme = 0.0
+        self.en_uzun_bekleme = 0.0
+        self.doygun_checkout = 0  # Alındığı anda havuzun tamamen dolu olduğu checkout'lar
+        self.kova_sayaclari = [0] * (len(self.KOVALAR) + 1)
+
+    def kaydet(self, bekleme, kullanimda, kapasite):
+        with self._kilit:
+            self.checkout_sayisi += 1
+            self.toplam_bekleme += bekleme
+            self.en_uzun_bekleme = max(self.en_uzun_bekleme, bekleme)
+            if kullanimda >= kapasite:
+                self.doygun_checkout += 1
+            for i, sinir in enumerate(self.KOVALAR):
+                if bekleme <= sinir:
+                    self.kova_sayaclari[i] += 1
+                    break
+            else:
+                self.kova_sayaclari[-1] += 1
+
+
+class OlculenHavuz(AsyncAdaptedQueuePool):
+    """Bağlantı alma (checkout) süresini ölçen asenkron kuyruk havuzu."""
+
+    metrikler = None
+
+    def _do_get(self):
+        baslangic = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            if self.metrikler is not None:
+                self.metrikler.kaydet(
+                    time.perf_counter() - baslangic, self.checkedout(), self.size() + self._max_overflow
+                )
+
+    def recreate(self):
+        # `engine.dispose()` havuzu yeniden oluşturur; sayaçlar kaybolmasın
+        yeni = super().recreate()
+        yeni.metrikler = self.metrikler
+        return yeni
+
+
+# --- Motor (Engine) ---
+
+# Modül 1'deki `baglanti_havuzu.VARSAYILAN_PRAGMALAR` ile aynı küme; laboratuvar dizini
+# bir paket olmadığı için backend onu içe aktaramaz.
+SQLITE_PRAGMALARI = {
+    "busy_timeout": 5000,
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "mmap_size": 256 * 1024 * 1024,
+    "foreign_keys": "ON",
+}
+
+
+def _sqlite_pragmalari(dbapi_conn, _kayit):
+    cursor = dbapi_conn.cursor()
+    for ad, deger in SQLITE_PRAGMALARI.items():
+        cursor.execute(f"PRAGMA {ad} = {deger}")
+    cursor.close()
+
+
+def motor_olustur(url=None, **ayarlar) -> AsyncEngine:
+    """Asenkron motoru havuz ayarları ve metriklerle birlikte oluşturur.
+
+    Args:
+        url: Veritabanı adresi; verilmezse `DATABASE_URL_ASYNC` okunur.
+        **ayarlar: `create_async_engine`'e geçilecek ek/ezici ayarlar.
+    """
+    url = url or os.getenv("DATABASE_URL_ASYNC", VARSAYILAN_URL)
+    bellek_ici = url.startswith("sqlite") and (":memory:" in url or url.rstrip("/").endswith(":"))
+
+    secenekler = {"echo": _ortam_bool("DB_ECHO", False)}
+    if not bellek_ici:
+        # Bellek içi SQLite tek bağlantılı StaticPool kullanır; havuz ayarları ona uygulanamaz.
+        secenekler.update(havuz_ayarlari_oku(), poolclass=OlculenHavuz)
+    secenekler.update(ayarlar)
+
+    motor = create_async_engine(url, **secenekler)
+    if isinstance(motor.sync_engine.pool, OlculenHavuz):
+        motor.sync_engine.pool.metrikler = HavuzMetrikleri()
+    if motor.dialect.name == "sqlite":
+        event.listen(motor.sync_engine, "connect", _sqlite_pragmalari)
+    return motor
+
+
+engine = motor_olustur()
+
+
+# --- Şema Kurulumu (yalnızca yerel SQLite) ---
+
+def sema_parmak_izi(metadata, dialect) -> int:
+    """Tabloların ve indekslerin DDL'inden türetilen, `PRAGMA user_version`'a sığan bir sayı."""
+    ddl = [str(CreateTable(tablo).compile(dialect=dialect)) for tablo in metadata.sorted_tables]
+    ddl += sorted(
+        str(CreateIndex(indeks).compile(dialect=dialect))
+        for tablo in metadata.sorted_tables for indeks in tablo.indexes
+    )
+    return zlib.crc32("\n".join(ddl).encode()) & 0x7FFFFFFF
+
+
+async def sema_hazirla(motor: AsyncEngine, metadata) -> bool:
+    """SQLite şeması modellerle aynı değilse `create_all` çalıştırır; çalıştırdıysa True döner.
+
+    Her açılışta `create_all` tablo başına bir `PRAGMA table_info` sorgusu atar. Bunun yerine
+    şemanın parmak izi veritabanının `user_version` alanında saklanır; tutuyorsa tek bir
+    PRAGMA okumasıyla kurulum atlanır. PostgreSQL'de şemayı Alembic yönetir, burada dokunulmaz.
+    """
+    if motor.dialect.name != "sqlite":
+        return False
+    iz = sema_parmak_izi(metadata, motor.dialect)
+    async with motor.begin() as conn:
+        if (await conn.exec_driver_sql("PRAGMA user_version")).scalar() == iz:
+            return False
+        await conn.run_sync(metadata.create_all)
+        await conn.exec_driver_sql(f"PRAGMA user_version = {iz}")
+    return True
+
+
+# --- Yazma Takibi (read-your-writes) ---
+
+# Son yazmanın zamanını (Unix saniyesi) taşıyan çerez. Durum sunucuda değil
+# istemcide tutulur; böylece birden fazla süreç/sunucu arkasında da çalışır.
+YAZMA_CEREZI = "son_yazma"
+
+
+class YazmaOturumu(Session):
+    """Veri değiştiren bir commit'ten sonra `info["yazma_bildir"]` geri çağrısını tetikleyen oturum."""
+
+
+@event.listens_for(YazmaOturumu, "after_flush")
+def _flush_yazdi(session, _flush_baglami):
+    session.info["yazdi"] = True
+
+
+@event.listens_for(YazmaOturumu, "do_orm_execute")
+def _dml_yazdi(durum):
+    # `session.execute(delete(...))` gibi toplu ifadeler flush'tan geçmez
+    if durum.is_insert or durum.is_update or durum.is_delete:
+        durum.session.info["yazdi"] = True
+
+
+@event.listens_for(YazmaOturumu, "after_commit")
+def _yazmayi_bildir(session):
+    if session.info.pop("yazdi", False) and "yazma_bildir" in session.info:
+        session.info["yazma_bildir"](time.time())
+
+
+@event.listens_for(YazmaOturumu, "after_rollback")
+def _yazmayi_unut(session):
+    session.info.pop("yazdi", None)
+
+
+class OkumaOturumu(Session):
+    """Okuma kopyalarına bağlanan oturum; yanlışlıkla yapılan yazmaları reddeder.
+
+    PostgreSQL kopyası yazmayı zaten reddeder, ama yerel SQLite kopyalarında yazma
+    sessizce başarılı olur ve kopya birincilden ayrışırdı.
+    """
+
+
+@event.listens_for(OkumaOturumu, "before_flush")
+@event.listens_for(OkumaOturumu, "do_orm_execute")
+def _okumada_yazma_yok(durum, *_):
+    if isinstance(durum, Session) or durum.is_insert or durum.is_update or durum.is_delete:
+        raise InvalidRequestError("Okuma oturumunda yazma yapılamaz; get_session kullanın")
+
+
+# expire_on_commit=False: commit'ten sonra nesnelere erişmek yeni bir (async ortamda
+# yasak olan) örtük sorgu tetiklemesin.
+AsyncSessionLocal = async_sessionmaker(
+    engine, class_=AsyncSession, sync_session_class=YazmaOturumu, expire_on_commit=False
+)
+
+
+# --- Okuma Kopyası (Read Replica) Yönlendirmesi ---
+
+def kopya_adresleri_oku():
+    """`DATABASE_REPLICA_URLS` ortam değişkenindeki (virgülle ayrılmış) okuma kopyası adresleri."""
+    return [u.strip() for u in os.getenv("DATABASE_REPLICA_URLS", "").split(",") if u.strip()]
+
+
+# Kopyanın en son uygulanan işlemin ne kadar gerisinde olduğu (saniye). Kopya değilse
+# (`pg_is_in_recovery()` false) ya da tüm WAL uygulanmışsa gecikme 0'dır.
+_POSTGRES_GECIKME_SORGUSU = text(
+    "SELECT CASE WHEN NOT pg_is_in_recovery() "
+    "OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END"
+)
+
+
+async def varsayilan_gecikme_olcer(motor: AsyncEngine) -> float:
+    """Kopyanın çoğaltma (replication) gecikmesini saniye olarak ölçer.
+
+    PostgreSQL dışındaki motorlarda (ör. yerel SQLite kopyaları) gecikme
+    kavramı yoktur; ucuz bir ping yapılır ve gecikme 0 kabul edilir.
+    """
+    async with motor.connect() as conn:
+        if motor.dialect.name == "postgresql":
+            return float(await conn.scalar(_POSTGRES_GECIKME_SORGUSU))
+        await conn.exec_driver_sql("SELECT 1")
+        return 0.0
+
+
+class KopyaDurumu:
+    """Bir okuma kopyasının son sağlık kontrolünün sonucu."""
+
+    __slots__ = ("motor", "saglikli", "gecikme", "son_kontrol", "hata", "okuma_sayisi")
+
+    def __init__(self, motor):
+        self.motor = motor
+        self.saglikli = False  # İlk kontrol geçilene kadar kopyaya okuma gönderilmez
+        self.gecikme = float("inf")
+        self.son_kontrol = 0.0
+        self.hata = None
+        self.okuma_sayisi = 0
+
+    def sozluk(self):
+        return {
+            "url": self.motor.url.render_as_string(hide_password=True),
+            "saglikli": self.saglikli,
+            "gecikme_sn": self.gecikme,
+            "son_kontrol": self.son_kontrol,
+            "hata": self.hata,
+            "okuma_sayisi": self.okuma_sayisi,
+        }
+
+
+class OkumaYonlendirici:
+    """Okumaları okuma kopyalarına, yazmaları birincil sunucuya yönlendirir.
+
+    Bir kopya yalnızca son sağlık kontrolünde yanıt verdiyse ve gecikmesi
+    `en_fazla_gecikme`'yi aşmıyorsa seçilir; uygun kopyalar arasında sırayla
+    (round-robin) dağıtılır. İstemci yakın zamanda yazdıysa (`son_yazma`), yalnızca
+    gecikmesi yazmadan bu yana geçen süreden az olan (yani o yazıyı çoktan
+    uygulamış) kopyalar uygundur. Uygun kopya yoksa okuma birincil sunucuya düşer.
+
+    Args:
+        birincil: Yazmaların (ve yedek okumaların) gittiği motor.
+        kopyalar: Okuma kopyalarının motorları; boşsa her şey birincile gider.
+        en_fazla_gecikme: Bu kadar saniyeden fazla geride kalan kopya kullanılmaz.
+        guvenlik_payi: Gecikme, son kontrolden beri artmış olabilir; yazmadan sonraki
+            karşılaştırmaya eklenen pay (saniye).
+        saglik_araligi: Arka plan sağlık kontrollerinin aralığı (saniye).
+        saglik_zaman_asimi: Tek bir kontrolün en fazla süresi; aşan kopya sağlıksız sayılır.
+        gecikme_olcer: `async (motor) -> saniye`; varsayılanı `varsayilan_gecikme_olcer`.
+    """
+
+    def __init__(
+        self,
+        birincil: AsyncEngine,
+        kopyalar=(),
+        en_fazla_gecikme=5.0,
+        guvenlik_payi=1.0,
+        saglik_araligi=2.0,
+        saglik_zaman_asimi=1.0,
+        gecikme_olcer=varsayilan_gecikme_olcer,
+    ):
+        self.birincil = birincil
+        self.kopyalar = [KopyaDurumu(m) for m in kopyalar]
+        self.en_fazla_gecikme = en_fazla_gecikme
+        self.guvenlik_payi = guvenlik_payi
+        self.saglik_araligi = saglik_araligi
+        self.saglik_zaman_asimi = saglik_zaman_asimi
+        self.gecikme_olcer = gecikme_olcer
+        self.birincile_dusen = 0  # Kopya varken birincile giden okumalar
+        self._sira = itertools.count()
+        self._fabrikalar = {}
+        self._gorev = None
+
+    # --- Seçim ---
+
+    def _uygun_mu(self, kopya, son_yazma, simdi):
+        if not kopya.saglikli or kopya.gecikme > self.en_fazla_gecikme:
+            return False
+        if son_yazma is None:
+            return True
+        # Kopya, yazmadan bu yana geçen süreden daha az gerideyse yazıyı görür
+        return kopya.gecikme + self.guvenlik_payi < simdi - son_yazma
+
+    def okuma_motoru(self, son_yazma: float = None) -> AsyncEngine:
+        """Bir okuma için kullanılacak motoru seçer.
+
+        Args:
+            son_yazma: İstemcinin son yazmasının zamanı (`time.time()`); bilinmiyorsa None.
+        """
+        if not self.kopyalar:
+            return self.birincil
+        simdi = time.time()
+        uygunlar = [k for k in self.kopyalar if self._uygun_mu(k, son_yazma, simdi)]
+        if not uygunlar:
+            self.birincile_dusen += 1
+            return self.birincil
+        kopya = uygunlar[next(self._sira) % len(uygunlar)]
+        kopya.okuma_sayisi += 1
+        return kopya.motor
+
+    def oturum_fabrikasi(self, motor: AsyncEngine) -> async_sessionmaker:
+        if motor is self.birincil:
+            return AsyncSessionLocal if motor is engine else self._fabrika(motor, YazmaOturumu)
+        return self._fabrika(motor, OkumaOturumu)
+
+    def _fabrika(self, motor, oturum_sinifi):
+        if motor not in self._fabrikalar:
+            self._fabrikalar[motor] = async_sessionmaker(
+                motor, class_=AsyncSession, sync_session_class=oturum_sinifi, expire_on_commit=False
+            )
+        return self._fabrikalar[motor]
+
+    # --- Sağlık ---
+
+    def _kopya(self, motor):
+        return next((k for k in self.kopyalar if k.motor is motor), None)
+
+    def sagliksiz_isaretle(self, motor: AsyncEngine, hata=None):
+        """Sorgu sırasında hata veren kopyayı bir sonraki başarılı kontrole kadar devre dışı bırakır."""
+        kopya = self._kopya(motor)
+        if kopya is not None and kopya.saglikli:
+            kopya.saglikli = False
+            kopya.hata = repr(hata) if hata else "sorgu hatası"
+            logger.warning("Okuma kopyası devre dışı: %s (%s)", kopya.sozluk()["url"], kopya.hata)
+
+    async def _kontrol_et(self, kopya):
+        try:
+            gecikme = await asyncio.wait_for(self.gecikme_olcer(kopya.motor), self.saglik_zaman_asimi)
+        except Exception as hata:  # Bağlantı hatası, zaman aşımı, ...: kopya kullanılmaz
+            kopya.saglikli, kopya.gecikme, kopya.hata = False, float("inf"), repr(hata)
+        else:
+            kopya.saglikli, kopya.gecikme, kopya.hata = True, gecikme, None
+        kopya.son_kontrol = time.time()
+
+    async def saglik_kontrolu(self):
+        """Tüm kopyaları aynı anda kontrol eder ve durumlarını günceller."""
+        await asyncio.gather(*(self._kontrol_et(k) for k in self.kopyalar))
+
+    async def _dongu(self):
+        while True:
+            await asyncio.sleep(self.saglik_araligi)
+            await self.saglik_kontrolu()
+
+    async def baslat(self):
+        """İlk kontrolü yapar ve periyodik kontrolü arka planda başlatır (uygulama açılışında)."""
+        if self.kopyalar and self._gorev is None:
+            await self.saglik_kontrolu()
+            self._gorev = asyncio.create_task(self._dongu())
+
+    async def durdur(self):
+        """Arka plan kontrolünü durdurur ve kopya motorlarını kapatır."""
+        if self._gorev is not None:
+            self._gorev.cancel()
+            try:
+                await self._gorev
+            except asyncio.CancelledError:
+                pass
+            self._gorev = None
+        for kopya in self.kopyalar:
+            await kopya.motor.dispose()
+
+    def durum(self):
+        return {
+            "kopyalar": [k.sozluk() for k in self.kopyalar],
+            "birincile_dusen": self.birincile_dusen,
+        }
+
+
+yonlendirici = OkumaYonlendirici(engine, [motor_olustur(url) for url in kopya_adresleri_oku()])
+
+
+def son_yazma_oku(request: Request):
+    """İstekteki `son_yazma` çerezini okur; yoksa ya da bozuksa None."""
+    try:
+        return float(request.cookies[YAZMA_CEREZI])
+    except (KeyError, ValueError):
+        return None
+
+
+def yazma_cerezi_ekle(response: Response, zaman: float, sure: float):
+    """Yanıta son yazma zamanını ekler; çerez yapışkanlığın gerektiği `sure` kadar yaşar."""
+    response.set_cookie(YAZMA_CEREZI, f"{zaman:.3f}", max_age=int(sure) + 1, httponly=True, samesite="lax")
+
+
+async def get_yonlendirici() -> OkumaYonlendirici:
+    """FastAPI bağımlılığı; testler kendi yönlendiricisiyle değiştirir.
+
+    async tanımlıdır: FastAPI senkron bağımlılıkları her istekte thread havuzunda çalıştırır.
+    """
+    return yonlendirici
+
+
+async def get_session(
+    response: Response, yonlendirici: OkumaYonlendirici = Depends(get_yonlendirici)
+) -> AsyncIterator[AsyncSession]:
+    """FastAPI bağımlılığı: istek başına birincil sunucuya bağlı bir `AsyncSession` verir.
+
+    Veri değiştiren bir commit olursa yanıta `son_yazma` çerezi eklenir; aynı
+    istemcinin sonraki okumaları bu yazıyı görebilecek bir sunucuya gider.
+
+    Kullanım:
+        @router.post("/kitaplar")
+        async def kitap_ekle(veri: KitapCreate, session: AsyncSession = Depends(get_session)):
+            ...
+    """
+    async with _yazan_oturum(yonlendirici, response) as session:
+        yield session
+
+
+@asynccontextmanager
+async def _yazan_oturum(yonlendirici, response):
+    # Yazıyı görmeyen en gecikmeli kopya bile bu süreden sonra onu uygulamıştır
+    sure = yonlendirici.en_fazla_gecikme + yonlendirici.guvenlik_payi
+    async with yonlendirici.oturum_fabrikasi(yonlendirici.birincil)() as session:
+        session.info["yazma_bildir"] = lambda zaman: yazma_cerezi_ekle(response, zaman, sure)
+        yield session
+
+
+async def get_oturum_fabrikasi(
+    response: Response, yonlendirici: OkumaYonlendirici = Depends(get_yonlendirici)
+):
+    """FastAPI bağımlılığı: oturumu kendisi kısa süreliğine açıp kapatan uç noktalar için.
+
+    `get_session`'ın oturumu isteğin sonuna kadar yaşar; ilk sorgudan sonra da bir
+    havuz bağlantısını tutar. Dakikalarca süren işler (ör. video yükleme) bunun
+    yerine birincil sunucuya her ihtiyaçta yeni, kısa bir oturum açar:
+
+        async with oturum_ac() as session:
+            ...
+    """
+    return functools.partial(_yazan_oturum, yonlendirici, response)
+
+
+async def get_okuma_session(
+    request: Request, yonlendirici: OkumaYonlendirici = Depends(get_yonlendirici)
+) -> AsyncIterator[AsyncSession]:
+    """FastAPI bağımlılığı: salt okunur uç noktalar için, yönlendiricinin seçtiği sunucuya bağlı oturum.
+
+    Kopya sorgu sırasında bağlantı hatası verirse bir sonraki sağlık kontrolüne
+    kadar devre dışı bırakılır; sonraki istekler birincile (veya diğer kopyalara) gider.
+
+    Kullanım:
+        @router.get("/kitaplar")
+        async def kitaplari_listele(session: AsyncSession = Depends(get_okuma_session)):
+            ...
+    """
+    motor = yonlendirici.okuma_motoru(son_yazma_oku(request))
+    async with yonlendirici.oturum_fabrikasi(motor)() as session:
+        try:
+            yield session
+        except (OperationalError, InterfaceError) as hata:
+            yonlendirici.sagliksiz_isaretle(motor, hata)
+            raise
+
+
+# --- Metrikleri Dışa Aktarma ---
+
+def havuz_metrikleri(motor: AsyncEngine = None):
+    """Havuzun anlık durumunu ve birikmiş bekleme metriklerini sözlük olarak döndürür."""
+    havuz = (motor or engine).sync_engine.pool
+    metrikler = getattr(havuz, "metrikler", None)
+    if metrikler is None:
+        return {"havuz": havuz.status()}
+
+    kapasite = havuz.size() + havuz._max_overflow
+    with metrikler._kilit:
+        return {
+            "boyut": havuz.size(),
+            "kapasite": kapasite,
+            "kullanimda": havuz.checkedout(),
+            "tasma": max(havuz.overflow(), 0),
+            "doluluk": havuz.checkedout() / kapasite if kapasite else 0.0,
+            "checkout_sayisi": metrikler.checkout_sayisi,
+            "doygun_checkout": metrikler.doygun_checkout,
+            "toplam_bekleme_sn": metrikler.toplam_bekleme,
+            "en_uzun_bekleme_sn": metrikler.en_uzun_bekleme,
+            "ortalama_bekleme_sn": (
+                metrikler.toplam_bekleme / metrikler.checkout_sayisi if metrikler.checkout_sayisi else 0.0
+            ),
+            "bekleme_histogrami": dict(zip(metrikler.KOVALAR + (float("inf"),), metrikler.kova_sayaclari)),
+        }
+
+
+def prometheus_metni(motor: AsyncEngine = None, onek="kitaplik_db_havuz"):
+    """Havuz metriklerini Prometheus metin formatında döndürür (ör. bir `/metrics` uç noktası için)."""
+    m = havuz_metrikleri(motor)
+    if "havuz" in m:
+        return ""
+    satirlar = [
+        f"# TYPE {onek}_kullanimda gauge",
+        f"{onek}_kullanimda {m['kullanimda']}",
+        f"# TYPE {onek}_kapasite gauge",
+        f"{onek}_kapasite {m['kapasite']}",
+        f"# TYPE {onek}_doluluk gauge",
+        f"{onek}_doluluk {m['doluluk']}",
+        f"# TYPE {onek}_doygun_checkout_total counter",
+        f"{onek}_doygun_checkout_total {m['doygun_checkout']}",
+        f"# TYPE {onek}_bekleme_saniye histogram",
+    ]
+    birikimli = 0
+    for sinir, sayi in m["bekleme_histogrami"].items():
+        birikimli += sayi
+        le = "+Inf" if sinir == float("inf") else repr(sinir)
+        satirlar.append(f'{onek}_bekleme_saniye_bucket{{le="{le}"}} {birikimli}')
+    satirlar.append(f"{onek}_bekleme_saniye_sum {m['toplam_bekleme_sn']}")
+    satirlar.append(f"{onek}_bekleme_saniye_count {m['checkout_sayisi']}")
+    return "\n".join(satirlar) + "\n"
@@ -0,0 +1,375 @@
+"""
+Modül 15: Okuma Özetleri - Okuma, Uzlaştırma ve Tazelik Metrikleri
+
+Sayaç tabloları (`backend/models/okuma_ozeti.py`) uygulamanın yazma oturumundaki
+(`YazmaOturumu`) her ORM eklemesinde artımlı güncellenir; dinleyici burada, yalnızca
+bu oturum sınıfına bağlanır. Bu modül:
+
+- Özetlerden okur: `en_cok_okunan_kitaplar`, `en_cok_okunan_yazarlar`,
+  `gunluk_okumalar`. Hiçbiri `okuma_kayitlari`'na dokunmaz; süre, kayıt
+  sayısından değil özet tablosundan (kitap/yazar/gün sayısı) etkilenir.
+- `OzetUzlastirici`: Arka planda periyodik olarak (`OZET_UZLASMA_ARALIGI` sn,
+  0 ise kapalı) her özeti okuma kayıtlarından yeniden sayar ve farkları düzeltir.
+  Canlı sayım ile özet AYNI ifadede (`UNION ALL`) okunur, yani aynı anlık
+  görüntüden gelir. Düzeltme mutlak değer yazmaz, farkı EKLER
+  (`okuma_sayisi = okuma_sayisi + fark`): okuma ile yazma arasında eklenen
+  kayıtlar hem kayıt tablosuna hem sayaca girdiği için farkı bozmaz ve kaybolmaz.
+  Birden fazla süreç (ör. birkaç uvicorn işçisi) aynı anda uzlaştırabilir: her özet,
+  okumadan ÖNCE alınan bir yazma kilidi altında düzeltilir (`ozet_kilidi_al`); aynı
+  farkı iki süreç birden eklemez.
+- Tazelik metrikleri: son uzlaştırmadan beri geçen süre, son çalıştırmada
+  düzeltilen satır sayısı (özetin ne kadar kaydığı) ve süresi; `durum()` sözlük,
+  `prometheus_metni()` Prometheus metin formatı döndürür.
+
+Kıyaslama (canlı GROUP BY ile özet okuması): `python -m backend.core.ozetler`
+"""
+
+import asyncio
+import logging
+import os
+import time
+import zlib
+from datetime import date
+
+from sqlalchemy import Date, Integer, cast, delete, event, func, literal, select, type_coerce, union_all
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from backend.core.database import AsyncSessionLocal, YazmaOturumu
+from backend.models import GunlukOkumaDB, KitapDB, KitapOkumaSayaciDB, OkumaKaydiDB, YazarDB, YazarOkumaSayaciDB
+from backend.models.okuma_ozeti import artir, okuma_sayaclarini_guncelle, upsert_ifadesi
+
+logger = logging.getLogger(__name__)
+
+# Global `Session`'a değil uygulamanın oturum sınıfına: başka kütüphanelerin ve betiklerin
+# oturumları (ör. Alembic, yönetim betikleri) sayaç yazmaz.
+event.listen(YazmaOturumu, "after_flush", okuma_sayaclarini_guncelle)
+
+
+# --- Özetlerden Okuma ---
+
+async def en_cok_okunan_kitaplar(session: AsyncSession, n=10):
+    """(kitap_id, baslik, okuma_sayisi) satırları; `ix_kitap_okuma_sayaclari_sayi` tersten okunur."""
+    stmt = (
+        select(KitapOkumaSayaciDB.kitap_id, KitapDB.baslik, KitapOkumaSayaciDB.okuma_sayisi)
+        .join(KitapDB, KitapDB.id == KitapOkumaSayaciDB.kitap_id)
+        .order_by(KitapOkumaSayaciDB.okuma_sayisi.desc(), KitapOkumaSayaciDB.kitap_id.desc())
+        .limit(n)
+    )
+    return (await session.execute(stmt)).all()
+
+
+async def en_cok_okunan_yazarlar(session: AsyncSession, n=10):
+    """(yazar_id, ad, okuma_sayisi) satırları."""
+    stmt = (
+        select(YazarOkumaSayaciDB.yazar_id, YazarDB.ad, YazarOkumaSayaciDB.okuma_sayisi)
+        .join(YazarDB, YazarDB.id == YazarOkumaSayaciDB.yazar_id)
+        .order_by(YazarOkumaSayaciDB.okuma_sayisi.desc(), YazarOkumaSayaciDB.yazar_id.desc())
+        .limit(n)
+    )
+    return (await session.execute(stmt)).all()
+
+
+async def gunluk_okumalar(session: AsyncSession, baslangic: date = None, bitis: date = None):
+    """[baslangic, bitis] aralığındaki (gun, okuma_sayisi) satırları, tarihe göre sıralı."""
+    stmt = select(GunlukOkumaDB.gun, GunlukOkumaDB.okuma_sayisi).order_by(GunlukOkumaDB.gun)
+    if baslangic is not None:
+        stmt = stmt.where(GunlukOkumaDB.gun >= baslangic)
+    if bitis is not None:
+        stmt = stmt.where(GunlukOkumaDB.gun <= bitis)
+    return (await session.execute(stmt)).all()
+
+
+# --- Canlı Sayım (uzlaştırma ve kıyaslama için) ---
+
+def gun_ifadesi(dialect_adi):
+    """Okuma zamanının UTC günü, veritabanında hesaplanır."""
+    if dialect_adi == "postgresql":
+        return cast(func.timezone("UTC", OkumaKaydiDB.okuma_tarihi), Date)
+    # SQLite zamanı UTC metni olarak saklar; date() 'YYYY-MM-DD' döndürür, Date tipi onu `date`'e çevirir.
+    return type_coerce(func.date(OkumaKaydiDB.okuma_tarihi), Date)
+
+
+def canli_sayimlar(dialect_adi):
+    """Özet adı -> (sayaç modeli, anahtar sütunu, kayıtlardan GROUP BY ile sayan ifade)."""
+    gun = gun_ifadesi(dialect_adi)
+    return {
+        "kitap": (
+            KitapOkumaSayaciDB, "kitap_id",
+            select(OkumaKaydiDB.kitap_id, func.count()).group_by(OkumaKaydiDB.kitap_id),
+        ),
+        "yazar": (
+            YazarOkumaSayaciDB, "yazar_id",
+            select(KitapDB.yazar_id, func.count())
+            .join_from(OkumaKaydiDB, KitapDB, OkumaKaydiDB.kitap_id == KitapDB.id)
+            .group_by(KitapDB.yazar_id),
+        ),
+        "gun": (GunlukOkumaDB, "gun", select(gun, func.count()).group_by(gun)),
+    }
+
+
+# --- Uzlaştırma ---
+
+# pg_advisory_xact_lock(sınıf, nesne) anahtarının uygulamaya ait ilk yarısı ("özet")
+_KILIT_SINIFI = 0x6F7A6574
+
+
+async def ozet_kilidi_al(session: AsyncSession, tablo):
+    """`tablo`'nun uzlaştırması için işlem sonuna kadar süren, süreçler arası bir kilit alır.
+
+    Kilit okumadan önce alınmalıdır: iki süreç aynı farkı okuyup ikisi birden eklerse
+    sayaç ters yönde kayar. PostgreSQL'de özete özgü bir advisory kilit alınır. SQLite'ta
+    ilk ifade olarak çalışan (zararsız) DELETE veritabanının yazma kilidini alır; sonraki
+    okuma diğer yazıcıların commit'lerini görür. Diğer diyalektlerde kilit yoktur; orada
+    uzlaştırmayı tek bir süreç çalıştırmalıdır (diğerlerinde `OZET_UZLASMA_ARALIGI=0`).
+    """
+    dialect_adi = session.bind.dialect.name
+    if dialect_adi == "postgresql":
+        anahtar = zlib.crc32(tablo.name.encode()) - 2**31  # int4 aralığına
+        await session.execute(select(func.pg_advisory_xact_lock(_KILIT_SINIFI, anahtar)))
+    elif dialect_adi == "sqlite":
+        await session.execute(delete(tablo).where(tablo.c.okuma_sayisi <= 0))
+
+
+class OzetUzlastirici:
+    """Sayaç tablolarını okuma kayıtlarıyla periyodik olarak karşılaştırıp düzeltir.
+
+    Args:
+        oturum_fabrikasi: Birincil sunucuya yazan `async_sessionmaker`.
+        aralik: Arka plan uzlaştırmaları arasındaki süre (saniye); 0 ise arka plan görevi başlatılmaz.
+    """
+
+    def __init__(self, oturum_fabrikasi: async_sessionmaker, aralik=300.0):
+        self.oturum_fabrikasi = oturum_fabrikasi
+        self.aralik = aralik
+        self.son_uzlasma = None  # time.time()
+        self.son_sure = None
+        self.son_duzeltme = {}  # Özet adı -> son çalıştırmada düzeltilen satır
+        self.toplam_duzeltme = 0
+        self.uzlasma_sayisi = 0
+        self.hata = None
+        self._kilit = asyncio.Lock()
+        self._gorev = None
+
+    async def _ozeti_uzlastir(self, model, anahtar, canli):
+        tablo = model.__table__
+        anahtar_sutunu = tablo.c[anahtar]
+        # Canlı sayım ve özet TEK ifadede okunur: ikisi de aynı anlık görüntüden gelir
+        ikisi = union_all(
+            select(literal(0, Integer).label("kaynak"), *canli.subquery().c),
+            select(literal(1, Integer), anahtar_sutunu, tablo.c.okuma_sayisi),
+        )
+        async with self.oturum_fabrikasi() as session:
+            await ozet_kilidi_al(session, tablo)
+            sayimlar = ({}, {})
+            for kaynak, deger, sayi in (await session.execute(ikisi.subquery().select())).all():
+                sayimlar[kaynak][deger] = sayi
+            canli_sayi, ozet_sayi = sayimlar
+            farklar = [
+                {anahtar: deger, "okuma_sayisi": canli_sayi.get(deger, 0) - ozet_sayi.get(deger, 0)}
+                for deger in canli_sayi.keys() | ozet_sayi.keys()
+                if canli_sayi.get(deger, 0) != ozet_sayi.get(deger, 0)
+            ]
+            if farklar:
+                await session.execute(artir(upsert_ifadesi(session.bind.dialect.name, tablo), anahtar), farklar)
+                await session.execute(delete(tablo).where(tablo.c.okuma_sayisi <= 0))
+            await session.commit()  # Kilit bırakılır
+        return len(farklar)
+
+    async def uzlastir(self):
+        """Tüm özetleri bir kez uzlaştırır ve özet başına düzeltilen satır sayısını döndürür.
+
+        `_kilit` aynı süreçteki eşzamanlı çağrıları, `ozet_kilidi_al` süreçler arasını sıralar.
+        """
+        async with self._kilit:
+            baslangic = time.perf_counter()
+            duzeltme = {}
+            async with self.oturum_fabrikasi() as session:
+                dialect_adi = session.bind.dialect.name
+            for ad, (model, anahtar, canli) in canli_sayimlar(dialect_adi).items():
+                duzeltme[ad] = await self._ozeti_uzlastir(model, anahtar, canli)
+            self.son_sure = time.perf_counter() - baslangic
+            self.son_uzlasma = time.time()
+            self.son_duzeltme = duzeltme
+            self.toplam_duzeltme += sum(duzeltme.values())
+            self.uzlasma_sayisi += 1
+            self.hata = None
+            if any(duzeltme.values()):
+                logger.info("Okuma özetleri düzeltildi: %s", duzeltme)
+            return duzeltme
+
+    async def _dongu(self):
+        while True:
+            try:
+                await self.uzlastir()
+            except Exception as hata:  # Bir sonraki turda yeniden denenir; görev ölmesin
+                self.hata = repr(hata)
+                logger.exception("Okuma özetleri uzlaştırılamadı")
+            await asyncio.sleep(self.aralik)
+
+    async def baslat(self):
+        """Periyodik uzlaştırmayı arka planda başlatır; ilk tur hemen, açılışı bekletmeden çalışır."""
+        if self.aralik > 0 and self._gorev is None:
+            self._gorev = asyncio.create_task(self._dongu())
+
+    async def durdur(self):
+        if self._gorev is not None:
+            self._gorev.cancel()
+            try:
+                await self._gorev
+            except asyncio.CancelledError:
+                pass
+            self._gorev = None
+
+    def durum(self):
+        return {
+            "son_uzlasma": self.son_uzlasma,
+            "uzlasmadan_beri_sn": None if self.son_uzlasma is None else round(time.time() - self.son_uzlasma, 3),
+            "son_uzlasma_suresi_sn": self.son_sure,
+            "son_duzeltme": dict(self.son_duzeltme),
+            "toplam_duzeltme": self.toplam_duzeltme,
+            "uzlasma_sayisi": self.uzlasma_sayisi,
+            "hata": self.hata,
+        }
+
+    def prometheus_metni(self, onek="kitaplik_okuma_ozeti"):
+        d = self.durum()
+        satirlar = [
+            f"# TYPE {onek}_uzlasma_total counter",
+            f"{onek}_uzlasma_total {d['uzlasma_sayisi']}",
+            f"# TYPE {onek}_duzeltme_total counter",
+            f"{onek}_duzeltme_total {d['toplam_duzeltme']}",
+        ]
+        if d["son_uzlasma"] is not None:
+            satirlar += [
+                f"# TYPE {onek}_uzlasmadan_beri_saniye gauge",
+                f"{onek}_uzlasmadan_beri_saniye {d['uzlasmadan_beri_sn']}",
+                f"# TYPE {onek}_son_uzlasma_suresi_saniye gauge",
+                f"{onek}_son_uzlasma_suresi_saniye {d['son_uzlasma_suresi_sn']:.6f}",
+                f"# TYPE {onek}_son_duzeltme gauge",
+                *(f'{onek}_son_duzeltme{{ozet="{ad}"}} {sayi}' for ad, sayi in d["son_duzeltme"].items()),
+            ]
+        return "\n".join(satirlar) + "\n"
+
+
+ozet_uzlastirici = OzetUzlastirici(AsyncSessionLocal, aralik=float(os.getenv("OZET_UZLASMA_ARALIGI", "300")))
+
+
+async def get_ozet_uzlastirici() -> OzetUzlastirici:
+    return ozet_uzlastirici
+
+
+# --- Kıyaslama ---
+
+async def kiyasla(kayit_sayisi=500_000, kitap_sayisi=5_000, yazar_sayisi=500, kullanici_sayisi=1_000,
+                  gun_sayisi=365, tekrar=20, klasor=None):
+    """Canlı GROUP BY ile özet tablolarından okumayı ve ekleme maliyetini karşılaştırır."""
+    import random
+    import statistics
+    import tempfile
+    from datetime import datetime, timedelta, timezone
+
+    from backend.core.database import motor_olustur
+    from backend.models import Base, KullaniciDB
+
+    klasor = klasor or tempfile.mkdtemp()
+    motor = motor_olustur(f"sqlite+aiosqlite:///{os.path.join(klasor, 'kitaplik_ozet.db')}")
+    async with motor.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.exec_driver_sql(
+            "INSERT INTO yazarlar (id, ad) VALUES (?, ?)", [(i, f"Yazar {i}") for i in range(1, yazar_sayisi + 1)]
+        )
+        await conn.exec_driver_sql(
+            "INSERT INTO kitaplar (id, baslik, yazar_id) VALUES (?, ?, ?)",
+            [(i, f"Kitap {i}", i % yazar_sayisi + 1) for i in range(1, kitap_sayisi + 1)],
+        )
+        await conn.exec_driver_sql(
+            "INSERT INTO kullanicilar (id, email, parola_hash, aktif) VALUES (?, ?, 'x', 1)",
+            [(i, f"k{i}@ornek.com") for i in range(1, kullanici_sayisi + 1)],
+        )
+        ilk_gun = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        rastgele = random.Random(42)
+        # Toplu yükleme ORM'i atlar: sayaçlar boş kalır, ilk uzlaştırma onları baştan doldurur
+        await conn.exec_driver_sql(
+            "INSERT INTO okuma_kayitlari (kullanici_id, kitap_id, okuma_tarihi) VALUES (?, ?, ?)",
+            [
+                (rastgele.randint(1, kullanici_sayisi), rastgele.randint(1, kitap_sayisi),
+                 (ilk_gun + timedelta(seconds=rastgele.randrange(gun_sayisi * 86400))).strftime("%Y-%m-%d %H:%M:%S.%f"))
+                for _ in range(kayit_sayisi)
+            ],
+        )
+
+    fabrika = async_sessionmaker(motor, class_=AsyncSession, sync_session_class=YazmaOturumu, expire_on_commit=False)
+    uzlastirici = OzetUzlastirici(fabrika, aralik=0)
+    baslangic = time.perf_counter()
+    await uzlastirici.uzlastir()
+    sonuclar = {"ilk_uzlasma_sn": time.perf_counter() - baslangic}
+
+    async def p50_ms(islev):
+        sureler = []
+        async with fabrika() as session:
+            for _ in range(tekrar):
+                once = time.perf_counter()
+                sonuc = await islev(session)
+                sureler.append((time.perf_counter() - once) * 1000)
+        return statistics.median(sureler), sonuc
+
+    sayimlar = canli_sayimlar("sqlite")
+
+    async def canli_kitaplar(session):
+        stmt = sayimlar["kitap"][2]
+        sayi = stmt.selected_columns[1]
+        return (await session.execute(stmt.order_by(sayi.desc(), OkumaKaydiDB.kitap_id.desc()).limit(10))).all()
+
+    async def canli_yazarlar(session):
+        stmt = sayimlar["yazar"][2]
+        sayi = stmt.selected_columns[1]
+        return (await session.execute(stmt.order_by(sayi.desc(), KitapDB.yazar_id.desc()).limit(10))).all()
+
+    async def canli_gunluk(session):
+        return (await session.execute(sayimlar["gun"][2].order_by(gun_ifadesi("sqlite")))).all()
+
+    karsilastirmalar = (
+        ("en_cok_okunan_kitaplar", canli_kitaplar, en_cok_okunan_kitaplar),
+        ("en_cok_okunan_yazarlar", canli_yazarlar, en_cok_okunan_yazarlar),
+        ("gunluk", canli_gunluk, gunluk_okumalar),
+    )
+    for ad, canli, ozet in karsilastirmalar:
+        canli_ms, canli_sonuc = await p50_ms(canli)
+        ozet_ms, ozet_sonuc = await p50_ms(ozet)
+        # Aynı sayılar (kitap/yazar sıralamasında başlık/ad sütunu fazladan gelir)
+        assert [s[-1] for s in canli_sonuc] == [s[-1] for s in ozet_sonuc], ad
+        sonuclar[ad] = {"canli_ms": canli_ms, "ozet_ms": ozet_ms, "hizlanma": canli_ms / ozet_ms}
+
+    # Eklemenin maliyeti: sayaçlar aynı transaction'da güncellenir
+    kullanici = KullaniciDB.__table__
+    async with fabrika() as session:
+        kullanici_id = await session.scalar(select(kullanici.c.id).limit(1))
+    ekleme = []
+    for _ in range(tekrar):
+        async with fabrika() as session:
+            session.add_all(OkumaKaydiDB(kullanici_id=kullanici_id, kitap_id=rastgele.randint(1, kitap_sayisi))
+                            for _ in range(10))
+            once = time.perf_counter()
+            await session.commit()
+            ekleme.append((time.perf_counter() - once) * 1000)
+    sonuclar["10_kayit_ekleme_ms"] = statistics.median(ekleme)
+
+    baslangic = time.perf_counter()
+    duzeltme = await uzlastirici.uzlastir()
+    sonuclar["uzlasma_sn"] = time.perf_counter() - baslangic
+    assert not any(duzeltme.values()), duzeltme  # Artımlı güncelleme hiç kaymamış olmalı
+    sonuclar["kayit"] = kayit_sayisi
+    await motor.dispose()
+    return sonuclar
+
+
+if __name__ == "__main__":
+    sonuc = asyncio.run(kiyasla())
+    print(f"--- Okuma Özetleri ({sonuc.pop('kayit'):,} kayıt) ---")
+    print(f"{'Sorgu':<26}{'Canlı ms':>10}{'Özet ms':>10}{'Hızlanma':>10}")
+    for ad in ("en_cok_okunan_kitaplar", "en_cok_okunan_yazarlar", "gunluk"):
+        s = sonuc.pop(ad)
+        print(f"{ad:<26}{s['canli_ms']:>10.2f}{s['ozet_ms']:>10.3f}{s['hizlanma']:>9.0f}x")
+    for ad, deger in sonuc.items():
+        print(f"  {ad:<22}: {deger:.3f}")
@@ -0,0 +1,366 @@
+"""
+Modül 8: Güvenlik - JWT Doğrulama ve Parola Özetleri
+
+Kimliği doğrulanmış her istek bir JWT çözer ve imzasını doğrular; her giriş
+(login) bir bcrypt karşılaştırması yapar. İkisi de istek yolunun üzerindedir:
+
+- Anahtar nesneleri (`jose.jwk`) bir kez kurulur. `jwt.decode`'a metin anahtar
+  vermek, her çağrıda anahtarı yeniden ayrıştırmak demektir (RS256'da PEM
+  ayrıştırması imza doğrulamasından bile pahalıdır).
+- Doğrulanmış token'lar süreç içi bir LRU önbellekte tutulur. Anahtar token'ın
+  kendisi değil SHA-256 özetidir (bellekte ham token saklanmaz, anahtar boyu
+  sabittir); her kayıt token'ın `exp` anında geçersiz olur, yani önbellek bir
+  token'ı hiçbir zaman ömründen uzun kabul etmez.
+- bcrypt bilerek yavaştır (tur=12'de ~250 ms CPU). Olay döngüsünde çalışırsa o
+  sürede başka hiçbir istek ilerleyemez; bu yüzden async yardımcılar özetlemeyi
+  ayrı bir thread havuzunda yapar (`bcrypt` hesap sırasında GIL'i bırakır).
+
+Ayarlar (ortam değişkenleri):
+- `JWT_ALGORITHM` (varsayılan HS256), `JWT_SECRET_KEY` (HS*), ya da asimetrik
+  algoritmalar için `JWT_PRIVATE_KEY_FILE` / `JWT_PUBLIC_KEY_FILE` (PEM).
+- `ACCESS_TOKEN_EXPIRE_MINUTES` (30), `JWT_ONBELLEK_KAPASITE` (10000).
+- `BCRYPT_TUR` (12), `BCRYPT_ISCI` (varsayılan: CPU sayısı).
+
+Kıyaslama için: `python -m backend.core.security`
+"""
+
+import asyncio
+import functools
+import hashlib
+import logging
+import os
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+
+import bcrypt
+from dotenv import load_dotenv
+from fastapi import Depends, HTTPException, status
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from jose import JWTError, jwk, jwt
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+
+class TokenHatasi(Exception):
+    """Token bozuk, imzası geçersiz ya da süresi dolmuş."""
+
+
+# --- JWT ---
+
+class TokenDogrulayici:
+    """JWT üretir ve doğrular; doğrulanmış token'ları süreleri dolana kadar önbellekte tutar.
+
+    Args:
+        imzalama_anahtari: HS* için ortak gizli anahtar; RS*/ES* için özel anahtar (PEM).
+            Yalnızca doğrulama yapan bir servis için None olabilir.
+        algoritma: JWT imza algoritması.
+        dogrulama_anahtari: Asimetrik algoritmalarda açık anahtar (PEM); verilmezse
+            özel anahtardan türetilir.
+        kapasite: Önbellekteki en fazla token sayısı; 0 önbelleği kapatır.
+        omur: `token_olustur` için varsayılan geçerlilik süresi (saniye).
+        saat: Önbellek sürelerinin ölçüldüğü saat (testler için değiştirilebilir).
+    """
+
+    def __init__(
+        self,
+        imzalama_anahtari=None,
+        algoritma="HS256",
+        dogrulama_anahtari=None,
+        kapasite=10_000,
+        omur=1800,
+        saat=time.time,
+    ):
+        if imzalama_anahtari is None and dogrulama_anahtari is None:
+            raise ValueError("İmzalama ya da doğrulama anahtarından en az biri gerekli")
+        self.algoritma = algoritma
+        self.kapasite = kapasite
+        self.omur = omur
+        self.saat = saat
+        # Anahtarlar bir kez ayrıştırılır; jose `Key` nesnesi aldığında yeniden kurmaz
+        self._imzalama = jwk.construct(imzalama_anahtari, algoritma) if imzalama_anahtari is not None else None
+        if dogrulama_anahtari is not None:
+            self._dogrulama = jwk.construct(dogrulama_anahtari, algoritma)
+        elif algoritma.startswith("HS"):
+            self._dogrulama = self._imzalama
+        else:
+            self._dogrulama = self._imzalama.public_key()
+
+        self._onbellek = OrderedDict()  # sha256(token) -> (exp, yük)
+        self._kilit = threading.Lock()
+        self.isabet = 0
+        self.iska = 0
+        self.tahliye = 0
+
+    def token_olustur(self, konu, sure=None, **ekler):
+        """`sub=konu` ve `exp=şimdi+sure` içeren imzalı bir token döndürür."""
+        if self._imzalama is None:
+            raise TokenHatasi("Bu doğrulayıcının imzalama anahtarı yok")
+        simdi = int(time.time())
+        yuk = {"sub": str(konu), "iat": simdi, "exp": simdi + int(self.omur if sure is None else sure), **ekler}
+        return jwt.encode(yuk, self._imzalama, algorithm=self.algoritma)
+
+    def dogrula(self, token):
+        """Token'ı doğrular ve (salt okunur) yükünü döndürür; geçersizse `TokenHatasi`."""
+        anahtar = hashlib.sha256(token.encode()).digest()
+        simdi = self.saat()
+        with self._kilit:
+            kayit = self._onbellek.get(anahtar)
+            if kayit is not None:
+                if kayit[0] > simdi:
+                    self._onbellek.move_to_end(anahtar)
+                    self.isabet += 1
+                    return kayit[1]
+                del self._onbellek[anahtar]
+            self.iska += 1
+
+        try:
+            yuk = jwt.decode(token, self._dogrulama, algorithms=[self.algoritma])
+        except JWTError as hata:
+            raise TokenHatasi(str(hata)) from hata
+        yuk = MappingProxyType(yuk)  # Aynı nesne sonraki isteklere de verilecek
+
+        bitis = yuk.get("exp")
+        # `exp`'siz token'lar ve henüz geçerli olmayanlar (`nbf`) önbelleğe girmez
+        if self.kapasite and isinstance(bitis, (int, float)) and yuk.get("nbf", 0) <= simdi:
+            with self._kilit:
+                self._onbellek[anahtar] = (bitis, yuk)
+                while len(self._onbellek) > self.kapasite:
+                    self._onbellek.popitem(last=False)
+                    self.tahliye += 1
+        return yuk
+
+    def unut(self, token):
+        """Token'ı önbellekten çıkarır (ör. çıkış yapıldığında)."""
+        with self._kilit:
+            self._onbellek.pop(hashlib.sha256(token.encode()).digest(), None)
+
+    def istatistikler(self):
+        toplam = self.isabet + self.iska
+        return {
+            "isabet": self.isabet,
+            "iska": self.iska,
+            "tahliye": self.tahliye,
+            "boyut": len(self._onbellek),
+            "isabet_orani": self.isabet / toplam if toplam else 0.0,
+        }
+
+
+def _dosya_oku(yol):
+    with open(yol, encoding="utf-8") as f:
+        return f.read()
+
+
+def dogrulayici_olustur(**ayarlar):
+    """Ortam değişkenlerinden bir `TokenDogrulayici` kurar."""
+    algoritma = os.getenv("JWT_ALGORITHM", "HS256")
+    if algoritma.startswith("HS"):
+        imzalama = os.getenv("JWT_SECRET_KEY")
+        if not imzalama:
+            # Her süreç kendi anahtarını üretir: süreçler/yeniden başlatmalar arası token geçmez
+            logger.warning("JWT_SECRET_KEY tanımlı değil; geçici, rastgele bir anahtar kullanılıyor")
+            imzalama = secrets.token_urlsafe(32)
+        dogrulama = None
+    else:
+        ozel, acik = os.getenv("JWT_PRIVATE_KEY_FILE"), os.getenv("JWT_PUBLIC_KEY_FILE")
+        imzalama = _dosya_oku(ozel) if ozel else None
+        dogrulama = _dosya_oku(acik) if acik else None
+    secenekler = {
+        "algoritma": algoritma,
+        "dogrulama_anahtari": dogrulama,
+        "kapasite": int(os.getenv("JWT_ONBELLEK_KAPASITE", "10000")),
+        "omur": int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30")) * 60,
+    }
+    secenekler.update(ayarlar)
+    return TokenDogrulayici(imzalama, **secenekler)
+
+
+@functools.lru_cache(maxsize=1)
+def varsayilan_dogrulayici() -> TokenDogrulayici:
+    """Süreç başına tek doğrulayıcı: anahtarlar ilk kullanımda bir kez yüklenir."""
+    return dogrulayici_olustur()
+
+
+async def get_token_dogrulayici() -> TokenDogrulayici:
+    """FastAPI bağımlılığı; async tanımlıdır, senkron bağımlılıklar thread havuzunda çalışırdı."""
+    return varsayilan_dogrulayici()
+
+
+_bearer = HTTPBearer(auto_error=False)
+
+
+async def token_yuku(
+    kimlik: HTTPAuthorizationCredentials = Depends(_bearer),
+    dogrulayici: TokenDogrulayici = Depends(get_token_dogrulayici),
+):
+    """FastAPI bağımlılığı: `Authorization: Bearer <token>` başlığını doğrular, yükü döndürür.
+
+    Kullanım:
+        @router.get("/ben")
+        async def ben(yuk=Depends(token_yuku)):
+            return {"kullanici_id": int(yuk["sub"])}
+    """
+    if kimlik is None:
+        raise HTTPException(
+            status.HTTP_401_UNAUTHORIZED, "Kimlik doğrulaması gerekli", headers={"WWW-Authenticate": "Bearer"}
+        )
+    try:
+        # Önbellek isabetinde mikro saniyeler; ıskada bile tek bir HMAC/RSA doğrulaması
+        return dogrulayici.dogrula(kimlik.credentials)
+    except TokenHatasi:
+        raise HTTPException(
+            status.HTTP_401_UNAUTHORIZED, "Geçersiz ya da süresi dolmuş token",
+            headers={"WWW-Authenticate": "Bearer"},
+        ) from None
+
+
+# --- Parola Özetleri (bcrypt) ---
+
+BCRYPT_TUR = int(os.getenv("BCRYPT_TUR", "12"))
+# bcrypt parolanın yalnızca ilk 72 baytını kullanır; bcrypt 5 daha uzununu reddettiği
+# için kesme burada açıkça yapılır (passlib'in ürettiği `$2b$` özetleriyle uyumlu).
+BCRYPT_EN_FAZLA_BAYT = 72
+
+_bcrypt_havuzu = ThreadPoolExecutor(
+    max_workers=int(os.getenv("BCRYPT_ISCI", str(os.cpu_count() or 1))), thread_name_prefix="bcrypt"
+)
+
+
+def _bayt(parola):
+    return parola.encode("utf-8")[:BCRYPT_EN_FAZLA_BAYT]
+
+
+def parola_ozetle_senkron(parola, tur=None):
+    """Parolanın bcrypt özetini döndürür. ENGELLEYİCİDİR; async kodda `parola_ozetle` kullanın."""
+    return bcrypt.hashpw(_bayt(parola), bcrypt.gensalt(tur or BCRYPT_TUR)).decode("ascii")
+
+
+def parola_dogrula_senkron(parola, ozet):
+    """Parola özetle eşleşiyor mu? Bozuk özetlerde False. ENGELLEYİCİDİR."""
+    if ozet is None:
+        # Olmayan kullanıcıda da aynı süre harcansın: yanıt süresinden e-postanın kayıtlı
+        # olup olmadığı anlaşılmasın.
+        bcrypt.checkpw(_bayt(parola), _sahte_ozet())
+        return False
+    try:
+        return bcrypt.checkpw(_bayt(parola), ozet.encode("ascii"))
+    except ValueError:
+        return False
+
+
+@functools.lru_cache(maxsize=1)
+def _sahte_ozet():
+    return parola_ozetle_senkron(secrets.token_urlsafe(16)).encode("ascii")
+
+
+async def parola_ozetle(parola, tur=None):
+    """`parola_ozetle_senkron`'u bcrypt thread havuzunda çalıştırır; olay döngüsü beklemez."""
+    return await asyncio.get_running_loop().run_in_executor(_bcrypt_havuzu, parola_ozetle_senkron, parola, tur)
+
+
+async def parola_dogrula(parola, ozet):
+    """`parola_dogrula_senkron`'u bcrypt thread havuzunda çalıştırır.
+
+    `ozet` None ise (kullanıcı bulunamadı) sahte bir özetle karşılaştırıp False döndürür.
+    """
+    return await asyncio.get_running_loop().run_in_executor(_bcrypt_havuzu, parola_dogrula_senkron, parola, ozet)
+
+
+# --- Kıyaslama ---
+
+def _rsa_anahtari():
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import rsa
+
+    anahtar = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    return anahtar.private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+    ).decode()
+
+
+def _dogrulama_kiyasi(algoritma, anahtar, istek_sayisi, kullanici_sayisi):
+    """İstek başına kimlik doğrulama maliyeti (mikro saniye): üç yöntem."""
+    dogrulayici = TokenDogrulayici(anahtar, algoritma, kapasite=kullanici_sayisi)
+    tokenlar = [dogrulayici.token_olustur(i) for i in range(kullanici_sayisi)]
+    acik_anahtar = anahtar if algoritma.startswith("HS") else dogrulayici._dogrulama.to_pem().decode()
+
+    def olc(dogrula):
+        for token in tokenlar:  # Isınma: önbellekli yöntem kararlı durumda ölçülsün
+            dogrula(token)
+        baslangic = time.perf_counter()
+        for i in range(istek_sayisi):
+            dogrula(tokenlar[i % kullanici_sayisi])
+        return (time.perf_counter() - baslangic) / istek_sayisi * 1e6
+
+    onbelleksiz = TokenDogrulayici(anahtar, algoritma, kapasite=0)
+    return {
+        f"{algoritma}_anahtar_her_istekte_us": olc(lambda t: jwt.decode(t, acik_anahtar, algorithms=[algoritma])),
+        f"{algoritma}_anahtar_bir_kez_us": olc(onbelleksiz.dogrula),
+        f"{algoritma}_onbellekli_us": olc(dogrulayici.dogrula),
+    }
+
+
+async def _giris_kiyasi(giris_sayisi, esz_zamanli, tur):
+    """Eşzamanlı girişlerde saniyedeki giriş sayısı ve olay döngüsünün en uzun takılması."""
+    ozet = parola_ozetle_senkron("dogru-parola", tur)
+
+    async def olc(dogrula):
+        takilma = 0.0
+        bitti = False
+
+        async def nabiz():  # Olay döngüsü her 1 ms'de bir tur atabiliyor mu?
+            nonlocal takilma
+            while not bitti:
+                once = time.perf_counter()
+                await asyncio.sleep(0.001)
+                takilma = max(takilma, time.perf_counter() - once - 0.001)
+
+        sira = iter(range(giris_sayisi))
+
+        async def isci():
+            for _ in sira:
+                assert await dogrula("dogru-parola", ozet)
+
+        gozcu = asyncio.create_task(nabiz())
+        baslangic = time.perf_counter()
+        await asyncio.gather(*(isci() for _ in range(esz_zamanli)))
+        sure = time.perf_counter() - baslangic
+        bitti = True
+        await gozcu
+        return giris_sayisi / sure, takilma * 1000
+
+    async def dongude(parola, ozet_):
+        return parola_dogrula_senkron(parola, ozet_)
+
+    dongude_hiz, dongude_takilma = await olc(dongude)
+    havuzda_hiz, havuzda_takilma = await olc(parola_dogrula)
+    return {
+        "bcrypt_tur": tur,
+        "giris_dongude_per_sn": dongude_hiz,
+        "giris_dongude_en_uzun_takilma_ms": dongude_takilma,
+        "giris_havuzda_per_sn": havuzda_hiz,
+        "giris_havuzda_en_uzun_takilma_ms": havuzda_takilma,
+        "bcrypt_isci": _bcrypt_havuzu._max_workers,
+    }
+
+
+def kiyasla(istek_sayisi=20_000, kullanici_sayisi=1_000, giris_sayisi=64, esz_zamanli=32, tur=BCRYPT_TUR):
+    """İstek başına JWT doğrulama maliyetini ve eşzamanlı giriş hızını ölçer."""
+    sonuc = {}
+    sonuc.update(_dogrulama_kiyasi("HS256", secrets.token_urlsafe(32), istek_sayisi, kullanici_sayisi))
+    # RS256 imza doğrulaması HS256'dan çok daha pahalı; istek sayısını azaltıyoruz
+    sonuc.update(_dogrulama_kiyasi("RS256", _rsa_anahtari(), istek_sayisi // 10, kullanici_sayisi // 10))
+    sonuc.update(asyncio.run(_giris_kiyasi(giris_sayisi, esz_zamanli, tur)))
+    return sonuc
+
+
+if __name__ == "__main__":
+    sonuc = kiyasla()
+    print("--- Kimlik Doğrulama Kıyaslaması ---")
+    for ad, deger in sonuc.items():
+        print(f"  {ad:<36}: {deger:.2f}" if isinstance(deger, float) else f"  {ad:<36}: {deger}")
@@ -0,0 +1,517 @@
+"""
+Modül 14: Video Depolama - Parçalı, Devam Ettirilebilir Yükleme
+
+Ders videoları yüzlerce MB'tır. Dosyayı belleğe alıp tek istekle göndermek hem
+belleği hem de (bağlantı koptuğunda) tüm emeği harcar. Bu modül videoyu
+parçalar hâlinde akıtır:
+
+- Kaynak (`read(n)` yöntemi olan her nesne: dosya, Starlette `UploadFile`, ya da
+  `AkisOkuyucu` ile sarılmış bir istek gövdesi) `parca_boyutu`'luk parçalarla okunur.
+  Aynı anda en fazla `eszamanli` parça yoldadır; bellek dosya boyutundan bağımsızdır.
+- Her parçanın SHA-256 özeti yerelde hesaplanır ve arka ucun bildirdiği özetle
+  karşılaştırılır; tutmayan ya da hata veren parça üstel beklemeyle yeniden denenir.
+- Yükleme yarıda kalırsa `YuklemeHatasi.yukleme_id` ile aynı kaynak yeniden
+  verilir: arka uçta özeti doğrulanmış parçalar tekrar gönderilmez.
+- Tüm dosyanın özeti okuma sırasında biriktirilir; birleştirilen dosyanın özeti tutmazsa yükleme başarısızdır.
+
+İki arka uç aynı arayüzü sunar:
+`YerelDepolamaArkaUcu` (dosya sistemi; ağ olmadan test ve kıyaslama için, yapay
+gecikme ve bant genişliği verilebilir) ve `BunnyStreamArkaUcu` (Bunny Stream'in
+TUS uç noktası; TUS parçaları sırayla kabul ettiği için orada `eszamanli=1`).
+
+Veritabanı oturumu bayt aktarımı sürerken AÇIK TUTULMAZ: açık bir oturum bir
+havuz bağlantısını dakikalarca meşgul ederdi. Uç nokta kitabı kısa bir oturumla
+kontrol eder, yüklemeyi oturumsuz yapar, `video_url`'yi yeni kısa bir oturumla yazar.
+
+Ayarlar: `DEPOLAMA` (`yerel` | `bunny`), `DEPOLAMA_KLASORU`, `BUNNY_STREAM_LIBRARY_ID`,
+`BUNNY_STREAM_API_KEY`, `YUKLEME_PARCA_MB` (8), `YUKLEME_ESZAMANLI` (4).
+Kıyaslama için: `python -m backend.core.storage`
+"""
+
+import asyncio
+import base64
+import hashlib
+import json
+import os
+import re
+import shutil
+import tempfile
+import time
+import uuid
+from pathlib import Path
+from urllib.parse import urljoin
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+MB = 1024 * 1024
+VARSAYILAN_PARCA = int(os.getenv("YUKLEME_PARCA_MB", "8")) * MB
+VARSAYILAN_ESZAMANLI = int(os.getenv("YUKLEME_ESZAMANLI", "4"))
+
+
+class YuklemeHatasi(Exception):
+    """Yükleme tamamlanamadı. `yukleme_id` verilirse aynı yükleme kaldığı yerden sürdürülebilir."""
+
+    def __init__(self, mesaj, yukleme_id=None):
+        super().__init__(mesaj)
+        self.yukleme_id = yukleme_id
+
+
+class AkisOkuyucu:
+    """Rastgele boyutlu parçalar veren bir async iteratörü `read(n)` arayüzüne çevirir.
+
+    Örn. `AkisOkuyucu(request.stream())`: istek gövdesi diske ya da belleğe
+    toplanmadan doğrudan yükleme hattına akar.
+    """
+
+    def __init__(self, akis):
+        self._akis = akis.__aiter__()
+        self._tampon = bytearray()
+        self._bitti = False
+
+    async def read(self, n):
+        while len(self._tampon) < n and not self._bitti:
+            try:
+                self._tampon += await self._akis.__anext__()
+            except StopAsyncIteration:
+                self._bitti = True
+        veri = bytes(self._tampon[:n])
+        del self._tampon[:n]
+        return veri
+
+
+class _DosyaOkuyucu:
+    """Yerel dosyayı olay döngüsünü bekletmeden `read(n)` ile okur."""
+
+    def __init__(self, yol):
+        self._dosya = open(yol, "rb")
+
+    async def read(self, n):
+        return await asyncio.to_thread(self._dosya.read, n)
+
+    def close(self):
+        self._dosya.close()
+
+
+def _sha256(veri):
+    return hashlib.sha256(veri).hexdigest()
+
+
+# --- Arka Uçlar ---
+
+class YerelDepolamaArkaUcu:
+    """Dosya sistemi arka ucu.
+
+    Parçalar `kok/.yuklemeler/<id>/` altında `<no>-<sha256>.parca` adıyla durur;
+    önce geçici adla yazılıp sonra yeniden adlandırıldıkları için yarım yazılmış
+    bir parça hiçbir zaman "yüklendi" görünmez. `tamamla` parçaları sırayla birleştirir,
+    özeti doğrular ve dosyayı `kok/<anahtar>` yoluna atomik olarak taşır.
+
+    Args:
+        kok: Dosyaların yazılacağı klasör.
+        taban_url: Dönen adreslerin öneki.
+        gecikme: Her parça isteğine eklenecek yapay gecikme (saniye).
+        bant_genisligi: Yapay bağlantı hızı (bayt/sn); None ise sınırsız.
+    """
+
+    sirali = False
+
+    def __init__(self, kok, taban_url="/medya", gecikme=0.0, bant_genisligi=None):
+        self.kok = Path(kok)
+        self.taban_url = taban_url.rstrip("/")
+        self.gecikme = gecikme
+        self.bant_genisligi = bant_genisligi
+        (self.kok / ".yuklemeler").mkdir(parents=True, exist_ok=True)
+
+    def _klasor(self, yukleme_id):
+        # Kimlik istemciden de gelebilir (sürdürme): klasör dışına çıkan bir yol olmasın
+        if not re.fullmatch(r"[0-9a-f]{32}", yukleme_id):
+            raise YuklemeHatasi(f"Geçersiz yükleme kimliği: {yukleme_id!r}")
+        return self.kok / ".yuklemeler" / yukleme_id
+
+    async def baslat(self, anahtar, boyut):
+        if self.kok.resolve() not in (self.kok / anahtar).resolve().parents:
+            raise ValueError(f"Anahtar depolama klasörünün dışını gösteriyor: {anahtar!r}")
+        yukleme_id = uuid.uuid4().hex
+        klasor = self._klasor(yukleme_id)
+        klasor.mkdir()
+        (klasor / "bilgi.json").write_text(json.dumps({"anahtar": anahtar, "boyut": boyut}))
+        return yukleme_id
+
+    async def parca_yukle(self, yukleme_id, no, konum, veri):
+        if self.gecikme or self.bant_genisligi:
+            await asyncio.sleep(self.gecikme + (len(veri) / self.bant_genisligi if self.bant_genisligi else 0))
+        return await asyncio.to_thread(self._parca_yaz, self._klasor(yukleme_id), no, veri)
+
+    @staticmethod
+    def _parca_yaz(klasor, no, veri):
+        ozet = _sha256(veri)  # Sunucu tarafı özeti: diske yazılan bayta göre
+        gecici = klasor / f"{no:06d}.yaziliyor"
+        gecici.write_bytes(veri)
+        for eski in klasor.glob(f"{no:06d}-*.parca"):
+            eski.unlink()
+        gecici.replace(klasor / f"{no:06d}-{ozet}.parca")
+        return ozet
+
+    async def yuklenen_parcalar(self, yukleme_id, parca_boyutu):
+        klasor = self._klasor(yukleme_id)
+        if not klasor.is_dir():
+            raise YuklemeHatasi(f"Bilinmeyen yükleme: {yukleme_id}")
+        parcalar = {}
+        for yol in klasor.glob("*.parca"):
+            no, ozet = yol.stem.split("-")
+            parcalar[int(no)] = ozet
+        return parcalar
+
+    async def tamamla(self, yukleme_id, parca_sayisi, boyut, sha256):
+        anahtar = await asyncio.to_thread(self._birlestir, yukleme_id, parca_sayisi, boyut, sha256)
+        return f"{self.taban_url}/{anahtar}"
+
+    def _birlestir(self, yukleme_id, parca_sayisi, boyut, sha256):
+        klasor = self._klasor(yukleme_id)
+        anahtar = json.loads((klasor / "bilgi.json").read_text())["anahtar"]
+        hedef = self.kok / anahtar
+        hedef.parent.mkdir(parents=True, exist_ok=True)
+        ozet, yazilan = hashlib.sha256(), 0
+        gecici = hedef.with_name(hedef.name + ".birlesiyor")
+        with open(gecici, "wb") as cikti:
+            for no in range(parca_sayisi):
+                yollar = list(klasor.glob(f"{no:06d}-*.parca"))
+                if not yollar:
+                    raise YuklemeHatasi(f"{no}. parça eksik", yukleme_id)
+                with open(yollar[0], "rb") as parca:
+                    while blok := parca.read(MB):
+                        ozet.update(blok)
+                        yazilan += len(blok)
+                        cikti.write(blok)
+        if yazilan != boyut or ozet.hexdigest() != sha256:
+            gecici.unlink()
+            raise YuklemeHatasi("Birleştirilen dosyanın boyutu/özeti tutmuyor", yukleme_id)
+        gecici.replace(hedef)
+        shutil.rmtree(klasor)
+        return anahtar
+
+    async def iptal(self, yukleme_id):
+        await asyncio.to_thread(shutil.rmtree, self._klasor(yukleme_id), True)
+
+    async def sil(self, url):
+        """Tamamlanmış bir yüklemenin dosyasını siler."""
+        yol = (self.kok / url.removeprefix(self.taban_url + "/")).resolve()
+        if self.kok.resolve() in yol.parents:
+            await asyncio.to_thread(yol.unlink, True)
+
+
+class BunnyStreamArkaUcu:
+    """Bunny Stream arka ucu: video kaydı API ile açılır, baytlar TUS ile gönderilir.
+
+    TUS bir yüklemeyi tek bir bayt akışı olarak görür ve `Upload-Offset`'e göre
+    sırayla ekler; bu yüzden parçalar paralel gönderilemez (`sirali = True`).
+    Sunucu TUS `checksum` eklentisini duyuruyorsa her parça SHA-1 özetiyle
+    gönderilir ve sunucuda doğrulanır; aksi halde doğrulama bayt sayısıyla sınırlıdır.
+
+    Args:
+        kutuphane_id, api_anahtari: Bunny Stream kütüphanesinin kimliği ve API anahtarı.
+        istemci: Paylaşılacak bir `httpx.AsyncClient` (testlerde sahte bir taşıyıcıyla).
+        imza_suresi: TUS imzasının geçerlilik süresi (saniye).
+    """
+
+    sirali = True
+    API = "https://video.bunnycdn.com"
+
+    def __init__(self, kutuphane_id, api_anahtari, istemci=None, imza_suresi=24 * 3600):
+        import httpx  # Sadece Bunny kullanılacaksa yüklensin
+
+        self.kutuphane_id = str(kutuphane_id)
+        self.api_anahtari = api_anahtari
+        self.imza_suresi = imza_suresi
+        self._istemci = istemci or httpx.AsyncClient(base_url=self.API, timeout=httpx.Timeout(60.0, connect=10.0))
+        self._checksum = None  # İlk yüklemede OPTIONS ile öğrenilir
+
+    def _coz(self, yukleme_id):
+        video_id, _, adres = yukleme_id.partition(" ")
+        # Kimlik istemciden de gelebilir: API anahtarı başka bir adrese gönderilmesin
+        if not adres.startswith(f"{self.API}/tusupload/") or not re.fullmatch(r"[0-9a-f-]{36}", video_id):
+            raise YuklemeHatasi(f"Geçersiz yükleme kimliği: {yukleme_id!r}")
+        return video_id, adres
+
+    def _tus_basliklari(self, **ekler):
+        return {"Tus-Resumable": "1.0.0", **ekler}
+
+    async def baslat(self, anahtar, boyut):
+        yanit = await self._istemci.post(
+            f"/library/{self.kutuphane_id}/videos", json={"title": anahtar}, headers={"AccessKey": self.api_anahtari}
+        )
+        yanit.raise_for_status()
+        video_id = yanit.json()["guid"]
+
+        bitis = int(time.time()) + self.imza_suresi
+        imza = _sha256(f"{self.kutuphane_id}{self.api_anahtari}{bitis}{video_id}".encode())
+        baslik = base64.b64encode(anahtar.encode()).decode()
+        yanit = await self._istemci.post("/tusupload", headers=self._tus_basliklari(**{
+            "AuthorizationSignature": imza,
+            "AuthorizationExpire": str(bitis),
+            "VideoId": video_id,
+            "LibraryId": self.kutuphane_id,
+            "Upload-Length": str(boyut),
+            "Upload-Metadata": f"filetype {base64.b64encode(b'video/mp4').decode()},title {baslik}",
+        }))
+        yanit.raise_for_status()
+        if self._checksum is None:
+            secenekler = await self._istemci.options("/tusupload", headers=self._tus_basliklari())
+            self._checksum = "checksum" in secenekler.headers.get("Tus-Extension", "")
+        # Yükleme kimliği hem videoyu hem TUS adresini taşır: sürdürmek için ikisi de gerekir
+        return f"{video_id} {urljoin(self.API + '/tusupload/', yanit.headers['Location'])}"
+
+    async def parca_yukle(self, yukleme_id, no, konum, veri):
+        _, adres = self._coz(yukleme_id)
+        basliklar = self._tus_basliklari(**{
+            "Upload-Offset": str(konum), "Content-Type": "application/offset+octet-stream"
+        })
+        if self._checksum:
+            basliklar["Upload-Checksum"] = "sha1 " + base64.b64encode(hashlib.sha1(veri).digest()).decode()
+        yanit = await self._istemci.patch(adres, content=veri, headers=basliklar)
+        yanit.raise_for_status()
+        if int(yanit.headers["Upload-Offset"]) != konum + len(veri):
+            raise YuklemeHatasi(f"{no}. parçadan sonra beklenmeyen konum: {yanit.headers['Upload-Offset']}")
+        return _sha256(veri)  # Sunucu özeti bildirmez; bayt sayısı ve (varsa) checksum doğrulandı
+
+    async def _konum(self, adres):
+        yanit = await self._istemci.head(adres, headers=self._tus_basliklari())
+        yanit.raise_for_status()
+        return int(yanit.headers["Upload-Offset"])
+
+    async def yuklenen_parcalar(self, yukleme_id, parca_boyutu):
+        _, adres = self._coz(yukleme_id)
+        # Sunucudaki baytlar TUS'un kendi doğrulamasından geçti; tam parçalar özetsiz kabul edilir
+        return dict.fromkeys(range(await self._konum(adres) // parca_boyutu))
+
+    async def tamamla(self, yukleme_id, parca_sayisi, boyut, sha256):
+        video_id, adres = self._coz(yukleme_id)
+        if await self._konum(adres) != boyut:
+            raise YuklemeHatasi("Sunucudaki bayt sayısı dosya boyutuyla tutmuyor", yukleme_id)
+        return f"https://iframe.mediadelivery.net/embed/{self.kutuphane_id}/{video_id}"
+
+    async def iptal(self, yukleme_id):
+        await self._video_sil(self._coz(yukleme_id)[0])
+
+    async def sil(self, url):
+        """Tamamlanmış bir yüklemenin videosunu siler (`tamamla`'nın döndürdüğü adresten)."""
+        await self._video_sil(url.rstrip("/").rsplit("/", 1)[-1])
+
+    async def _video_sil(self, video_id):
+        yanit = await self._istemci.delete(
+            f"/library/{self.kutuphane_id}/videos/{video_id}", headers={"AccessKey": self.api_anahtari}
+        )
+        yanit.raise_for_status()
+
+
+def depolama_olustur():
+    """`DEPOLAMA=bunny` ise Bunny Stream, değilse yerel klasör arka ucunu kurar."""
+    if os.getenv("DEPOLAMA", "yerel") == "bunny":
+        return BunnyStreamArkaUcu(os.environ["BUNNY_STREAM_LIBRARY_ID"], os.environ["BUNNY_STREAM_API_KEY"])
+    return YerelDepolamaArkaUcu(os.getenv("DEPOLAMA_KLASORU", "./medya"))
+
+
+_depolama = None
+
+
+async def get_depolama():
+    """FastAPI bağımlılığı: süreç başına tek depolama arka ucu."""
+    global _depolama
+    if _depolama is None:
+        _depolama = depolama_olustur()
+    return _depolama
+
+
+# --- Yükleme Hattı ---
+
+class YuklemeSonucu:
+    __slots__ = ("url", "yukleme_id", "boyut", "sha256", "parca_sayisi", "gonderilen_parca", "sure_sn")
+
+    def __init__(self, **alanlar):
+        for ad, deger in alanlar.items():
+            setattr(self, ad, deger)
+
+    def sozluk(self):
+        return {ad: getattr(self, ad) for ad in self.__slots__}
+
+
+async def parcali_yukle(
+    arka_uc,
+    kaynak,
+    anahtar,
+    boyut,
+    yukleme_id=None,
+    parca_boyutu=VARSAYILAN_PARCA,
+    eszamanli=VARSAYILAN_ESZAMANLI,
+    deneme=3,
+    ilerleme=None,
+):
+    """`kaynak`'ı `arka_uc`'a parça parça yükler ve `YuklemeSonucu` döndürür.
+
+    Args:
+        kaynak: `async read(n)` yöntemi olan bir nesne ya da yerel dosya yolu.
+        anahtar: Hedefteki dosya adı / video başlığı.
+        boyut: Toplam bayt; parça sayısı ve sonda boyut doğrulaması için gerekir.
+        yukleme_id: Yarıda kalmış bir yüklemeyi sürdürmek için önceki kimlik.
+        eszamanli: Aynı anda yolda olabilecek en fazla parça; bellek ~ eszamanli x parca_boyutu.
+        deneme: Bir parçanın en fazla gönderilme sayısı.
+        ilerleme: Her parça bittiğinde `ilerleme(gonderilen_bayt, boyut)` çağrılır.
+
+    Raises:
+        YuklemeHatasi: Yükleme bitmedi; `yukleme_id` ile yeniden çağrılabilir.
+    """
+    if isinstance(kaynak, (str, Path)):
+        okuyucu = _DosyaOkuyucu(kaynak)
+        try:
+            return await parcali_yukle(
+                arka_uc, okuyucu, anahtar, boyut, yukleme_id, parca_boyutu, eszamanli, deneme, ilerleme
+            )
+        finally:
+            okuyucu.close()
+
+    baslangic = time.perf_counter()
+    if arka_uc.sirali:
+        eszamanli = 1
+    if yukleme_id is None:
+        yukleme_id = await arka_uc.baslat(anahtar, boyut)
+        onceki = {}
+    else:
+        onceki = await arka_uc.yuklenen_parcalar(yukleme_id, parca_boyutu)
+
+    parca_sayisi = max(1, -(-boyut // parca_boyutu))
+    bos_yer = asyncio.Semaphore(eszamanli)
+    gorevler = set()
+    gonderilen_parca = 0
+    biten_bayt = 0
+    hata = None
+
+    async def gonder(no, konum, veri, ozet):
+        nonlocal gonderilen_parca, biten_bayt, hata
+        try:
+            for i in range(deneme):
+                try:
+                    if await arka_uc.parca_yukle(yukleme_id, no, konum, veri) == ozet:
+                        break
+                except YuklemeHatasi:
+                    raise
+                except Exception:
+                    if i == deneme - 1:
+                        raise
+                else:
+                    if i == deneme - 1:
+                        raise YuklemeHatasi(f"{no}. parçanın özeti tutmuyor", yukleme_id)
+                await asyncio.sleep(0.1 * 2**i)  # Üstel bekleme
+            gonderilen_parca += 1
+            biten_bayt += len(veri)
+            if ilerleme is not None:
+                ilerleme(biten_bayt, boyut)
+        except Exception as e:
+            hata = hata or e
+        finally:
+            bos_yer.release()
+
+    tum_ozet = hashlib.sha256()
+    okunan = 0
+    try:
+        for no in range(parca_sayisi):
+            await bos_yer.acquire()  # Yolda `eszamanli` parça varsa yenisini okuma bile
+            if hata is not None:
+                bos_yer.release()
+                break
+            beklenen = min(parca_boyutu, boyut - okunan)
+            try:
+                veri = await kaynak.read(beklenen)
+            except BaseException:
+                bos_yer.release()
+                raise
+            if len(veri) != beklenen:
+                bos_yer.release()
+                raise YuklemeHatasi(f"Kaynak beklenenden kısa: {okunan + len(veri)} / {boyut} bayt")
+            tum_ozet.update(veri)
+            # 8 MB'lık bir özet ~20 ms sürer; hashlib GIL'i bırakır, döngü beklemesin
+            ozet = await asyncio.to_thread(_sha256, veri)
+            konum, okunan = okunan, okunan + len(veri)
+            if no in onceki and onceki[no] in (None, ozet):
+                biten_bayt += len(veri)  # Önceki denemede yüklenmiş ve doğrulanmış
+                bos_yer.release()
+                continue
+            gorev = asyncio.create_task(gonder(no, konum, veri, ozet))
+            gorevler.add(gorev)
+            gorev.add_done_callback(gorevler.discard)
+        if hata is None and await kaynak.read(1):
+            raise YuklemeHatasi(f"Kaynak {boyut} bayttan uzun")
+    except asyncio.CancelledError:
+        for gorev in gorevler:
+            gorev.cancel()
+        raise
+    except Exception as e:
+        hata = hata or e
+    finally:
+        # Yoldaki parçaların bitmesini bekle: kaynak koptuysa bile bitenler sürdürmede atlanır
+        if gorevler:
+            await asyncio.gather(*gorevler, return_exceptions=True)
+
+    if hata is not None:
+        if isinstance(hata, YuklemeHatasi):
+            hata.yukleme_id = yukleme_id
+            raise hata
+        raise YuklemeHatasi(f"Yükleme yarıda kaldı: {hata!r}", yukleme_id) from hata
+
+    url = await arka_uc.tamamla(yukleme_id, parca_sayisi, boyut, tum_ozet.hexdigest())
+    return YuklemeSonucu(
+        url=url,
+        yukleme_id=yukleme_id,
+        boyut=boyut,
+        sha256=tum_ozet.hexdigest(),
+        parca_sayisi=parca_sayisi,
+        gonderilen_parca=gonderilen_parca,
+        sure_sn=time.perf_counter() - baslangic,
+    )
+
+
+# --- Kıyaslama ---
+
+def _ornek_dosya(yol, boyut):
+    with open(yol, "wb") as f:
+        for _ in range(boyut // MB):
+            f.write(os.urandom(MB))
+
+
+async def kiyasla(boyut_mb=256, parca_mb=8, bant_mb_sn=100, gecikme=0.02):
+    """Yapay gecikmeli/bant sınırlı yerel arka uca farklı eşzamanlılıklarla yükler.
+
+    Her parça isteği `gecikme` kadar gidiş-dönüş süresi ödediği için tek parçalı
+    sıralı yükleme hattı boş bekler; eşzamanlılık bu bekleyişi örter. Tepe bellek
+    `tracemalloc` ile ölçülür ve dosya boyutuyla değil `eszamanli x parca` ile büyür.
+    """
+    import tracemalloc
+
+    sonuclar = []
+    with tempfile.TemporaryDirectory() as klasor:
+        kaynak = Path(klasor) / "kaynak.bin"
+        _ornek_dosya(kaynak, boyut_mb * MB)
+        for eszamanli in (1, 2, 4, 8):
+            # Bant genişliği parça başınadır: paralel bağlantılar bir ölçüde daha fazla hız alır
+            arka_uc = YerelDepolamaArkaUcu(Path(klasor) / "hedef", gecikme=gecikme, bant_genisligi=bant_mb_sn * MB)
+            tracemalloc.start()
+            sonuc = await parcali_yukle(
+                arka_uc, kaynak, f"video_{eszamanli}.bin", boyut_mb * MB,
+                parca_boyutu=parca_mb * MB, eszamanli=eszamanli,
+            )
+            _, tepe = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            sonuclar.append({
+                "eszamanli": eszamanli,
+                "sure_sn": round(sonuc.sure_sn, 2),
+                "mb_sn": round(boyut_mb / sonuc.sure_sn, 1),
+                "tepe_bellek_mb": round(tepe / MB, 1),
+            })
+    return sonuclar
+
+
+if __name__ == "__main__":
+    print("--- Parçalı Yükleme Kıyaslaması (256 MB, 8 MB parça) ---")
+    for satir in asyncio.run(kiyasla()):
+        print("  " + "  ".join(f"{ad}={deger}" for ad, deger in satir.items()))
@@ -0,0 +1,46 @@
+"""
+Modül 11: FastAPI Uygulaması - Router'ların ve yaşam döngüsünün birleştiği yer.
+
+Çalıştırmak için:
+    uvicorn backend.main:app --reload
+"""
+
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
+from fastapi.staticfiles import StaticFiles
+
+from backend.api.v1 import router as v1_router
+from backend.core.database import engine, prometheus_metni, sema_hazirla, yonlendirici
+from backend.core.ozetler import ozet_uzlastirici
+from backend.core.storage import YerelDepolamaArkaUcu, get_depolama
+from backend.models import Base
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Yerel SQLite'ta tabloları kolaylık olsun diye oluştur (şema değişmediyse atlanır);
+    # PostgreSQL'de şemayı Alembic yönetir.
+    await sema_hazirla(engine, Base.metadata)
+    # Okuma kopyaları (varsa) ilk sağlık kontrolünü geçene kadar okuma almaz
+    await yonlendirici.baslat()
+    # Yerel depolamaya yüklenen videolar `/medya/...` adresinden oynatılabilsin
+    depolama = await get_depolama()
+    if isinstance(depolama, YerelDepolamaArkaUcu):
+        app.mount(depolama.taban_url, StaticFiles(directory=depolama.kok), name="medya")
+    # Okuma özetleri arka planda periyodik olarak kayıtlarla uzlaştırılır
+    await ozet_uzlastirici.baslat()
+    yield
+    await ozet_uzlastirici.durdur()
+    await yonlendirici.durdur()
+    await engine.dispose()
+
+
+app = FastAPI(title="Kitaplık API", version="1.0.0", lifespan=lifespan)
+app.include_router(v1_router)
+
+
+@app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def metrikler():
+    return prometheus_metni() + ozet_uzlastirici.prometheus_metni()
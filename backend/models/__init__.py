@@ -0,0 +1,13 @@
+# Tüm modeller burada içe aktarılır; böylece `Base.metadata` her tabloyu tanır
+# (create_all ve Alembic autogenerate için gereklidir).
+from backend.models.base import Base
+from backend.models.kitap import KitapDB
+from backend.models.kullanici import KullaniciDB
+from backend.models.okuma_kaydi import OkumaKaydiDB
+from backend.models.okuma_ozeti import GunlukOkumaDB, KitapOkumaSayaciDB, YazarOkumaSayaciDB
+from backend.models.yazar import YazarDB
+
+__all__ = [
+    "Base", "GunlukOkumaDB", "KitapDB", "KitapOkumaSayaciDB", "KullaniciDB", "OkumaKaydiDB", "YazarDB",
+    "YazarOkumaSayaciDB",
+]
@@ -0,0 +1,26 @@
+"""
+Modül 4: Tüm ORM Modellerinin Ortak Temeli
+
+Tüm modeller (`YazarDB`, `KitapDB`, `KullaniciDB`, `OkumaKaydiDB`) bu `Base`
+sınıfından türer; böylece hepsi aynı `MetaData` kataloğunda toplanır ve
+Alembic göçleri tek yerden üretilebilir.
+
+İsimlendirme kuralı (naming_convention), indeks ve kısıtlara her veritabanında
+aynı, öngörülebilir isimleri verir. Alembic'in kısıt silip yeniden oluştururken
+isme ihtiyacı olduğu için bu önemlidir.
+"""
+
+from sqlalchemy import MetaData
+from sqlalchemy.orm import DeclarativeBase
+
+ISIMLENDIRME_KURALI = {
+    "ix": "ix_%(column_0_label)s",
+    "uq": "uq_%(table_name)s_%(column_0_name)s",
+    "ck": "ck_%(table_name)s_%(constraint_name)s",
+    "fk": "fk_%(table_name)s_%(column_0_name)s_%(referred_table_name)s",
+    "pk": "pk_%(table_name)s",
+}
+
+
+class Base(DeclarativeBase):
+    metadata = MetaData(naming_convention=ISIMLENDIRME_KURALI)
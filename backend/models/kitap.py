@@ -0,0 +1,31 @@
+"""
+Modül 4: KitapDB - Her kitap bir yazara aittir (many-to-one) ve birçok okuma kaydına sahiptir.
+"""
+
+from typing import TYPE_CHECKING, Optional
+
+from sqlalchemy import ForeignKey, String
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from backend.models.base import Base
+
+if TYPE_CHECKING:
+    from backend.models.okuma_kaydi import OkumaKaydiDB
+    from backend.models.yazar import YazarDB
+
+
+class KitapDB(Base):
+    __tablename__ = "kitaplar"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    baslik: Mapped[str] = mapped_column(String(300))
+    # Yazara göre listeleme en sık yapılan sorgu; yabancı anahtar indekslenir.
+    yazar_id: Mapped[int] = mapped_column(ForeignKey("yazarlar.id", ondelete="CASCADE"), index=True)
+    # Video veritabanında değil depolamada durur (bkz. backend/core/storage.py); burada yalnız adresi.
+    video_url: Mapped[Optional[str]] = mapped_column(String(500), default=None)
+
+    yazar: Mapped["YazarDB"] = relationship(back_populates="kitaplar", lazy="raise")
+    okuma_kayitlari: Mapped[list["OkumaKaydiDB"]] = relationship(back_populates="kitap", lazy="raise", passive_deletes=True)
+
+    def __repr__(self):
+        return f"<KitapDB id={self.id} baslik={self.baslik!r}>"
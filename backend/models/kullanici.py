@@ -0,0 +1,29 @@
+"""
+Modül 4, 8: KullaniciDB - Sisteme giriş yapan ve kitap okuyan kullanıcılar.
+
+Parolanın kendisi ASLA saklanmaz; sadece bcrypt özeti (`parola_hash`) tutulur.
+"""
+
+from typing import TYPE_CHECKING
+
+from sqlalchemy import String
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from backend.models.base import Base
+
+if TYPE_CHECKING:
+    from backend.models.okuma_kaydi import OkumaKaydiDB
+
+
+class KullaniciDB(Base):
+    __tablename__ = "kullanicilar"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    email: Mapped[str] = mapped_column(String(320), unique=True)
+    parola_hash: Mapped[str] = mapped_column(String(200))
+    aktif: Mapped[bool] = mapped_column(default=True)
+
+    okuma_kayitlari: Mapped[list["OkumaKaydiDB"]] = relationship(back_populates="kullanici", lazy="raise", passive_deletes=True)
+
+    def __repr__(self):
+        return f"<KullaniciDB id={self.id} email={self.email!r}>"
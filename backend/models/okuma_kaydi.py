@@ -0,0 +1,39 @@
+"""
+Modül 4, 11: OkumaKaydiDB - Hangi kullanıcının hangi kitabı ne zaman okuduğu.
+
+Kullanıcı ile kitap arasındaki çoktan-çoğa (many-to-many) ilişkiyi, ek bilgi
+(okuma zamanı) taşıyan bir ara tablo olarak modeller.
+"""
+
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING
+
+from sqlalchemy import DateTime, ForeignKey, Index
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from backend.models.base import Base
+
+if TYPE_CHECKING:
+    from backend.models.kitap import KitapDB
+    from backend.models.kullanici import KullaniciDB
+
+
+def _simdi():
+    return datetime.now(timezone.utc)
+
+
+class OkumaKaydiDB(Base):
+    __tablename__ = "okuma_kayitlari"
+    # "Kullanıcının okuma geçmişi, en yeniden eskiye" sorgusu bu indeksle sıralama yapmadan okunur.
+    __table_args__ = (Index("ix_okuma_kayitlari_kullanici_tarih", "kullanici_id", "okuma_tarihi"),)
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    kullanici_id: Mapped[int] = mapped_column(ForeignKey("kullanicilar.id", ondelete="CASCADE"))
+    kitap_id: Mapped[int] = mapped_column(ForeignKey("kitaplar.id", ondelete="CASCADE"), index=True)
+    okuma_tarihi: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=_simdi)
+
+    kullanici: Mapped["KullaniciDB"] = relationship(back_populates="okuma_kayitlari", lazy="raise")
+    kitap: Mapped["KitapDB"] = relationship(back_populates="okuma_kayitlari", lazy="raise")
+
+    def __repr__(self):
+        return f"<OkumaKaydiDB kullanici_id={self.kullanici_id} kitap_id={self.kitap_id}>"
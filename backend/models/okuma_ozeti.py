@@ -0,0 +1,126 @@
+"""
+Modül 15: Okuma Özetleri - Okuma kayıtlarından türetilen (materialized) sayaç tabloları.
+
+"En çok okunan kitaplar", "yazar başına okuma" ve "günlük okuma" ekranlarını her
+istekte `okuma_kayitlari` üzerinde GROUP BY ile hesaplamak, kayıt sayısıyla
+doğrusal büyür. Bu tablolar aynı sonuçları önceden toplanmış olarak tutar:
+
+- `KitapOkumaSayaciDB`: kitap başına okuma sayısı.
+- `YazarOkumaSayaciDB`: yazar başına okuma sayısı.
+- `GunlukOkumaDB`: UTC gün başına okuma sayısı.
+
+Sayaçlar ARTIMLI güncellenir: uygulamanın yazma oturumunda (`YazmaOturumu`; dinleyici
+`backend/core/ozetler.py` içinde bağlanır) bir flush yeni `OkumaKaydiDB` satırları eklediğinde,
+aynı transaction içinde her tablo için tek bir "varsa artır, yoksa ekle" (upsert)
+ifadesi çalışır. Kayıt ve sayaç birlikte commit edilir ya da birlikte geri alınır.
+ORM dışından yapılan yazmalar (toplu `INSERT`), `ON DELETE CASCADE` ile silinen
+kayıtlar ve kitabın yazarının değişmesi sayaçlara yansımaz; bunları
+`backend/core/ozetler.py` içindeki periyodik uzlaştırma düzeltir.
+"""
+
+import logging
+from collections import Counter
+from datetime import date, timezone
+from typing import TYPE_CHECKING
+
+from sqlalchemy import Date, ForeignKey, Index, Integer, bindparam, select
+from sqlalchemy.orm import Mapped, mapped_column
+
+from backend.models.base import Base
+from backend.models.kitap import KitapDB
+from backend.models.okuma_kaydi import OkumaKaydiDB
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Connection
+
+logger = logging.getLogger(__name__)
+
+# `INSERT ... ON CONFLICT DO UPDATE` yapısı olan diyalektler
+UPSERT_DIYALEKTLERI = ("postgresql", "sqlite")
+
+
+class KitapOkumaSayaciDB(Base):
+    __tablename__ = "kitap_okuma_sayaclari"
+    # "En çok okunanlar" bu indeksi tersten okur; sıralama yapılmaz.
+    __table_args__ = (Index("ix_kitap_okuma_sayaclari_sayi", "okuma_sayisi", "kitap_id"),)
+
+    kitap_id: Mapped[int] = mapped_column(ForeignKey("kitaplar.id", ondelete="CASCADE"), primary_key=True)
+    okuma_sayisi: Mapped[int] = mapped_column(default=0)
+
+
+class YazarOkumaSayaciDB(Base):
+    __tablename__ = "yazar_okuma_sayaclari"
+    __table_args__ = (Index("ix_yazar_okuma_sayaclari_sayi", "okuma_sayisi", "yazar_id"),)
+
+    yazar_id: Mapped[int] = mapped_column(ForeignKey("yazarlar.id", ondelete="CASCADE"), primary_key=True)
+    okuma_sayisi: Mapped[int] = mapped_column(default=0)
+
+
+class GunlukOkumaDB(Base):
+    __tablename__ = "gunluk_okumalar"
+
+    gun: Mapped[date] = mapped_column(Date, primary_key=True)
+    okuma_sayisi: Mapped[int] = mapped_column(default=0)
+
+
+# --- Artımlı Güncelleme ---
+
+def upsert_ifadesi(dialect_adi, tablo):
+    """`tablo` için diyalektin `INSERT ... ON CONFLICT` yapısını döndürür (PostgreSQL ve SQLite)."""
+    if dialect_adi == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect_adi == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        raise NotImplementedError(f"Özet tabloları {dialect_adi} için upsert desteklemiyor")
+    return insert(tablo)
+
+
+def artir(ifade, anahtar):
+    """Çakışmada mevcut sayaca eklenecek değeri yazar: `okuma_sayisi = okuma_sayisi + excluded.okuma_sayisi`."""
+    return ifade.on_conflict_do_update(
+        index_elements=[anahtar],
+        set_={"okuma_sayisi": ifade.table.c.okuma_sayisi + ifade.excluded.okuma_sayisi},
+    )
+
+
+def utc_gun(zaman):
+    """Kaydın UTC günü; saat dilimi olmayan değerler zaten UTC kabul edilir (bkz. `_simdi`)."""
+    return zaman.date() if zaman.tzinfo is None else zaman.astimezone(timezone.utc).date()
+
+
+def sayaclari_artir(conn: "Connection", kayitlar):
+    """Verilen okuma kayıtlarını üç sayaç tablosuna, tablo başına TEK ifadeyle ekler."""
+    kitap_basina = Counter(k.kitap_id for k in kayitlar)
+    gun_basina = Counter(utc_gun(k.okuma_tarihi) for k in kayitlar)
+    dialect = conn.dialect.name
+
+    kitap = upsert_ifadesi(dialect, KitapOkumaSayaciDB.__table__)
+    conn.execute(artir(kitap, "kitap_id"), [
+        {"kitap_id": kitap_id, "okuma_sayisi": n} for kitap_id, n in kitap_basina.items()
+    ])
+    gun = upsert_ifadesi(dialect, GunlukOkumaDB.__table__)
+    conn.execute(artir(gun, "gun"), [{"gun": g, "okuma_sayisi": n} for g, n in gun_basina.items()])
+    # Yazar, kitaptan INSERT ... SELECT ile bulunur; ayrıca bir SELECT gidiş-dönüşü yoktur.
+    yazar = upsert_ifadesi(dialect, YazarOkumaSayaciDB.__table__).from_select(
+        ["yazar_id", "okuma_sayisi"],
+        select(KitapDB.yazar_id, bindparam("n", type_=Integer)).where(KitapDB.id == bindparam("kid", type_=Integer)),
+    )
+    conn.execute(artir(yazar, "yazar_id"), [{"kid": kitap_id, "n": n} for kitap_id, n in kitap_basina.items()])
+
+
+def okuma_sayaclarini_guncelle(session, _flush_baglami):
+    """`after_flush` dinleyicisi; yalnızca uygulamanın oturum sınıfına bağlanır (bkz. `backend/core/ozetler.py`).
+
+    Upsert'i olmayan bir diyalektte flush'ı düşürmez; sayaçlar uzlaştırmaya kalır.
+    """
+    # after_flush'ta `session.new` hâlâ flush öncesi hâlindedir; varsayılanlar (okuma_tarihi) doldurulmuştur.
+    yeni = [nesne for nesne in session.new if isinstance(nesne, OkumaKaydiDB)]
+    if not yeni:
+        return
+    conn = session.connection()
+    if conn.dialect.name not in UPSERT_DIYALEKTLERI:
+        logger.warning("%s upsert desteklemiyor; %d okuma kaydı sayaçlara uzlaştırmada yansıyacak",
+                       conn.dialect.name, len(yeni))
+        return
+    sayaclari_artir(conn, yeni)
@@ -0,0 +1,32 @@
+"""
+Modül 4: YazarDB - Bir yazarın birden çok kitabı olabilir (one-to-many).
+
+İlişkiler varsayılan olarak `lazy="raise"` ile tanımlanır: ilişkili veriye
+açıkça yüklenmeden (selectinload / joinedload) erişilirse SQLAlchemy hata
+fırlatır. Böylece N+1 sorgu problemi üretimde değil, testte yakalanır.
+
+Silme işlemi veritabanındaki `ON DELETE CASCADE`'e bırakılır (`passive_deletes=True`);
+SQLAlchemy silmeden önce alt kayıtları tek tek yüklemeye çalışmaz.
+"""
+
+from typing import TYPE_CHECKING
+
+from sqlalchemy import String
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from backend.models.base import Base
+
+if TYPE_CHECKING:
+    from backend.models.kitap import KitapDB
+
+
+class YazarDB(Base):
+    __tablename__ = "yazarlar"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    ad: Mapped[str] = mapped_column(String(200), unique=True)
+
+    kitaplar: Mapped[list["KitapDB"]] = relationship(back_populates="yazar", lazy="raise", passive_deletes=True)
+
+    def __repr__(self):
+        return f"<YazarDB id={self.id} ad={self.ad!r}>"
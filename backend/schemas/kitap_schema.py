@@ -0,0 +1,61 @@
+"""
+Modül 3, 5: Kitap ve Yazar için Pydantic şemaları (API'nin giriş/çıkış sözleşmesi).
+
+`from_attributes=True`, şemanın doğrudan ORM nesnelerinden (`KitapDB`) okunmasını sağlar.
+Çıkış şemalarındaki ilişkili alanlar (ör. `KitapOut.yazar`) ancak uç nokta
+o ilişkiyi AÇIKÇA yüklediyse doldurulabilir; aksi halde `lazy="raise"` hata verir.
+"""
+
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class YazarOzet(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    ad: str
+
+
+class KitapOzet(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    baslik: str
+
+
+class KitapOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    baslik: str
+    yazar: YazarOzet
+    video_url: Optional[str] = None
+
+
+class YazarOut(YazarOzet):
+    kitaplar: list[KitapOzet]
+
+
+class KitapCreate(BaseModel):
+    baslik: str = Field(min_length=1, max_length=300)
+    yazar_id: int
+
+
+class KitapUpdate(BaseModel):
+    baslik: Optional[str] = Field(default=None, min_length=1, max_length=300)
+    yazar_id: Optional[int] = None
+
+
+class YazarCreate(BaseModel):
+    ad: str = Field(min_length=1, max_length=200)
+
+
+class VideoOut(BaseModel):
+    kitap_id: int
+    video_url: str
+    boyut: int
+    sha256: str
+    parca_sayisi: int
+    gonderilen_parca: int  # Sürdürülen yüklemede önceki denemede gönderilenler sayılmaz
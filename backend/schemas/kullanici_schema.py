@@ -0,0 +1,18 @@
+"""
+Modül 8: Kullanıcı şemaları. Parola sadece girişte alınır, ASLA geri döndürülmez.
+"""
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class KullaniciCreate(BaseModel):
+    email: str = Field(min_length=3, max_length=320)
+    parola: str = Field(min_length=8, max_length=128)
+
+
+class KullaniciOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    email: str
+    aktif: bool
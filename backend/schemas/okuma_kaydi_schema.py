@@ -0,0 +1,67 @@
+"""
+Modül 11, 15: Okuma kaydı ve okuma istatistiği şemaları.
+"""
+
+from datetime import date, datetime
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict
+
+from backend.schemas.kitap_schema import KitapOut
+
+
+class OkumaKaydiCreate(BaseModel):
+    kullanici_id: int
+    kitap_id: int
+
+
+class OkumaKaydiOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    kullanici_id: int
+    kitap_id: int
+    okuma_tarihi: datetime
+
+
+class OkumaGecmisiOut(OkumaKaydiOut):
+    """Okuma geçmişi ekranı için: kayıt + kitabı + kitabın yazarı."""
+
+    kitap: KitapOut
+
+
+# --- İstatistikler (özet tablolarından) ---
+
+class KitapOkumaSayisiOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    kitap_id: int
+    baslik: str
+    okuma_sayisi: int
+
+
+class YazarOkumaSayisiOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    yazar_id: int
+    ad: str
+    okuma_sayisi: int
+
+
+class GunlukOkumaOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    gun: date
+    okuma_sayisi: int
+
+
+class OzetDurumuOut(BaseModel):
+    """Özet tablolarının tazeliği: son uzlaştırma ve o turda düzeltilen satırlar."""
+
+    son_uzlasma: Optional[float]
+    uzlasmadan_beri_sn: Optional[float]
+    son_uzlasma_suresi_sn: Optional[float]
+    son_duzeltme: dict[str, int]
+    toplam_duzeltme: int
+    uzlasma_sayisi: int
+    hata: Optional[str]
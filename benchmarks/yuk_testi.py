@@ -0,0 +1,481 @@
+"""
+Yük Testi ve Kıyaslama: CRUD Yollarının Gecikme ve Verim Ölçümü
+
+Ders örneklerindeki işlemleri (ham sqlite3, SQLAlchemy Core ve asenkron
+backend) aynı veri büyüklüğü ve eşzamanlılık düzeyinde çalıştırır; her işlem
+için p50/p95/p99 gecikmeyi ve saniyedeki işlem sayısını JSON olarak raporlar.
+Bir önceki çalıştırmanın JSON çıktısı `--karsilastir` ile verilirse gerileyen
+işlemler listelenir ve komut sıfırdan farklı bir çıkış koduyla biter; böylece
+iki commit arasındaki performans farkı CI'da yakalanabilir.
+
+Katmanlar ve işlemler:
+- `ham`: `kitaplari_getir_tehlikeli`'nin parametreli (güvenli) karşılığı ve tek satır ekleme,
+  `baglanti_havuzu.BaglantiHavuzu` üzerinden.
+- `core`: `tum_kitaplari_goster`, `yazara_gore_kitap_bul`, `yeni_kitap_ekle`,
+  `kitap_guncelle`, `kitap_sil`; `kitap_sorgulari.KitapSorgulari` üzerinden.
+- `async`: `backend` modelleri ve `motor_olustur()` ile AsyncSession üzerinden
+  sayfa okuma, id ile okuma ve ekleme.
+
+Üç katman da aynı SQLite ayarlarıyla (`VARSAYILAN_PRAGMALAR`: WAL, synchronous=NORMAL,
+...) çalışır; katmanlar arasındaki fark yapılandırmadan değil katmanın kendisinden gelir.
+
+Her veri büyüklüğü için veritabanı dosyası bir kez üretilir ve `--klasor`
+içinde saklanır; sonraki çalıştırmalar aynı dosyayı kullanır (`--yeniden-kur`
+ile zorla yeniden üretilir). Silme işlemleri yalnızca aynı çalıştırmada
+eklenen kitapları siler, böylece tablo boyutu çalıştırmalar arasında sabit kalır.
+
+Kullanım (depo kökünden):
+    python -m benchmarks.yuk_testi --satir 1k 100k --eszamanlilik 1 8 --cikti sonuc.json
+    python -m benchmarks.yuk_testi --satir 1k --karsilastir onceki.json --tolerans 0.2
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import platform
+import random
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import sqlalchemy as sa
+
+KOK = Path(__file__).resolve().parent.parent
+# Ders yardımcıları bir paket değildir; örnek dosyalar gibi kardeş modül olarak içe aktarılır.
+sys.path.insert(0, str(KOK / "modul_01_orm_felsefesi"))
+sys.path.insert(0, str(KOK))
+
+from baglanti_havuzu import BaglantiHavuzu, pragmalari_bagla  # noqa: E402
+from kitap_sorgulari import KitapSorgulari  # noqa: E402
+from toplu_aktarim import sqlite_ice_aktar  # noqa: E402
+
+KATMANLAR = ("ham", "core", "async")
+YAZAR_BASINA_KITAP = 100
+# `tum_kitaplari_goster` tüm tabloyu belleğe okur; bu sınırın üstünde tek bir çağrı
+# dakikalar sürer ve yüzdelikler anlamsızlaşır, bu yüzden işlem atlanır.
+TUMU_SINIRI = 100_000
+YUZDELIKLER = (50, 95, 99)
+
+
+# --- Yardımcılar ---
+
+def satir_sayisi_oku(metin):
+    """`1k`, `250K`, `10M` veya `5000` biçimindeki satır sayısını tamsayıya çevirir."""
+    metin = metin.strip().lower().replace("_", "")
+    carpan = {"k": 1_000, "m": 1_000_000}.get(metin[-1:], 1)
+    sayi = int(float(metin[:-1] if carpan > 1 else metin) * carpan)
+    if not 1_000 <= sayi <= 10_000_000:
+        raise argparse.ArgumentTypeError(f"satır sayısı 1k ile 10M arasında olmalı: {metin}")
+    return sayi
+
+
+def yuzdelik(sirali, oran):
+    """Sıralı bir listede en yakın sıra (nearest-rank) yöntemiyle yüzdeliği döndürür."""
+    if not sirali:
+        return None
+    sira = max(0, math.ceil(oran / 100 * len(sirali)) - 1)
+    return sirali[sira]
+
+
+def ozetle(gecikmeler, hata, sure):
+    """Saniye cinsinden gecikmelerden rapor satırını üretir."""
+    sirali = sorted(gecikmeler)
+    ozet = {
+        "istek": len(sirali),
+        "hata": hata,
+        "sure_sn": round(sure, 4),
+        "islem_per_sn": round(len(sirali) / sure, 2) if sure else 0.0,
+        "ortalama_ms": round(sum(sirali) / len(sirali) * 1000, 4) if sirali else None,
+    }
+    for oran in YUZDELIKLER:
+        deger = yuzdelik(sirali, oran)
+        ozet[f"p{oran}_ms"] = round(deger * 1000, 4) if deger is not None else None
+    return ozet
+
+
+def git_surumu():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=KOK, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+# --- Veri Hazırlığı ---
+
+def _kitap_satirlari(satir_sayisi):
+    yazar_sayisi = max(1, satir_sayisi // YAZAR_BASINA_KITAP)
+    return ((f"Kitap {i}", f"Yazar {i % yazar_sayisi}") for i in range(1, satir_sayisi + 1))
+
+
+def veritabani_hazirla(klasor, satir_sayisi, yeniden_kur=False):
+    """Ham ve Core katmanlarının kullandığı `kitaplar(id, baslik, yazar)` dosyasını üretir."""
+    yol = Path(klasor) / f"yuk_testi_core_{satir_sayisi}.db"
+    if yol.exists() and not yeniden_kur:
+        return yol
+    for ek in ("", "-wal", "-shm"):
+        Path(f"{yol}{ek}").unlink(missing_ok=True)
+    conn = sqlite3.connect(yol)
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("CREATE TABLE kitaplar (id INTEGER PRIMARY KEY, baslik TEXT NOT NULL, yazar TEXT NOT NULL)")
+    sqlite_ice_aktar(conn, _kitap_satirlari(satir_sayisi), parti_boyutu=50_000, pragmalari_gevset=True)
+    conn.close()
+    return yol
+
+
+def backend_veritabani_hazirla(klasor, satir_sayisi, yeniden_kur=False):
+    """Backend şemasını (`backend.models`) oluşturur ve yazar/kitap tablolarını doldurur."""
+    from backend.models import Base
+
+    yol = Path(klasor) / f"yuk_testi_backend_{satir_sayisi}.db"
+    if yol.exists() and not yeniden_kur:
+        return yol
+    for ek in ("", "-wal", "-shm"):
+        Path(f"{yol}{ek}").unlink(missing_ok=True)
+    motor = sa.create_engine(f"sqlite:///{yol}")
+    Base.metadata.create_all(motor)
+    motor.dispose()
+
+    yazar_sayisi = max(1, satir_sayisi // YAZAR_BASINA_KITAP)
+    conn = sqlite3.connect(yol)
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.executemany("INSERT INTO yazarlar (id, ad) VALUES (?, ?)",
+                     ((i, f"Yazar {i}") for i in range(1, yazar_sayisi + 1)))
+    conn.commit()
+    # `toplu_aktarim` yalnızca ders şemasını bilir; backend tablosu aynı partileme ile doldurulur.
+    satirlar = ((f"Kitap {i}", i % yazar_sayisi + 1) for i in range(1, satir_sayisi + 1))
+    while parti := [s for _, s in zip(range(50_000), satirlar)]:
+        conn.executemany("INSERT INTO kitaplar (baslik, yazar_id) VALUES (?, ?)", parti)
+    conn.commit()
+    conn.close()
+    return yol
+
+
+# --- Senkron İşçiler ---
+
+def senkron_calistir(islem, eszamanlilik, sure):
+    """`islem(rastgele)` çağrısını `eszamanlilik` thread ile `sure` saniye boyunca tekrarlar.
+
+    `islem` False döndürürse (ör. silinecek kitap kalmadı) o thread durur.
+    """
+    gecikmeler, hatalar = [], [0]
+    kilit = threading.Lock()
+    bitis = time.perf_counter() + sure
+
+    def isci(tohum):
+        rastgele = random.Random(tohum)
+        yerel = []
+        hata = 0
+        while time.perf_counter() < bitis:
+            baslangic = time.perf_counter()
+            try:
+                devam = islem(rastgele)
+            except Exception:
+                hata += 1
+                continue
+            if devam is False:
+                break
+            yerel.append(time.perf_counter() - baslangic)
+        with kilit:
+            gecikmeler.extend(yerel)
+            hatalar[0] += hata
+
+    threadler = [threading.Thread(target=isci, args=(i,)) for i in range(eszamanlilik)]
+    baslangic = time.perf_counter()
+    for t in threadler:
+        t.start()
+    for t in threadler:
+        t.join()
+    return ozetle(gecikmeler, hatalar[0], time.perf_counter() - baslangic)
+
+
+def ham_islemleri(db_yolu, satir_sayisi, eszamanlilik):
+    """Ham sqlite3 işlemleri; `kitaplari_getir_tehlikeli`'nin parametreli karşılığını ölçer."""
+    havuz = BaglantiHavuzu(str(db_yolu), boyut=eszamanlilik)
+    yazar_sayisi = max(1, satir_sayisi // YAZAR_BASINA_KITAP)
+
+    def yazara_gore(rastgele):
+        with havuz.baglanti() as conn:
+            conn.execute(
+                "SELECT id, baslik, yazar FROM kitaplar WHERE yazar = ?",
+                (f"Yazar {rastgele.randrange(yazar_sayisi)}",),
+            ).fetchall()
+
+    def ekle(rastgele):
+        with havuz.baglanti() as conn:
+            conn.execute("INSERT INTO kitaplar (baslik, yazar) VALUES (?, ?)",
+                          (f"Yük Testi {rastgele.random()}", "Yük Testi"))
+            conn.commit()
+
+    islemler = {"ham_yazara_gore": yazara_gore, "ham_ekle": ekle}
+
+    def temizle():
+        with havuz.baglanti() as conn:
+            conn.execute("DELETE FROM kitaplar WHERE yazar = 'Yük Testi'")
+            conn.commit()
+        havuz.kapat()
+
+    return islemler, temizle
+
+
+def core_islemleri(db_yolu, satir_sayisi, eszamanlilik):
+    """`2_sqlalchemy_core_ornek.py`'deki fonksiyonların yaptığı işi, yazdırma olmadan ölçer."""
+    engine = sa.create_engine(f"sqlite:///{db_yolu}", pool_size=eszamanlilik, max_overflow=0,
+                              connect_args={"timeout": 5})
+    # Ham ve async katmanlarla aynı PRAGMA'lar; yoksa Core synchronous=FULL ile ölçülür
+    pragmalari_bagla(engine)
+    tablo = sa.Table(
+        "kitaplar", sa.MetaData(),
+        sa.Column("id", sa.Integer, primary_key=True),
+        sa.Column("baslik", sa.String, nullable=False),
+        sa.Column("yazar", sa.String, nullable=False),
+    )
+    sorgular = KitapSorgulari(tablo)
+    yazar_sayisi = max(1, satir_sayisi // YAZAR_BASINA_KITAP)
+    eklenenler = []  # `kitap_sil` yalnızca bu çalıştırmada eklenen başlıkları siler
+    kilit = threading.Lock()
+
+    def tumu(_rastgele):
+        with engine.connect() as conn:
+            sorgular.tumunu_getir(conn)
+
+    def yazara_gore(rastgele):
+        with engine.connect() as conn:
+            sorgular.yazara_gore_bul(conn, f"Yazar {rastgele.randrange(yazar_sayisi)}")
+
+    def ekle(rastgele):
+        baslik = f"Yük Testi {rastgele.random()}"
+        with engine.connect() as conn:
+            sorgular.ekle(conn, baslik, "Yük Testi")
+            conn.commit()
+        with kilit:
+            eklenenler.append(baslik)
+
+    def guncelle(rastgele):
+        # Başlığı kendisiyle değiştirir; tablo içeriği çalıştırmalar arasında sabit kalır.
+        baslik = f"Kitap {rastgele.randrange(1, satir_sayisi + 1)}"
+        with engine.connect() as conn:
+            sorgular.guncelle(conn, baslik, baslik)
+            conn.commit()
+
+    def sil(_rastgele):
+        with kilit:
+            if not eklenenler:
+                return False
+            baslik = eklenenler.pop()
+        with engine.connect() as conn:
+            sorgular.sil(conn, baslik)
+            conn.commit()
+
+    islemler = {
+        "core_yazara_gore": yazara_gore,
+        "core_ekle": ekle,
+        "core_guncelle": guncelle,
+        "core_sil": sil,
+    }
+    if satir_sayisi <= TUMU_SINIRI:
+        islemler = {"core_tumu": tumu, **islemler}
+
+    def temizle():
+        with engine.begin() as conn:
+            conn.execute(sa.delete(tablo).where(tablo.c.yazar == "Yük Testi"))
+        engine.dispose()
+
+    return islemler, temizle
+
+
+# --- Asenkron İşçiler ---
+
+async def _asenkron_calistir(islem, eszamanlilik, sure):
+    gecikmeler, hata = [], 0
+    bitis = time.perf_counter() + sure
+
+    async def isci(tohum):
+        nonlocal hata
+        rastgele = random.Random(tohum)
+        while time.perf_counter() < bitis:
+            baslangic = time.perf_counter()
+            try:
+                await islem(rastgele)
+            except Exception:
+                hata += 1
+                continue
+            gecikmeler.append(time.perf_counter() - baslangic)
+
+    baslangic = time.perf_counter()
+    await asyncio.gather(*(isci(i) for i in range(eszamanlilik)))
+    return ozetle(gecikmeler, hata, time.perf_counter() - baslangic)
+
+
+async def _asenkron_olc(db_yolu, satir_sayisi, eszamanlilik, sure, secilenler):
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+    from sqlalchemy.orm import joinedload
+
+    from backend.core.database import motor_olustur
+    from backend.models import KitapDB
+
+    motor = motor_olustur(f"sqlite+aiosqlite:///{db_yolu}", pool_size=eszamanlilik, max_overflow=0)
+    oturumlar = async_sessionmaker(motor, class_=AsyncSession, expire_on_commit=False)
+    yazar_sayisi = max(1, satir_sayisi // YAZAR_BASINA_KITAP)
+
+    async def sayfa(rastgele):
+        # GET /api/v1/kitaplar ile aynı sorgu: keyset sayfalama + joinedload(yazar)
+        async with oturumlar() as session:
+            stmt = (
+                sa.select(KitapDB).options(joinedload(KitapDB.yazar))
+                .where(KitapDB.id > rastgele.randrange(satir_sayisi))
+                .order_by(KitapDB.id).limit(50)
+            )
+            (await session.scalars(stmt)).all()
+
+    async def getir(rastgele):
+        async with oturumlar() as session:
+            await session.get(KitapDB, rastgele.randrange(1, satir_sayisi + 1), options=[joinedload(KitapDB.yazar)])
+
+    async def ekle(rastgele):
+        async with oturumlar() as session:
+            session.add(KitapDB(baslik=f"Yük Testi {rastgele.random()}", yazar_id=rastgele.randrange(yazar_sayisi) + 1))
+            await session.commit()
+
+    islemler = {"async_sayfa": sayfa, "async_getir": getir, "async_ekle": ekle}
+    sonuclar = {}
+    try:
+        for ad, islem in islemler.items():
+            if secilenler and ad not in secilenler:
+                continue
+            sonuclar[ad] = await _asenkron_calistir(islem, eszamanlilik, sure)
+        async with motor.begin() as conn:
+            await conn.execute(sa.delete(KitapDB).where(KitapDB.baslik.like("Yük Testi %")))
+    finally:
+        await motor.dispose()
+    return sonuclar
+
+
+# --- Ana Akış ---
+
+def calistir(satirlar, eszamanliliklar, katmanlar=KATMANLAR, secilenler=None, sure=2.0, klasor=None,
+             yeniden_kur=False, ilerleme=print):
+    """Tüm büyüklük × eşzamanlılık × işlem kombinasyonlarını ölçer ve JSON'a uygun bir sözlük döndürür."""
+    klasor = Path(klasor or Path(tempfile.gettempdir()) / "kitaplik_yuk_testi")
+    klasor.mkdir(parents=True, exist_ok=True)
+    sonuclar = []
+
+    def ekle(katman, ad, satir_sayisi, eszamanlilik, ozet):
+        sonuclar.append({"katman": katman, "islem": ad, "satir": satir_sayisi, "eszamanlilik": eszamanlilik, **ozet})
+        if ilerleme:
+            ilerleme(f"  {ad:<18} satır={satir_sayisi:>10,} eşz={eszamanlilik:>3}  "
+                     f"{ozet['islem_per_sn']:>10,.0f} işlem/sn  p50={ozet['p50_ms']} p95={ozet['p95_ms']} "
+                     f"p99={ozet['p99_ms']} ms  hata={ozet['hata']}")
+
+    for satir_sayisi in satirlar:
+        if ilerleme:
+            ilerleme(f"--- {satir_sayisi:,} satır ---")
+        if {"ham", "core"} & set(katmanlar):
+            db_yolu = veritabani_hazirla(klasor, satir_sayisi, yeniden_kur)
+        if "async" in katmanlar:
+            backend_yolu = backend_veritabani_hazirla(klasor, satir_sayisi, yeniden_kur)
+
+        for eszamanlilik in eszamanliliklar:
+            for katman, kurucu in (("ham", ham_islemleri), ("core", core_islemleri)):
+                if katman not in katmanlar:
+                    continue
+                islemler, temizle = kurucu(db_yolu, satir_sayisi, eszamanlilik)
+                try:
+                    for ad, islem in islemler.items():
+                        if secilenler and ad not in secilenler:
+                            continue
+                        ekle(katman, ad, satir_sayisi, eszamanlilik, senkron_calistir(islem, eszamanlilik, sure))
+                finally:
+                    temizle()
+            if "async" in katmanlar:
+                olcumler = asyncio.run(_asenkron_olc(backend_yolu, satir_sayisi, eszamanlilik, sure, secilenler))
+                for ad, ozet in olcumler.items():
+                    ekle("async", ad, satir_sayisi, eszamanlilik, ozet)
+
+    return {
+        "ortam": {
+            "commit": git_surumu(),
+            "tarih": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "sqlalchemy": sa.__version__,
+            "sqlite": sqlite3.sqlite_version,
+            "platform": platform.platform(),
+            "cpu_sayisi": os.cpu_count(),
+            "sure_sn": sure,
+        },
+        "sonuclar": sonuclar,
+    }
+
+
+def karsilastir(onceki, simdiki, tolerans=0.2, olcut="p95_ms"):
+    """İki rapordaki ortak ölçümleri karşılaştırır; `olcut` oranı toleransı aşanları döndürür.
+
+    Gecikme ölçütlerinde artış, `islem_per_sn`'de düşüş gerileme sayılır.
+    """
+    def anahtar(s):
+        return s["katman"], s["islem"], s["satir"], s["eszamanlilik"]
+
+    eskiler = {anahtar(s): s for s in onceki["sonuclar"]}
+    gerilemeler = []
+    for yeni in simdiki["sonuclar"]:
+        eski = eskiler.get(anahtar(yeni))
+        if not eski or not eski.get(olcut) or yeni.get(olcut) is None:
+            continue
+        oran = yeni[olcut] / eski[olcut]
+        kotu = oran < 1 - tolerans if olcut == "islem_per_sn" else oran > 1 + tolerans
+        if kotu:
+            gerilemeler.append({
+                "katman": yeni["katman"], "islem": yeni["islem"], "satir": yeni["satir"],
+                "eszamanlilik": yeni["eszamanlilik"], "olcut": olcut,
+                "onceki": eski[olcut], "simdiki": yeni[olcut], "oran": round(oran, 3),
+            })
+    return gerilemeler
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Kitaplık CRUD yollarının gecikme/verim kıyaslaması.")
+    parser.add_argument("--satir", nargs="+", type=satir_sayisi_oku, default=[1_000, 100_000],
+                        help="Tablo büyüklükleri (1k-10M; ör. 1k 100k 1M)")
+    parser.add_argument("--eszamanlilik", nargs="+", type=int, default=[1, 8],
+                        help="Eşzamanlı thread/görev sayıları")
+    parser.add_argument("--katman", nargs="+", choices=KATMANLAR, default=list(KATMANLAR))
+    parser.add_argument("--islem", nargs="+", help="Yalnızca bu işlemleri çalıştır (ör. core_ekle async_getir)")
+    parser.add_argument("--sure", type=float, default=2.0, help="Her ölçümün süresi (saniye)")
+    parser.add_argument("--klasor", help="Veritabanı dosyalarının saklanacağı klasör")
+    parser.add_argument("--yeniden-kur", action="store_true", help="Veritabanı dosyalarını yeniden üret")
+    parser.add_argument("--cikti", help="JSON raporunun yazılacağı dosya (verilmezse stdout)")
+    parser.add_argument("--karsilastir", help="Önceki bir çalıştırmanın JSON raporu")
+    parser.add_argument("--tolerans", type=float, default=0.2, help="Gerileme sayılacak oran (0.2 = %%20)")
+    parser.add_argument("--olcut", default="p95_ms", choices=["p50_ms", "p95_ms", "p99_ms", "islem_per_sn"])
+    args = parser.parse_args()
+
+    rapor = calistir(
+        args.satir, args.eszamanlilik, katmanlar=args.katman, secilenler=args.islem, sure=args.sure,
+        klasor=args.klasor, yeniden_kur=args.yeniden_kur, ilerleme=lambda m: print(m, file=sys.stderr),
+    )
+
+    cikis_kodu = 0
+    if args.karsilastir:
+        with open(args.karsilastir, encoding="utf-8") as f:
+            gerilemeler = karsilastir(json.load(f), rapor, args.tolerans, args.olcut)
+        rapor["gerilemeler"] = gerilemeler
+        for g in gerilemeler:
+            print(f"⚠️ GERİLEME {g['islem']} satır={g['satir']:,} eşz={g['eszamanlilik']}: "
+                  f"{g['olcut']} {g['onceki']} -> {g['simdiki']} (x{g['oran']})", file=sys.stderr)
+        cikis_kodu = 1 if gerilemeler else 0
+
+    metin = json.dumps(rapor, ensure_ascii=False, indent=2)
+    if args.cikti:
+        with open(args.cikti, "w", encoding="utf-8") as f:
+            f.write(metin + "\n")
+    else:
+        print(metin)
+    sys.exit(cikis_kodu)
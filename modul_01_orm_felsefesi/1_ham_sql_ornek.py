@@ -11,10 +11,15 @@ gerçek dünyada kullanılan sofistike SQL Injection saldırılarını gösterir
 """
 
 import sqlite3
-import os
+
+from baglanti_havuzu import havuz_al, veritabani_dosyasini_sil
+from kitap_sonuclari import KitapSonuclari
 
 DB_DOSYASI = "kitaplik_ileri_tehlike.db"
 
+# Tüm sorgular her seferinde yeni bağlantı açmak yerine ortak havuzu kullanır.
+havuz = havuz_al(DB_DOSYASI, row_factory=sqlite3.Row)
+
 
 # --- Yardımcı Fonksiyonlar ---
 def duraklat(mesaj=""):
@@ -23,17 +28,16 @@ def duraklat(mesaj=""):
 
 # --- Veritabanı Fonksiyonları ---
 def tablo_olustur():
-    if os.path.exists(DB_DOSYASI): os.remove(DB_DOSYASI)
-    conn = sqlite3.connect(DB_DOSYASI)
-    cursor = conn.cursor()
-    cursor.execute("CREATE TABLE kitaplar (id INTEGER PRIMARY KEY, baslik TEXT, yazar TEXT)")
-    kitaplar = [('Sefiller', 'Victor Hugo'), ('1984', 'George Orwell')]
-    cursor.executemany("INSERT INTO kitaplar (baslik, yazar) VALUES (?, ?)", kitaplar)
-    cursor.execute("CREATE TABLE kullanicilar (id INTEGER PRIMARY KEY, email TEXT, parola_hash TEXT)")
-    kullanicilar = [('admin@site.com', 'cok_gizli_sifre_hash_123'), ('user@site.com', 'baska_gizli_sifre_456')]
-    cursor.executemany("INSERT INTO kullanicilar (email, parola_hash) VALUES (?, ?)", kullanicilar)
-    conn.commit()
-    conn.close()
+    veritabani_dosyasini_sil(DB_DOSYASI)
+    with havuz.baglanti() as conn:
+        cursor = conn.cursor()
+        cursor.execute("CREATE TABLE kitaplar (id INTEGER PRIMARY KEY, baslik TEXT, yazar TEXT)")
+        kitaplar = [('Sefiller', 'Victor Hugo'), ('1984', 'George Orwell')]
+        cursor.executemany("INSERT INTO kitaplar (baslik, yazar) VALUES (?, ?)", kitaplar)
+        cursor.execute("CREATE TABLE kullanicilar (id INTEGER PRIMARY KEY, email TEXT, parola_hash TEXT)")
+        kullanicilar = [('admin@site.com', 'cok_gizli_sifre_hash_123'), ('user@site.com', 'baska_gizli_sifre_456')]
+        cursor.executemany("INSERT INTO kullanicilar (email, parola_hash) VALUES (?, ?)", kullanicilar)
+        conn.commit()
     print("✅ Veritabanı, 'kitaplar' ve GİZLİ 'kullanicilar' tablolarıyla oluşturuldu.")
 
 
@@ -41,27 +45,27 @@ def tablo_olustur():
 
 # ❌ TEHLİKELİ: SQL Injection açığı var!
 def kitaplari_getir_tehlikeli(yazar_adi: str):
-    conn = sqlite3.connect(DB_DOSYASI)
-    conn.row_factory = sqlite3.Row
-    cursor = conn.cursor()
-    query = f"SELECT id, baslik, yazar FROM kitaplar WHERE yazar = '{yazar_adi}'"
-    print(f"\n executing DANGEROUS query: {query}\n")
-    try:
-        cursor.execute(query)
-        rows = cursor.fetchall()
-        print("--- Uygulamanın Kullanıcıya Gösterdiği Sonuç ---")
-        if not rows:
-            print("Hiçbir şey bulunamadı.")
-        else:
-            for row in rows:
-                print(f"Başlık: {row['baslik']}, Yazar: {row['yazar']}")
-        print("-------------------------------------------")
-        return len(rows) > 0  # Sonuç döndü mü dönmedi mi bilgisini geri verelim
-    except Exception as e:
-        print(f"❌ Sorgu çalıştırılırken bir HATA MESAJI oluştu: {e}")
-        return False  # Hata durumunda sonuç yok
-    finally:
-        conn.close()
+    # Havuz, sorgunun güvenliğini DEĞİŞTİRMEZ; sadece bağlantı açma maliyetini ortadan kaldırır.
+    with havuz.baglanti() as conn:
+        cursor = conn.cursor()
+        query = f"SELECT id, baslik, yazar FROM kitaplar WHERE yazar = '{yazar_adi}'"
+        print(f"\n executing DANGEROUS query: {query}\n")
+        # Sütunlu kap satır nesnesine ihtiyaç duymaz; bu imleç düz tuple döndürsün.
+        cursor.row_factory = None
+        try:
+            cursor.execute(query)
+            # Sonuç `sqlite3.Row` listesi yerine sütunlar hâlinde tutulur (bkz. kitap_sonuclari.py)
+            kitaplar = KitapSonuclari.sorgudan(cursor)
+            print("--- Uygulamanın Kullanıcıya Gösterdiği Sonuç ---")
+            if not kitaplar:
+                print("Hiçbir şey bulunamadı.")
+            else:
+                kitaplar.yazdir(sablon="Başlık: {1}, Yazar: {2}")
+            print("-------------------------------------------")
+            return bool(kitaplar)  # Sonuç döndü mü dönmedi mi bilgisini geri verelim
+        except Exception as e:
+            print(f"❌ Sorgu çalıştırılırken bir HATA MESAJI oluştu: {e}")
+            return False  # Hata durumunda sonuç yok
 
 
 if __name__ == "__main__":
@@ -6,65 +6,78 @@ Bu uygulama, ham SQL kullanımının risklerini interaktif bir arayüzde göster
 ne kadar yıkıcı olabileceğini kendi gözleriyle görecekler.
 """
 
-import flet as ft
 import sqlite3
-import os
+
+from baglanti_havuzu import havuz_al, veritabani_dosyasini_sil
+from baslangic_olcumu import isaretle
+from degisiklik_takibi import degisiklik_imzasi
+from sayfalama import SqliteSayfaKaynagi
+from sorgu_olcumu import SorguOlcer
+
+# `flet` (içe aktarılması saniyeye yakın sürer) sayfa açılırken yüklenir.
 
 DB_DOSYASI = "kitaplik_flet_deney.db"
+# Tablo yapısı değiştiğinde artırılır; `PRAGMA user_version` bununla karşılaştırılır.
+SEMA_SURUMU = 1
+
+# Havuzdaki bağlantıların çalıştırdığı her ifade ölçülür. SQLite'ın trace callback'i
+# `executescript` içindeki ifadeleri de tek tek bildirir; böylece bir saldırı metninin
+# aslında hangi komutları (ör. `DROP TABLE`) çalıştırdığı ölçüm panelinde görünür.
+olcer = SorguOlcer()
+# Her buton tıklamasında yeni bağlantı açmak yerine ortak havuzu kullanıyoruz.
+havuz = havuz_al(DB_DOSYASI, olcer=olcer)
+# Liste, tablonun tamamı yerine `id > son_id` ile sayfa sayfa okunur.
+kitap_kaynagi = SqliteSayfaKaynagi(havuz)
 
 
 # --- Veritabanı Fonksiyonları ---
 
 def tablo_olustur_ve_sifirla():
     """Veritabanını sıfırlar ve test verileriyle doldurur."""
-    if os.path.exists(DB_DOSYASI):
-        os.remove(DB_DOSYASI)
-
-    conn = sqlite3.connect(DB_DOSYASI)
-    cursor = conn.cursor()
-    cursor.execute("""
-        CREATE TABLE kitaplar (
-            id INTEGER PRIMARY KEY,
-            baslik TEXT NOT NULL,
-            yazar TEXT NOT NULL
-        )
-    """)
-    kitaplar = [
-        ('Sefiller', 'Victor Hugo'),
-        ('Savaş ve Barış', 'Leo Tolstoy'),
-        ('Suç ve Ceza', 'Fyodor Dostoyevski'),
-        ('1984', 'George Orwell')
-    ]
-    cursor.executemany("INSERT INTO kitaplar (baslik, yazar) VALUES (?, ?)", kitaplar)
-    conn.commit()
-    conn.close()
-
-
-def tum_kitaplari_getir():
-    """Veritabanındaki tüm kitapları bir Flet kontrolleri listesi olarak döndürür."""
-    controls = []
-    try:
-        conn = sqlite3.connect(DB_DOSYASI)
+    veritabani_dosyasini_sil(DB_DOSYASI)
+
+    with havuz.baglanti() as conn:
         cursor = conn.cursor()
-        cursor.execute("SELECT id, baslik, yazar FROM kitaplar ORDER BY id")
-        rows = cursor.fetchall()
+        cursor.execute("""
+            CREATE TABLE kitaplar (
+                id INTEGER PRIMARY KEY,
+                baslik TEXT NOT NULL,
+                yazar TEXT NOT NULL
+            )
+        """)
+        kitaplar = [
+            ('Sefiller', 'Victor Hugo'),
+            ('Savaş ve Barış', 'Leo Tolstoy'),
+            ('Suç ve Ceza', 'Fyodor Dostoyevski'),
+            ('1984', 'George Orwell')
+        ]
+        cursor.executemany("INSERT INTO kitaplar (baslik, yazar) VALUES (?, ?)", kitaplar)
+        cursor.execute(f"PRAGMA user_version = {SEMA_SURUMU}")
+        conn.commit()
 
-        if not rows:
-            controls.append(ft.Text("Tabloda hiç kitap yok. Muhtemelen silindi!", color=ft.Colors.RED))
-        else:
-            for row in rows:
-                controls.append(ft.Text(f"ID: {row[0]}, Başlık: {row[1]}, Yazar: {row[2]}"))
-        conn.close()
-    except sqlite3.OperationalError:
-        controls.append(
-            ft.Text("❌ HATA: 'kitaplar' tablosu bulunamadı!", color=ft.Colors.RED, weight=ft.FontWeight.BOLD))
 
-    return controls
+def tablo_hazirla():
+    """Tablo yoksa ya da şema sürümü eskiyse veritabanını kurar; kurduysa True döner.
+
+    Bir saldırı tabloyu silmiş olabilir (`DROP TABLE`); bu yüzden sürümün yanında
+    tablonun varlığına da bakılır. İkisi de tutuyorsa veri olduğu gibi bırakılır.
+    """
+    with havuz.baglanti() as conn:
+        surum = conn.execute("PRAGMA user_version").fetchone()[0]
+        tablo = conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'kitaplar'").fetchone()
+    if surum == SEMA_SURUMU and tablo:
+        return False
+    tablo_olustur_ve_sifirla()
+    return True
 
 
 # --- Flet Uygulaması ---
 
-def main(page: ft.Page):
+def main(page: "ft.Page"):
+    import flet as ft
+
+    from flet_bilesenleri import SayfaliKitapListesi, SorguOlcumPaneli
+
     page.title = "SQL Injection Deney Laboratuvarı"
     page.scroll = ft.ScrollMode.ADAPTIVE
 
@@ -72,7 +85,14 @@ def main(page: ft.Page):
 
     arama_input = ft.TextField(label="Aranacak Yazar Adı veya Saldırı Metni", width=500)
     sonuc_text = ft.Text("Sorgu sonucu burada görünecek...", italic=True,color=ft.Colors.GREEN_900)
-    mevcut_durum_listesi = ft.Column(controls=tum_kitaplari_getir())
+    # Tablo silinirse (ör. DROP TABLE saldırısı) sqlite3.OperationalError listede hata olarak gösterilir.
+    mevcut_durum_listesi = SayfaliKitapListesi(
+        kitap_kaynagi,
+        hata_turleri=(sqlite3.OperationalError,),
+        bos_mesaj="Tabloda hiç kitap yok. Muhtemelen silindi!",
+        height=300,
+    )
+    olcum_paneli = SorguOlcumPaneli(olcer, ilk=20)
 
     # --- Sorgu Fonksiyonları ---
 
@@ -81,24 +101,28 @@ def main(page: ft.Page):
         if not yazar_adi:
             return
 
-        conn = sqlite3.connect(DB_DOSYASI)
-        cursor = conn.cursor()
         query = f"SELECT * FROM kitaplar WHERE yazar = '{yazar_adi}'"
 
-        try:
-            # `executescript` birden çok komuta izin verdiği için saldırılar için idealdir.
-            cursor.executescript(query)
-            # Eğer sorgu bir SELECT ise, fetchall ile sonuç alınır (sınırlı senaryo)
-            # Genellikle saldırgan SELECT sonucunu umursamaz.
-            sonuc_text.value = "Tehlikeli sorgu çalıştırıldı. Veritabanı durumu aşağıda."
-        except Exception as err:
-            sonuc_text.value = f"Tehlikeli sorguda hata: {err}"
-
-        conn.commit()
-        conn.close()
-
-        # Her işlemden sonra veritabanının son durumunu göster
-        mevcut_durum_listesi.controls = tum_kitaplari_getir()
+        with havuz.baglanti() as conn:
+            once = degisiklik_imzasi(conn)
+            cursor = conn.cursor()
+            try:
+                # `executescript` birden çok komuta izin verdiği için saldırılar için idealdir.
+                cursor.executescript(query)
+                # Eğer sorgu bir SELECT ise, fetchall ile sonuç alınır (sınırlı senaryo)
+                # Genellikle saldırgan SELECT sonucunu umursamaz.
+                sonuc_text.value = "Tehlikeli sorgu çalıştırıldı. Veritabanı durumu aşağıda."
+            except Exception as err:
+                sonuc_text.value = f"Tehlikeli sorguda hata: {err}"
+
+            conn.commit()
+            veritabani_degisti = degisiklik_imzasi(conn) != once
+
+        # Saldırı veriyi veya şemayı değiştirdiyse veritabanının son durumunu göster.
+        # Hangi satırların değiştiğini bilemeyiz; ama hiçbir şey değişmediyse yenilemeyi atlarız.
+        if veritabani_degisti:
+            mevcut_durum_listesi.yenile()
+        olcum_paneli.yenile()
         page.update()
 
     def arama_yap_guvenli(e):
@@ -106,31 +130,30 @@ def main(page: ft.Page):
         if not yazar_adi:
             return
 
-        conn = sqlite3.connect(DB_DOSYASI)
-        cursor = conn.cursor()
         query = "SELECT * FROM kitaplar WHERE yazar = ?"
 
-        try:
-            cursor.execute(query, (yazar_adi,))
-            rows = cursor.fetchall()
-            if not rows:
-                sonuc_text.value = "Güvenli sorgu sonuç bulamadı."
-            else:
-                sonuclar = "\n".join([f"{row[1]} by {row[2]}" for row in rows])
-                sonuc_text.value = f"Güvenli sorgu sonucu:\n{sonuclar}"
-        except Exception as err:
-            sonuc_text.value = f"Güvenli sorguda hata: {err}"
-
-        conn.close()
+        with havuz.baglanti() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(query, (yazar_adi,))
+                rows = cursor.fetchall()
+                if not rows:
+                    sonuc_text.value = "Güvenli sorgu sonuç bulamadı."
+                else:
+                    sonuclar = "\n".join([f"{row[1]} by {row[2]}" for row in rows])
+                    sonuc_text.value = f"Güvenli sorgu sonucu:\n{sonuclar}"
+            except Exception as err:
+                sonuc_text.value = f"Güvenli sorguda hata: {err}"
 
         # Güvenli sorgu veritabanını DEĞİŞTİREMEZ, bu yüzden
-        # durumu yenilemeye gerek yok, ama tutarlılık için yapabiliriz.
-        mevcut_durum_listesi.controls = tum_kitaplari_getir()
+        # listeyi yeniden sorgulamaya gerek yok.
+        olcum_paneli.yenile()
         page.update()
 
     def veritabani_sifirla(e):
         tablo_olustur_ve_sifirla()
-        mevcut_durum_listesi.controls = tum_kitaplari_getir()
+        mevcut_durum_listesi.yenile()
+        olcum_paneli.yenile()
         sonuc_text.value = "Veritabanı başlangıç durumuna sıfırlandı."
         page.update()
 
@@ -178,17 +201,27 @@ def main(page: ft.Page):
                 ft.IconButton(icon=ft.Icons.REFRESH, on_click=veritabani_sifirla, tooltip="Veritabanını Sıfırla")
             ]),
             ft.Container(
-                content=mevcut_durum_listesi,
+                content=mevcut_durum_listesi.view,
                 border=ft.Border.all(1, ft.Colors.GREY_300),
                 padding=10,
                 border_radius=5
             ),
+            ft.Divider(),
+            olcum_paneli.view,
         ])
     )
 
-    # Uygulama ilk açıldığında veritabanını hazırla
-    veritabani_sifirla(None)
+    # Uygulama ilk açıldığında veritabanını hazırla. Şema zaten kuruluysa sıfırlanmaz;
+    # saldırılardan sonra başlangıç durumuna dönmek için yenile butonu kullanılır.
+    tablo_hazirla()
+    mevcut_durum_listesi.yenile()
+    olcum_paneli.yenile()
+    page.update()
+    isaretle("ilk_sayfa")
 
 
 if __name__ == "__main__":
+    import flet as ft
+
+    isaretle("hazir")
     ft.run(main=main,view=ft.AppView.WEB_BROWSER)
\ No newline at end of file
@@ -10,14 +10,28 @@ Tüm işlemler ve çıktılar bu konsol ekranında görünecektir.
 
 import sqlalchemy as sa
 
+from baglanti_havuzu import pragmalari_bagla
+from indeks_danismani import IndeksDanismani
+from kitap_arama import KitapArama
+from kitap_sorgulari import kitap_sorgulari
+from sorgu_olcumu import SorguOlcer
+
 # --- Adım 1: Temelleri Kurmak ---
 
 # 1.1: Veritabanı Motorunu (Engine) Oluşturma
 # Basitlik için dosya tabanlı bir SQLite veritabanı kullanacağız.
-# echo=True, SQLAlchemy'nin arka planda oluşturduğu TÜM SQL sorgularını
-# konsola yazdırmasını sağlar. Bu, ne olup bittiğini görmek için harika bir yoldur!
-# ⚠️ NOT: Ders dışı yazacağınız tüm kodlarda BUNU KAPATIN! Yani echo=False yapın. Güvenlik ve performans için.
-engine = sa.create_engine("sqlite:///kitaplik_core.db", echo=True)
+# `echo=True` SQLAlchemy'nin ürettiği TÜM SQL'i parametreleriyle birlikte senkron
+# olarak konsola yazdırır; ders dışında hem güvenlik hem performans için kapatılmalıdır.
+# Bunun yerine motora bir `SorguOlcer` bağlıyoruz: her ifade kalıbının kaç kez
+# çalıştığını ve ne kadar sürdüğünü sessizce toplar, sonda tek bir rapor yazdırır.
+engine = sa.create_engine("sqlite:///kitaplik_core.db")
+# WAL, busy_timeout, synchronous ve mmap_size ayarları tüm örneklerde ortaktır (bkz. baglanti_havuzu.py).
+pragmalari_bagla(engine)
+olcer = SorguOlcer(yavas_esik=0.05)
+olcer.motora_bagla(engine)
+# İndeks danışmanı da aynı ifadeleri gözler; sonda hangi sorgunun tabloyu taradığını söyler.
+danisman = IndeksDanismani(engine)
+danisman.motora_bagla()
 
 # 1.2: MetaData Objesini Oluşturma
 # MetaData, veritabanımızdaki tüm tabloların bir kataloğu gibidir.
@@ -35,6 +49,8 @@ kitaplar_tablosu = sa.Table(
 
 
 # --- Adım 2: Veritabanı Operasyonları İçin Fonksiyonlar ---
+# Aşağıdaki fonksiyonlar ifadeleri her çağrıda yeniden kurmaz; `kitap_sorgulari`
+# tablo için bir kez `sa.bindparam` ile hazırlanmış ifadeleri verir.
 
 def veritabani_kurulum(engine, metadata, kitaplar_tablosu):
     """Tabloyu oluşturur ve içine başlangıç verilerini ekler."""
@@ -57,6 +73,8 @@ def veritabani_kurulum(engine, metadata, kitaplar_tablosu):
         # Değişiklikleri kalıcı hale getir
         # ⚠️ SQLAlchemy Core'da (INSERT/UPDATE/DELETE) için commit() ZORUNLUDUR.
         conn.commit()
+    # Tam metin arama indeksi ve onu güncel tutan tetikleyiciler (bkz. kitap_arama.py)
+    KitapArama(engine).kur()
     print("--- VERİTABANI KURULUMU TAMAMLANDI ---\n")
 
 
@@ -64,10 +82,10 @@ def tum_kitaplari_goster(engine, kitaplar_tablosu):
     """Tablodaki tüm kitapları listeler."""
     print("\n--- Tüm Kitaplar Listeleniyor ---")
     with engine.connect() as conn:
-        stmt = sa.select(kitaplar_tablosu)
-        result = conn.execute(stmt)
-        for row in result:
-            print(f"ID: {row.id}, Başlık: {row.baslik}, Yazar: {row.yazar}")
+        # Satır başına bir `Row` ve bir `print` yerine sonuç sütunlar hâlinde okunur ve
+        # tek seferde yazdırılır (bkz. kitap_sonuclari.py); büyük tablolarda belleği ~3 kat azaltır.
+        kitaplar = kitap_sorgulari(kitaplar_tablosu).tumunu_sutunlu_getir(conn)
+    kitaplar.yazdir()
 
 
 def yazara_gore_kitap_bul(engine, kitaplar_tablosu, yazar_adi):
@@ -75,11 +93,9 @@ def yazara_gore_kitap_bul(engine, kitaplar_tablosu, yazar_adi):
     print(f"\n--- Yazar '{yazar_adi}' için Kitaplar Aranıyor (Güvenli Yöntem) ---")
     with engine.connect() as conn:
         # DİKKAT: Burada f-string KULLANMIYORUZ!
-        # SQLAlchemy Core, bu ifadeyi parametreli bir sorguya çevirerek
-        # SQL Injection'ı otomatik olarak engeller.
-        stmt = sa.select(kitaplar_tablosu).where(kitaplar_tablosu.c.yazar == yazar_adi)
-        result = conn.execute(stmt)
-        rows = result.fetchall()
+        # Hazır ifade `WHERE yazar = :yazar` şeklindedir; değer parametre
+        # olarak gönderilir ve SQL Injection otomatik olarak engellenir.
+        rows = kitap_sorgulari(kitaplar_tablosu).yazara_gore_bul(conn, yazar_adi)
         if rows:
             for row in rows:
                 print(f"Bulunan Kitap: {row.baslik}")
@@ -87,41 +103,53 @@ def yazara_gore_kitap_bul(engine, kitaplar_tablosu, yazar_adi):
             print("Bu yazara ait kitap bulunamadı.")
 
 
+def kitap_ara(engine, metin):
+    """Başlıkta veya yazarda geçen kelimelerle (ön ek dahil) kitap arar; en alakalılar önce gelir."""
+    print(f"\n--- '{metin}' için Tam Metin Arama ---")
+    # `LIKE '%metin%'` tüm tabloyu tarardı; burada FTS5 indeksi kullanılır.
+    rows = KitapArama(engine).ara(metin)
+    if rows:
+        for row in rows:
+            print(f"Bulunan Kitap: {row.baslik} ({row.yazar})")
+    else:
+        print("Aramaya uyan kitap bulunamadı.")
+
+
 def yeni_kitap_ekle(engine, kitaplar_tablosu, baslik, yazar):
     """Yeni bir kitap ekler."""
     print(f"\n--- Yeni Kitap Ekleniyor: '{baslik}' ---")
     with engine.connect() as conn:
-        stmt = sa.insert(kitaplar_tablosu).values(baslik=baslik, yazar=yazar)
-        conn.execute(stmt)
+        # `INSERT ... RETURNING`: eklenen satır (yeni id'siyle) aynı ifadeyle geri gelir.
+        row = kitap_sorgulari(kitaplar_tablosu).ekle(conn, baslik, yazar)
         # ⚠️ SQLAlchemy Core'da (INSERT/UPDATE/DELETE) için commit() ZORUNLUDUR.
         conn.commit()
-    print("Ekleme başarılı.")
+    print(f"Ekleme başarılı. Yeni kitabın ID'si: {row.id}")
 
 
 def kitap_guncelle(engine, kitaplar_tablosu, eski_baslik, yeni_baslik):
     """Bir kitabın başlığını günceller."""
     print(f"\n--- Kitap Güncelleniyor: '{eski_baslik}' -> '{yeni_baslik}' ---")
     with engine.connect() as conn:
-        stmt = (
-            sa.update(kitaplar_tablosu)
-            .where(kitaplar_tablosu.c.baslik == eski_baslik)
-            .values(baslik=yeni_baslik)
-        )
-        conn.execute(stmt)
+        # `UPDATE ... RETURNING`: değişen satırları görmek için tabloyu tekrar okumaya gerek yok.
+        rows = kitap_sorgulari(kitaplar_tablosu).guncelle(conn, eski_baslik, yeni_baslik)
         # ⚠️ SQLAlchemy Core'da (INSERT/UPDATE/DELETE) için commit() ZORUNLUDUR.
         conn.commit()
-    print("Güncelleme başarılı.")
+    for row in rows:
+        print(f"Güncellendi -> ID: {row.id}, Başlık: {row.baslik}, Yazar: {row.yazar}")
+    print(f"Güncelleme başarılı ({len(rows)} kitap).")
 
 
 def kitap_sil(engine, kitaplar_tablosu, baslik):
     """Bir kitabı başlığına göre siler."""
     print(f"\n--- Kitap Siliniyor: '{baslik}' ---")
     with engine.connect() as conn:
-        stmt = sa.delete(kitaplar_tablosu).where(kitaplar_tablosu.c.baslik == baslik)
-        conn.execute(stmt)
+        # `DELETE ... RETURNING`: silinen satırlar son kez geri döner.
+        rows = kitap_sorgulari(kitaplar_tablosu).sil(conn, baslik)
         # ⚠️ SQLAlchemy Core'da (INSERT/UPDATE/DELETE) için commit() ZORUNLUDUR.
         conn.commit()
-    print("Silme başarılı.")
+    for row in rows:
+        print(f"Silindi -> ID: {row.id}, Başlık: {row.baslik}, Yazar: {row.yazar}")
+    print(f"Silme başarılı ({len(rows)} kitap).")
 
 
 # --- Adım 3: Operasyonları Sırayla Çalıştırma ---
@@ -140,6 +168,10 @@ if __name__ == "__main__":
     yeni_kitap_ekle(engine, kitaplar_tablosu, "Suç ve Ceza", "Fyodor Dostoyevski")
     tum_kitaplari_goster(engine, kitaplar_tablosu)
 
+    # 4b. Tam metin arama: büyük/küçük harf ve Türkçe karakterden bağımsız, ön ekle
+    kitap_ara(engine, "SUÇ")
+    kitap_ara(engine, "dosto")
+
     # 5. Mevcut bir kaydı güncelle (UPDATE)
     kitap_guncelle(engine, kitaplar_tablosu, "Sefiller", "Les Misérables")
     tum_kitaplari_goster(engine, kitaplar_tablosu)
@@ -153,7 +185,11 @@ if __name__ == "__main__":
     print("=" * 50)
     print("✅ Gördüğünüz gibi, SQL'e çok daha yakın ifadeler kullandık.")
     print("✅ `Table`, `select`, `insert`, `update`, `delete` gibi fonksiyonlarla çalıştık.")
-    print("✅ `echo=True` sayesinde Python kodumuzun hangi SQL'e dönüştüğünü gördük.")
+    print("✅ Sorgu ölçer sayesinde Python kodumuzun hangi SQL'e dönüştüğünü ve ne kadar sürdüğünü gördük:")
+    print(olcer.rapor())
+    print("✅ Bu sorgular büyük bir tabloda tam tarama yapardı; danışmanın önerileri:")
+    print(danisman.rapor())
+    print(f"✅ Hazır ifadelerin derleme önbelleği: {kitap_sorgulari(kitaplar_tablosu).istatistikler()}")
     print("✅ ORM'deki sihirli `kitap.yazar` gibi nesne erişimleri burada yok, her şey daha açık.")
     print("⚠️ Daha fazla kod yazdık. ORM, bu işlemlerin çoğunu bizim için basitleştirir.")
     print("➡️ Şimdi ORM'in bu işlemleri nasıl daha 'Pythonic' hale getirdiğini daha iyi anlayabiliriz.")
\ No newline at end of file
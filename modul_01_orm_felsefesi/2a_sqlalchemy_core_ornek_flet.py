@@ -8,44 +8,120 @@ Amaç: Öğrencilerin, ORM olmadan, SQL benzeri ifadelerle bir arayüzü
 nasıl yöneteceklerini görmelerini sağlamaktır.
 """
 
-import flet as ft
-import sqlalchemy as sa
+import atexit
+import sys
+import threading
+from collections import namedtuple
+
+from baslangic_olcumu import isaretle
+
+# `flet` ve `sqlalchemy` burada içe aktarılmaz: ikisi birlikte saniyeye yakın sürer.
+# SQLAlchemy ilk kullanımda (`kurulum()`), Flet sayfa açılırken yüklenir.
+
+DB_DOSYASI = "kitaplik_core_flet.db"
+# Tablo tanımı değiştiğinde artırılır. Veritabanındaki `PRAGMA user_version` buna
+# eşitse ve tablo varsa kurulum atlanır; `--sifirla` ile her durumda baştan kurulur.
+SEMA_SURUMU = 1
+SIFIRLA = "--sifirla" in sys.argv
+
+Kurulum = namedtuple("Kurulum", ["engine", "olcer", "kitaplar_tablosu", "kitap_yazici"])
+
+_kurulum = None
+_kurulum_kilidi = threading.Lock()
+
 
 # --- Adım 1: Temelleri Kurmak ---
 
-# Veritabanı motoru (echo=True ile SQL logları terminalde görünecek)
-engine = sa.create_engine("sqlite:///kitaplik_core_flet.db", echo=True)
-metadata = sa.MetaData()
+def kurulum():
+    """Motoru, tabloyu ve yazma kuyruğunu İLK KULLANIMDA bir kez kurar.
+
+    Aynı anda açılan sayfalar (ya da arka planda başlatılan ön ısıtma) aynı
+    kurulumu paylaşır; kilit, motorun iki kez oluşturulmasını önler.
+    """
+    global _kurulum
+    with _kurulum_kilidi:
+        if _kurulum is None:
+            _kurulum = _kur()
+        return _kurulum
+
+
+def _kur():
+    import sqlalchemy as sa
+
+    from baglanti_havuzu import pragmalari_bagla
+    from kitap_sorgulari import kitap_sorgulari
+    from sorgu_olcumu import SorguOlcer
+    from yazma_kuyrugu import GRUP, YazmaKuyrugu
+
+    # Veritabanı motoru. SQL'i terminale yazdıran echo=True yerine ifadeler
+    # `SorguOlcer` ile ölçülür ve sayfadaki "Sorgu Ölçümleri" panelinde görünür.
+    engine = sa.create_engine(f"sqlite:///{DB_DOSYASI}")
+    # WAL sayesinde yazma kuyruğu commit ederken sayfaların okumaları beklemez.
+    pragmalari_bagla(engine)
+    olcer = SorguOlcer()
+    olcer.motora_bagla(engine)
+    metadata = sa.MetaData()
+
+    # Tablo tanımı
+    kitaplar_tablosu = sa.Table(
+        'kitaplar',
+        metadata,
+        sa.Column('id', sa.Integer, primary_key=True),
+        sa.Column('baslik', sa.String, nullable=False),
+        sa.Column('yazar', sa.String, nullable=False)
+    )
+    veritabani_kurulum(engine, kitaplar_tablosu, sifirla=SIFIRLA)
 
-# Tablo tanımı
-kitaplar_tablosu = sa.Table(
-    'kitaplar',
-    metadata,
-    sa.Column('id', sa.Integer, primary_key=True),
-    sa.Column('baslik', sa.String, nullable=False),
-    sa.Column('yazar', sa.String, nullable=False)
-)
+    # Yazma işlemleri bu kuyruk üzerinden yapılır. Tüm oturumların tıklamaları toplanır
+    # ve en fazla 10 ms içinde TEK transaction'da commit edilir (her tıklama için ayrı fsync yok).
+    # Her işlem commit'ten sonra etkilenen satırı bir olay olarak yayınlar ve açık olan
+    # TÜM oturumların listeleri sadece o satırı günceller.
+    kitap_yazici = YazmaKuyrugu(engine, kitap_sorgulari(kitaplar_tablosu), dayaniklilik=GRUP, aralik_ms=10)
+    # Program kapanırken kuyrukta bekleyen yazmalar kaybolmasın
+    atexit.register(kitap_yazici.kapat)
+    return Kurulum(engine, olcer, kitaplar_tablosu, kitap_yazici)
 
 
-# Flet uygulamasını çalıştırmadan önce veritabanını hazırla
-def veritabani_kurulum():
-    """Tabloyu oluşturur ve içine başlangıç verilerini ekler."""
+def veritabani_kurulum(engine, kitaplar_tablosu, sifirla=False):
+    """Şema güncel değilse tabloyu oluşturur ve içine başlangıç verilerini ekler.
+
+    Her açılışta `drop_all`/`create_all` yapmak yerine önce `PRAGMA user_version`
+    okunur; `SEMA_SURUMU` ile aynıysa ve tablo varsa hiçbir şey yapılmaz.
+    Kurulum yapıldıysa True döner.
+    """
+    import sqlalchemy as sa
+
+    with engine.connect() as conn:
+        surum = conn.exec_driver_sql("PRAGMA user_version").scalar()
+        if not sifirla and surum == SEMA_SURUMU and sa.inspect(conn).has_table(kitaplar_tablosu.name):
+            return False
+
+    metadata = kitaplar_tablosu.metadata
     metadata.drop_all(engine)
     metadata.create_all(engine)
-    with engine.connect() as conn:
+    with engine.begin() as conn:
         stmt = sa.insert(kitaplar_tablosu).values([
             {'baslik': 'Sefiller', 'yazar': 'Victor Hugo'},
             {'baslik': '1984', 'yazar': 'George Orwell'},
             {'baslik': 'Dune', 'yazar': 'Frank Herbert'},
         ])
         conn.execute(stmt)
-        conn.commit()
+        conn.exec_driver_sql(f"PRAGMA user_version = {SEMA_SURUMU}")
     print("✅ Veritabanı Flet için kuruldu.")
+    return True
 
 
 # --- Flet Uygulaması ---
 
-def main(page: ft.Page):
+def main(page: "ft.Page"):
+    import flet as ft
+    import sqlalchemy as sa
+
+    from flet_bilesenleri import SayfaliKitapListesi, SorguOlcumPaneli
+    from kitap_sorgulari import kitap_sorgulari
+    from sayfalama import CoreSayfaKaynagi
+
+    db = kurulum()
     page.title = "SQLAlchemy Core ile Kütüphane Yönetimi"
     page.scroll = ft.ScrollMode.ADAPTIVE
 
@@ -53,77 +129,67 @@ def main(page: ft.Page):
 
     baslik_input = ft.TextField(label="Kitap Başlığı", width=250)
     yazar_input = ft.TextField(label="Yazar", width=250)
-    kitaplar_listesi_view = ft.ListView(expand=True, spacing=5)
+    # Liste sayfa sayfa yüklenir; kullanıcı aşağı kaydırdıkça yeni sayfa gelir.
+    kitap_listesi = SayfaliKitapListesi(
+        CoreSayfaKaynagi(db.engine, kitap_sorgulari(db.kitaplar_tablosu)),
+        hata_turleri=(sa.exc.OperationalError,),
+        expand=True,
+    )
+    olcum_paneli = SorguOlcumPaneli(db.olcer)
+
+    # --- Değişiklik Olaylarını Listeye Yansıtma ---
+
+    def degisikligi_yansit(degisiklik):
+        kitap_listesi.uygula(degisiklik)
+        olcum_paneli.yenile()
+        page.update()
+
+    db.kitap_yazici.yayin.abone_ol(degisikligi_yansit)
+    page.on_close = lambda e: db.kitap_yazici.yayin.abonelikten_cik(degisikligi_yansit)
 
     # --- Veritabanı Operasyonları (Flet Butonlarına Bağlı) ---
 
     def tum_kitaplari_listele(e=None):
-        """Tüm kitapları veritabanından çeker ve arayüzü günceller."""
-        kitaplar_listesi_view.controls.clear()
-        with engine.connect() as conn:
-            stmt = sa.select(kitaplar_tablosu).order_by(kitaplar_tablosu.c.id)
-            result = conn.execute(stmt)
-            for row in result:
-                kitaplar_listesi_view.controls.append(
-                    ft.Text(f"ID: {row.id}, Başlık: {row.baslik}, Yazar: {row.yazar}")
-                )
+        """Yüklü sayfaları veritabanından tazeler; ekrandaki kontroller yeniden kullanılır."""
+        kitap_listesi.yenile()
+        olcum_paneli.yenile()
         page.update()
 
     def kitap_ekle(e):
         if not baslik_input.value or not yazar_input.value:
             return
 
-        with engine.connect() as conn:
-            stmt = sa.insert(kitaplar_tablosu).values(
-                baslik=baslik_input.value,
-                yazar=yazar_input.value
-            )
-            conn.execute(stmt)
-            conn.commit()
+        # Yeni satır `ekle` olayıyla listeye eklenir; tabloyu yeniden sorgulamıyoruz.
+        db.kitap_yazici.ekle(baslik_input.value, yazar_input.value)
 
         baslik_input.value = ""
         yazar_input.value = ""
-        tum_kitaplari_listele()  # Listeyi tazele
+        page.update()
 
     def kitap_guncelle(e):
         # Bu örnekte, basitlik için ilk kitabı güncelleyelim
         if not baslik_input.value:
             return
 
-        with engine.connect() as conn:
-            # ID'si 1 olan kitabın başlığını güncelle
-            stmt = (
-                sa.update(kitaplar_tablosu)
-                .where(kitaplar_tablosu.c.id == 1)
-                .values(baslik=baslik_input.value)
-            )
-            conn.execute(stmt)
-            conn.commit()
+        # ID'si 1 olan kitabın başlığını güncelle; sadece o satırın metni değişir.
+        db.kitap_yazici.baslik_guncelle(1, baslik_input.value)
 
         baslik_input.value = ""
-        tum_kitaplari_listele()
+        page.update()
 
     def en_son_kitabi_sil(e):
-        with engine.connect() as conn:
-            # En yüksek ID'li kitabı bulmak için bir alt sorgu
-            # Bu, Core'un SQL'e ne kadar yakın olduğunu gösterir
-            latest_id_stmt = sa.select(sa.func.max(kitaplar_tablosu.c.id))
-            latest_id = conn.execute(latest_id_stmt).scalar_one_or_none()
-
-            if latest_id:
-                # Silme işlemini yap
-                delete_stmt = sa.delete(kitaplar_tablosu).where(kitaplar_tablosu.c.id == latest_id)
-                conn.execute(delete_stmt)
-                conn.commit()
-
-        tum_kitaplari_listele()
+        # En yüksek ID'li kitap tek ifadede bulunup silinir:
+        # `DELETE ... WHERE id = (SELECT max(id) ...) RETURNING ...`
+        # Silinen satır `sil` olayıyla yayınlanır ve listeden sadece o kontrol çıkarılır.
+        db.kitap_yazici.en_son_sil()
 
     # --- Sayfa Düzeni ---
 
     page.add(
         ft.Column([
             ft.Text("SQLAlchemy Core Deney Paneli", size=24, weight=ft.FontWeight.BOLD),
-            ft.Text("Terminaldeki SQL loglarını izleyin!", italic=True, color=ft.Colors.BLUE_GREY),
+            ft.Text("Her işlemin ürettiği SQL'i aşağıdaki ölçüm panelinde izleyin!", italic=True,
+                    color=ft.Colors.BLUE_GREY),
             ft.Divider(),
 
             ft.Row([baslik_input, yazar_input]),
@@ -141,21 +207,29 @@ def main(page: ft.Page):
                 ft.IconButton(icon=ft.Icons.REFRESH, on_click=tum_kitaplari_listele, tooltip="Listeyi Yenile"),
             ]),
             ft.Container(
-                content=kitaplar_listesi_view,
+                content=kitap_listesi.view,
                 border=ft.Border.all(1, ft.Colors.GREY_300),
                 padding=10,
                 border_radius=5,
                 height=300
             ),
+
+            ft.Divider(),
+            olcum_paneli.view,
         ])
     )
 
     # Uygulama ilk açıldığında listeyi doldur
     tum_kitaplari_listele()
+    isaretle("ilk_sayfa")
 
 
 if __name__ == "__main__":
-    # Flet uygulamasını çalıştırmadan önce veritabanını her seferinde temiz bir şekilde kur
-    veritabani_kurulum()
+    import flet as ft
+
+    # Veritabanı, tarayıcı açılıp bağlanana kadar geçen sürede arka planda hazırlanır.
+    # Şema sürümü tutuyorsa kurulum atlanır; temiz başlamak için `--sifirla` verin.
+    threading.Thread(target=kurulum, name="kurulum", daemon=True).start()
+    isaretle("hazir")
     # Flet uygulamasını web tarayıcısında çalıştır
     ft.run(main=main, view=ft.AppView.WEB_BROWSER)
\ No newline at end of file
@@ -0,0 +1,325 @@
+"""
+Modül 1 - Yardımcı: Ham sqlite3 Örnekleri İçin Ortak Bağlantı Havuzu
+
+Ham SQL örneklerindeki her fonksiyon `sqlite3.connect()` ile yeni bir bağlantı
+açıp hemen kapatıyordu. Her açılışta dosya açılır, şema okunur ve kilit
+yapıları yeniden kurulur. Tek bir makinede onlarca öğrenci aynı anda
+laboratuvar çalıştırdığında bu maliyet her butona tıklamada ödenir.
+
+Bu modül, tüm ham SQL örneklerinin paylaştığı küçük ve thread-safe bir
+bağlantı havuzu sunar:
+- Havuz boyutu ayarlanabilir; dolduğunda yeni istek bir bağlantı boşalana kadar bekler.
+- Her bağlantı açılırken PRAGMA'lar (WAL, synchronous, busy_timeout...) BİR KEZ ayarlanır.
+- Uzun süre boşta kalan bağlantılar tekrar kullanılmadan önce sağlık kontrolünden geçer.
+- Havuz isabet (hit) / ıska (miss) sayaçları tutulur.
+- İsteğe bağlı bir `olcer` (`sorgu_olcumu.SorguOlcer`) verilirse her bağlantının
+  ifadeleri ölçülür.
+
+Dosya doğrudan çalıştırılırsa, "her çağrıda bağlan" yöntemiyle havuzu
+karşılaştıran küçük bir kıyaslama (benchmark) yapar.
+"""
+
+import os
+import queue
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+# Her yeni bağlantıda bir kez çalıştırılan ayarlar. Ham sqlite3 havuzu, SQLAlchemy
+# motorları (`pragmalari_bagla`) ve çok süreçli sunucu aynı sözlüğü kullanır.
+# busy_timeout ilk sıradadır: kilit beklemesi gereken sonraki PRAGMA'lar hata vermek yerine bekler.
+# WAL modu okuyucuların yazıcıyı beklemesini engeller; NORMAL senkronizasyon
+# WAL ile birlikte güvenli ve çok daha hızlıdır. mmap_size okumaları SQLite'ın
+# kendi sayfa önbelleğine kopyalamadan işletim sisteminin (süreçler arasında
+# paylaşılan) sayfa önbelleğinden yapar.
+VARSAYILAN_PRAGMALAR = {
+    "busy_timeout": 5000,
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "mmap_size": 256 * 1024 * 1024,
+    "foreign_keys": "ON",
+}
+
+
+def pragmalari_uygula(conn, pragmalar=None):
+    """DB-API bağlantısına PRAGMA'ları sırayla uygular (varsayılan: `VARSAYILAN_PRAGMALAR`)."""
+    for ad, deger in (VARSAYILAN_PRAGMALAR if pragmalar is None else pragmalar).items():
+        conn.execute(f"PRAGMA {ad} = {deger}")
+
+
+def pragmalari_bagla(engine, pragmalar=None):
+    """SQLAlchemy motorunun açtığı her bağlantıya aynı PRAGMA'ları uygular."""
+    from sqlalchemy import event
+
+    @event.listens_for(engine, "connect")
+    def _pragmalar(dbapi_conn, _kayit):
+        pragmalari_uygula(dbapi_conn, pragmalar)
+
+
+class HavuzZamanAsimi(Exception):
+    """Havuzdaki tüm bağlantılar meşgulken bekleme süresi aşıldığında fırlatılır."""
+
+
+class BaglantiHavuzu:
+    """Aynı SQLite dosyasına açılmış bağlantıları yeniden kullanan thread-safe havuz."""
+
+    def __init__(self, db_dosyasi, boyut=5, pragmalar=None, row_factory=None,
+                 bekleme_suresi=5.0, saglik_kontrol_araligi=30.0, olcer=None):
+        self.db_dosyasi = db_dosyasi
+        self.boyut = boyut
+        self.pragmalar = dict(VARSAYILAN_PRAGMALAR if pragmalar is None else pragmalar)
+        self.row_factory = row_factory
+        self.bekleme_suresi = bekleme_suresi
+        self.saglik_kontrol_araligi = saglik_kontrol_araligi
+        self.olcer = olcer
+
+        # Boştaki bağlantılar: (bağlantı, son kullanım zamanı).
+        # LIFO kullanıyoruz; en son iade edilen (en "sıcak") bağlantı önce verilir.
+        self._bostakiler = queue.LifoQueue()
+        self._kilit = threading.Lock()
+        self._acik_sayisi = 0
+        self._isabet = 0
+        self._iska = 0
+        self._bekleme = 0
+        self._saglik_hatasi = 0
+
+    # --- Bağlantı Yaşam Döngüsü ---
+
+    def _yeni_baglanti(self):
+        # check_same_thread=False: Bağlantı bir thread'de açılıp başka bir
+        # thread'de kullanılabilir. Aynı anda tek bir thread kullandığı için güvenlidir.
+        if self.olcer is None:
+            conn = sqlite3.connect(self.db_dosyasi, check_same_thread=False)
+        else:
+            # Sadece ölçüm istendiğinde yüklenir; ölçümsüz havuz sorgu_olcumu'nu hiç içe aktarmaz
+            from sorgu_olcumu import OlculenBaglanti
+
+            conn = sqlite3.connect(self.db_dosyasi, check_same_thread=False, factory=OlculenBaglanti)
+            self.olcer.sqlite3_bagla(conn)
+        if self.row_factory is not None:
+            conn.row_factory = self.row_factory
+        pragmalari_uygula(conn, self.pragmalar)
+        return conn
+
+    def _saglikli_mi(self, conn):
+        try:
+            conn.execute("SELECT 1").fetchone()
+            return True
+        except sqlite3.Error:
+            return False
+
+    def _al(self):
+        try:
+            conn, son_kullanim = self._bostakiler.get_nowait()
+            with self._kilit:
+                self._isabet += 1
+        except queue.Empty:
+            with self._kilit:
+                yeni_acilabilir = self._acik_sayisi < self.boyut
+                if yeni_acilabilir:
+                    self._acik_sayisi += 1
+                    self._iska += 1
+                else:
+                    self._bekleme += 1
+            if yeni_acilabilir:
+                try:
+                    return self._yeni_baglanti()
+                except Exception:
+                    with self._kilit:
+                        self._acik_sayisi -= 1
+                    raise
+            try:
+                conn, son_kullanim = self._bostakiler.get(timeout=self.bekleme_suresi)
+            except queue.Empty:
+                raise HavuzZamanAsimi(
+                    f"{self.bekleme_suresi} saniye içinde boş bağlantı bulunamadı (boyut={self.boyut})."
+                ) from None
+            with self._kilit:
+                self._isabet += 1
+
+        # Uzun süre boşta kalan bağlantıyı kullanmadan önce kontrol et
+        if time.monotonic() - son_kullanim > self.saglik_kontrol_araligi and not self._saglikli_mi(conn):
+            with self._kilit:
+                self._saglik_hatasi += 1
+            self._at(conn)
+            return self._al()
+        return conn
+
+    def _iade_et(self, conn):
+        # Yarım kalmış bir transaction'ı bir sonraki kullanıcıya devretmeyelim
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+        except sqlite3.Error:
+            self._at(conn)
+            return
+        self._bostakiler.put((conn, time.monotonic()))
+
+    def _at(self, conn):
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+        with self._kilit:
+            self._acik_sayisi -= 1
+
+    @contextmanager
+    def baglanti(self):
+        """Havuzdan bir bağlantı ödünç verir; `with` bloğu bitince geri alır.
+
+        Kullanım:
+            with havuz.baglanti() as conn:
+                conn.execute("SELECT ...")
+        """
+        conn = self._al()
+        try:
+            yield conn
+        except sqlite3.DatabaseError:
+            # Bozulmuş olabilecek bağlantıyı havuza geri koyma
+            if not self._saglikli_mi(conn):
+                with self._kilit:
+                    self._saglik_hatasi += 1
+                self._at(conn)
+                conn = None
+            raise
+        finally:
+            if conn is not None:
+                self._iade_et(conn)
+
+    def kapat(self):
+        """Boştaki tüm bağlantıları kapatır. Havuz daha sonra tekrar kullanılabilir."""
+        while True:
+            try:
+                conn, _ = self._bostakiler.get_nowait()
+            except queue.Empty:
+                break
+            self._at(conn)
+
+    # --- İstatistikler ---
+
+    def istatistikler(self):
+        """Havuzun anlık sayaçlarını sözlük olarak döndürür."""
+        with self._kilit:
+            toplam = self._isabet + self._iska
+            return {
+                "boyut": self.boyut,
+                "acik": self._acik_sayisi,
+                "bosta": self._bostakiler.qsize(),
+                "isabet": self._isabet,
+                "iska": self._iska,
+                "bekleme": self._bekleme,
+                "saglik_hatasi": self._saglik_hatasi,
+                "isabet_orani": self._isabet / toplam if toplam else 0.0,
+            }
+
+
+# --- Paylaşılan Havuzlar ---
+# Aynı dosyaya bağlanan tüm örnekler aynı havuzu kullanır.
+
+_havuzlar = {}
+_havuzlar_kilidi = threading.Lock()
+
+
+def havuz_al(db_dosyasi, **ayarlar):
+    """Verilen veritabanı dosyası için paylaşılan havuzu döndürür, yoksa oluşturur.
+
+    Ayarlar yalnızca havuz ilk kez oluşturulurken dikkate alınır.
+    Havuz boyutu `KITAPLIK_HAVUZ_BOYUTU` ortam değişkeniyle de ayarlanabilir.
+    """
+    anahtar = os.path.abspath(db_dosyasi)
+    with _havuzlar_kilidi:
+        havuz = _havuzlar.get(anahtar)
+        if havuz is None:
+            ayarlar.setdefault("boyut", int(os.environ.get("KITAPLIK_HAVUZ_BOYUTU", "5")))
+            havuz = BaglantiHavuzu(db_dosyasi, **ayarlar)
+            _havuzlar[anahtar] = havuz
+        return havuz
+
+
+def veritabani_dosyasini_sil(db_dosyasi):
+    """Veritabanı dosyasını WAL yan dosyalarıyla (-wal, -shm) birlikte siler.
+
+    Önce o dosyaya ait havuzdaki boş bağlantıları kapatır; açık bir bağlantı
+    varken dosyayı silmek eski içeriğin okunmaya devam etmesine yol açar.
+    """
+    havuz = _havuzlar.get(os.path.abspath(db_dosyasi))
+    if havuz is not None:
+        havuz.kapat()
+    for ek in ("", "-wal", "-shm"):
+        if os.path.exists(db_dosyasi + ek):
+            os.remove(db_dosyasi + ek)
+
+
+# --- Kıyaslama: Her Çağrıda Bağlan vs. Havuz ---
+
+def kiyasla(db_dosyasi="kitaplik_havuz_kiyas.db", sorgu_sayisi=2000, thread_sayisi=8, havuz_boyutu=4):
+    """Aynı sorguyu iki yöntemle çalıştırır ve süreleri döndürür."""
+    veritabani_dosyasini_sil(db_dosyasi)
+    conn = sqlite3.connect(db_dosyasi)
+    conn.execute("CREATE TABLE kitaplar (id INTEGER PRIMARY KEY, baslik TEXT NOT NULL, yazar TEXT NOT NULL)")
+    conn.executemany(
+        "INSERT INTO kitaplar (baslik, yazar) VALUES (?, ?)",
+        ((f"Kitap {i}", f"Yazar {i % 100}") for i in range(10_000)),
+    )
+    conn.commit()
+    conn.close()
+
+    # Birincil anahtarla arama: sorgunun kendisi ucuz olduğu için
+    # ölçülen farkın büyük kısmı bağlantı açma/kapama maliyetidir.
+    sorgu = "SELECT id, baslik, yazar FROM kitaplar WHERE id = ?"
+
+    def her_cagrida_baglan(i):
+        c = sqlite3.connect(db_dosyasi)
+        try:
+            c.execute(sorgu, (i % 10_000 + 1,)).fetchall()
+        finally:
+            c.close()
+
+    havuz = BaglantiHavuzu(db_dosyasi, boyut=havuz_boyutu)
+
+    def havuzdan(i):
+        with havuz.baglanti() as c:
+            c.execute(sorgu, (i % 10_000 + 1,)).fetchall()
+
+    def calistir(islev):
+        sayaclar = iter(range(sorgu_sayisi))
+        sayac_kilidi = threading.Lock()
+
+        def isci():
+            while True:
+                with sayac_kilidi:
+                    i = next(sayaclar, None)
+                if i is None:
+                    return
+                islev(i)
+
+        baslangic = time.perf_counter()
+        threadler = [threading.Thread(target=isci) for _ in range(thread_sayisi)]
+        for t in threadler:
+            t.start()
+        for t in threadler:
+            t.join()
+        return time.perf_counter() - baslangic
+
+    sonuc = {
+        "sorgu_sayisi": sorgu_sayisi,
+        "thread_sayisi": thread_sayisi,
+        "her_cagrida_baglan_sn": calistir(her_cagrida_baglan),
+        "havuz_sn": calistir(havuzdan),
+        "havuz": havuz.istatistikler(),
+    }
+    havuz.kapat()
+    veritabani_dosyasini_sil(db_dosyasi)
+    return sonuc
+
+
+if __name__ == "__main__":
+    print("--- Bağlantı Havuzu Kıyaslaması ---")
+    for thread_sayisi in (1, 8):
+        s = kiyasla(thread_sayisi=thread_sayisi)
+        print(f"\n{s['sorgu_sayisi']} sorgu, {thread_sayisi} thread:")
+        print(f"  Her çağrıda bağlan : {s['her_cagrida_baglan_sn'] * 1000:8.1f} ms")
+        print(f"  Havuz              : {s['havuz_sn'] * 1000:8.1f} ms")
+        print(f"  Hızlanma           : {s['her_cagrida_baglan_sn'] / s['havuz_sn']:.1f}x")
+        print(f"  Havuz sayaçları    : {s['havuz']}")
@@ -0,0 +1,243 @@
+"""
+Modül 1 - Yardımcı: Başlangıç Süresi Ölçümü (Soğuk Açılış Profili)
+
+Bir Flet örneği açıldığında ilk sayfa görünmeden önce olan her şey kullanıcıyı
+bekletir: `flet` ve `sqlalchemy` paketlerinin içe aktarılması, motorun kurulması,
+şemanın silinip yeniden oluşturulması... Tek seferlik bir betikte bu fark
+edilmez; ama her istek için yeni süreç açan (serverless, worker-per-request)
+bir dağıtımda her istek bu bedeli yeniden öder.
+
+Bu modül iki şeyi ölçer:
+- İçe aktarma dökümü: hedef modül `python -X importtime` ile AYRI bir süreçte
+  içe aktarılır; süreler paket başına toplanır ve en pahalı modüller listelenir.
+  Örnek dosyaların içe aktarılması artık ucuz olmalıdır: `flet`, `sqlalchemy`,
+  motor ve şema ilk kullanımda kurulur.
+- Duvar saati: Süreç başlatıldığı andan itibaren
+  - Flet örneklerinde betiğin `isaretle()` ile bildirdiği anlara kadar
+    (`hazir`: sunucu başlamak üzere, `ilk_sayfa`: ilk sayfa çizildi; ilk sayfa
+    için tarayıcının bağlanması gerekir, `WEB_BROWSER` görünümü onu kendisi açar),
+  - backend'de (`modul:uygulama` biçiminde verilirse) uvicorn'un ilk isteğe
+    başarılı yanıt verdiği ana kadar geçen süre.
+
+`isaretle()` yalnızca profil modunda (ölçüm süreci ortam değişkenlerini verdiğinde)
+bir şey yazar; normal çalıştırmada maliyeti bir sözlük okumasıdır.
+
+Kullanım:
+    python baslangic_olcumu.py 2a_sqlalchemy_core_ornek_flet.py --tekrar 5
+    python baslangic_olcumu.py 1a_ham_sql_ornek_flet.py --yalniz-ice-aktarma
+    python baslangic_olcumu.py backend.main:app --yol /metrics
+"""
+
+import json
+import os
+import time
+
+ORTAM_BASLANGIC = "KITAPLIK_BASLANGIC_T0"
+ORTAM_DOSYA = "KITAPLIK_BASLANGIC_DOSYASI"
+
+KOK = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def isaretle(ad):
+    """Profil modunda, süreç başlangıcından bu ana kadar geçen süreyi kaydeder."""
+    dosya = os.environ.get(ORTAM_DOSYA)
+    if not dosya:
+        return
+    gecen_ms = (time.time() - float(os.environ[ORTAM_BASLANGIC])) * 1000
+    with open(dosya, "a", encoding="utf-8") as f:
+        f.write(json.dumps({"ad": ad, "ms": round(gecen_ms, 1)}) + "\n")
+
+
+# --- İçe Aktarma Dökümü ---
+
+def importtime_coz(metin):
+    """`-X importtime` çıktısını (modül, kendi_us, toplam_us) listesine çevirir."""
+    satirlar = []
+    for satir in metin.splitlines():
+        if not satir.startswith("import time:"):
+            continue
+        kendi, toplam, modul = satir[len("import time:"):].split("|")
+        if not kendi.strip().isdigit():
+            continue  # Başlık satırı
+        satirlar.append((modul.strip(), int(kendi), int(toplam)))
+    return satirlar
+
+
+def ice_aktarma_dokumu(modul, klasor=None, ilk=15):
+    """Modülü yeni bir süreçte `-X importtime` ile içe aktarır ve süreleri özetler.
+
+    Returns:
+        `surec_ms` (yorumlayıcının açılışı dahil duvar saati), `ice_aktarma_ms`
+        (tüm modüllerin kendi sürelerinin toplamı), `paketler` (en üst paket
+        başına ms, büyükten küçüğe) ve `moduller` (kendi süresi en uzun `ilk` modül).
+    """
+    import subprocess
+    import sys
+
+    kod = f"import importlib; importlib.import_module({modul!r})"
+    baslangic = time.perf_counter()
+    sonuc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", kod],
+        cwd=klasor, capture_output=True, text=True, check=False,
+    )
+    surec_ms = (time.perf_counter() - baslangic) * 1000
+    if sonuc.returncode != 0:
+        hata = sonuc.stderr.strip().splitlines()
+        raise RuntimeError(f"{modul} içe aktarılamadı: {hata[-1] if hata else sonuc.returncode}")
+
+    satirlar = importtime_coz(sonuc.stderr)
+    paketler = {}
+    for ad, kendi, _toplam in satirlar:
+        paket = ad.split(".", 1)[0]
+        paketler[paket] = paketler.get(paket, 0) + kendi
+    return {
+        "surec_ms": round(surec_ms, 1),
+        "ice_aktarma_ms": round(sum(kendi for _, kendi, _ in satirlar) / 1000, 1),
+        "paketler": sorted(((p, round(us / 1000, 1)) for p, us in paketler.items()), key=lambda x: -x[1]),
+        "moduller": [
+            (ad, round(kendi / 1000, 1))
+            for ad, kendi, _ in sorted(satirlar, key=lambda s: -s[1])[:ilk]
+        ],
+    }
+
+
+# --- Duvar Saati: İlk Sayfa / İlk İstek ---
+
+def ilk_sayfa_suresi(betik, zaman_asimi=60.0, bekle="ilk_sayfa"):
+    """Flet betiğini profil modunda başlatır ve `isaretle()` ile bildirilen anları döndürür.
+
+    `bekle` işareti gelince (ya da zaman aşımında) süreç sonlandırılır. İşaretler
+    `{ad: ms}` sözlüğüdür; gelmeyen işaret sözlükte yer almaz.
+    """
+    import subprocess
+    import sys
+    import tempfile
+
+    klasor, dosya_adi = os.path.split(os.path.abspath(betik))
+    with tempfile.TemporaryDirectory() as gecici:
+        kayit = os.path.join(gecici, "isaretler.jsonl")
+        ortam = dict(os.environ, **{ORTAM_DOSYA: kayit, ORTAM_BASLANGIC: repr(time.time())})
+        surec = subprocess.Popen(
+            [sys.executable, dosya_adi], cwd=klasor, env=ortam,
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+        isaretler = {}
+        son = time.monotonic() + zaman_asimi
+        try:
+            while bekle not in isaretler and time.monotonic() < son and surec.poll() is None:
+                time.sleep(0.01)
+                if os.path.exists(kayit):
+                    with open(kayit, encoding="utf-8") as f:
+                        isaretler = {k["ad"]: k["ms"] for k in map(json.loads, f)}
+        finally:
+            surec.kill()
+            surec.wait()
+    return isaretler
+
+
+def ilk_istek_suresi(uygulama, yol="/metrics", zaman_asimi=30.0):
+    """`uvicorn modul:uygulama` başlatılıp `yol`'a ilk başarılı yanıt alınana kadar geçen ms.
+
+    Süreç depo kökünde çalıştırılır; zaman aşımında None döner.
+    """
+    import socket
+    import subprocess
+    import sys
+    import urllib.error
+    import urllib.request
+
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+
+    baslangic = time.perf_counter()
+    surec = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", uygulama, "--port", str(port), "--log-level", "warning"],
+        cwd=KOK, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        while time.perf_counter() - baslangic < zaman_asimi and surec.poll() is None:
+            try:
+                with urllib.request.urlopen(f"http://127.0.0.1:{port}{yol}", timeout=1) as yanit:
+                    if yanit.status < 400:
+                        return round((time.perf_counter() - baslangic) * 1000, 1)
+            except (urllib.error.URLError, ConnectionError):
+                time.sleep(0.01)
+        return None
+    finally:
+        surec.terminate()
+        surec.wait()
+
+
+# --- Rapor ---
+
+def _ortanca(degerler):
+    degerler = sorted(d for d in degerler if d is not None)
+    return degerler[len(degerler) // 2] if degerler else None
+
+
+def profil_cikar(hedef, tekrar=3, ilk=15, yol="/metrics", zaman_asimi=60.0, yalniz_ice_aktarma=False):
+    """Hedefin içe aktarma dökümünü ve `tekrar` soğuk açılışın ortanca duvar saatini döndürür.
+
+    `hedef` bir Flet betiği (`*.py`) ya da bir ASGI uygulamasıdır (`backend.main:app`).
+    """
+    if hedef.endswith(".py"):
+        klasor, dosya_adi = os.path.split(os.path.abspath(hedef))
+        modul = dosya_adi[:-3]
+    else:
+        klasor, modul = KOK, hedef.split(":", 1)[0]
+
+    # İlk çalıştırma .pyc dosyalarını üretir; ölçüm sıcak disk önbelleğiyle yapılır
+    ice_aktarma_dokumu(modul, klasor, ilk)
+    dokumler = [ice_aktarma_dokumu(modul, klasor, ilk) for _ in range(tekrar)]
+    rapor = min(dokumler, key=lambda d: d["ice_aktarma_ms"])
+    rapor["hedef"] = hedef
+    if yalniz_ice_aktarma:
+        return rapor
+
+    if hedef.endswith(".py"):
+        olcumler = [ilk_sayfa_suresi(hedef, zaman_asimi) for _ in range(tekrar)]
+        rapor["duvar_saati_ms"] = {
+            ad: _ortanca(o.get(ad) for o in olcumler) for ad in ("hazir", "ilk_sayfa")
+        }
+    else:
+        rapor["duvar_saati_ms"] = {
+            "ilk_istek": _ortanca(ilk_istek_suresi(hedef, yol, zaman_asimi) for _ in range(tekrar))
+        }
+    return rapor
+
+
+def raporu_yazdir(rapor):
+    print(f"--- {rapor['hedef']} ---")
+    print(f"Süreç (yorumlayıcı + içe aktarma): {rapor['surec_ms']:.0f} ms, "
+          f"içe aktarma toplamı: {rapor['ice_aktarma_ms']:.0f} ms")
+    print(f"\n{'Paket':<28}{'ms':>8}")
+    for paket, ms in rapor["paketler"][:10]:
+        print(f"{paket:<28}{ms:>8.1f}")
+    print(f"\n{'En pahalı modüller (kendi süresi)':<48}{'ms':>8}")
+    for modul, ms in rapor["moduller"]:
+        print(f"{modul:<48}{ms:>8.1f}")
+    if "duvar_saati_ms" in rapor:
+        print("\nSüreç başlangıcından itibaren (ortanca):")
+        for ad, ms in rapor["duvar_saati_ms"].items():
+            print(f"  {ad:<12}" + (f"{ms:>8.0f} ms" if ms is not None else "  ölçülemedi (zaman aşımı)"))
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Bir örneğin ya da backend'in soğuk açılışını profiller.")
+    parser.add_argument("hedef", help="Flet betiği (ör. 2a_sqlalchemy_core_ornek_flet.py) ya da backend.main:app")
+    parser.add_argument("--tekrar", type=int, default=3, help="Soğuk açılış sayısı (ortanca raporlanır)")
+    parser.add_argument("--ilk", type=int, default=15, help="Listelenecek en pahalı modül sayısı")
+    parser.add_argument("--yol", default="/metrics", help="Backend için ilk isteğin atılacağı yol")
+    parser.add_argument("--zaman-asimi", type=float, default=60.0, help="Açılış başına en fazla bekleme (sn)")
+    parser.add_argument("--yalniz-ice-aktarma", action="store_true", help="Süreci çalıştırmadan sadece dökümü al")
+    parser.add_argument("--json", action="store_true", help="Raporu JSON olarak yazdır")
+    args = parser.parse_args()
+
+    sonuc = profil_cikar(args.hedef, args.tekrar, args.ilk, args.yol, args.zaman_asimi, args.yalniz_ice_aktarma)
+    if args.json:
+        print(json.dumps(sonuc, ensure_ascii=False, indent=2))
+    else:
+        raporu_yazdir(sonuc)
@@ -0,0 +1,577 @@
+"""
+Modül 1 - Yardımcı: Çok Süreçli Sunum (Tek Yazıcı, Çok Okuyucu)
+
+Tek makinelik kurulumlarda örneklerin ürettiği SQLite dosyaları
+(`kitaplik_core.db`, `kitaplik_core_flet.db`) doğrudan sunulur. Tek bir Python
+süreci GIL yüzünden tüm okumaları tek çekirdeğe sıkıştırır. Birden fazla süreç
+ise aynı dosyaya aynı anda yazmaya çalıştığında SQLite'ın tek yazıcı kilidinde
+sıraya girer. Varsayılan (rollback journal) modda yazıcı commit ederken
+okuyucular da bekler; bekleme süresini aşan her istek "database is locked"
+hatasıyla düşer.
+
+Bu modül hiçbir şey paylaşmayan (shared-nothing) bir sunum düzeni kurar:
+- Ana süreç dinleme soketini açar ve `isci` adet İŞÇİ süreci başlatır. Her işçi
+  aynı soketten bağlantı kabul eder ve okumaları kendi `BaglantiHavuzu`'ndan
+  yapar. Okuma bağlantıları `query_only` ile yazmaya kapatılır.
+- Tüm yazmalar bir `multiprocessing` kuyruğuyla TEK bir YAZICI sürecine gider.
+  Yazıcı, `yazma_kuyrugu.YazmaKuyrugu` ile grup commit yapar. Sonucu, isteği
+  gönderen işçinin yanıt kuyruğuna koyar. Dosyaya tek süreç yazdığı için
+  yazıcılar arasında kilit yarışı olmaz.
+- PRAGMA'lar (WAL, busy_timeout, synchronous=NORMAL, mmap_size) her bağlantıda
+  `baglanti_havuzu.VARSAYILAN_PRAGMALAR`'dan uygulanır. WAL'da okuyucular
+  yazıcıyı, yazıcı da okuyucuları beklemez.
+
+HTTP arayüzü (JSON):
+    GET    /kitaplar?son_id=0&limit=50   Keyset sayfalama
+    GET    /kitaplar?yazar=...           Yazara göre kitaplar
+    GET    /kitaplar/<id>
+    POST   /kitaplar                     {"baslik": ..., "yazar": ...}
+    PATCH  /kitaplar/<id>                {"baslik": ...}
+    DELETE /kitaplar/son                 En son eklenen kitabı siler
+    GET    /durum                        İşçinin pid'i ve havuz sayaçları
+
+Dosya `--kiyasla` ile çalıştırılırsa, okuma ağırlıklı ve eşzamanlı yazmalı bir
+yük altında iki düzeni işçi sayısına göre karşılaştırır. Eski düzen rollback
+journal kullanır ve her işçi kendisi yazar; yeni düzende tek yazıcı ve WAL
+vardır. Raporda okuma verimi ve "database is locked" hataları yer alır.
+
+Kullanım:
+    python cok_surecli_sunucu.py kitaplik_core.db --isci 4 --port 8050
+    python cok_surecli_sunucu.py --kiyasla --isci 1 2 4 --sure 5
+"""
+
+import argparse
+import itertools
+import json
+import multiprocessing
+import os
+import signal
+import socket
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureZamanAsimi
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from baglanti_havuzu import VARSAYILAN_PRAGMALAR, BaglantiHavuzu, HavuzZamanAsimi, pragmalari_uygula
+
+# SQLite ve Python'un varsayılanları: örneklerin bugüne kadar çalıştığı düzen (kıyaslama için).
+ESKI_PRAGMALAR = {"journal_mode": "DELETE", "synchronous": "FULL"}
+
+KOLONLAR = ("id", "baslik", "yazar")
+TABLO_DDL = "CREATE TABLE IF NOT EXISTS kitaplar (id INTEGER PRIMARY KEY, baslik TEXT NOT NULL, yazar TEXT NOT NULL)"
+ID_ILE_SQL = "SELECT id, baslik, yazar FROM kitaplar WHERE id = ?"
+SAYFA_SQL = "SELECT id, baslik, yazar FROM kitaplar WHERE id > ? ORDER BY id LIMIT ?"
+YAZARA_GORE_SQL = "SELECT id, baslik, yazar FROM kitaplar WHERE yazar = ?"
+EN_FAZLA_SAYFA = 500
+
+
+class YazmaHatasi(Exception):
+    """Yazıcı sürecinde başarısız olan bir yazma; özgün hatanın türünü ve mesajını taşır."""
+
+
+def _satir_sozluk(satir):
+    return None if satir is None else dict(zip(KOLONLAR, satir))
+
+
+# --- Yazıcı Süreci ---
+
+def _yazici_calistir(db_dosyasi, istek_kuyrugu, yanit_kuyruklari, pragmalar, aralik_ms, hazir):
+    """Tek yazıcı süreci: işçilerden gelen yazmaları `YazmaKuyrugu` ile grup commit eder."""
+    import sqlalchemy as sa
+
+    from baglanti_havuzu import pragmalari_bagla
+    from kitap_sorgulari import kitap_sorgulari
+    from yazma_kuyrugu import GRUP, YazmaKuyrugu
+
+    # Ctrl+C'yi ana süreç yönetir; yazıcı kuyruktaki işler commit edilmeden ölmemeli.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    for yanit_kuyrugu in yanit_kuyruklari:
+        # Sonlandırılmış bir işçinin kuyruğu çıkışta yazıcıyı bekletmesin
+        yanit_kuyrugu.cancel_join_thread()
+
+    engine = sa.create_engine(f"sqlite:///{db_dosyasi}")
+    pragmalari_bagla(engine, pragmalar)
+    tablo = sa.Table(
+        'kitaplar',
+        sa.MetaData(),
+        sa.Column('id', sa.Integer, primary_key=True),
+        sa.Column('baslik', sa.String, nullable=False),
+        sa.Column('yazar', sa.String, nullable=False)
+    )
+    kuyruk = YazmaKuyrugu(engine, kitap_sorgulari(tablo), dayaniklilik=GRUP, aralik_ms=aralik_ms)
+
+    def yanitla(yanit_kuyrugu, istek_no, gelecek):
+        hata = gelecek.exception()
+        if hata is None:
+            yanit_kuyrugu.put((istek_no, _satir_sozluk(gelecek.result()), None))
+        else:
+            # Sürücü istisnaları süreçler arasında her zaman taşınamaz; metin olarak gönderilir.
+            yanit_kuyrugu.put((istek_no, None, f"{type(hata).__name__}: {hata}"))
+
+    hazir.set()
+    while (istek := istek_kuyrugu.get()) is not None:
+        isci_no, istek_no, islem, argumanlar = istek
+        gelecek = getattr(kuyruk, islem)(*argumanlar)
+        gelecek.add_done_callback(lambda g, k=yanit_kuyruklari[isci_no], n=istek_no: yanitla(k, n, g))
+    kuyruk.kapat()
+    engine.dispose()
+
+
+class UzakYazici:
+    """İşçi tarafında yazmaları yazıcı sürecine ileten vekil.
+
+    Arayüzü `YazmaKuyrugu` ile aynıdır (`ekle`, `baslik_guncelle`, `en_son_sil`)
+    ve sonucu bir `Future` olarak verir. Sonuç, satırın sözlük hâlidir.
+    """
+
+    def __init__(self, isci_no, istek_kuyrugu, yanit_kuyrugu):
+        self.isci_no = isci_no
+        self._istek_kuyrugu = istek_kuyrugu
+        self._yanit_kuyrugu = yanit_kuyrugu
+        self._bekleyenler = {}
+        self._sayac = itertools.count()
+        self._kilit = threading.Lock()
+        threading.Thread(target=self._yanitlari_dagit, name="yanit-dagitici", daemon=True).start()
+
+    def _gonder(self, islem, *argumanlar):
+        gelecek = Future()
+        with self._kilit:
+            istek_no = next(self._sayac)
+            self._bekleyenler[istek_no] = gelecek
+        self._istek_kuyrugu.put((self.isci_no, istek_no, islem, argumanlar))
+        return gelecek
+
+    def ekle(self, baslik, yazar):
+        return self._gonder("ekle", baslik, yazar)
+
+    def baslik_guncelle(self, kitap_id, yeni_baslik):
+        return self._gonder("baslik_guncelle", kitap_id, yeni_baslik)
+
+    def en_son_sil(self):
+        return self._gonder("en_son_sil")
+
+    def _yanitlari_dagit(self):
+        while True:
+            istek_no, satir, hata = self._yanit_kuyrugu.get()
+            with self._kilit:
+                gelecek = self._bekleyenler.pop(istek_no)
+            if hata is None:
+                gelecek.set_result(satir)
+            else:
+                gelecek.set_exception(YazmaHatasi(hata))
+
+
+class DogrudanYazici:
+    """Kıyaslama için ESKİ düzen: her işçi kendi bağlantısıyla doğrudan yazar (tek yazıcı yok)."""
+
+    def __init__(self, havuz):
+        self.havuz = havuz
+
+    def _calistir(self, sql, parametreler=()):
+        gelecek = Future()
+        try:
+            with self.havuz.baglanti() as conn:
+                satir = conn.execute(sql, parametreler).fetchone()
+                conn.commit()
+            gelecek.set_result(_satir_sozluk(satir))
+        except sqlite3.Error as hata:
+            gelecek.set_exception(hata)
+        return gelecek
+
+    def ekle(self, baslik, yazar):
+        return self._calistir(
+            "INSERT INTO kitaplar (baslik, yazar) VALUES (?, ?) RETURNING id, baslik, yazar", (baslik, yazar)
+        )
+
+    def baslik_guncelle(self, kitap_id, yeni_baslik):
+        return self._calistir(
+            "UPDATE kitaplar SET baslik = ? WHERE id = ? RETURNING id, baslik, yazar", (yeni_baslik, kitap_id)
+        )
+
+    def en_son_sil(self):
+        return self._calistir(
+            "DELETE FROM kitaplar WHERE id = (SELECT max(id) FROM kitaplar) RETURNING id, baslik, yazar"
+        )
+
+
+# --- İşçi Süreci: HTTP ---
+
+class _IstekIsleyici(BaseHTTPRequestHandler):
+    # HTTP/1.1: istemci bağlantıyı açık tutar (keep-alive), her istekte yeni TCP el sıkışması olmaz.
+    protocol_version = "HTTP/1.1"
+    # Başlıklar ve gövde ayrı yazılır; Nagle açıkken keep-alive'daki her yanıt gövdesi,
+    # istemcinin gecikmeli ACK'ini (~40 ms) bekler ve ölçülen şey TCP olur.
+    disable_nagle_algorithm = True
+
+    def log_message(self, *_):
+        pass  # Erişim günlüğü her isteği stderr'e yazar; yük altında darboğaz olur
+
+    def do_GET(self):
+        self._isle(self._oku)
+
+    def do_POST(self):
+        self._isle(self._yaz)
+
+    def do_PATCH(self):
+        self._isle(self._yaz)
+
+    def do_DELETE(self):
+        self._isle(self._yaz)
+
+    def _isle(self, islev):
+        parcalar = urlsplit(self.path)
+        try:
+            durum, govde = islev(parcalar.path.strip("/").split("/"), parse_qs(parcalar.query))
+        except (ValueError, KeyError, TypeError) as hata:
+            durum, govde = 400, {"hata": f"Geçersiz istek: {hata}"}
+        except (sqlite3.Error, YazmaHatasi, HavuzZamanAsimi, FutureZamanAsimi) as hata:
+            durum, govde = 503, {"hata": str(hata) or type(hata).__name__}
+        veri = json.dumps(govde, ensure_ascii=False).encode()
+        self.send_response(durum)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(veri)))
+        self.end_headers()
+        self.wfile.write(veri)
+
+    def _govde(self):
+        uzunluk = int(self.headers.get("Content-Length") or 0)
+        return json.loads(self.rfile.read(uzunluk)) if uzunluk else {}
+
+    def _oku(self, yol, sorgu):
+        sunucu = self.server
+        if yol == ["durum"]:
+            return 200, sunucu.durum()
+        if yol[0] != "kitaplar" or len(yol) > 2:
+            return 404, {"hata": "Bulunamadı"}
+        with sunucu.havuz.baglanti() as conn:
+            if len(yol) == 2:
+                satir = conn.execute(ID_ILE_SQL, (int(yol[1]),)).fetchone()
+                return (200, _satir_sozluk(satir)) if satir else (404, {"hata": "Kitap bulunamadı"})
+            if "yazar" in sorgu:
+                satirlar = conn.execute(YAZARA_GORE_SQL, (sorgu["yazar"][0],)).fetchall()
+            else:
+                son_id = int(sorgu.get("son_id", ["0"])[0])
+                limit = min(int(sorgu.get("limit", ["50"])[0]), EN_FAZLA_SAYFA)
+                satirlar = conn.execute(SAYFA_SQL, (son_id, limit)).fetchall()
+        return 200, [_satir_sozluk(s) for s in satirlar]
+
+    def _yaz(self, yol, _sorgu):
+        yazici, govde = self.server.yazici, self._govde()
+        if self.command == "POST" and yol == ["kitaplar"]:
+            durum, gelecek = 201, yazici.ekle(govde["baslik"], govde["yazar"])
+        elif self.command == "PATCH" and len(yol) == 2 and yol[0] == "kitaplar":
+            durum, gelecek = 200, yazici.baslik_guncelle(int(yol[1]), govde["baslik"])
+        elif self.command == "DELETE" and yol == ["kitaplar", "son"]:
+            durum, gelecek = 200, yazici.en_son_sil()
+        else:
+            return 404, {"hata": "Bulunamadı"}
+        # Yanıt, yazma commit edildikten SONRA döner (grup commit en fazla `aralik_ms` bekletir)
+        satir = gelecek.result(timeout=self.server.yazma_zaman_asimi)
+        return (durum, satir) if satir is not None else (404, {"hata": "Kitap bulunamadı"})
+
+
+class _KitapSunucusu(ThreadingHTTPServer):
+    """Ana süreçte açılmış dinleme soketini kullanan, işçi başına bir HTTP sunucusu."""
+
+    daemon_threads = True
+
+    def __init__(self, soket, havuz, yazici, isci_no, yazma_zaman_asimi):
+        super().__init__(soket.getsockname()[:2], _IstekIsleyici, bind_and_activate=False)
+        self.socket.close()
+        self.socket = soket
+        self.havuz = havuz
+        self.yazici = yazici
+        self.isci_no = isci_no
+        self.yazma_zaman_asimi = yazma_zaman_asimi
+
+    def durum(self):
+        return {
+            "isci": self.isci_no,
+            "pid": os.getpid(),
+            "tek_yazici": isinstance(self.yazici, UzakYazici),
+            "havuz": self.havuz.istatistikler(),
+        }
+
+
+def _isci_calistir(isci_no, soket, db_dosyasi, pragmalar, havuz_boyutu, istek_kuyrugu, yanit_kuyrugu,
+                   yazma_zaman_asimi):
+    signal.signal(signal.SIGINT, signal.SIG_IGN)  # Ana süreç işçileri kendisi sonlandırır
+    # Aynı soketi dinleyen süreçlerden yalnızca biri bağlantıyı alır; diğerlerinin
+    # accept() çağrısı bloklamak yerine hemen döner ve bir sonraki bağlantıyı bekler.
+    soket.setblocking(False)
+    if istek_kuyrugu is None:
+        havuz = BaglantiHavuzu(db_dosyasi, boyut=havuz_boyutu, pragmalar=pragmalar)
+        yazici = DogrudanYazici(havuz)
+    else:
+        # Okuma bağlantıları yazamaz; işçiden kaçan bir yazma tek yazıcı düzenini bozmasın.
+        havuz = BaglantiHavuzu(db_dosyasi, boyut=havuz_boyutu, pragmalar={**pragmalar, "query_only": "ON"})
+        yazici = UzakYazici(isci_no, istek_kuyrugu, yanit_kuyrugu)
+    _KitapSunucusu(soket, havuz, yazici, isci_no, yazma_zaman_asimi).serve_forever()
+
+
+# --- Ana Süreç ---
+
+class CokSurecliSunucu:
+    """Yazıcı ve işçi süreçlerini başlatan, durduran ana süreç tarafı.
+
+    Args:
+        db_dosyasi: Sunulacak SQLite dosyası; `kitaplar(id, baslik, yazar)` tablosu yoksa oluşturulur.
+        isci: İşçi süreci sayısı; verilmezse çekirdek sayısı.
+        adres: Dinlenecek (host, port); port 0 ise boş bir port seçilir.
+        tek_yazici: False ise yazıcı süreci kurulmaz, her işçi kendisi yazar (yalnızca kıyaslama için).
+        pragmalar: Tüm bağlantılara uygulanacak PRAGMA'lar (varsayılan: `VARSAYILAN_PRAGMALAR`).
+        havuz_boyutu: İşçi başına okuma bağlantısı sayısı.
+        aralik_ms: Yazıcının grup commit bekleme aralığı.
+        yazma_zaman_asimi: Bir yazmanın commit edilmesi için en fazla bekleme (sn); aşılırsa 503.
+    """
+
+    def __init__(self, db_dosyasi, isci=None, adres=("127.0.0.1", 8050), tek_yazici=True, pragmalar=None,
+                 havuz_boyutu=8, aralik_ms=10, yazma_zaman_asimi=10.0):
+        self.db_dosyasi = os.path.abspath(db_dosyasi)
+        self.isci = isci or os.cpu_count() or 1
+        self.tek_yazici = tek_yazici
+        self.pragmalar = dict(VARSAYILAN_PRAGMALAR if pragmalar is None else pragmalar)
+        self.havuz_boyutu = havuz_boyutu
+        self.aralik_ms = aralik_ms
+        self.yazma_zaman_asimi = yazma_zaman_asimi
+        self._istenen_adres = adres
+        self._soket = None
+        self._yazici = None
+        self._istek_kuyrugu = None
+        self._isciler = []
+
+    @property
+    def adres(self):
+        return self._soket.getsockname()[:2]
+
+    def _tablo_hazirla(self):
+        # journal_mode değişikliği süreçler başlamadan, tek bağlantıdan bir kez yapılır.
+        conn = sqlite3.connect(self.db_dosyasi)
+        try:
+            pragmalari_uygula(conn, self.pragmalar)
+            conn.execute(TABLO_DDL)
+            conn.commit()
+        finally:
+            conn.close()
+
+    def baslat(self, hazir_zaman_asimi=30.0):
+        self._tablo_hazirla()
+        baglam = multiprocessing.get_context()
+        self._soket = socket.create_server(self._istenen_adres, backlog=1024)
+
+        yanit_kuyruklari = [None] * self.isci
+        if self.tek_yazici:
+            self._istek_kuyrugu = baglam.Queue()
+            yanit_kuyruklari = [baglam.Queue() for _ in range(self.isci)]
+            hazir = baglam.Event()
+            self._yazici = baglam.Process(
+                target=_yazici_calistir, name="kitaplik-yazici",
+                args=(self.db_dosyasi, self._istek_kuyrugu, yanit_kuyruklari, self.pragmalar, self.aralik_ms, hazir),
+            )
+            self._yazici.start()
+            if not hazir.wait(hazir_zaman_asimi):
+                self.durdur()
+                raise RuntimeError("Yazıcı süreci başlatılamadı")
+
+        for no in range(self.isci):
+            surec = baglam.Process(
+                target=_isci_calistir, name=f"kitaplik-isci-{no}", daemon=True,
+                args=(no, self._soket, self.db_dosyasi, self.pragmalar, self.havuz_boyutu,
+                      self._istek_kuyrugu, yanit_kuyruklari[no], self.yazma_zaman_asimi),
+            )
+            surec.start()
+            self._isciler.append(surec)
+        return self
+
+    def durdur(self, zaman_asimi=10.0):
+        """İşçileri sonlandırır; yazıcı kuyruktaki yazmaları commit ettikten sonra kapanır."""
+        for surec in self._isciler:
+            surec.terminate()
+        for surec in self._isciler:
+            surec.join()
+        self._isciler = []
+        if self._yazici is not None:
+            self._istek_kuyrugu.put(None)
+            self._yazici.join(zaman_asimi)
+            if self._yazici.is_alive():
+                self._yazici.terminate()
+                self._yazici.join()
+            self._yazici = None
+        if self._soket is not None:
+            self._soket.close()
+            self._soket = None
+
+    def __enter__(self):
+        return self.baslat()
+
+    def __exit__(self, *_):
+        self.durdur()
+
+
+# --- Kıyaslama ---
+
+def _yuzdelik(sirali, oran):
+    return sirali[min(len(sirali) - 1, int(len(sirali) * oran))] if sirali else 0.0
+
+
+def _yuk_uret(adres, sure_sn, baglanti, yazma_orani, satir_sayisi, sonuc_kuyrugu):
+    """Bir istemci süreci: `baglanti` adet keep-alive bağlantıyla `sure_sn` boyunca istek atar."""
+    import http.client
+    import random
+
+    sonuclar = []
+    kilit = threading.Lock()
+
+    def istemci(no):
+        rastgele = random.Random(no)
+        sayac = {"okuma": 0, "yazma": 0, "kilitli": 0, "hata": 0}
+        gecikmeler = []
+        conn = http.client.HTTPConnection(*adres, timeout=30)
+        bitis = time.perf_counter() + sure_sn
+        while (baslangic := time.perf_counter()) < bitis:
+            yazma = rastgele.random() < yazma_orani
+            try:
+                if yazma:
+                    govde = json.dumps({"baslik": f"Yeni Kitap {no}", "yazar": f"Yazar {no}"})
+                    conn.request("POST", "/kitaplar", govde, {"Content-Type": "application/json"})
+                else:
+                    conn.request("GET", f"/kitaplar/{rastgele.randint(1, satir_sayisi)}")
+                yanit = conn.getresponse()
+                veri = yanit.read()
+            except (OSError, http.client.HTTPException):
+                sayac["hata"] += 1
+                conn.close()
+                continue
+            if yanit.status >= 500:
+                sayac["kilitli" if b"locked" in veri else "hata"] += 1
+            elif yazma:
+                sayac["yazma"] += 1
+            else:
+                sayac["okuma"] += 1
+                gecikmeler.append(time.perf_counter() - baslangic)
+        conn.close()
+        with kilit:
+            sonuclar.append((sayac, gecikmeler))
+
+    threadler = [threading.Thread(target=istemci, args=(os.getpid() * 1000 + no,)) for no in range(baglanti)]
+    for t in threadler:
+        t.start()
+    for t in threadler:
+        t.join()
+    sonuc_kuyrugu.put(sonuclar)
+
+
+def yuk_testi(adres, sure_sn=5.0, istemci=2, baglanti=8, yazma_orani=0.05, satir_sayisi=1000):
+    """Sunucuya `istemci` süreçten eşzamanlı okuma/yazma yükü uygular ve özetini döndürür."""
+    baglam = multiprocessing.get_context()
+    sonuc_kuyrugu = baglam.Queue()
+    surecler = [
+        baglam.Process(target=_yuk_uret, args=(adres, sure_sn, baglanti, yazma_orani, satir_sayisi, sonuc_kuyrugu))
+        for _ in range(istemci)
+    ]
+    baslangic = time.perf_counter()
+    for s in surecler:
+        s.start()
+    parcalar = [p for _ in surecler for p in sonuc_kuyrugu.get()]
+    for s in surecler:
+        s.join()
+    sure = time.perf_counter() - baslangic
+
+    toplam = {"okuma": 0, "yazma": 0, "kilitli": 0, "hata": 0}
+    gecikmeler = []
+    for sayac, g in parcalar:
+        for ad, n in sayac.items():
+            toplam[ad] += n
+        gecikmeler.extend(g)
+    gecikmeler.sort()
+    return {
+        **toplam,
+        "okuma_per_sn": toplam["okuma"] / sure,
+        "yazma_per_sn": toplam["yazma"] / sure,
+        "okuma_p50_ms": _yuzdelik(gecikmeler, 0.50) * 1000,
+        "okuma_p95_ms": _yuzdelik(gecikmeler, 0.95) * 1000,
+    }
+
+
+def kiyasla(isci_sayilari=(1, 2, 4), sure_sn=5.0, istemci=None, baglanti=8, yazma_orani=0.05,
+            satir_sayisi=100_000, klasor=None):
+    """Eski düzeni (rollback journal, her işçi yazar) tek yazıcı + WAL düzeniyle karşılaştırır.
+
+    Her işçi sayısı için sunucu aynı veritabanının yeni bir kopyası üzerinde
+    başlatılır ve aynı yük uygulanır. Yük, `istemci` süreç x `baglanti` keep-alive
+    bağlantıdan oluşur; isteklerin `yazma_orani` kadarı ekleme, kalanı id ile okumadır.
+    `istemci` verilmezse en büyük işçi sayısı kadar istemci süreci açılır.
+    İstemciler de CPU kullandığından ölçeklenme yalnızca yeterli çekirdekte görülür.
+    """
+    import shutil
+    import tempfile
+
+    istemci = istemci or max(isci_sayilari)
+    duzenler = {"eski": (False, ESKI_PRAGMALAR), "tek_yazici": (True, VARSAYILAN_PRAGMALAR)}
+    sonuclar = {ad: {} for ad in duzenler}
+    with tempfile.TemporaryDirectory(dir=klasor) as gecici:
+        kaynak = os.path.join(gecici, "kaynak.db")
+        conn = sqlite3.connect(kaynak)
+        conn.execute(TABLO_DDL)
+        conn.executemany(
+            "INSERT INTO kitaplar (baslik, yazar) VALUES (?, ?)",
+            ((f"Kitap {i}", f"Yazar {i % 1000}") for i in range(satir_sayisi)),
+        )
+        conn.commit()
+        conn.close()
+
+        for ad, (tek_yazici, pragmalar) in duzenler.items():
+            for isci in isci_sayilari:
+                db_dosyasi = os.path.join(gecici, f"{ad}_{isci}.db")
+                shutil.copyfile(kaynak, db_dosyasi)
+                with CokSurecliSunucu(db_dosyasi, isci=isci, adres=("127.0.0.1", 0), tek_yazici=tek_yazici,
+                                      pragmalar=pragmalar, havuz_boyutu=baglanti) as sunucu:
+                    sonuclar[ad][isci] = yuk_testi(sunucu.adres, sure_sn, istemci, baglanti, yazma_orani,
+                                                   satir_sayisi)
+    return sonuclar
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="kitaplar tablosunu çok süreçli, tek yazıcılı sunar.")
+    parser.add_argument("db", nargs="?", default="kitaplik_core.db", help="Sunulacak SQLite dosyası")
+    parser.add_argument("--isci", type=int, nargs="+", default=None,
+                        help="İşçi süreci sayısı (kıyaslamada birden fazla verilebilir)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8050)
+    parser.add_argument("--aralik-ms", type=float, default=10, help="Grup commit bekleme aralığı")
+    parser.add_argument("--kiyasla", action="store_true", help="Sunmak yerine eşzamanlılık kıyaslaması yap")
+    parser.add_argument("--sure", type=float, default=5.0, help="Kıyaslamada her ölçümün süresi (sn)")
+    parser.add_argument("--istemci", type=int, default=None, help="Kıyaslamada yük üreten süreç sayısı")
+    parser.add_argument("--yazma-orani", type=float, default=0.05, help="Kıyaslamada yazma isteklerinin oranı")
+    args = parser.parse_args()
+
+    if args.kiyasla:
+        isci_sayilari = args.isci or (1, 2, 4)
+        sonuclar = kiyasla(isci_sayilari, args.sure, args.istemci, yazma_orani=args.yazma_orani)
+        print(f"--- Eşzamanlılık Kıyaslaması ({os.cpu_count()} çekirdek, %{args.yazma_orani * 100:.0f} yazma) ---")
+        print(f"{'Düzen':<12}{'İşçi':>5}{'Okuma/sn':>10}{'Hızlanma':>10}{'Yazma/sn':>10}"
+              f"{'p50 ms':>8}{'p95 ms':>8}{'locked':>8}{'Diğer':>7}")
+        for duzen, olcumler in sonuclar.items():
+            temel = olcumler[isci_sayilari[0]]["okuma_per_sn"] or 1
+            for isci, s in olcumler.items():
+                print(f"{duzen:<12}{isci:>5}{s['okuma_per_sn']:>10.0f}{s['okuma_per_sn'] / temel:>9.1f}x"
+                      f"{s['yazma_per_sn']:>10.0f}{s['okuma_p50_ms']:>8.1f}{s['okuma_p95_ms']:>8.1f}"
+                      f"{s['kilitli']:>8}{s['hata']:>7}")
+    else:
+        sunucu = CokSurecliSunucu(args.db, isci=args.isci[0] if args.isci else None,
+                                  adres=(args.host, args.port), aralik_ms=args.aralik_ms)
+        # SIGTERM (ör. systemd) de Ctrl+C gibi düzgün kapanışa gider
+        signal.signal(signal.SIGTERM, signal.default_int_handler)
+        sunucu.baslat()
+        print(f"✅ {args.db}: http://{sunucu.adres[0]}:{sunucu.adres[1]} "
+              f"({sunucu.isci} işçi + 1 yazıcı süreç). Durdurmak için Ctrl+C.")
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            print("\nKapatılıyor; kuyruktaki yazmalar commit ediliyor...")
+        finally:
+            sunucu.durdur()
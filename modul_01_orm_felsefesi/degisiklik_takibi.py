@@ -0,0 +1,100 @@
+"""
+Modül 1 - Yardımcı: Değişiklik Takibi (Ekleme / Güncelleme / Silme Olayları)
+
+Flet örneklerinde her yazma işleminden sonra tüm tablo yeniden sorgulanıp
+liste baştan çiziliyordu: tek bir satır değişse bile O(tablo) iş yapılıyordu.
+
+Bu modülde yazma işlemleri, etkilenen satırı taşıyan bir OLAY yayınlar:
+    Degisiklik(tur="ekle", satir=(4, "Suç ve Ceza", "Fyodor Dostoyevski"))
+Arayüz bu olaya abone olur ve sadece ilgili kontrolü günceller (O(1)).
+
+- Yayınlanan satır, yazma ifadesinin kendisinden gelir (`INSERT/UPDATE/DELETE ...
+  RETURNING`, bkz. `kitap_sorgulari.py`); her işlem tek bir ifadedir ve ek bir SELECT gerekmez.
+
+Ham SQL laboratuvarındaki keyfi (saldırı) sorgular için hangi satırın
+değiştiğini bilemeyiz; orada `degisiklik_imzasi()` ile en azından "bir şey
+değişti mi?" sorusunu ucuzca cevaplayıp gereksiz yenilemeleri atlıyoruz.
+"""
+
+import threading
+from collections import namedtuple
+
+EKLE = "ekle"
+GUNCELLE = "guncelle"
+SIL = "sil"
+
+Degisiklik = namedtuple("Degisiklik", ["tur", "satir"])
+
+
+class DegisiklikYayini:
+    """Yazma olaylarını abonelere dağıtan basit, thread-safe yayın kanalı."""
+
+    def __init__(self):
+        self._aboneler = []
+        self._kilit = threading.Lock()
+
+    def abone_ol(self, islev):
+        with self._kilit:
+            self._aboneler.append(islev)
+        return islev
+
+    def abonelikten_cik(self, islev):
+        with self._kilit:
+            if islev in self._aboneler:
+                self._aboneler.remove(islev)
+
+    def yayinla(self, tur, satir):
+        degisiklik = Degisiklik(tur, tuple(satir))
+        with self._kilit:
+            aboneler = list(self._aboneler)
+        for islev in aboneler:
+            islev(degisiklik)
+        return degisiklik
+
+
+class TakipliKitapYazici:
+    """Core üzerinden yazar ve her yazmadan sonra etkilenen satırı yayınlar.
+
+    Her işlem kendi transaction'ında commit edilir; olay ancak commit
+    başarılı olduktan sonra yayınlanır.
+    """
+
+    def __init__(self, engine, sorgular, yayin=None):
+        self.engine = engine
+        self.sorgular = sorgular
+        self.yayin = yayin or DegisiklikYayini()
+
+    def ekle(self, baslik, yazar):
+        with self.engine.connect() as conn:
+            satir = self.sorgular.ekle(conn, baslik, yazar)
+            conn.commit()
+        self.yayin.yayinla(EKLE, satir)
+        return satir
+
+    def baslik_guncelle(self, kitap_id, yeni_baslik):
+        with self.engine.connect() as conn:
+            satir = self.sorgular.id_ile_baslik_guncelle(conn, kitap_id, yeni_baslik)
+            conn.commit()
+        if satir is not None:
+            self.yayin.yayinla(GUNCELLE, satir)
+        return satir
+
+    def en_son_sil(self):
+        # `SELECT max(id)` + `DELETE` yerine tek ifade: iki ifade arasında başka bir
+        # oturumun aynı satırı silmesi (veya yeni satır eklemesi) ihtimali ortadan kalkar.
+        with self.engine.connect() as conn:
+            satir = self.sorgular.en_sonu_sil(conn)
+            conn.commit()
+        if satir is not None:
+            self.yayin.yayinla(SIL, satir)
+        return satir
+
+
+def degisiklik_imzasi(conn):
+    """Ham sqlite3 bağlantısında veri veya şema değişikliğini gösteren ucuz bir imza.
+
+    `total_changes` bu bağlantıdaki INSERT/UPDATE/DELETE sayısını, `schema_version`
+    ise CREATE/DROP gibi şema değişikliklerini yansıtır. Bir sorgudan önce ve sonra
+    alınan imzalar eşitse veritabanı değişmemiştir ve listeyi yenilemeye gerek yoktur.
+    """
+    return conn.total_changes, conn.execute("PRAGMA schema_version").fetchone()[0]
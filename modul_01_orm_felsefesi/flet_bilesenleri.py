@@ -0,0 +1,218 @@
+"""
+Modül 1 - Yardımcı: Flet Örneklerinde Ortak Kullanılan Arayüz Bileşenleri
+
+`SayfaliKitapListesi`, kitap listesini tek seferde değil, kullanıcı aşağı
+kaydırdıkça sayfa sayfa yükler:
+- Veri, `sayfalama.py` içindeki keyset kaynaklarından (`id > son_id`) gelir.
+- Liste sonuna yaklaşıldığında (`on_scroll`) bir sonraki sayfa istenir.
+- `yenile()` listeyi `controls.clear()` ile silip baştan kurmaz; ekrandaki
+  `ft.Text` kontrollerini yerinde günceller. Değeri değişmeyen kontrol için
+  tarayıcıya hiçbir şey gönderilmez.
+- `uygula()` tek bir değişiklik olayını (`degisiklik_takibi.py`) sadece ilgili
+  satıra yansıtır; yazma işleminden sonra tabloyu yeniden sorgulamaya gerek kalmaz.
+
+`SorguOlcumPaneli`, `sorgu_olcumu.SorguOlcer` istatistiklerini (kalıp başına
+sayı, süre, p95, satır ve son yavaş sorgular) terminal yerine arayüzde gösterir.
+"""
+
+import threading
+
+import flet as ft
+
+from degisiklik_takibi import EKLE, GUNCELLE, SIL
+
+
+def kitap_satiri_metni(satir):
+    return f"ID: {satir[0]}, Başlık: {satir[1]}, Yazar: {satir[2]}"
+
+
+class SayfaliKitapListesi:
+    """Keyset kaynağından beslenen, kaydırdıkça yüklenen kitap listesi.
+
+    Args:
+        kaynak: `sayfa(son_id, limit)` yöntemi olan bir sayfa kaynağı.
+        sayfa_boyutu: Her seferde yüklenecek satır sayısı.
+        hata_turleri: Yakalanıp listede hata mesajı olarak gösterilecek istisnalar
+            (ör. tablo silindiğinde `sqlite3.OperationalError`).
+        bos_mesaj: Tablo boşsa gösterilecek metin.
+        esik: Listenin sonuna kaç piksel kala yeni sayfa isteneceği.
+    """
+
+    def __init__(self, kaynak, sayfa_boyutu=50, hata_turleri=(), bos_mesaj=None,
+                 hata_mesaji="❌ HATA: 'kitaplar' tablosu bulunamadı!", esik=200, **liste_ayarlari):
+        self.kaynak = kaynak
+        self.sayfa_boyutu = sayfa_boyutu
+        self.hata_turleri = tuple(hata_turleri)
+        self.bos_mesaj = bos_mesaj
+        self.hata_mesaji = hata_mesaji
+        self.esik = esik
+
+        liste_ayarlari.setdefault("spacing", 5)
+        self.view = ft.ListView(on_scroll=self._kaydirildi, scroll_interval=100, **liste_ayarlari)
+
+        self._satir_kontrolleri = []  # Ekrandaki kitap satırları (sırasıyla)
+        self._id_kontrolleri = {}  # kitap id -> o satırın kontrolü
+        self._son_id = 0
+        self._bitti = False
+        self._kilit = threading.Lock()
+
+    # --- Yükleme ---
+
+    def _getir(self, son_id, limit):
+        try:
+            return self.kaynak.sayfa(son_id, limit), None
+        except self.hata_turleri:
+            return [], ft.Text(self.hata_mesaji, color=ft.Colors.RED, weight=ft.FontWeight.BOLD)
+
+    def _listeyi_yansit(self, hata_kontrolu=None):
+        kontroller = list(self._satir_kontrolleri)
+        if hata_kontrolu is not None:
+            kontroller.append(hata_kontrolu)
+        elif not kontroller and self.bos_mesaj:
+            kontroller.append(ft.Text(self.bos_mesaj, color=ft.Colors.RED))
+        self.view.controls = kontroller
+
+    def _satir_ekle(self, satir):
+        kontrol = ft.Text(kitap_satiri_metni(satir), data=satir[0])
+        self._satir_kontrolleri.append(kontrol)
+        self._id_kontrolleri[satir[0]] = kontrol
+
+    def sonraki_sayfa(self):
+        """Bir sonraki sayfayı listenin sonuna ekler. Yeni satır geldiyse True döner."""
+        with self._kilit:
+            if self._bitti:
+                return False
+            satirlar, hata = self._getir(self._son_id, self.sayfa_boyutu)
+            if hata is not None:
+                self._bitti = True
+                self._listeyi_yansit(hata)
+                return False
+            for satir in satirlar:
+                self._satir_ekle(satir)
+            if satirlar:
+                self._son_id = satirlar[-1][0]
+            self._bitti = len(satirlar) < self.sayfa_boyutu
+            self._listeyi_yansit()
+            return bool(satirlar)
+
+    def yenile(self):
+        """Şu an yüklü olan kadar satırı baştan tek sorguyla okur ve kontrolleri yerinde günceller.
+
+        Sayfa güncellemesini (`page.update()`) çağıran yapar.
+        """
+        with self._kilit:
+            limit = max(self.sayfa_boyutu, len(self._satir_kontrolleri))
+            satirlar, hata = self._getir(0, limit)
+
+            kontroller = self._satir_kontrolleri
+            self._id_kontrolleri = {}
+            for i, satir in enumerate(satirlar):
+                metin = kitap_satiri_metni(satir)
+                if i < len(kontroller):
+                    # Var olan kontrolü yeniden kullan; metin aynıysa Flet fark göndermez
+                    kontroller[i].value = metin
+                    kontroller[i].data = satir[0]
+                else:
+                    kontroller.append(ft.Text(metin, data=satir[0]))
+                self._id_kontrolleri[satir[0]] = kontroller[i]
+            del kontroller[len(satirlar):]
+
+            self._son_id = satirlar[-1][0] if satirlar else 0
+            self._bitti = hata is not None or len(satirlar) < limit
+            self._listeyi_yansit(hata)
+
+    def uygula(self, degisiklik):
+        """Tek bir ekleme/güncelleme/silme olayını sadece ilgili satıra yansıtır.
+
+        Liste değiştiyse True döner; sayfa güncellemesini (`page.update()`) çağıran yapar.
+        """
+        tur, satir = degisiklik
+        with self._kilit:
+            kontrol = self._id_kontrolleri.get(satir[0])
+            if tur == GUNCELLE and kontrol is not None:
+                kontrol.value = kitap_satiri_metni(satir)
+                return True
+            if tur == SIL and kontrol is not None:
+                del self._id_kontrolleri[satir[0]]
+                self._satir_kontrolleri.remove(kontrol)
+                if self._bitti:
+                    # SQLite silinen en büyük id'yi tekrar kullanabilir; sınırı geri çek
+                    self._son_id = self._satir_kontrolleri[-1].data if self._satir_kontrolleri else 0
+                self._listeyi_yansit()
+                return True
+            if tur == EKLE and self._bitti and satir[0] > self._son_id:
+                # Liste sonuna kadar yüklüyse yeni satırı ekle; değilse kaydırınca zaten gelecek
+                self._satir_ekle(satir)
+                self._son_id = satir[0]
+                self._listeyi_yansit()
+                return True
+            return False
+
+    def _kaydirildi(self, e):
+        if e.max_scroll_extent is None or e.pixels is None:
+            return
+        if e.max_scroll_extent - e.pixels <= self.esik and self.sonraki_sayfa():
+            self.view.update()
+
+
+class SorguOlcumPaneli:
+    """Bir `SorguOlcer`'ın en çok zaman harcayan kalıplarını ve yavaş sorgularını gösteren panel.
+
+    Panel kendiliğinden yenilenmez; `yenile()` çağrıldığında (ör. her işlemden sonra)
+    ölçerden tek bir özet okur. Böylece ölçüm yolu arayüzden bağımsız ve ucuz kalır.
+    """
+
+    def __init__(self, olcer, ilk=10, kalip_genisligi=80):
+        self.olcer = olcer
+        self.ilk = ilk
+        self.kalip_genisligi = kalip_genisligi
+
+        self._tablo = ft.DataTable(
+            columns=[
+                ft.DataColumn("Sayı", numeric=True),
+                ft.DataColumn("Ort. ms", numeric=True),
+                ft.DataColumn("p95 ms", numeric=True),
+                ft.DataColumn("Satır", numeric=True),
+                ft.DataColumn("Kalıp"),
+            ],
+            rows=[],
+        )
+        self._yavaslar = ft.Text(size=12, color=ft.Colors.RED_700)
+        self.view = ft.Column([
+            ft.Row([
+                ft.Text("Sorgu Ölçümleri", size=18, weight=ft.FontWeight.BOLD),
+                ft.IconButton(icon=ft.Icons.REFRESH, on_click=self._yenile_tiklandi, tooltip="Ölçümleri Yenile"),
+                ft.IconButton(icon=ft.Icons.DELETE_SWEEP, on_click=self._sifirla_tiklandi, tooltip="Sıfırla"),
+            ]),
+            self._tablo,
+            self._yavaslar,
+        ])
+
+    def _kisalt(self, kalip):
+        return kalip if len(kalip) <= self.kalip_genisligi else kalip[:self.kalip_genisligi - 1] + "…"
+
+    def yenile(self):
+        """Ölçerden güncel özeti okuyup tabloya yansıtır. `page.update()` çağıran yapar."""
+        self._tablo.rows = [
+            ft.DataRow(cells=[
+                ft.DataCell(str(s["sayi"] or f"({s['izlenen']})")),
+                ft.DataCell(f"{s['ortalama_ms']:.3f}"),
+                ft.DataCell(f"{s['p95_ms']:.2f}"),
+                ft.DataCell(str(s["satir"])),
+                ft.DataCell(ft.Text(self._kisalt(s["kalip"]), selectable=True)),
+            ])
+            for s in self.olcer.ozet(ilk=self.ilk)
+        ]
+        yavaslar = self.olcer.yavas_sorgular()[-3:]
+        self._yavaslar.value = "\n".join(
+            f"🐢 {y['sure_ms']:.1f} ms: {self._kisalt(y['kalip'])}" for y in reversed(yavaslar)
+        )
+
+    def _yenile_tiklandi(self, e):
+        self.yenile()
+        self.view.update()
+
+    def _sifirla_tiklandi(self, e):
+        self.olcer.sifirla()
+        self.yenile()
+        self.view.update()
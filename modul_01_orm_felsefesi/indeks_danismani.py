@@ -0,0 +1,556 @@
+"""
+Modül 1 - Yardımcı: Gözlenen WHERE Koşullarından İndeks Önerisi
+
+Dört örnekteki `kitaplar` tablosunda yalnızca birincil anahtar var. Oysa her
+arama `yazar`'a (`yazara_gore_kitap_bul`, `arama_yap_guvenli`), her güncelleme
+ve silme `baslik`'a göre süzer; yani her biri TÜM TABLOYU tarar. 3 satırda
+fark edilmez, bir milyon satırda her tıklama yüzlerce milisaniye sürer.
+
+Bu modül indeks kararını tahmine değil, gerçekten çalışan sorgulara dayandırır:
+- Motorun (`motora_bagla`) veya ham sqlite3 bağlantısının (`sqlite3_bagla`)
+  çalıştırdığı SELECT/UPDATE/DELETE ifadelerinden her kalıp için bir örnek saklar.
+- Her örneğin planını çıkarır: SQLite'ta `EXPLAIN QUERY PLAN`, PostgreSQL'de
+  `EXPLAIN (FORMAT JSON)`. Planda tam tablo taraması (`SCAN kitaplar` /
+  `Seq Scan`) varsa ve ifade o tablonun sütunlarına göre süzüyorsa bir öneri üretir.
+- Bileşik indekslerde önce eşitlik (`=`, `IN`), sonra aralık (`<`, `>`, `BETWEEN`)
+  sütunları gelir; sıralama geçici bir B-ağacıyla yapılıyorsa ORDER BY sütunları
+  eklenir. `kapsayan=True` ile seçilen sütunlar da indekse katılır (covering index).
+- `kiyasla_ve_uygula()` önerileri uygular ve her ifadenin öncesi/sonrası
+  gecikmesini ölçer; yazma ifadeleri geri alınan bir işlem içinde ölçülür.
+- `alembic_gocu_yaz()` önerileri bir Alembic göç dosyasına dönüştürür
+  (PostgreSQL'de `CREATE INDEX CONCURRENTLY`, tabloyu kilitlemeden).
+
+`LIKE '%metin%'` gibi baştan joker içeren aramalar B-ağacı indeksiyle
+hızlanmaz; onlar için `kitap_arama.py`'deki tam metin indeksi kullanılmalıdır.
+
+Dosya doğrudan çalıştırılırsa büyük bir tabloda ders fonksiyonlarının
+sorgularını gözler, önerileri uygular ve öncesi/sonrası süreleri yazdırır.
+"""
+
+import json
+import re
+import statistics
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+import sqlalchemy as sa
+from sqlalchemy import event
+
+from sorgu_olcumu import sorgu_kalibi
+
+# --- İfade Çözümleme ---
+
+_ANALIZ_EDILEN = re.compile(r"^\s*(SELECT|UPDATE|DELETE)\b", re.IGNORECASE)
+_TABLOLAR = re.compile(
+    r"\b(?:FROM|JOIN|UPDATE|INTO)\s+\"?(\w+)\"?(?:\s+(?:AS\s+)?(?!WHERE|SET|ORDER|GROUP|LIMIT|JOIN|ON|INNER|LEFT|RETURNING)(\w+))?",
+    re.IGNORECASE,
+)
+_WHERE = re.compile(r"\bWHERE\b(.*?)(?:\bGROUP\s+BY\b|\bORDER\s+BY\b|\bLIMIT\b|\bRETURNING\b|$)", re.IGNORECASE | re.DOTALL)
+_ORDER_BY = re.compile(r"\bORDER\s+BY\b(.*?)(?:\bLIMIT\b|\bOFFSET\b|\bRETURNING\b|$)", re.IGNORECASE | re.DOTALL)
+_SECILENLER = re.compile(r"^\s*SELECT\s+(.*?)\s+FROM\b", re.IGNORECASE | re.DOTALL)
+_KOSUL = re.compile(
+    r"(?:\"?(\w+)\"?\.)?\"?(\w+)\"?\s*(==|=|<=|>=|<>|!=|<|>|\bIN\b|\bIS\b|\bBETWEEN\b|\bLIKE\b)",
+    re.IGNORECASE,
+)
+_ESITLIK = {"=", "==", "IN", "IS"}
+_ARALIK = {"<", ">", "<=", ">=", "BETWEEN"}
+_SQLITE_TARAMA = re.compile(r"^SCAN (?:TABLE )?(\w+)(?: AS (\w+))?$")
+
+
+def _sutun_adi(ifade):
+    """`kitaplar.yazar DESC` -> `yazar`; basit bir sütun değilse None."""
+    parcalar = ifade.strip().split()
+    if not parcalar or len(parcalar) > 2:
+        return None
+    ad = parcalar[0].split(".")[-1].strip('"')
+    return ad if re.fullmatch(r"\w+", ad) else None
+
+
+def kosul_sutunlari(sql, tablo, takma_adlar, sutunlar):
+    """İfadenin WHERE kısmında `tablo`'ya ait sütunları (eşitlik, aralık) listeleri olarak döndürür."""
+    eslesme = _WHERE.search(sql)
+    if not eslesme:
+        return [], []
+    esitlik, aralik = [], []
+    for on_ek, sutun, islec in _KOSUL.findall(eslesme.group(1)):
+        if on_ek and on_ek not in takma_adlar:
+            continue
+        if sutun not in sutunlar:
+            continue
+        islec = islec.upper()
+        if islec in _ESITLIK and sutun not in esitlik:
+            esitlik.append(sutun)
+        elif islec in _ARALIK and sutun not in aralik:
+            aralik.append(sutun)
+        # LIKE: SQLite varsayılan (büyük/küçük harf duyarsız) LIKE'ta indeksi kullanmaz.
+    return esitlik, [s for s in aralik if s not in esitlik]
+
+
+def siralama_sutunlari(sql, sutunlar):
+    eslesme = _ORDER_BY.search(sql)
+    if not eslesme:
+        return []
+    adlar = [_sutun_adi(parca) for parca in eslesme.group(1).split(",")]
+    return adlar if all(ad in sutunlar for ad in adlar) else []
+
+
+def secilen_sutunlar(sql, sutunlar):
+    eslesme = _SECILENLER.search(sql)
+    if not eslesme:
+        return []
+    adlar = [_sutun_adi(parca.split(" AS ")[0]) for parca in eslesme.group(1).split(",")]
+    return adlar if all(ad in sutunlar for ad in adlar) else []
+
+
+# --- Öneri ---
+
+class IndeksOnerisi:
+    """Tek bir tablo için önerilen (bileşik / kapsayan) indeks."""
+
+    __slots__ = ("tablo", "sutunlar", "kapsanan", "kaliplar", "neden")
+
+    def __init__(self, tablo, sutunlar, kapsanan=(), kaliplar=None, neden=""):
+        self.tablo = tablo
+        self.sutunlar = tuple(sutunlar)
+        self.kapsanan = tuple(s for s in kapsanan if s not in sutunlar)
+        self.kaliplar = list(kaliplar or [])
+        self.neden = neden
+
+    @property
+    def tum_sutunlar(self):
+        return self.sutunlar + self.kapsanan
+
+    @property
+    def ad(self):
+        # backend/models/base.py'deki `ix_%(column_0_label)s` kuralıyla aynı biçim
+        return f"ix_{self.tablo}_{'_'.join(self.tum_sutunlar)}"
+
+    def ddl(self, eszamanli=False):
+        """`CREATE INDEX` ifadesi; `eszamanli=True` PostgreSQL'de `CONCURRENTLY` ekler."""
+        eszamanli = " CONCURRENTLY" if eszamanli else ""
+        return f"CREATE INDEX{eszamanli} IF NOT EXISTS {self.ad} ON {self.tablo} ({', '.join(self.tum_sutunlar)})"
+
+    def sozluk(self):
+        return {
+            "ad": self.ad,
+            "tablo": self.tablo,
+            "sutunlar": list(self.sutunlar),
+            "kapsanan": list(self.kapsanan),
+            "neden": self.neden,
+            "kaliplar": self.kaliplar,
+        }
+
+    def __repr__(self):
+        return f"<IndeksOnerisi {self.ad}>"
+
+
+def onerileri_birlestir(oneriler):
+    """Aynı indeksi isteyen önerileri birleştirir; başka bir önerinin ön eki olanları atar.
+
+    (yazar) ve (yazar, baslik) birlikte önerildiyse ikincisi ilkinin sorgularını da karşılar.
+    """
+    birlesik = {}
+    for oneri in oneriler:
+        anahtar = (oneri.tablo, oneri.tum_sutunlar)
+        if anahtar in birlesik:
+            birlesik[anahtar].kaliplar.extend(k for k in oneri.kaliplar if k not in birlesik[anahtar].kaliplar)
+        else:
+            birlesik[anahtar] = oneri
+    sonuc = list(birlesik.values())
+    for kisa in list(sonuc):
+        for uzun in sonuc:
+            if (uzun is not kisa and uzun.tablo == kisa.tablo and len(uzun.tum_sutunlar) > len(kisa.tum_sutunlar)
+                    and uzun.tum_sutunlar[:len(kisa.tum_sutunlar)] == kisa.tum_sutunlar):
+                uzun.kaliplar.extend(k for k in kisa.kaliplar if k not in uzun.kaliplar)
+                sonuc.remove(kisa)
+                break
+    return sonuc
+
+
+# --- Danışman ---
+
+class IndeksDanismani:
+    """Çalışan ifadeleri gözleyip tam tablo taramalarına indeks öneren yardımcı.
+
+    Args:
+        engine: Planların çıkarılacağı ve indekslerin kurulacağı senkron motor.
+        kapsayan: True ise SELECT'te seçilen sütunlar da indekse eklenir.
+    """
+
+    def __init__(self, engine, kapsayan=False):
+        self.engine = engine
+        self.kapsayan = kapsayan
+        self._ornekler = {}  # kalıp -> {"sql", "parametreler", "sayi"}
+        self._kilit = threading.Lock()
+        self._durdu = threading.local()
+
+    # --- Gözlem ---
+
+    def kaydet(self, sql, parametreler=None):
+        if getattr(self._durdu, "evet", False) or not _ANALIZ_EDILEN.match(sql):
+            return
+        kalip = sorgu_kalibi(sql)
+        with self._kilit:
+            ornek = self._ornekler.get(kalip)
+            if ornek is None:
+                self._ornekler[kalip] = {"sql": sql, "parametreler": parametreler, "sayi": 1}
+            else:
+                ornek["sayi"] += 1
+
+    def motora_bagla(self, engine=None):
+        """Motorun çalıştırdığı ifadeleri gözlemeye başlar (varsayılan: danışmanın motoru)."""
+        event.listen(engine or self.engine, "before_cursor_execute", self._once)
+        return engine or self.engine
+
+    def motordan_ayir(self, engine=None):
+        event.remove(engine or self.engine, "before_cursor_execute", self._once)
+
+    def _once(self, conn, cursor, statement, parameters, context, executemany):
+        if not executemany:
+            self.kaydet(statement, parameters)
+
+    def sqlite3_bagla(self, conn):
+        """Ham bir sqlite3 bağlantısına trace callback kurar (değerler ifadeye gömülü gelir).
+
+        Bir bağlantının tek bir trace callback'i olabilir; `SorguOlcer.sqlite3_bagla`
+        ile birlikte kullanılacaksa ikisini çağıran bir fonksiyon verilmelidir.
+        """
+        conn.set_trace_callback(self.kaydet)
+        return conn
+
+    def ornekler(self):
+        with self._kilit:
+            return {kalip: dict(ornek) for kalip, ornek in self._ornekler.items()}
+
+    def sifirla(self):
+        with self._kilit:
+            self._ornekler.clear()
+
+    @contextmanager
+    def _gozlem_durdu(self):
+        # Danışmanın kendi EXPLAIN ve ölçüm sorguları gözleme karışmasın
+        self._durdu.evet = True
+        try:
+            yield
+        finally:
+            self._durdu.evet = False
+
+    # --- Plan ---
+
+    def plan(self, conn, sql, parametreler=None):
+        """İfadenin planını okunabilir satırlar olarak döndürür."""
+        if self.engine.dialect.name == "postgresql":
+            ham = conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {sql}", parametreler or ()).scalar()
+            return _postgres_dugumleri(json.loads(ham) if isinstance(ham, str) else ham)
+        return [satir[-1] for satir in conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}", parametreler or ())]
+
+    def taranan_tablolar(self, plan_satirlari):
+        """Plandaki tam tablo taramalarını `{ad_veya_takma_ad}` kümesi olarak döndürür."""
+        taranan = set()
+        for satir in plan_satirlari:
+            if self.engine.dialect.name == "postgresql":
+                if satir.startswith("Seq Scan on "):
+                    taranan.update(satir[len("Seq Scan on "):].split())
+            else:
+                eslesme = _SQLITE_TARAMA.match(satir)
+                if eslesme:
+                    taranan.update(ad for ad in eslesme.groups() if ad)
+        return taranan
+
+    def analiz_et(self):
+        """Gözlenen ifadelerden indeks önerilerini üretir."""
+        denetci = sa.inspect(self.engine)
+        semalar = {}
+
+        def sema(tablo):
+            if tablo not in semalar:
+                try:
+                    sutunlar = [s["name"] for s in denetci.get_columns(tablo)]
+                    birincil = set(denetci.get_pk_constraint(tablo)["constrained_columns"])
+                    indeksler = [tuple(i["column_names"]) for i in denetci.get_indexes(tablo)]
+                except sa.exc.NoSuchTableError:
+                    sutunlar, birincil, indeksler = [], set(), []
+                semalar[tablo] = (sutunlar, birincil, indeksler)
+            return semalar[tablo]
+
+        oneriler = []
+        with self._gozlem_durdu(), self.engine.connect() as conn:
+            for kalip, ornek in self.ornekler().items():
+                try:
+                    plan_satirlari = self.plan(conn, ornek["sql"], ornek["parametreler"])
+                except sa.exc.DBAPIError:
+                    conn.rollback()
+                    continue
+                taranan = self.taranan_tablolar(plan_satirlari)
+                if not taranan:
+                    continue
+                for tablo, takma_ad in _TABLOLAR.findall(ornek["sql"]):
+                    adlar = {tablo, takma_ad} - {""}
+                    if not adlar & taranan:
+                        continue
+                    sutunlar, birincil, indeksler = sema(tablo)
+                    adaylar = [s for s in sutunlar if s not in birincil]
+                    esitlik, aralik = kosul_sutunlari(ornek["sql"], tablo, adlar, adaylar)
+                    if not esitlik and not aralik:
+                        continue
+                    secim = esitlik + aralik[:1]
+                    if not aralik and any("ORDER BY" in s or "Sort" in s for s in plan_satirlari):
+                        secim += [s for s in siralama_sutunlari(ornek["sql"], adaylar) if s not in secim]
+                    kapsanan = secilen_sutunlar(ornek["sql"], adaylar) if self.kapsayan else ()
+                    oneri = IndeksOnerisi(tablo, secim, kapsanan, [kalip], neden=f"{'; '.join(plan_satirlari)}")
+                    if any(indeks[:len(oneri.tum_sutunlar)] == oneri.tum_sutunlar for indeks in indeksler):
+                        continue  # Zaten var; planlayıcı bilerek kullanmıyor (ör. düşük seçicilik)
+                    oneriler.append(oneri)
+        return onerileri_birlestir(oneriler)
+
+    # --- Uygulama ve Ölçüm ---
+
+    def uygula(self, oneriler):
+        """Önerilen indeksleri kurar ve planlayıcı istatistiklerini günceller."""
+        postgres = self.engine.dialect.name == "postgresql"
+        with self._gozlem_durdu():
+            # CONCURRENTLY bir işlem (transaction) içinde çalışamaz
+            with self.engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+                for oneri in oneriler:
+                    conn.exec_driver_sql(oneri.ddl(eszamanli=postgres))
+                for tablo in {o.tablo for o in oneriler}:
+                    conn.exec_driver_sql(f"ANALYZE {tablo}")
+
+    def olc(self, tekrar=10):
+        """Her gözlenen ifadenin medyan süresini (ms) ve planını döndürür.
+
+        Yazma ifadeleri her seferinde geri alınan bir işlem içinde çalışır; veri değişmez.
+        """
+        sonuc = {}
+        with self._gozlem_durdu(), self.engine.connect() as conn:
+            for kalip, ornek in self.ornekler().items():
+                sureler = []
+                try:
+                    plan_satirlari = self.plan(conn, ornek["sql"], ornek["parametreler"])
+                    conn.rollback()
+                    for _ in range(tekrar):
+                        baslangic = time.perf_counter()
+                        sonuc_kumesi = conn.exec_driver_sql(ornek["sql"], ornek["parametreler"] or ())
+                        if sonuc_kumesi.returns_rows:
+                            sonuc_kumesi.fetchall()
+                        sureler.append(time.perf_counter() - baslangic)
+                        conn.rollback()  # Yazma ifadelerinin etkisi geri alınır
+                except sa.exc.DBAPIError:
+                    conn.rollback()
+                    continue
+                sonuc[kalip] = {"ms": statistics.median(sureler) * 1000, "plan": plan_satirlari}
+        return sonuc
+
+    def kiyasla_ve_uygula(self, tekrar=10, oneriler=None):
+        """Önerileri uygular; her ifadenin öncesi/sonrası süresini ve planını döndürür."""
+        oneriler = self.analiz_et() if oneriler is None else oneriler
+        once = self.olc(tekrar)
+        self.uygula(oneriler)
+        sonra = self.olc(tekrar)
+        olcumler = []
+        for kalip, o in once.items():
+            s = sonra.get(kalip)
+            if s is None:
+                continue
+            olcumler.append({
+                "kalip": kalip,
+                "once_ms": o["ms"],
+                "sonra_ms": s["ms"],
+                "hizlanma": o["ms"] / s["ms"] if s["ms"] else float("inf"),
+                "plan_once": o["plan"],
+                "plan_sonra": s["plan"],
+            })
+        olcumler.sort(key=lambda s: s["once_ms"], reverse=True)
+        return {"oneriler": oneriler, "olcumler": olcumler}
+
+    def rapor(self, oneriler=None, olcumler=None, kalip_genisligi=70):
+        """Önerileri (ve varsa öncesi/sonrası ölçümleri) düz metin olarak döndürür."""
+        oneriler = self.analiz_et() if oneriler is None else oneriler
+        satirlar = ["İndeks önerileri:" if oneriler else "İndeks önerisi yok: tam tablo taraması gözlenmedi."]
+        for oneri in oneriler:
+            satirlar.append(f"  {oneri.ddl()}")
+            satirlar.append(f"      plan: {oneri.neden}")
+            for kalip in oneri.kaliplar:
+                satirlar.append(f"      <- {_kisalt(kalip, kalip_genisligi)}")
+        if olcumler:
+            satirlar.append("")
+            satirlar.append(f"{'Önce ms':>10}{'Sonra ms':>10}{'Kat':>8}  Kalıp")
+            for s in olcumler:
+                satirlar.append(
+                    f"{s['once_ms']:>10.3f}{s['sonra_ms']:>10.3f}{s['hizlanma']:>7.1f}x  {_kisalt(s['kalip'], kalip_genisligi)}"
+                )
+        return "\n".join(satirlar)
+
+
+def _kisalt(metin, genislik):
+    return metin if len(metin) <= genislik else metin[:genislik - 1] + "…"
+
+
+def _postgres_dugumleri(plan_json):
+    """`EXPLAIN (FORMAT JSON)` ağacını `Seq Scan on kitaplar k` gibi düz satırlara çevirir."""
+    satirlar = []
+
+    def gez(dugum):
+        satir = dugum["Node Type"]
+        if "Relation Name" in dugum:
+            satir += f" on {dugum['Relation Name']}"
+            if dugum.get("Alias") and dugum["Alias"] != dugum["Relation Name"]:
+                satir += f" {dugum['Alias']}"
+        satirlar.append(satir)
+        for alt in dugum.get("Plans", ()):
+            gez(alt)
+
+    gez(plan_json[0]["Plan"])
+    return satirlar
+
+
+# --- Alembic ---
+
+_GOC_SABLONU = '''"""{mesaj}
+
+Revision ID: {revizyon}
+Revises: {onceki}
+Create Date: {tarih}
+
+indeks_danismani.py tarafından gözlenen sorgulardan üretildi:
+{aciklama}
+"""
+from alembic import op
+
+revision = {revizyon!r}
+down_revision = {onceki!r}
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # PostgreSQL'de CONCURRENTLY tabloyu kilitlemeden indeks kurar; bir işlem içinde
+    # çalışamadığı için autocommit bloğu kullanılır. SQLite bu seçeneği yok sayar.
+    with op.get_context().autocommit_block():
+{yukselt}
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+{geri_al}
+'''
+
+
+def alembic_gocu(oneriler, mesaj="indeks danismani onerileri", revizyon=None, onceki=None):
+    """Önerileri bir Alembic göç betiğinin metnine dönüştürür."""
+    yukselt, geri_al, aciklama = [], [], []
+    for oneri in oneriler:
+        yukselt.append(
+            f"        op.create_index({oneri.ad!r}, {oneri.tablo!r}, {list(oneri.tum_sutunlar)!r}, "
+            f"if_not_exists=True, postgresql_concurrently=True)"
+        )
+        geri_al.append(
+            f"        op.drop_index({oneri.ad!r}, table_name={oneri.tablo!r}, "
+            f"if_exists=True, postgresql_concurrently=True)"
+        )
+        aciklama.extend(f"- {oneri.ad}: {kalip}" for kalip in oneri.kaliplar)
+    return _GOC_SABLONU.format(
+        mesaj=mesaj,
+        revizyon=revizyon or uuid.uuid4().hex[:12],
+        onceki=onceki,
+        tarih=datetime.now().isoformat(sep=" ", timespec="seconds"),
+        aciklama="\n".join(aciklama),
+        yukselt="\n".join(yukselt) or "        pass",
+        geri_al="\n".join(reversed(geri_al)) or "        pass",
+    )
+
+
+def alembic_basi(klasor):
+    """`versions` klasöründeki tek başı (head) bulur; klasör boşsa None döndürür."""
+    revizyonlar, oncekiler = set(), set()
+    for dosya in Path(klasor).glob("*.py"):
+        metin = dosya.read_text(encoding="utf-8")
+        revizyon = re.search(r"^revision\s*=\s*['\"](\w+)['\"]", metin, re.MULTILINE)
+        if revizyon:
+            revizyonlar.add(revizyon.group(1))
+        onceki = re.search(r"^down_revision\s*=\s*(.+)$", metin, re.MULTILINE)
+        if onceki:
+            oncekiler.update(re.findall(r"['\"](\w+)['\"]", onceki.group(1)))
+    baslar = revizyonlar - oncekiler
+    if len(baslar) > 1:
+        raise ValueError(f"Birden fazla Alembic başı var, önce birleştirin: {sorted(baslar)}")
+    return next(iter(baslar), None)
+
+
+def alembic_gocu_yaz(oneriler, klasor="alembic/versions", mesaj="indeks danismani onerileri"):
+    """Önerileri mevcut başın üzerine yeni bir göç dosyası olarak yazar ve dosya yolunu döndürür."""
+    klasor = Path(klasor)
+    klasor.mkdir(parents=True, exist_ok=True)
+    revizyon = uuid.uuid4().hex[:12]
+    kisa_ad = re.sub(r"\W+", "_", mesaj.lower()).strip("_")
+    yol = klasor / f"{revizyon}_{kisa_ad}.py"
+    yol.write_text(alembic_gocu(oneriler, mesaj, revizyon, alembic_basi(klasor)), encoding="utf-8")
+    return yol
+
+
+# --- Kıyaslama ---
+
+def kiyasla(satir_sayisi=500_000, tekrar=10, kapsayan=False, alembic_klasoru=None):
+    """Ders fonksiyonlarının sorgularını büyük bir tabloda gözler, önerileri uygular ve ölçer."""
+    import os
+    import tempfile
+
+    from kitap_sorgulari import KitapSorgulari
+
+    db_dosyasi = os.path.join(tempfile.mkdtemp(), "kitaplik_indeks.db")
+    engine = sa.create_engine(f"sqlite:///{db_dosyasi}")
+    metadata = sa.MetaData()
+    kitaplar_tablosu = sa.Table(
+        "kitaplar", metadata,
+        sa.Column("id", sa.Integer, primary_key=True),
+        sa.Column("baslik", sa.String, nullable=False),
+        sa.Column("yazar", sa.String, nullable=False),
+    )
+    metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(kitaplar_tablosu.insert(), [
+            {"baslik": f"Kitap {i}", "yazar": f"Yazar {i % 5000}"} for i in range(satir_sayisi)
+        ])
+
+    danisman = IndeksDanismani(engine, kapsayan=kapsayan)
+    danisman.motora_bagla()
+    sorgular = KitapSorgulari(kitaplar_tablosu)
+    with engine.connect() as conn:
+        # yazara_gore_kitap_bul / kitap_guncelle / kitap_sil'in çalıştırdığı ifadeler
+        sorgular.yazara_gore_bul(conn, "Yazar 42")
+        sorgular.guncelle(conn, "Kitap 7", "Kitap 7")
+        sorgular.sil(conn, "Olmayan Kitap")
+        sorgular.id_ile_getir(conn, 1)  # Birincil anahtar: öneri ÇIKMAMALI
+        conn.commit()
+    danisman.motordan_ayir()
+
+    sonuc = danisman.kiyasla_ve_uygula(tekrar=tekrar)
+    if alembic_klasoru:
+        sonuc["goc_dosyasi"] = alembic_gocu_yaz(sonuc["oneriler"], alembic_klasoru)
+    sonuc["rapor"] = danisman.rapor(sonuc["oneriler"], sonuc["olcumler"])
+    engine.dispose()
+    for ek in ("", "-wal", "-shm", "-journal"):
+        if os.path.exists(db_dosyasi + ek):
+            os.remove(db_dosyasi + ek)
+    return sonuc
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Gözlenen sorgulardan indeks önerir ve etkisini ölçer.")
+    parser.add_argument("--satir", type=int, default=500_000, help="Deneme tablosundaki kitap sayısı")
+    parser.add_argument("--tekrar", type=int, default=10, help="Her ifadenin ölçüm tekrarı")
+    parser.add_argument("--kapsayan", action="store_true", help="Seçilen sütunları da indekse ekle")
+    parser.add_argument("--alembic", metavar="KLASOR", help="Önerileri bu klasöre Alembic göçü olarak yaz")
+    args = parser.parse_args()
+
+    s = kiyasla(args.satir, args.tekrar, args.kapsayan, args.alembic)
+    print(f"--- İndeks Danışmanı ({args.satir:,} satır) ---")
+    print(s["rapor"])
+    if "goc_dosyasi" in s:
+        print(f"\n✅ Alembic göçü yazıldı: {s['goc_dosyasi']}")
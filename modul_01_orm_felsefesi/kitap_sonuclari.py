@@ -0,0 +1,470 @@
+"""
+Modül 1 - Yardımcı: Kitap Sorgu Sonuçları İçin Sütunlu (Columnar) Kap
+
+`tum_kitaplari_goster` ve `kitaplari_getir_tehlikeli` gibi okuma yolları her
+satırı önce bir `sqlite3.Row` / SQLAlchemy `Row` nesnesine, sonra bir f-string'e
+(ya da `ft.Text`'e) çevirir. Satır başına en az beş Python nesnesi oluşur: satır,
+içindeki tuple, id için bir int ve iki str. Aynı yazar adı her satırda ayrı bir
+str'dir. Büyük listelerde zamanın çoğu bu nesneleri oluşturup çöpe atmaya gider.
+
+`KitapSonuclari` aynı sonucu SÜTUNLAR hâlinde tutar:
+- id'ler bir `array('q')` içindedir: satır başına 8 bayt, Python nesnesi yok.
+- Yazarlar sözlük kodlamasıyla tutulur. Her farklı yazar adı bir kez saklanır
+  (intern edilmiş gibi), satırlar yalnızca 4 baytlık bir kod (`array('I')`) taşır.
+- Başlıklar sürücünün ürettiği str nesneleridir; kopyalanmaz.
+
+Satırlara erişim için `__slots__`'lu, sözlüksüz `KitapGorunumu` nesneleri
+yalnızca istendiğinde üretilir. Görünüm bir tuple gibi (`satir[0]`) ya da ad
+ile (`satir.baslik`) okunur. Adım (step) olmadan dilimleme KOPYALAMAZ: yeni kap
+aynı sütunlar üzerinde bir pencere olur. Metin ve JSON çıktısı satır başına
+sözlük ya da görünüm oluşturmadan, sütunlar üzerinde C seviyesindeki `map` ve
+`str.join` ile üretilir.
+
+Kap, `sayfalama.py` kaynaklarıyla aynı `sayfa(son_id, limit)` arayüzünü de
+sunar. Böylece bellekteki bir sonuç `flet_bilesenleri.SayfaliKitapListesi` ile
+doğrudan gösterilebilir.
+
+Dosya doğrudan çalıştırılırsa 1 milyon satırda mevcut yollarla bellek ve süre
+kıyaslaması yapar (`--satir` ile değiştirilebilir).
+"""
+
+import gc
+import json
+import sys
+import threading
+from array import array
+from bisect import bisect_right
+from contextlib import contextmanager
+from itertools import chain, islice, repeat
+from string import Formatter
+
+VARSAYILAN_PARTI = 10_000
+SATIR_SABLONU = "ID: {0}, Başlık: {1}, Yazar: {2}"
+_JSON_SABLONU = '{{"id": {0}, "baslik": {1}, "yazar": {2}}}'
+# json.dumps(ensure_ascii=False) ile aynı kaçış; C hızlandırıcısı varsa onu kullanır.
+_json_metni = json.encoder.encode_basestring
+_BICIMLEYICI = Formatter()
+
+
+_gc_kilidi = threading.Lock()
+_gc_kullanici = 0  # Şu an toplayıcıyı duraklatmış yükleme sayısı
+_gc_acikti = True  # İlk yükleme başladığında toplayıcı açık mıydı
+
+
+@contextmanager
+def _cop_toplayici_duraklatilmis():
+    """Toplu yükleme süresince döngüsel çöp toplayıcıyı durdurur.
+
+    Her parti binlerce izlenen (tuple/Row) nesne üretir ve çöp toplayıcıyı
+    tetikler. Yığın büyüdükçe her tam tarama daha uzun sürer; 1 milyon satırda
+    yükleme süresinin üçte biri buna gider. Kap döngüsel referans oluşturmaz,
+    partiler referans sayımıyla hemen serbest kalır.
+
+    `gc.disable()` süreç genelidir. Aynı anda yükleyen thread'ler bir sayaçla
+    izlenir: ilk giren önceki durumu saklar, son çıkan onu geri yükler. Böylece
+    erken biten bir yükleme, süren bir yüklemenin ortasında toplayıcıyı açmaz.
+    """
+    global _gc_kullanici, _gc_acikti
+    with _gc_kilidi:
+        if _gc_kullanici == 0:
+            _gc_acikti = gc.isenabled()
+            gc.disable()
+        _gc_kullanici += 1
+    try:
+        yield
+    finally:
+        with _gc_kilidi:
+            _gc_kullanici -= 1
+            if _gc_kullanici == 0 and _gc_acikti:
+                gc.enable()
+
+
+class _YazarSozlugu(dict):
+    """Yazar adı -> kod. Yeni bir ad ilk görüldüğünde sıradaki kodu alır."""
+
+    __slots__ = ("adlar",)
+
+    def __init__(self):
+        super().__init__()
+        self.adlar = []
+
+    def __missing__(self, ad):
+        kod = self[ad] = len(self.adlar)
+        self.adlar.append(sys.intern(ad) if type(ad) is str else ad)
+        return kod
+
+
+class KitapGorunumu:
+    """Kaptaki tek bir satırın görünümü; veriyi kopyalamaz, sütunlardan okur.
+
+    `(id, baslik, yazar)` tuple'ı gibi indekslenir ve açılır (`id, baslik, yazar = satir`).
+    """
+
+    __slots__ = ("_sonuclar", "_i")
+
+    def __init__(self, sonuclar, i):
+        self._sonuclar = sonuclar
+        self._i = i
+
+    @property
+    def id(self):
+        return self._sonuclar._idler[self._i]
+
+    @property
+    def baslik(self):
+        return self._sonuclar._basliklar[self._i]
+
+    @property
+    def yazar(self):
+        s = self._sonuclar
+        return s._yazar_sozlugu.adlar[s._kodlar[self._i]]
+
+    def __getitem__(self, sutun):
+        return (self.id, self.baslik, self.yazar)[sutun]
+
+    def __iter__(self):
+        return iter((self.id, self.baslik, self.yazar))
+
+    def __len__(self):
+        return 3
+
+    def __eq__(self, diger):
+        if isinstance(diger, (KitapGorunumu, tuple)):
+            return tuple(self) == tuple(diger)
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(tuple(self))
+
+    def __repr__(self):
+        return f"KitapGorunumu(id={self.id!r}, baslik={self.baslik!r}, yazar={self.yazar!r})"
+
+    def _asdict(self):
+        return {"id": self.id, "baslik": self.baslik, "yazar": self.yazar}
+
+
+class KitapSonuclari:
+    """`(id, baslik, yazar)` sorgu sonuçlarını sütunlu ve sıkı biçimde tutan kap.
+
+    Doğrudan oluşturulmaz; `sorgudan()` ya da `satirlardan()` kullanılır.
+    Sütunlar yalnızca sona ekleme ile büyür. Bir dilim, kaynağın o anki
+    penceresini paylaşır.
+    """
+
+    __slots__ = ("_idler", "_basliklar", "_kodlar", "_yazar_sozlugu", "_bas", "_son")
+
+    def __init__(self, idler=None, basliklar=None, kodlar=None, yazar_sozlugu=None, bas=0, son=None):
+        self._idler = array("q") if idler is None else idler
+        self._basliklar = [] if basliklar is None else basliklar
+        self._kodlar = array("I") if kodlar is None else kodlar
+        self._yazar_sozlugu = _YazarSozlugu() if yazar_sozlugu is None else yazar_sozlugu
+        self._bas = bas
+        self._son = len(self._idler) if son is None else son
+
+    # --- Oluşturma ---
+
+    @classmethod
+    def sorgudan(cls, imlec, parti_boyutu=VARSAYILAN_PARTI):
+        """`fetchmany()` destekleyen bir imleçten (sqlite3 cursor ya da SQLAlchemy Result) doldurur.
+
+        Satırlar partiler hâlinde okunur. Her parti `zip(*parti)` ile sütunlara
+        ayrılır; bellekte aynı anda en fazla bir partinin satır nesneleri bulunur.
+        """
+        sonuclar = cls()
+        with _cop_toplayici_duraklatilmis():
+            while parti := imlec.fetchmany(parti_boyutu):
+                sonuclar._parti_ekle(parti)
+        return sonuclar
+
+    @classmethod
+    def satirlardan(cls, satirlar, parti_boyutu=VARSAYILAN_PARTI):
+        """Herhangi bir `(id, baslik, yazar)` yinelenebilirinden doldurur."""
+        sonuclar = cls()
+        satirlar = iter(satirlar)
+        with _cop_toplayici_duraklatilmis():
+            while parti := list(islice(satirlar, parti_boyutu)):
+                sonuclar._parti_ekle(parti)
+        return sonuclar
+
+    def _parti_ekle(self, parti):
+        idler, basliklar, yazarlar = zip(*parti)
+        self._idler.extend(idler)
+        self._basliklar.extend(basliklar)
+        # Bilinen yazarın kodu sözlükten C seviyesinde gelir; yalnızca yeni adlar Python'a düşer.
+        self._kodlar.extend(map(self._yazar_sozlugu.__getitem__, yazarlar))
+        self._son = len(self._idler)
+
+    # --- Sütunlar ---
+
+    @property
+    def idler(self):
+        """id sütunu; kopyasız bir `memoryview` (`tolist()` ile listeye çevrilebilir)."""
+        return memoryview(self._idler)[self._bas:self._son]
+
+    @property
+    def basliklar(self):
+        return self._basliklar[self._bas:self._son]
+
+    @property
+    def yazarlar(self):
+        """Yazar sütunu; her ad tek bir str nesnesidir, satırlar onu paylaşır."""
+        return list(self._yazar_iter())
+
+    @property
+    def farkli_yazarlar(self):
+        return list(self._yazar_sozlugu.adlar)
+
+    # Pencere dışındaki satırlar atlanmaz, hiç dolaşılmaz: diziler memoryview ile,
+    # başlık listesi indeksle okunur. Sayfa derinliği süreyi etkilemez.
+
+    def _tamami_mi(self):
+        return self._bas == 0 and self._son == len(self._idler)
+
+    def _id_iter(self):
+        return iter(memoryview(self._idler)[self._bas:self._son])
+
+    def _kod_iter(self):
+        return iter(memoryview(self._kodlar)[self._bas:self._son])
+
+    def _baslik_iter(self):
+        if self._tamami_mi():
+            return iter(self._basliklar)
+        return map(self._basliklar.__getitem__, range(self._bas, self._son))
+
+    def _yazar_iter(self):
+        return map(self._yazar_sozlugu.adlar.__getitem__, self._kod_iter())
+
+    # --- Dizi Arayüzü ---
+
+    def __len__(self):
+        return self._son - self._bas
+
+    def __getitem__(self, anahtar):
+        if isinstance(anahtar, slice):
+            bas, son, adim = anahtar.indices(len(self))
+            if adim == 1:
+                return KitapSonuclari(self._idler, self._basliklar, self._kodlar, self._yazar_sozlugu,
+                                      self._bas + bas, self._bas + max(bas, son))
+            # Adımlı dilim pencere olamaz; sıkı sütunlar kopyalanır (yazar sözlüğü paylaşılır)
+            secilen = range(self._bas + bas, self._bas + son, adim)
+            return KitapSonuclari(
+                array("q", map(self._idler.__getitem__, secilen)),
+                list(map(self._basliklar.__getitem__, secilen)),
+                array("I", map(self._kodlar.__getitem__, secilen)),
+                self._yazar_sozlugu,
+            )
+        i = anahtar + len(self) if anahtar < 0 else anahtar
+        if not 0 <= i < len(self):
+            raise IndexError("KitapSonuclari indeksi aralık dışında")
+        return KitapGorunumu(self, self._bas + i)
+
+    def __iter__(self):
+        return map(KitapGorunumu, repeat(self), range(self._bas, self._son))
+
+    def __bool__(self):
+        return self._son > self._bas
+
+    def __repr__(self):
+        return f"<KitapSonuclari {len(self)} satır, {len(self._yazar_sozlugu.adlar)} farklı yazar>"
+
+    def satirlar(self):
+        """Satırları düz `(id, baslik, yazar)` tuple'ları olarak verir (ör. `executemany` için)."""
+        return zip(self._id_iter(), self._baslik_iter(), self._yazar_iter())
+
+    # --- Sayfa Kaynağı (sayfalama.py ile aynı arayüz) ---
+
+    def sayfa(self, son_id=0, limit=50):
+        """`id > son_id` olan ilk `limit` satırı kopyasız bir dilim olarak döndürür.
+
+        Sonucun id'ye göre sıralı olduğunu varsayar (`ORDER BY id`); ikili arama kullanır.
+        """
+        i = bisect_right(self._idler, son_id, self._bas, self._son) - self._bas
+        return self[i:i + limit]
+
+    # --- Çıktı ---
+
+    def metin_satirlari(self, sablon=SATIR_SABLONU):
+        """Her satır için `sablon.format(id, baslik, yazar)`; sözlük ya da görünüm oluşturmaz."""
+        return map(sablon.format, self._id_iter(), self._baslik_iter(), self._yazar_iter())
+
+    def _birlestir(self, sablon, sutunlar, ayirici):
+        """`sablon`'u her satır için sütunlardan doldurur ve her satırın ARDINA `ayirici` koyar.
+
+        Şablon bir kez parçalanır. Sabit parçalar satır sayısı kadar `repeat`, alanlar sütun
+        yineleyicileridir (alansız bir şablon da böylece satır sayısıyla sınırlı kalır);
+        hepsi tek bir `str.join` ile birleşir. Satır başına ne tuple ne de ara str
+        oluşur (id'lerin metni hariç). Biçim belirteci (`{0:>5}`) içeren şablonlar
+        `str.format`'a düşer.
+        """
+        n = len(self)
+        parcalar = []
+        for sabit, alan, bicim, donusum in _BICIMLEYICI.parse(sablon):
+            if sabit:
+                parcalar.append(repeat(sabit, n))
+            if alan is None:
+                continue
+            if bicim or donusum or alan not in ("0", "1", "2"):
+                return "".join(chain.from_iterable(zip(self.metin_satirlari(sablon), repeat(ayirici))))
+            parcalar.append(sutunlar[int(alan)]())
+        return "".join(chain.from_iterable(zip(*parcalar, repeat(ayirici, n))))
+
+    def _metin_sutunlari(self):
+        return (lambda: map(str, self._id_iter()), self._baslik_iter, self._yazar_iter)
+
+    def metin(self, sablon=SATIR_SABLONU, ayirici="\n"):
+        """Tüm sonucu TEK bir metin olarak verir (tek `print` ya da tek bir `ft.Text` için)."""
+        metin = self._birlestir(sablon, self._metin_sutunlari(), ayirici)
+        return metin[:len(metin) - len(ayirici)]
+
+    def yazdir(self, dosya=None, sablon=SATIR_SABLONU):
+        """Satırları tek bir `write` ile yazar; satır başına `print` çağrısı yoktur."""
+        dosya = sys.stdout if dosya is None else dosya
+        dosya.write(self._birlestir(sablon, self._metin_sutunlari(), "\n"))
+
+    def json_metni(self):
+        """`json.dumps([{"id":..., "baslik":..., "yazar":...}, ...], ensure_ascii=False)` ile aynı çıktı.
+
+        Satır başına sözlük kurulmaz. Her yazar adı satır başına değil, BİR KEZ JSON'a kaçışlanır.
+        Başlık ve yazar metin olmalıdır (kitaplar tablolarında `NOT NULL`).
+        """
+        yazar_json = list(map(_json_metni, self._yazar_sozlugu.adlar))
+        sutunlar = (
+            lambda: map(str, self._id_iter()),
+            lambda: map(_json_metni, self._baslik_iter()),
+            lambda: map(yazar_json.__getitem__, self._kod_iter()),
+        )
+        nesneler = self._birlestir(_JSON_SABLONU, sutunlar, ", ")
+        return "[" + nesneler[:len(nesneler) - 2] + "]"
+
+    def bellek(self):
+        """Kabın tuttuğu yaklaşık bayt sayısı (paylaşılan sütunlar, başlık ve yazar str'leri dahil)."""
+        return (
+            sys.getsizeof(self._idler) + sys.getsizeof(self._kodlar) + sys.getsizeof(self._basliklar)
+            + sum(map(sys.getsizeof, self._basliklar))
+            + sum(map(sys.getsizeof, self._yazar_sozlugu.adlar)) + sys.getsizeof(self._yazar_sozlugu)
+        )
+
+
+# --- Kıyaslama: Satır Nesneleri vs. Sütunlu Kap ---
+
+def kiyasla(satir_sayisi=1_000_000, yazar_sayisi=10_000, klasor=None):
+    """Aynı `SELECT id, baslik, yazar` sonucunu mevcut yollarla ve `KitapSonuclari` ile okur.
+
+    Her yol için yükleme (sorgu + sonucu belleğe alma), metne dökme (satır başına
+    `print` ya da tek `write`) ve JSON üretme süresi ile sonucun bellekte kapladığı
+    yer (`tracemalloc`, ayrı bir çalıştırmada) ölçülür. Çıktı bir `io.StringIO`'ya
+    yazılır; terminalin kendi maliyeti ölçüme girmez.
+    """
+    import gc
+    import io
+    import os
+    import sqlite3
+    import tempfile
+    import time
+    import tracemalloc
+
+    import sqlalchemy as sa
+
+    from kitap_sorgulari import KitapSorgulari
+
+    sorgu = "SELECT id, baslik, yazar FROM kitaplar ORDER BY id"
+
+    with tempfile.TemporaryDirectory(dir=klasor) as gecici:
+        db_dosyasi = os.path.join(gecici, "sonuc_kiyas.db")
+        conn = sqlite3.connect(db_dosyasi)
+        conn.execute("CREATE TABLE kitaplar (id INTEGER PRIMARY KEY, baslik TEXT NOT NULL, yazar TEXT NOT NULL)")
+        conn.executemany(
+            "INSERT INTO kitaplar (baslik, yazar) VALUES (?, ?)",
+            ((f"Kitap {i}", f"Yazar {i % yazar_sayisi}") for i in range(satir_sayisi)),
+        )
+        conn.commit()
+        conn.row_factory = sqlite3.Row
+
+        engine = sa.create_engine(f"sqlite:///{db_dosyasi}")
+        tablo = sa.Table(
+            'kitaplar',
+            sa.MetaData(),
+            sa.Column('id', sa.Integer, primary_key=True),
+            sa.Column('baslik', sa.String, nullable=False),
+            sa.Column('yazar', sa.String, nullable=False)
+        )
+        sorgular = KitapSorgulari(tablo)
+        sa_conn = engine.connect()
+
+        def sqlite_row():
+            # kitaplari_getir_tehlikeli: row_factory=sqlite3.Row + fetchall
+            return conn.execute(sorgu).fetchall()
+
+        def sqlalchemy_row():
+            # tum_kitaplari_goster: KitapSorgulari.tumunu_getir
+            return sorgular.tumunu_getir(sa_conn)
+
+        def sutunlu_sqlite():
+            imlec = conn.cursor()
+            imlec.row_factory = None  # Kap satır nesnesine ihtiyaç duymaz; düz tuple yeterli
+            return KitapSonuclari.sorgudan(imlec.execute(sorgu))
+
+        def sutunlu_sqlalchemy():
+            return sorgular.tumunu_sutunlu_getir(sa_conn)
+
+        def satir_satir_yazdir(satirlar, cikti):
+            for row in satirlar:
+                print(f"ID: {row[0]}, Başlık: {row[1]}, Yazar: {row[2]}", file=cikti)
+
+        yollar = {
+            "sqlite3.Row": (sqlite_row, satir_satir_yazdir,
+                            lambda r: json.dumps([dict(s) for s in r], ensure_ascii=False)),
+            "SQLAlchemy Row": (sqlalchemy_row, satir_satir_yazdir,
+                               lambda r: json.dumps([s._asdict() for s in r], ensure_ascii=False)),
+            "KitapSonuclari (sqlite3)": (sutunlu_sqlite, lambda r, c: r.yazdir(c), KitapSonuclari.json_metni),
+            "KitapSonuclari (SQLAlchemy)": (sutunlu_sqlalchemy, lambda r, c: r.yazdir(c),
+                                            KitapSonuclari.json_metni),
+        }
+
+        def sure(islev, *argumanlar):
+            gc.collect()
+            baslangic = time.perf_counter()
+            sonuc = islev(*argumanlar)
+            return time.perf_counter() - baslangic, sonuc
+
+        sonuclar = {}
+        for ad, (yukle, yazdir, jsonla) in yollar.items():
+            gc.collect()
+            tracemalloc.start()
+            satirlar = yukle()
+            bellek, tepe = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            del satirlar
+
+            yukleme_sn, satirlar = sure(yukle)
+            metin_sn, _ = sure(yazdir, satirlar, io.StringIO())
+            json_sn, _ = sure(jsonla, satirlar)
+            sonuclar[ad] = {
+                "yukleme_sn": yukleme_sn,
+                "metin_sn": metin_sn,
+                "json_sn": json_sn,
+                "bellek_mb": bellek / 2**20,
+                "tepe_mb": tepe / 2**20,
+            }
+            del satirlar
+
+        sa_conn.close()
+        engine.dispose()
+        conn.close()
+    return sonuclar
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Satır nesneleri ile sütunlu sonuç kabını karşılaştırır.")
+    parser.add_argument("--satir", type=int, default=1_000_000, help="Tablodaki kitap sayısı")
+    parser.add_argument("--yazar", type=int, default=10_000, help="Farklı yazar sayısı")
+    parser.add_argument("--klasor", default=None, help="Geçici veritabanının oluşturulacağı klasör")
+    args = parser.parse_args()
+
+    print(f"--- {args.satir:,} kitap, {args.yazar:,} yazar ---")
+    print(f"{'Yol':<30}{'Yükleme ms':>12}{'Metin ms':>10}{'JSON ms':>10}{'Bellek MB':>11}{'Tepe MB':>9}")
+    for ad, s in kiyasla(args.satir, args.yazar, args.klasor).items():
+        print(f"{ad:<30}{s['yukleme_sn'] * 1000:>12.0f}{s['metin_sn'] * 1000:>10.0f}{s['json_sn'] * 1000:>10.0f}"
+              f"{s['bellek_mb']:>11.1f}{s['tepe_mb']:>9.1f}")
@@ -0,0 +1,320 @@
+"""
+Modül 1 - Yardımcı: SQLAlchemy Core İçin Önceden Hazırlanmış Sorgular
+
+`2_sqlalchemy_core_ornek.py` içindeki yardımcı fonksiyonlar her çağrıda
+`sa.select` / `sa.insert` / `sa.update` / `sa.delete` ifadesini baştan kurar.
+SQLAlchemy derlenmiş SQL'i önbellekte tutsa da, ifadeyi her seferinde
+oluşturmak ve önbellek anahtarını yeniden hesaplamak istek başına CPU harcar.
+
+Bu modüldeki `KitapSorgulari` sınıfı, `kitaplar_tablosu` üzerindeki her ifadeyi
+BİR KEZ, `sa.bindparam` yer tutucularıyla kurar. Değerler çalıştırma anında
+parametre olarak verilir; böylece:
+- İfade nesnesi tekrar tekrar oluşturulmaz,
+- Önbellek anahtarı ifade üzerinde hatırlanır (memoize),
+- Derlenmiş SQL, sınıfa ait bir önbellekten (compiled_cache) gelir ve isabet oranı ölçülebilir.
+
+Yazma işlemleri değişen satırları çağırana GERİ VERİR ve bunu tek ifadeyle yapar:
+    INSERT INTO kitaplar (...) VALUES (...) RETURNING id, baslik, yazar
+    UPDATE kitaplar SET ... WHERE ... RETURNING id, baslik, yazar
+    DELETE FROM kitaplar WHERE id = (SELECT max(id) FROM kitaplar) RETURNING id, baslik, yazar
+"Önce SELECT, sonra DELETE" gibi iki ifadeli akışlarda hem veritabanına iki kez
+gidilir hem de iki ifade arasında başka bir yazıcı satırı değiştirebilir.
+RETURNING desteklemeyen veritabanlarında (ör. 3.35'ten eski SQLite) aynı
+sonuç, aynı transaction içinde iki ifadeyle üretilir.
+
+Dosya doğrudan çalıştırılırsa, her işlem için "oluşturma + derleme" ile
+"çalıştırma" sürelerini karşılaştıran bir mikro kıyaslama yapar.
+"""
+
+import time
+
+import sqlalchemy as sa
+from sqlalchemy.engine.default import CACHE_HIT
+from sqlalchemy.util import LRUCache
+
+from kitap_sonuclari import KitapSonuclari
+
+
+class KitapSorgulari:
+    """`kitaplar` tablosu için bir kez kurulan, parametreli Core ifadeleri.
+
+    Args:
+        kitaplar_tablosu: `id`, `baslik`, `yazar` kolonlu tablo.
+        onbellek_boyutu: Derlenmiş SQL önbelleğinin kapasitesi.
+        returning_kullan: None ise lehçenin RETURNING desteğine bakılır;
+            False verilirse her zaman iki ifadeli yedek yol kullanılır.
+    """
+
+    def __init__(self, kitaplar_tablosu, onbellek_boyutu=100, returning_kullan=None):
+        t = kitaplar_tablosu
+        self.tablo = t
+        self.returning_kullan = returning_kullan
+
+        # --- İfadeler: sadece burada, bir kez oluşturulur ---
+        self.tumu_stmt = sa.select(t).order_by(t.c.id)
+        self.yazara_gore_stmt = sa.select(t).where(t.c.yazar == sa.bindparam("yazar"))
+        # Keyset sayfalama: OFFSET yerine "son görülen id'den sonrakiler"; her sayfa indeksle bulunur.
+        self.sayfa_stmt = (
+            sa.select(t)
+            .where(t.c.id > sa.bindparam("son_id"))
+            .order_by(t.c.id)
+            .limit(sa.bindparam("limit"))
+        )
+        # INSERT için kolon adları zaten parametre adıdır: {"baslik": ..., "yazar": ...}
+        self.ekle_stmt = sa.insert(t)
+        # Kolon adı (baslik) UPDATE'in SET kısmına ayrıldığı için farklı parametre adları kullanıyoruz.
+        self.guncelle_stmt = (
+            sa.update(t)
+            .where(t.c.baslik == sa.bindparam("eski_baslik"))
+            .values(baslik=sa.bindparam("yeni_baslik"))
+        )
+        self.sil_stmt = sa.delete(t).where(t.c.baslik == sa.bindparam("silinecek_baslik"))
+
+        # id ile tek satır işlemleri (değişiklik takibi ve Flet arayüzü için)
+        self.id_ile_getir_stmt = sa.select(t).where(t.c.id == sa.bindparam("kitap_id"))
+        self.id_ile_baslik_guncelle_stmt = (
+            sa.update(t)
+            .where(t.c.id == sa.bindparam("kitap_id"))
+            .values(baslik=sa.bindparam("yeni_baslik"))
+        )
+        self.id_ile_sil_stmt = sa.delete(t).where(t.c.id == sa.bindparam("kitap_id"))
+        self.en_buyuk_id_stmt = sa.select(sa.func.max(t.c.id))
+        en_buyuk_id = sa.select(sa.func.max(t.c.id)).scalar_subquery()
+        self.en_sonu_getir_stmt = sa.select(t).where(t.c.id == en_buyuk_id)
+
+        # --- Değişen satırı döndüren tek ifadeli yazmalar (RETURNING) ---
+        kolonlar = tuple(t.c)
+        self.ekle_donen_stmt = self.ekle_stmt.returning(*kolonlar)
+        self.guncelle_donen_stmt = self.guncelle_stmt.returning(*kolonlar)
+        self.sil_donen_stmt = self.sil_stmt.returning(*kolonlar)
+        self.id_ile_baslik_guncelle_donen_stmt = self.id_ile_baslik_guncelle_stmt.returning(*kolonlar)
+        self.id_ile_sil_donen_stmt = self.id_ile_sil_stmt.returning(*kolonlar)
+        self.en_sonu_sil_donen_stmt = sa.delete(t).where(t.c.id == en_buyuk_id).returning(*kolonlar)
+
+        # --- RETURNING olmayan veritabanları için yardımcı ifadeler ---
+        self.basliga_gore_stmt = sa.select(t).where(t.c.baslik == sa.bindparam("baslik"))
+        self.idlere_gore_stmt = sa.select(t).where(t.c.id.in_(sa.bindparam("idler", expanding=True)))
+
+        # Bu katmana ait derlenmiş SQL önbelleği
+        self._onbellek = LRUCache(onbellek_boyutu)
+        self._isabet = 0
+        self._iska = 0
+
+    def calistir(self, conn, stmt, parametreler=None):
+        """İfadeyi katmanın derleme önbelleğiyle çalıştırır ve isabeti sayar."""
+        result = conn.execute(stmt, parametreler, execution_options={"compiled_cache": self._onbellek})
+        if result.context.cache_hit == CACHE_HIT:
+            self._isabet += 1
+        else:
+            self._iska += 1
+        return result
+
+    # --- CRUD İşlemleri ---
+    # Yazma işlemleri commit() ÇAĞIRMAZ; transaction sınırını çağıran belirler.
+
+    def tumunu_getir(self, conn):
+        return self.calistir(conn, self.tumu_stmt).fetchall()
+
+    def tumunu_sutunlu_getir(self, conn):
+        """Tüm tabloyu `Row` listesi yerine sütunlu bir `KitapSonuclari` olarak okur (bkz. kitap_sonuclari.py)."""
+        return KitapSonuclari.sorgudan(self.calistir(conn, self.tumu_stmt))
+
+    def sayfa_getir(self, conn, son_id=0, limit=50):
+        return self.calistir(conn, self.sayfa_stmt, {"son_id": son_id, "limit": limit}).fetchall()
+
+    def yazara_gore_bul(self, conn, yazar_adi):
+        return self.calistir(conn, self.yazara_gore_stmt, {"yazar": yazar_adi}).fetchall()
+
+    def _returning_var(self, conn):
+        if self.returning_kullan is not None:
+            return self.returning_kullan
+        lehce = conn.dialect
+        return lehce.insert_returning and lehce.update_returning and lehce.delete_returning
+
+    def ekle(self, conn, baslik, yazar):
+        """Kitabı ekler ve eklenen satırı `(id, baslik, yazar)` olarak döndürür."""
+        parametreler = {"baslik": baslik, "yazar": yazar}
+        if self._returning_var(conn):
+            return self.calistir(conn, self.ekle_donen_stmt, parametreler).one()
+        result = self.calistir(conn, self.ekle_stmt, parametreler)
+        return self.id_ile_getir(conn, result.inserted_primary_key[0])
+
+    def guncelle(self, conn, eski_baslik, yeni_baslik):
+        """Başlığı `eski_baslik` olan kitapları günceller; güncellenen satırları döndürür."""
+        parametreler = {"eski_baslik": eski_baslik, "yeni_baslik": yeni_baslik}
+        if self._returning_var(conn):
+            return self.calistir(conn, self.guncelle_donen_stmt, parametreler).all()
+        idler = [satir.id for satir in self.calistir(conn, self.basliga_gore_stmt, {"baslik": eski_baslik})]
+        self.calistir(conn, self.guncelle_stmt, parametreler)
+        return self.calistir(conn, self.idlere_gore_stmt, {"idler": idler}).all() if idler else []
+
+    def sil(self, conn, baslik):
+        """Başlığı `baslik` olan kitapları siler; silinen satırları döndürür."""
+        if self._returning_var(conn):
+            return self.calistir(conn, self.sil_donen_stmt, {"silinecek_baslik": baslik}).all()
+        satirlar = self.calistir(conn, self.basliga_gore_stmt, {"baslik": baslik}).all()
+        self.calistir(conn, self.sil_stmt, {"silinecek_baslik": baslik})
+        return satirlar
+
+    def id_ile_getir(self, conn, kitap_id):
+        return self.calistir(conn, self.id_ile_getir_stmt, {"kitap_id": kitap_id}).first()
+
+    def id_ile_baslik_guncelle(self, conn, kitap_id, yeni_baslik):
+        """Kitabın başlığını günceller; güncellenen satırı (yoksa None) döndürür."""
+        parametreler = {"kitap_id": kitap_id, "yeni_baslik": yeni_baslik}
+        if self._returning_var(conn):
+            return self.calistir(conn, self.id_ile_baslik_guncelle_donen_stmt, parametreler).one_or_none()
+        if self.calistir(conn, self.id_ile_baslik_guncelle_stmt, parametreler).rowcount == 0:
+            return None
+        return self.id_ile_getir(conn, kitap_id)
+
+    def id_ile_sil(self, conn, kitap_id):
+        """Kitabı siler; silinen satırı (yoksa None) döndürür."""
+        if self._returning_var(conn):
+            return self.calistir(conn, self.id_ile_sil_donen_stmt, {"kitap_id": kitap_id}).one_or_none()
+        satir = self.id_ile_getir(conn, kitap_id)
+        if satir is not None:
+            self.calistir(conn, self.id_ile_sil_stmt, {"kitap_id": kitap_id})
+        return satir
+
+    def en_sonu_sil(self, conn):
+        """En büyük id'li kitabı tek ifadede bulup siler; silinen satırı (tablo boşsa None) döndürür."""
+        if self._returning_var(conn):
+            return self.calistir(conn, self.en_sonu_sil_donen_stmt).one_or_none()
+        satir = self.calistir(conn, self.en_sonu_getir_stmt).first()
+        if satir is not None:
+            self.calistir(conn, self.id_ile_sil_stmt, {"kitap_id": satir.id})
+        return satir
+
+    def en_buyuk_id(self, conn):
+        return self.calistir(conn, self.en_buyuk_id_stmt).scalar_one_or_none()
+
+    # --- İstatistikler ---
+
+    def istatistikler(self):
+        toplam = self._isabet + self._iska
+        return {
+            "isabet": self._isabet,
+            "iska": self._iska,
+            "isabet_orani": self._isabet / toplam if toplam else 0.0,
+            "onbellekteki_ifade": len(self._onbellek),
+        }
+
+
+# Aynı tablo için tek bir katman kullanılsın diye küçük bir kayıt defteri
+_katmanlar = {}
+
+
+def kitap_sorgulari(kitaplar_tablosu):
+    """Verilen tablo için paylaşılan `KitapSorgulari` nesnesini döndürür."""
+    katman = _katmanlar.get(kitaplar_tablosu)
+    if katman is None:
+        katman = _katmanlar[kitaplar_tablosu] = KitapSorgulari(kitaplar_tablosu)
+    return katman
+
+
+# --- Mikro Kıyaslama: Oluşturma + Derleme vs. Çalıştırma ---
+
+def kiyasla(tekrar=5000):
+    """Her işlem için ifade kurma, derleme ve çalıştırma sürelerini (mikrosaniye) ölçer."""
+    engine = sa.create_engine("sqlite://")
+    metadata = sa.MetaData()
+    t = sa.Table(
+        'kitaplar',
+        metadata,
+        sa.Column('id', sa.Integer, primary_key=True),
+        sa.Column('baslik', sa.String, nullable=False),
+        sa.Column('yazar', sa.String, nullable=False)
+    )
+    metadata.create_all(engine)
+    katman = KitapSorgulari(t)
+
+    # Her işlem: (her çağrıda kurulan ifade, hazır ifade, parametreler)
+    islemler = {
+        "yazara_gore_bul": (
+            lambda: sa.select(t).where(t.c.yazar == "George Orwell"),
+            katman.yazara_gore_stmt, {"yazar": "George Orwell"},
+        ),
+        "ekle": (
+            lambda: sa.insert(t).values(baslik="Dune", yazar="Frank Herbert"),
+            katman.ekle_stmt, {"baslik": "Dune", "yazar": "Frank Herbert"},
+        ),
+        "guncelle": (
+            lambda: sa.update(t).where(t.c.baslik == "Dune").values(baslik="Dune 2"),
+            katman.guncelle_stmt, {"eski_baslik": "Dune", "yeni_baslik": "Dune 2"},
+        ),
+        "sil": (
+            lambda: sa.delete(t).where(t.c.baslik == "Dune 2"),
+            katman.sil_stmt, {"silinecek_baslik": "Dune 2"},
+        ),
+    }
+
+    def mikrosaniye(islev):
+        baslangic = time.perf_counter()
+        for _ in range(tekrar):
+            islev()
+        return (time.perf_counter() - baslangic) / tekrar * 1e6
+
+    sonuclar = {}
+    with engine.connect() as conn:
+        for ad, (kur, hazir_stmt, parametreler) in islemler.items():
+            sonuclar[ad] = {
+                "kurma_us": mikrosaniye(kur),
+                "derleme_us": mikrosaniye(lambda: kur().compile(dialect=engine.dialect)),
+                "her_cagrida_kur_calistir_us": mikrosaniye(lambda: conn.execute(kur())),
+                "hazir_ifade_calistir_us": mikrosaniye(lambda: katman.calistir(conn, hazir_stmt, parametreler)),
+            }
+        conn.rollback()
+    sonuclar["onbellek"] = katman.istatistikler()
+    return sonuclar
+
+
+def yazma_kiyasla(tekrar=2000):
+    """Ekle + güncelle + en sonu sil döngüsünü RETURNING ile ve iki ifadeli yedek yolla karşılaştırır."""
+    engine = sa.create_engine("sqlite://")
+    metadata = sa.MetaData()
+    t = sa.Table(
+        'kitaplar',
+        metadata,
+        sa.Column('id', sa.Integer, primary_key=True),
+        sa.Column('baslik', sa.String, nullable=False),
+        sa.Column('yazar', sa.String, nullable=False)
+    )
+    metadata.create_all(engine)
+
+    ifade_sayisi = 0
+
+    @sa.event.listens_for(engine, "before_cursor_execute")
+    def say(*_):
+        nonlocal ifade_sayisi
+        ifade_sayisi += 1
+
+    sonuclar = {}
+    for ad, returning_kullan in (("returning", True), ("yedek", False)):
+        katman = KitapSorgulari(t, returning_kullan=returning_kullan)
+        ifade_sayisi = 0
+        with engine.connect() as conn:
+            baslangic = time.perf_counter()
+            for _ in range(tekrar):
+                satir = katman.ekle(conn, "Dune", "Frank Herbert")
+                katman.id_ile_baslik_guncelle(conn, satir.id, "Dune Mesih")
+                katman.en_sonu_sil(conn)
+            sure = time.perf_counter() - baslangic
+            conn.rollback()
+        sonuclar[ad] = {"dongu_us": sure / tekrar * 1e6, "dongu_basina_ifade": ifade_sayisi / tekrar}
+    return sonuclar
+
+
+if __name__ == "__main__":
+    print("--- Hazır İfade Mikro Kıyaslaması (mikrosaniye / işlem) ---")
+    sonuclar = kiyasla()
+    onbellek = sonuclar.pop("onbellek")
+    print(f"{'İşlem':<18}{'Kurma':>10}{'Derleme':>10}{'Kur+Çalış':>12}{'Hazır':>10}")
+    for ad, s in sonuclar.items():
+        print(f"{ad:<18}{s['kurma_us']:>10.1f}{s['derleme_us']:>10.1f}"
+              f"{s['her_cagrida_kur_calistir_us']:>12.1f}{s['hazir_ifade_calistir_us']:>10.1f}")
+    print(f"\nDerleme önbelleği: {onbellek}")
+
+    print("\n--- Yazma Döngüsü: Ekle + Güncelle + En Sonu Sil ---")
+    for ad, s in yazma_kiyasla().items():
+        print(f"{ad:<10}{s['dongu_us']:>10.1f} µs/döngü{s['dongu_basina_ifade']:>6.0f} ifade/döngü")
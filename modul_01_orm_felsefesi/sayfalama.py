@@ -0,0 +1,50 @@
+"""
+Modül 1 - Yardımcı: Keyset (Anahtar Tabanlı) Sayfalama Kaynakları
+
+`SELECT ... ORDER BY id` sorgusunu LIMIT olmadan çalıştırıp `fetchall()` ile
+tüm tabloyu çekmek, 100 bin satırda arayüzü dondurur. OFFSET ile sayfalama ise
+her sayfada atlanan satırları yine de okur; 1000. sayfa 1. sayfadan çok daha yavaştır.
+
+Keyset sayfalamada bir sonraki sayfa "son görülen id'den büyük olanlar" diye
+istenir:
+    SELECT id, baslik, yazar FROM kitaplar WHERE id > :son_id ORDER BY id LIMIT :limit
+Birincil anahtar indeksi sayesinde her sayfa, hangi sayfada olursak olalım aynı sürede gelir.
+
+Tüm kaynaklar aynı arayüzü sunar: `sayfa(son_id, limit)` -> `(id, baslik, yazar)` satırları.
+"""
+
+SAYFA_SORGUSU = "SELECT id, baslik, yazar FROM kitaplar WHERE id > ? ORDER BY id LIMIT ?"
+
+
+class SqliteSayfaKaynagi:
+    """Ham sqlite3 bağlantı havuzu üzerinden keyset sayfaları okur."""
+
+    def __init__(self, havuz):
+        self.havuz = havuz
+
+    def sayfa(self, son_id=0, limit=50):
+        with self.havuz.baglanti() as conn:
+            return conn.execute(SAYFA_SORGUSU, (son_id, limit)).fetchall()
+
+
+class CoreSayfaKaynagi:
+    """SQLAlchemy Core motoru ve hazır `KitapSorgulari` ifadeleriyle keyset sayfaları okur."""
+
+    def __init__(self, engine, sorgular):
+        self.engine = engine
+        self.sorgular = sorgular
+
+    def sayfa(self, son_id=0, limit=50):
+        with self.engine.connect() as conn:
+            return self.sorgular.sayfa_getir(conn, son_id, limit)
+
+
+def tum_sayfalar(kaynak, sayfa_boyutu=500):
+    """Tabloyu baştan sona sayfa sayfa dolaşır; bellekte her an en fazla bir sayfa bulunur."""
+    son_id = 0
+    while True:
+        satirlar = kaynak.sayfa(son_id, sayfa_boyutu)
+        if not satirlar:
+            return
+        yield satirlar
+        son_id = satirlar[-1][0]
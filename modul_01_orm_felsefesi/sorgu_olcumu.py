@@ -0,0 +1,349 @@
+"""
+Modül 1 - Yardımcı: Sorgu Ölçümü (echo=True Yerine)
+
+Core örneklerinde motor `echo=True` ile kuruluyordu: her ifade, parametreleriyle
+birlikte SENKRON olarak terminale yazılır. Bu hem yavaştır (her sorguda
+biçimlendirme + G/Ç) hem de yüzlerce satırlık bir metin seli içinde asıl
+soruyu ("hangi sorgu yavaş, kaç kez çalıştı?") cevaplamayı zorlaştırır.
+
+Bu modül aynı görünürlüğü, echo=True'nun küçük bir kesri kadar maliyetle verir:
+- Her ifade bir KALIBA indirgenir: sabitler `?` olur, boşluklar sadeleşir
+  (`WHERE id = 5` ve `WHERE id = 7` aynı kalıptır).
+- Her kalıp için çalışma sayısı, hata sayısı, toplam/en uzun süre, süre
+  histogramı ve etkilenen satır sayısı tutulur. Hata veren ifadeler de
+  (hataya kadar geçen süreyle) sayılır.
+- Eşik süresini aşan sorgular `kitaplik.sorgu` logger'ına yazılır ve son
+  N tanesi bellekte saklanır.
+- SQLAlchemy motorlarına `before_cursor_execute` / `after_cursor_execute` /
+  `handle_error` olaylarıyla bağlanır (`motora_bagla`).
+- Ham sqlite3 bağlantılarında `OlculenBaglanti` (execute süreleri) ve
+  `set_trace_callback` (SQLite'ın GERÇEKTEN çalıştırdığı her ifade; betik
+  ve tetikleyici içindekiler dahil) birlikte kullanılır (`sqlite3_bagla`).
+
+Sonuçlar `ozet()` / `yavas_sorgular()` / `rapor()` ile okunur; Flet
+uygulamaları için `flet_bilesenleri.SorguOlcumPaneli` aynı veriyi gösterir.
+
+Dosya doğrudan çalıştırılırsa `echo=True` ile ölçerin maliyetini karşılaştırır.
+"""
+
+import logging
+import re
+import sqlite3
+import threading
+import time
+from collections import deque
+from functools import lru_cache
+
+logger = logging.getLogger("kitaplik.sorgu")
+
+# --- İfade Kalıbı ---
+
+_DIZGI = re.compile(r"'(?:[^']|'')*'")
+_SAYI = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b")
+_IN_LISTESI = re.compile(r"\b(IN\s*)\(\s*\?(?:\s*,\s*\?)+\s*\)", re.IGNORECASE)
+_BOSLUK = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=4096)
+def sorgu_kalibi(sql):
+    """İfadeyi sabitlerden arındırılmış tek satırlık bir kalıba indirger.
+
+    >>> sorgu_kalibi("SELECT * FROM kitaplar WHERE yazar = 'Orwell' AND id IN (1, 2, 3)")
+    'SELECT * FROM kitaplar WHERE yazar = ? AND id IN (?)'
+    """
+    kalip = _DIZGI.sub("?", sql)
+    kalip = _SAYI.sub("?", kalip)
+    kalip = _IN_LISTESI.sub(r"\1(?)", kalip)
+    return _BOSLUK.sub(" ", kalip).strip()
+
+
+# --- İstatistikler ---
+
+class KalipIstatistigi:
+    """Tek bir ifade kalıbının birikmiş ölçümleri."""
+
+    # Süre histogramının üst sınırları (saniye)
+    KOVALAR = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0)
+
+    __slots__ = ("kalip", "sayi", "hata", "toplam_sure", "en_uzun", "satir", "izlenen", "kova_sayaclari")
+
+    def __init__(self, kalip):
+        self.kalip = kalip
+        self.sayi = 0
+        self.hata = 0  # Hata veren çalıştırmalar (`sayi`'ya da dahildir)
+        self.toplam_sure = 0.0
+        self.en_uzun = 0.0
+        self.satir = 0  # Etkilenen satırlar (INSERT/UPDATE/DELETE); SELECT'te sürücü bildirmez
+        self.izlenen = 0  # sqlite3 trace callback'in gördüğü çalıştırmalar
+        self.kova_sayaclari = [0] * (len(self.KOVALAR) + 1)
+
+    def kaydet(self, sure, satir, hata=False):
+        self.sayi += 1
+        if hata:
+            self.hata += 1
+        self.toplam_sure += sure
+        if sure > self.en_uzun:
+            self.en_uzun = sure
+        if satir:
+            self.satir += satir
+        for i, sinir in enumerate(self.KOVALAR):
+            if sure <= sinir:
+                self.kova_sayaclari[i] += 1
+                break
+        else:
+            self.kova_sayaclari[-1] += 1
+
+    def yuzdelik(self, oran):
+        """Histogramdan yüzdelik tahmini: `oran` kadar ölçümün altında kaldığı kova sınırı."""
+        if not self.sayi:
+            return 0.0
+        hedef = oran * self.sayi
+        birikimli = 0
+        for sinir, sayi in zip(self.KOVALAR, self.kova_sayaclari):
+            birikimli += sayi
+            if birikimli >= hedef:
+                return sinir
+        return self.en_uzun
+
+    def sozluk(self):
+        return {
+            "kalip": self.kalip,
+            "sayi": self.sayi,
+            "hata": self.hata,
+            "izlenen": self.izlenen,
+            "toplam_ms": self.toplam_sure * 1000,
+            "ortalama_ms": self.toplam_sure / self.sayi * 1000 if self.sayi else 0.0,
+            "p95_ms": self.yuzdelik(0.95) * 1000,
+            "en_uzun_ms": self.en_uzun * 1000,
+            "satir": self.satir,
+            "histogram": dict(zip(self.KOVALAR + (float("inf"),), self.kova_sayaclari)),
+        }
+
+
+class SorguOlcer:
+    """İfade kalıbı başına süre, sayı ve satır istatistiklerini toplayan thread-safe ölçer.
+
+    Args:
+        yavas_esik: Bu süreyi (saniye) aşan sorgular yavaş sayılır ve loglanır.
+        yavas_kayit_boyutu: Bellekte tutulacak en fazla yavaş sorgu sayısı.
+    """
+
+    def __init__(self, yavas_esik=0.1, yavas_kayit_boyutu=100):
+        self.yavas_esik = yavas_esik
+        self._kaliplar = {}
+        self._yavaslar = deque(maxlen=yavas_kayit_boyutu)
+        self._kilit = threading.Lock()
+
+    def _istatistik(self, sql):
+        kalip = sorgu_kalibi(sql)
+        istatistik = self._kaliplar.get(kalip)
+        if istatistik is None:
+            istatistik = self._kaliplar.setdefault(kalip, KalipIstatistigi(kalip))
+        return istatistik
+
+    def kaydet(self, sql, sure, satir=None, hata=False):
+        """Bir ifadenin çalışma süresini (saniye) ve etkilenen satır sayısını kaydeder.
+
+        `hata=True` ifadenin hata verdiğini belirtir; süre hataya kadar geçen süredir.
+        """
+        if satir is not None and satir < 0:
+            satir = None  # DB-API, sayıyı bilmediğinde -1 döndürür
+        with self._kilit:
+            istatistik = self._istatistik(sql)
+            istatistik.kaydet(sure, satir, hata)
+            if sure >= self.yavas_esik:
+                self._yavaslar.append({
+                    "kalip": istatistik.kalip,
+                    "sure_ms": sure * 1000,
+                    "satir": satir,
+                    "hata": hata,
+                    "zaman": time.time(),
+                })
+        if sure >= self.yavas_esik:
+            logger.warning("Yavaş sorgu (%.1f ms): %s", sure * 1000, istatistik.kalip)
+
+    def izlendi(self, sql):
+        """Süresi bilinmeyen ama SQLite'ın çalıştırdığı bir ifadeyi sayar (trace callback)."""
+        with self._kilit:
+            self._istatistik(sql).izlenen += 1
+
+    # --- SQLAlchemy ---
+
+    def motora_bagla(self, engine):
+        """Bir SQLAlchemy motorunun tüm cursor çalıştırmalarını ölçmeye başlar."""
+        # Ham sqlite3 örnekleri bu modülü SQLAlchemy'yi hiç yüklemeden kullanabilsin
+        from sqlalchemy import event
+
+        event.listen(engine, "before_cursor_execute", self._once)
+        event.listen(engine, "after_cursor_execute", self._sonra)
+        event.listen(engine, "handle_error", self._hata)
+        return engine
+
+    def motordan_ayir(self, engine):
+        from sqlalchemy import event
+
+        event.remove(engine, "before_cursor_execute", self._once)
+        event.remove(engine, "after_cursor_execute", self._sonra)
+        event.remove(engine, "handle_error", self._hata)
+
+    def _once(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("_sorgu_baslangic", []).append(time.perf_counter())
+
+    def _sonra(self, conn, cursor, statement, parameters, context, executemany):
+        sure = time.perf_counter() - conn.info["_sorgu_baslangic"].pop()
+        self.kaydet(statement, sure, cursor.rowcount)
+
+    def _hata(self, baglam):
+        # Hata veren ifadede after_cursor_execute çalışmaz; başlangıç burada alınmazsa
+        # yığında kalır ve bağlantının sonraki ifadelerinin süreleri kayardı.
+        baslangiclar = baglam.connection.info.get("_sorgu_baslangic") if baglam.connection is not None else None
+        if baslangiclar and baglam.statement is not None:
+            self.kaydet(baglam.statement, time.perf_counter() - baslangiclar.pop(), hata=True)
+
+    # --- Ham sqlite3 ---
+
+    def sqlite3_bagla(self, conn):
+        """Ham bir sqlite3 bağlantısına trace callback kurar; bağlantı `OlculenBaglanti` ise süreleri de ölçer."""
+        conn.set_trace_callback(self.izlendi)
+        if isinstance(conn, OlculenBaglanti):
+            conn.olcer = self
+        return conn
+
+    # --- Okuma ---
+
+    def ozet(self, sirala="toplam_ms", ilk=None):
+        """Kalıp istatistiklerini `sirala` alanına göre büyükten küçüğe sıralı sözlükler olarak döndürür."""
+        with self._kilit:
+            satirlar = [istatistik.sozluk() for istatistik in self._kaliplar.values()]
+        satirlar.sort(key=lambda s: s[sirala], reverse=True)
+        return satirlar[:ilk] if ilk else satirlar
+
+    def yavas_sorgular(self):
+        with self._kilit:
+            return list(self._yavaslar)
+
+    def sifirla(self):
+        with self._kilit:
+            self._kaliplar.clear()
+            self._yavaslar.clear()
+
+    def rapor(self, ilk=10, kalip_genisligi=70):
+        """En çok zaman harcayan kalıpları düz metin tablo olarak döndürür."""
+        satirlar = [f"{'Sayı':>6}{'Hata':>6}{'Toplam ms':>11}{'Ort. ms':>9}{'p95 ms':>8}{'Satır':>7}  Kalıp"]
+        for s in self.ozet(ilk=ilk):
+            kalip = s["kalip"] if len(s["kalip"]) <= kalip_genisligi else s["kalip"][:kalip_genisligi - 1] + "…"
+            sayi = s["sayi"] or f"({s['izlenen']})"
+            satirlar.append(
+                f"{sayi:>6}{s['hata']:>6}{s['toplam_ms']:>11.2f}{s['ortalama_ms']:>9.3f}{s['p95_ms']:>8.2f}{s['satir']:>7}  {kalip}"
+            )
+        return "\n".join(satirlar)
+
+
+# --- Ham sqlite3 İçin Ölçülen Bağlantı ---
+
+class OlculenImlec(sqlite3.Cursor):
+    """`execute` / `executemany` / `executescript` sürelerini bağlantının ölçerine bildiren cursor."""
+
+    def _olc(self, islev, sql, *args):
+        olcer = self.connection.olcer
+        if olcer is None:
+            return islev(sql, *args)
+        baslangic = time.perf_counter()
+        try:
+            sonuc = islev(sql, *args)
+        except sqlite3.Error:
+            olcer.kaydet(sql, time.perf_counter() - baslangic, hata=True)
+            raise
+        olcer.kaydet(sql, time.perf_counter() - baslangic, self.rowcount)
+        return sonuc
+
+    def execute(self, sql, parameters=()):
+        return self._olc(super().execute, sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self._olc(super().executemany, sql, seq_of_parameters)
+
+    def executescript(self, sql_script):
+        return self._olc(super().executescript, sql_script)
+
+
+class OlculenBaglanti(sqlite3.Connection):
+    """`sqlite3.connect(..., factory=OlculenBaglanti)` ile açılan, ifadelerini ölçen bağlantı.
+
+    `olcer` atanmadıkça (bkz. `SorguOlcer.sqlite3_bagla`) normal bir bağlantı gibi davranır.
+    """
+
+    olcer = None
+
+    def cursor(self, factory=OlculenImlec):
+        return super().cursor(factory)
+
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+    def executescript(self, sql_script):
+        return self.cursor().executescript(sql_script)
+
+
+# --- Kıyaslama ---
+
+def kiyasla(tekrar=20_000, deneme=3):
+    """Aynı sorguyu ölçümsüz, ölçerli ve echo=True'ya denk loglamalı motorlarla çalıştırır.
+
+    Her motor `deneme` kez ölçülür ve en iyi sonuç alınır. echo=True'nun maliyeti,
+    çıktısı /dev/null'a giden bir INFO handler'ı ile ölçülür (terminale yazmak daha da yavaştır).
+    """
+    import os
+
+    import sqlalchemy as sa
+
+    def motor_kur():
+        motor = sa.create_engine("sqlite://")
+        with motor.begin() as conn:
+            conn.exec_driver_sql("CREATE TABLE kitaplar (id INTEGER PRIMARY KEY, baslik TEXT, yazar TEXT)")
+            conn.exec_driver_sql("INSERT INTO kitaplar (baslik, yazar) VALUES ('1984', 'George Orwell')")
+        return motor
+
+    stmt = sa.text("SELECT id, baslik, yazar FROM kitaplar WHERE id = :id")
+
+    def mikrosaniye(motor):
+        sureler = []
+        with motor.connect() as conn:
+            for _ in range(deneme):
+                baslangic = time.perf_counter()
+                for i in range(tekrar):
+                    conn.execute(stmt, {"id": i % 3}).all()
+                sureler.append((time.perf_counter() - baslangic) / tekrar * 1e6)
+        return min(sureler)
+
+    sonuclar = {"olcumsuz_us": mikrosaniye(motor_kur())}
+    olcer = SorguOlcer()
+    sonuclar["olcerli_us"] = mikrosaniye(olcer.motora_bagla(motor_kur()))
+
+    sa_logger = logging.getLogger("sqlalchemy.engine")
+    with open(os.devnull, "w") as bos:
+        handler = logging.StreamHandler(bos)
+        handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s %(message)s"))
+        eski_seviye = sa_logger.level
+        sa_logger.addHandler(handler)
+        sa_logger.setLevel(logging.INFO)
+        try:
+            sonuclar["echo_us"] = mikrosaniye(motor_kur())
+        finally:
+            sa_logger.removeHandler(handler)
+            sa_logger.setLevel(eski_seviye)
+    sonuclar["olcer"] = olcer
+    return sonuclar
+
+
+if __name__ == "__main__":
+    s = kiyasla()
+    print("--- Sorgu Başına Süre (µs) ---")
+    print(f"  Ölçümsüz          : {s['olcumsuz_us']:.1f}")
+    print(f"  SorguOlcer        : {s['olcerli_us']:.1f} (+{s['olcerli_us'] - s['olcumsuz_us']:.1f})")
+    print(f"  echo=True (devnull): {s['echo_us']:.1f} (+{s['echo_us'] - s['olcumsuz_us']:.1f})")
+    print()
+    print(s["olcer"].rapor())
@@ -0,0 +1,203 @@
+"""
+Modül 1 - Yardımcı: Büyük Kitap Kataloglarını Toplu İçe Aktarma
+
+Örneklerde veri ya sabit listelerden (`tablo_olustur`, `veritabani_kurulum`)
+ya da tek tek (`yeni_kitap_ekle`, Flet'teki `kitap_ekle`) giriyor ve her ifade
+ayrı ayrı commit ediliyor. Milyonlarca kitaplık bir katalogda bu yöntem saatler sürer.
+
+Bu modül CSV veya JSONL dosyalarını AKIŞ halinde okur:
+- Dosya bir generator ile satır satır okunur; tamamı asla belleğe alınmaz.
+- Satırlar ayarlanabilir boyutta partilere bölünür ve tek bir `executemany`
+  (ham sqlite3) veya çoklu parametreli Core `insert()` ile yazılır.
+- Commit her satırda değil, belirli sayıda partide bir yapılır.
+- İsteğe bağlı olarak yükleme süresince SQLite PRAGMA'ları gevşetilir.
+- Sonunda saniyedeki satır sayısı raporlanır.
+
+Komut satırından kullanım:
+    python toplu_aktarim.py katalog.csv --db kitaplik_core.db --parti 10000 --hizli
+    python toplu_aktarim.py --ornek-uret katalog.jsonl --satir 1000000
+"""
+
+import argparse
+import csv
+import json
+import os
+import sqlite3
+import time
+from itertools import islice
+
+import sqlalchemy as sa
+
+# Yükleme süresince kullanılan gevşek ayarlar. `synchronous=OFF` ile her commit'te
+# fsync yapılmaz; elektrik kesilirse YARIM kalan yükleme baştan yapılmalıdır.
+GEVSEK_PRAGMALAR = {
+    "synchronous": "OFF",
+    "temp_store": "MEMORY",
+    "cache_size": -64000,  # Negatif değer KiB cinsindendir (~64 MB)
+}
+
+
+# --- Okuma: Generator'lar ---
+
+def satirlari_oku(dosya_yolu, bicim=None):
+    """CSV veya JSONL dosyasındaki kitapları `(baslik, yazar)` demetleri olarak üretir.
+
+    Biçim verilmezse dosya uzantısından anlaşılır. Başlığı veya yazarı boş
+    olan satırlar atlanır (tablodaki NOT NULL kısıtlarını ihlal ederlerdi).
+    """
+    bicim = bicim or os.path.splitext(dosya_yolu)[1].lstrip(".").lower()
+    with open(dosya_yolu, encoding="utf-8", newline="") as f:
+        if bicim == "csv":
+            kayitlar = csv.DictReader(f)
+        elif bicim in ("jsonl", "ndjson"):
+            kayitlar = (json.loads(satir) for satir in f if satir.strip())
+        else:
+            raise ValueError(f"Desteklenmeyen dosya biçimi: {bicim!r} (csv veya jsonl olmalı)")
+
+        for kayit in kayitlar:
+            baslik, yazar = kayit.get("baslik"), kayit.get("yazar")
+            if baslik and yazar:
+                yield baslik, yazar
+
+
+def partilere_bol(satirlar, parti_boyutu):
+    """Bir iterator'ı en fazla `parti_boyutu` elemanlı listelere böler."""
+    satirlar = iter(satirlar)
+    while True:
+        parti = list(islice(satirlar, parti_boyutu))
+        if not parti:
+            return
+        yield parti
+
+
+# --- Yazma: Ham sqlite3 ve SQLAlchemy Core ---
+
+def _rapor(satir_sayisi, parti_sayisi, sure):
+    return {
+        "satir": satir_sayisi,
+        "parti": parti_sayisi,
+        "sure_sn": sure,
+        "satir_per_sn": satir_sayisi / sure if sure else 0.0,
+    }
+
+
+def sqlite_ice_aktar(conn, satirlar, parti_boyutu=10_000, commit_araligi=10, pragmalari_gevset=False,
+                     ilerleme=None):
+    """Ham bir sqlite3 bağlantısıyla kitapları partiler halinde ekler.
+
+    Args:
+        conn: Açık bir `sqlite3.Connection`.
+        satirlar: `(baslik, yazar)` üreten herhangi bir iterable (ör. `satirlari_oku(...)`).
+        parti_boyutu: Tek `executemany` çağrısındaki satır sayısı.
+        commit_araligi: Kaç partide bir commit yapılacağı.
+        pragmalari_gevset: True ise yükleme süresince `GEVSEK_PRAGMALAR` uygulanır.
+        ilerleme: Her commit'ten sonra `ilerleme(rapor)` şeklinde çağrılır.
+    """
+    eski_pragmalar = {}
+    if pragmalari_gevset:
+        for ad, deger in GEVSEK_PRAGMALAR.items():
+            eski_pragmalar[ad] = conn.execute(f"PRAGMA {ad}").fetchone()[0]
+            conn.execute(f"PRAGMA {ad} = {deger}")
+
+    satir_sayisi = parti_sayisi = 0
+    baslangic = time.perf_counter()
+    try:
+        for parti in partilere_bol(satirlar, parti_boyutu):
+            conn.executemany("INSERT INTO kitaplar (baslik, yazar) VALUES (?, ?)", parti)
+            satir_sayisi += len(parti)
+            parti_sayisi += 1
+            if parti_sayisi % commit_araligi == 0:
+                conn.commit()
+                if ilerleme:
+                    ilerleme(_rapor(satir_sayisi, parti_sayisi, time.perf_counter() - baslangic))
+        conn.commit()
+    except Exception:
+        # Son commit'ten sonraki yarım parti geri alınır; önceki parçalar kalıcıdır.
+        conn.rollback()
+        raise
+    finally:
+        for ad, deger in eski_pragmalar.items():
+            conn.execute(f"PRAGMA {ad} = {deger}")
+
+    return _rapor(satir_sayisi, parti_sayisi, time.perf_counter() - baslangic)
+
+
+def core_ice_aktar(engine, kitaplar_tablosu, satirlar, parti_boyutu=10_000, commit_araligi=10,
+                   pragmalari_gevset=False, ilerleme=None):
+    """SQLAlchemy Core ile kitapları partiler halinde ekler.
+
+    `conn.execute(insert(...), [{...}, {...}])` çağrısı, SQLAlchemy tarafından
+    sürücünün `executemany` yöntemine çevrilir. Parametreler `sqlite_ice_aktar` ile aynıdır.
+    """
+    stmt = sa.insert(kitaplar_tablosu)
+    satir_sayisi = parti_sayisi = 0
+    baslangic = time.perf_counter()
+
+    with engine.connect() as conn:
+        eski_pragmalar = {}
+        if pragmalari_gevset and engine.dialect.name == "sqlite":
+            for ad, deger in GEVSEK_PRAGMALAR.items():
+                eski_pragmalar[ad] = conn.exec_driver_sql(f"PRAGMA {ad}").scalar()
+                conn.exec_driver_sql(f"PRAGMA {ad} = {deger}")
+        try:
+            for parti in partilere_bol(satirlar, parti_boyutu):
+                conn.execute(stmt, [{"baslik": baslik, "yazar": yazar} for baslik, yazar in parti])
+                satir_sayisi += len(parti)
+                parti_sayisi += 1
+                if parti_sayisi % commit_araligi == 0:
+                    conn.commit()
+                    if ilerleme:
+                        ilerleme(_rapor(satir_sayisi, parti_sayisi, time.perf_counter() - baslangic))
+            conn.commit()
+        except Exception:
+            # PRAGMA synchronous açık bir transaction içinde değiştirilemez; önce geri alınır.
+            conn.rollback()
+            raise
+        finally:
+            for ad, deger in eski_pragmalar.items():
+                conn.exec_driver_sql(f"PRAGMA {ad} = {deger}")
+
+    return _rapor(satir_sayisi, parti_sayisi, time.perf_counter() - baslangic)
+
+
+# --- Örnek Veri Üretimi ---
+
+def ornek_dosya_uret(dosya_yolu, satir_sayisi):
+    """Deneme için `satir_sayisi` kitaplık bir CSV/JSONL dosyası üretir (akış halinde yazar)."""
+    bicim = os.path.splitext(dosya_yolu)[1].lstrip(".").lower()
+    with open(dosya_yolu, "w", encoding="utf-8", newline="") as f:
+        if bicim == "csv":
+            yazici = csv.writer(f)
+            yazici.writerow(["baslik", "yazar"])
+            yazici.writerows((f"Kitap {i}", f"Yazar {i % 5000}") for i in range(satir_sayisi))
+        else:
+            for i in range(satir_sayisi):
+                f.write(json.dumps({"baslik": f"Kitap {i}", "yazar": f"Yazar {i % 5000}"}, ensure_ascii=False))
+                f.write("\n")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Kitap kataloğunu CSV/JSONL'den SQLite'a toplu aktarır.")
+    parser.add_argument("dosya", help="Okunacak (veya --ornek-uret ile üretilecek) CSV/JSONL dosyası")
+    parser.add_argument("--db", default="kitaplik_core.db", help="Hedef SQLite veritabanı dosyası")
+    parser.add_argument("--parti", type=int, default=10_000, help="Parti başına satır sayısı")
+    parser.add_argument("--commit-araligi", type=int, default=10, help="Kaç partide bir commit yapılacağı")
+    parser.add_argument("--hizli", action="store_true", help="Yükleme süresince PRAGMA'ları gevşet")
+    parser.add_argument("--ornek-uret", action="store_true", help="Dosyayı okumak yerine örnek veriyle üret")
+    parser.add_argument("--satir", type=int, default=1_000_000, help="--ornek-uret için satır sayısı")
+    args = parser.parse_args()
+
+    if args.ornek_uret:
+        ornek_dosya_uret(args.dosya, args.satir)
+        print(f"✅ {args.satir} satırlık örnek dosya üretildi: {args.dosya}")
+    else:
+        conn = sqlite3.connect(args.db)
+        conn.execute("CREATE TABLE IF NOT EXISTS kitaplar (id INTEGER PRIMARY KEY, baslik TEXT NOT NULL, yazar TEXT NOT NULL)")
+        rapor = sqlite_ice_aktar(
+            conn, satirlari_oku(args.dosya), parti_boyutu=args.parti, commit_araligi=args.commit_araligi,
+            pragmalari_gevset=args.hizli,
+            ilerleme=lambda r: print(f"  ... {r['satir']:>10,} satır ({r['satir_per_sn']:,.0f} satır/sn)"),
+        )
+        conn.close()
+        print(f"✅ {rapor['satir']:,} satır {rapor['sure_sn']:.2f} sn'de aktarıldı "
+              f"({rapor['satir_per_sn']:,.0f} satır/sn, {rapor['parti']} parti).")
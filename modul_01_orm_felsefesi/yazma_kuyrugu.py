@@ -0,0 +1,327 @@
+"""
+Modül 1 - Yardımcı: Yazma Kuyruğu (Unit of Work / Grup Commit)
+
+Flet örneklerinde her buton tıklaması kendi bağlantısını açıp hemen commit
+ediyordu. SQLite'ta her commit en az bir fsync demektir: disk, verinin
+gerçekten yazıldığını onaylayana kadar beklenir. 30 öğrenci aynı anda
+tıkladığında 30 ayrı fsync sıraya girer ve her biri diğerini bekler.
+
+`YazmaKuyrugu` tüm oturumlardan gelen yazmaları tek bir kuyrukta toplar ve
+arka plandaki tek bir thread ile uygular:
+- GRUP modunda ilk işlemden sonra en fazla `aralik_ms` beklenir veya
+  `en_fazla_islem` işlem birikir; hepsi TEK transaction'da commit edilir
+  (grup commit). 30 tıklama = 1 fsync.
+- ANINDA modunda her işlem kendi transaction'ında hemen commit edilir
+  (eski davranış; en düşük gecikme, en çok fsync).
+- Her iki modda da işlem, commit BAŞARILI olduktan sonra tamamlanır: dönen
+  `Future`'ın `result()`'ı beklenirse veri diskte demektir. Beklemeyen
+  (arayüz gibi) çağıranlar için değişiklik olayı commit'ten sonra yayınlanır.
+- Gruptaki bir işlem hata verirse grup geri alınır ve işlemler tek tek
+  tekrar denenir; böylece hatalı işlem diğerlerini sürüklemez.
+- Uygulanmadan önce iptal edilen (`Future.cancel()`) işlemler atlanır; `kapat()`
+  çağrıldıktan sonra gelen yazmalar `RuntimeError` ile reddedilir.
+- Grup boyutu, commit süresi ve kuyrukta bekleme süresi `istatistikler()` ile okunur.
+
+Arayüzü `degisiklik_takibi.TakipliKitapYazici` ile aynıdır (`ekle`,
+`baslik_guncelle`, `en_son_sil`, `yayin`); tek farkı sonucu bir `Future` olarak vermesidir.
+
+Dosya doğrudan çalıştırılırsa eşzamanlı sanal kullanıcılarla ANINDA ve GRUP
+modlarının saniyedeki commit (fsync) ve işlem sayısını karşılaştırır.
+"""
+
+import argparse
+import logging
+import os
+import queue
+import statistics
+import tempfile
+import threading
+import time
+from collections import deque, namedtuple
+from concurrent.futures import Future
+
+from degisiklik_takibi import EKLE, GUNCELLE, SIL, DegisiklikYayini, TakipliKitapYazici
+
+logger = logging.getLogger("kitaplik.yazma_kuyrugu")
+
+ANINDA = "aninda"
+GRUP = "grup"
+
+_Islem = namedtuple("_Islem", ["yontem", "tur", "argumanlar", "gelecek", "eklenme"])
+_DUR = object()
+
+
+def _yuzdelikler(ornekler):
+    if not ornekler:
+        return 0.0, 0.0
+    if len(ornekler) == 1:
+        return ornekler[0], ornekler[0]
+    kesimler = statistics.quantiles(ornekler, n=100, method="inclusive")
+    return kesimler[49], kesimler[94]
+
+
+class YazmaKuyrugu:
+    """Yazmaları arka planda tek thread'de, gruplar halinde commit eden kuyruk.
+
+    Args:
+        engine: SQLAlchemy motoru.
+        sorgular: `kitap_sorgulari.KitapSorgulari` (yazmalar RETURNING ile satırı döndürür).
+        yayin: Değişiklik olaylarının yayınlanacağı `DegisiklikYayini`.
+        dayaniklilik: `GRUP` veya `ANINDA`.
+        aralik_ms: GRUP modunda ilk işlemden sonra en fazla bekleme süresi.
+        en_fazla_islem: GRUP modunda tek transaction'daki en fazla işlem sayısı.
+        ornek_sayisi: Yüzdelikler için tutulacak son ölçüm sayısı.
+    """
+
+    def __init__(self, engine, sorgular, yayin=None, dayaniklilik=GRUP, aralik_ms=10, en_fazla_islem=200,
+                 ornek_sayisi=1000):
+        if dayaniklilik not in (ANINDA, GRUP):
+            raise ValueError(f"Bilinmeyen dayanıklılık modu: {dayaniklilik!r}")
+        self.engine = engine
+        self.sorgular = sorgular
+        self.yayin = yayin or DegisiklikYayini()
+        self.dayaniklilik = dayaniklilik
+        self.aralik = aralik_ms / 1000
+        self.en_fazla_islem = en_fazla_islem if dayaniklilik == GRUP else 1
+
+        self._kuyruk = queue.Queue()
+        self._kilit = threading.Lock()
+        self._kapali = False
+        self._grup_sayisi = 0
+        self._islem_sayisi = 0
+        self._hata_sayisi = 0
+        self._en_buyuk_grup = 0
+        self._commit_sureleri = deque(maxlen=ornek_sayisi)
+        self._bekleme_sureleri = deque(maxlen=ornek_sayisi)
+
+        self._thread = threading.Thread(target=self._calis, name="yazma-kuyrugu", daemon=True)
+        self._thread.start()
+
+    # --- Yazma API'si (TakipliKitapYazici ile aynı) ---
+
+    def _gonder(self, yontem, tur, *argumanlar):
+        gelecek = Future()
+        with self._kilit:
+            # Kilit altında: kapat()'ın _DUR'undan sonra kuyruğa hiçbir işlem girmez
+            if self._kapali:
+                raise RuntimeError("Yazma kuyruğu kapatıldı")
+            self._kuyruk.put(_Islem(yontem, tur, argumanlar, gelecek, time.perf_counter()))
+        return gelecek
+
+    def ekle(self, baslik, yazar):
+        return self._gonder(self.sorgular.ekle, EKLE, baslik, yazar)
+
+    def baslik_guncelle(self, kitap_id, yeni_baslik):
+        return self._gonder(self.sorgular.id_ile_baslik_guncelle, GUNCELLE, kitap_id, yeni_baslik)
+
+    def en_son_sil(self):
+        return self._gonder(self.sorgular.en_sonu_sil, SIL)
+
+    # --- Arka Plan Thread'i ---
+
+    def _grup_topla(self, ilk):
+        # Çalışıyor olarak işaretlenen Future artık iptal edilemez; iptal edilmiş olanlar atlanır
+        grup = [ilk] if ilk.gelecek.set_running_or_notify_cancel() else []
+        son_an = time.perf_counter() + self.aralik
+        while len(grup) < self.en_fazla_islem:
+            kalan = son_an - time.perf_counter()
+            try:
+                islem = self._kuyruk.get(timeout=kalan) if kalan > 0 else self._kuyruk.get_nowait()
+            except queue.Empty:
+                break
+            if islem is _DUR:
+                self._kuyruk.put(_DUR)  # Bu grup bittikten sonra dur
+                break
+            if islem.gelecek.set_running_or_notify_cancel():
+                grup.append(islem)
+        return grup
+
+    def _calis(self):
+        while True:
+            ilk = self._kuyruk.get()
+            if ilk is _DUR:
+                return
+            grup = self._grup_topla(ilk)
+            if grup:
+                self._uygula(grup)
+
+    def _uygula(self, grup):
+        baslangic = time.perf_counter()
+        try:
+            with self.engine.begin() as conn:
+                satirlar = [islem.yontem(conn, *islem.argumanlar) for islem in grup]
+        except Exception as hata:
+            if len(grup) > 1:
+                # Grup geri alındı; hatalı işlemi ayırmak için her birini kendi transaction'ında dene
+                for islem in grup:
+                    self._uygula([islem])
+                return
+            with self._kilit:
+                self._hata_sayisi += 1
+            grup[0].gelecek.set_exception(hata)
+            return
+
+        bitis = time.perf_counter()
+        with self._kilit:
+            self._grup_sayisi += 1
+            self._islem_sayisi += len(grup)
+            self._en_buyuk_grup = max(self._en_buyuk_grup, len(grup))
+            self._commit_sureleri.append(bitis - baslangic)
+            self._bekleme_sureleri.extend(bitis - islem.eklenme for islem in grup)
+
+        for islem, satir in zip(grup, satirlar):
+            islem.gelecek.set_result(satir)
+            if satir is not None:
+                try:
+                    self.yayin.yayinla(islem.tur, satir)
+                except Exception:
+                    # Bir abonenin hatası kuyruğu durdurmamalı; veri zaten commit edildi
+                    logger.exception("Değişiklik olayı yayınlanırken hata")
+
+    # --- Yaşam Döngüsü ---
+
+    def kapat(self, zaman_asimi=5.0):
+        """Kuyruktaki işlemleri commit eder ve arka plan thread'ini durdurur; sonraki yazmalar reddedilir."""
+        with self._kilit:
+            if self._kapali:
+                return
+            self._kapali = True
+            self._kuyruk.put(_DUR)
+        self._thread.join(zaman_asimi)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.kapat()
+
+    # --- İstatistikler ---
+
+    def istatistikler(self):
+        """Grup boyutu, commit süresi ve kuyrukta bekleme süresi (ms) özetini döndürür."""
+        with self._kilit:
+            commit = list(self._commit_sureleri)
+            bekleme = list(self._bekleme_sureleri)
+            grup_sayisi, islem_sayisi = self._grup_sayisi, self._islem_sayisi
+            en_buyuk_grup, hata_sayisi = self._en_buyuk_grup, self._hata_sayisi
+        commit_p50, commit_p95 = _yuzdelikler(commit)
+        bekleme_p50, bekleme_p95 = _yuzdelikler(bekleme)
+        return {
+            "dayaniklilik": self.dayaniklilik,
+            "grup": grup_sayisi,
+            "islem": islem_sayisi,
+            "hata": hata_sayisi,
+            "kuyrukta": self._kuyruk.qsize(),
+            "ortalama_grup_boyutu": islem_sayisi / grup_sayisi if grup_sayisi else 0.0,
+            "en_buyuk_grup": en_buyuk_grup,
+            "commit_p50_ms": commit_p50 * 1000,
+            "commit_p95_ms": commit_p95 * 1000,
+            "bekleme_p50_ms": bekleme_p50 * 1000,
+            "bekleme_p95_ms": bekleme_p95 * 1000,
+        }
+
+
+# --- Kıyaslama ---
+
+def kiyasla(kullanici=20, islem=50, dusunme_ms=2.0, aralik_ms=10, klasor=None):
+    """Eşzamanlı sanal kullanıcılarla her-işlem-commit ile grup commit'i karşılaştırır.
+
+    Her kullanıcı `islem` kez kitap ekler ve sonucun commit edilmesini bekler
+    (tıklamadan sonra "kaydedildi" görmek isteyen bir kullanıcı gibi). Veritabanı
+    `synchronous=FULL` ile çalışır; bu modda her commit en az bir fsync'tir ve
+    commit sayısı motor olaylarıyla doğrudan sayılır. `klasor` verilmezse sistemin
+    geçici klasörü kullanılır; bu bir RAM diski (tmpfs) ise fsync neredeyse bedavadır ve
+    süre farkı gerçek bir diske göre çok küçük çıkar.
+    """
+    import sqlalchemy as sa
+
+    from kitap_sorgulari import KitapSorgulari
+
+    def motor_kur(db_dosyasi):
+        engine = sa.create_engine(f"sqlite:///{db_dosyasi}", connect_args={"timeout": 30})
+
+        @sa.event.listens_for(engine, "connect")
+        def pragmalar(dbapi_conn, _kayit):
+            dbapi_conn.execute("PRAGMA journal_mode = WAL")
+            dbapi_conn.execute("PRAGMA synchronous = FULL")
+
+        return engine
+
+    def calistir(yazici_kur):
+        with tempfile.TemporaryDirectory(dir=klasor) as gecici:
+            engine = motor_kur(os.path.join(gecici, "kiyas.db"))
+            metadata = sa.MetaData()
+            t = sa.Table(
+                'kitaplar',
+                metadata,
+                sa.Column('id', sa.Integer, primary_key=True),
+                sa.Column('baslik', sa.String, nullable=False),
+                sa.Column('yazar', sa.String, nullable=False)
+            )
+            metadata.create_all(engine)
+            yazici = yazici_kur(engine, KitapSorgulari(t))
+
+            commit_sayisi = 0
+
+            @sa.event.listens_for(engine, "commit")
+            def say(_conn):
+                nonlocal commit_sayisi
+                commit_sayisi += 1
+
+            gecikmeler = []
+            gecikme_kilidi = threading.Lock()
+
+            def sanal_kullanici(no):
+                yerel = []
+                for i in range(islem):
+                    time.sleep(dusunme_ms / 1000)
+                    baslangic = time.perf_counter()
+                    sonuc = yazici.ekle(f"Kitap {no}-{i}", f"Yazar {no}")
+                    if isinstance(sonuc, Future):
+                        sonuc.result()
+                    yerel.append(time.perf_counter() - baslangic)
+                with gecikme_kilidi:
+                    gecikmeler.extend(yerel)
+
+            baslangic = time.perf_counter()
+            threadler = [threading.Thread(target=sanal_kullanici, args=(no,)) for no in range(kullanici)]
+            for th in threadler:
+                th.start()
+            for th in threadler:
+                th.join()
+            sure = time.perf_counter() - baslangic
+
+            if isinstance(yazici, YazmaKuyrugu):
+                yazici.kapat()
+            engine.dispose()
+
+        p50, p95 = _yuzdelikler(gecikmeler)
+        return {
+            "sure_sn": sure,
+            "islem_per_sn": kullanici * islem / sure,
+            "commit": commit_sayisi,
+            "fsync_per_sn": commit_sayisi / sure,
+            "gecikme_p50_ms": p50 * 1000,
+            "gecikme_p95_ms": p95 * 1000,
+        }
+
+    return {
+        ANINDA: calistir(lambda engine, sorgular: TakipliKitapYazici(engine, sorgular)),
+        GRUP: calistir(lambda engine, sorgular: YazmaKuyrugu(engine, sorgular, aralik_ms=aralik_ms)),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Her-işlem-commit ile grup commit'i karşılaştırır.")
+    parser.add_argument("--kullanici", type=int, default=20, help="Eşzamanlı sanal kullanıcı sayısı")
+    parser.add_argument("--islem", type=int, default=50, help="Kullanıcı başına yazma sayısı")
+    parser.add_argument("--aralik-ms", type=float, default=10, help="Grup commit bekleme aralığı")
+    parser.add_argument("--klasor", default=None, help="Veritabanının oluşturulacağı klasör (gerçek disk için)")
+    args = parser.parse_args()
+
+    sonuclar = kiyasla(args.kullanici, args.islem, aralik_ms=args.aralik_ms, klasor=args.klasor)
+    print(f"--- {args.kullanici} kullanıcı x {args.islem} ekleme (synchronous=FULL) ---")
+    print(f"{'Mod':<8}{'Süre sn':>9}{'İşlem/sn':>10}{'Commit':>8}{'fsync/sn':>10}{'p50 ms':>8}{'p95 ms':>8}")
+    for mod, s in sonuclar.items():
+        print(f"{mod:<8}{s['sure_sn']:>9.2f}{s['islem_per_sn']:>10.0f}{s['commit']:>8}{s['fsync_per_sn']:>10.0f}"
+              f"{s['gecikme_p50_ms']:>8.1f}{s['gecikme_p95_ms']:>8.1f}")
@@ -0,0 +1,216 @@
+"""
+Ortak test fikstürleri.
+
+Şema her test için yeniden kurulmaz. Test oturumunun başında (pytest-xdist ile
+her işçi için ayrı) bir kez şablon veritabanı dosyası kurulur ve örnek veriyle
+doldurulur; her işçi bu şablonun kendi kopyasında çalışır. Her test, tek bir
+bağlantı üzerinde açılan dış bir işlemin (transaction) içinde koşar: uygulamanın
+oturumları bu işleme SAVEPOINT ile katılır (`commit()` yalnızca savepoint'i
+bırakır) ve test bitince dış işlem geri alınır. Böylece test başına maliyet,
+test sayısı ve şema büyüklüğünden bağımsız olarak birkaç milisaniyedir.
+
+- `test_motoru`: Testin veritabanı motoru.
+- `session_fabrikasi`: Testin işlemine bağlı `AsyncSession` fabrikası.
+- `istemci`: Uygulamaya ağ açmadan istek atan `httpx.AsyncClient`; `get_session`,
+  `get_okuma_session`, `get_oturum_fabrikasi` ve önbellek bağımlılıkları test
+  işlemine / boş bir LRU önbelleğe yönlendirilir.
+- `ornek_veri`: Şablondaki örnek verinin id'leri (5 yazar, 20 kitap, 10 okuma kaydı).
+- `sorgu_sayaci`: Bir blok içinde çalışan SQL ifadelerini sayar. N+1 gerilemelerini
+  yakalamak için uç nokta testleri bunu bir üst sınırla kullanır:
+
+      with sorgu_sayaci.en_fazla(1):
+          await istemci.get("/api/v1/kitaplar")
+
+Gerçek commit'lere ya da birden fazla bağlantıya ihtiyaç duyan testler
+(ör. ayrı bir bağlantıdan toplu veri yükleme, havuzdan alınan bağlantıları sayma)
+`@pytest.mark.ayri_veritabani` ile işaretlenir; onlara şablonun özel bir kopyası
+verilir ve geri alma yapılmaz.
+
+Milyon satırlık, saniyeler süren testler `@pytest.mark.slow` ile işaretlenir ve
+varsayılan çalıştırmada atlanır; `pytest --slow` ile onlar da çalışır.
+
+Paralel çalıştırma: `pytest -n auto` (pytest-xdist).
+"""
+
+import os
+import shutil
+from contextlib import contextmanager
+
+import pytest
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from backend.api.v1 import get_kitap_onbellegi
+from backend.core.cache import KitapOnbellegi, Onbellek, YerelLRUArkaUcu
+from backend.core.database import (
+    YazmaOturumu, get_okuma_session, get_oturum_fabrikasi, get_session, motor_olustur,
+)
+from backend.main import app
+from backend.models import Base, KitapDB, KullaniciDB, OkumaKaydiDB, YazarDB
+
+# Sayaç bunları saymaz: test yalıtımının ürettiği işlem kontrol ifadeleridir, uygulamanınki değil
+_ISLEM_IFADELERI = ("BEGIN", "SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK TO SAVEPOINT")
+
+
+def pytest_addoption(parser):
+    parser.addoption("--slow", action="store_true", help="@pytest.mark.slow ile işaretli uzun testleri de çalıştır")
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "ayri_veritabani: test, geri alınan bir işlem yerine şablonun özel bir kopyasında çalışır"
+    )
+    config.addinivalue_line("markers", "slow: milyon satırlık uzun test; yalnızca --slow ile çalışır")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--slow"):
+        return
+    atla = pytest.mark.skip(reason="uzun test; çalıştırmak için --slow")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(atla)
+
+
+class SorguSayaci:
+    """Motor üzerinde çalışan her SQL ifadesini kaydeder."""
+
+    def __init__(self, motor):
+        self.ifadeler = []
+        self._motor = motor.sync_engine
+        event.listen(self._motor, "before_cursor_execute", self._kaydet)
+
+    def _kaydet(self, conn, cursor, statement, parameters, context, executemany):
+        if not statement.startswith(_ISLEM_IFADELERI):
+            self.ifadeler.append(statement)
+
+    def kaldir(self):
+        event.remove(self._motor, "before_cursor_execute", self._kaydet)
+
+    @contextmanager
+    def en_fazla(self, sinir):
+        """Blok içinde `sinir`'dan fazla ifade çalışırsa testi, ifadeleri listeleyerek düşürür."""
+        baslangic = len(self.ifadeler)
+        yield self
+        calisan = self.ifadeler[baslangic:]
+        if len(calisan) > sinir:
+            liste = "\n".join(f"  {i}. {ifade}" for i, ifade in enumerate(calisan, 1))
+            pytest.fail(f"En fazla {sinir} SQL ifadesi bekleniyordu, {len(calisan)} çalıştı:\n{liste}")
+
+
+# --- Şablon Veritabanı (oturum başına bir kez) ---
+
+def _ornek_veriyi_yukle(session):
+    yazarlar = [YazarDB(ad=f"Yazar {i}") for i in range(1, 6)]
+    kitaplar = [KitapDB(baslik=f"{y.ad} - Kitap {j}", yazar=y) for y in yazarlar for j in range(1, 5)]
+    kullanici = KullaniciDB(email="okur@example.com", parola_hash="x")
+    session.add_all([*yazarlar, *kitaplar, kullanici])
+    session.flush()
+    session.add_all(OkumaKaydiDB(kullanici_id=kullanici.id, kitap_id=k.id) for k in kitaplar[:10])
+    session.commit()
+    return {"yazarlar": [y.id for y in yazarlar], "kitaplar": [k.id for k in kitaplar], "kullanici": kullanici.id}
+
+
+@pytest.fixture(scope="session")
+def sablon(tmp_path_factory):
+    """Şema kurulmuş ve örnek veriyle doldurulmuş şablon dosyası; her xdist işçisine ayrı."""
+    isci = os.getenv("PYTEST_XDIST_WORKER", "ana")
+    yol = tmp_path_factory.getbasetemp() / f"kitaplik_sablon_{isci}.db"
+    motor = create_engine(f"sqlite:///{yol}")
+    Base.metadata.create_all(motor)
+    # Uygulamanın oturum sınıfı: okuma kayıtları özet sayaçlarına da yansır
+    with YazmaOturumu(motor) as session:
+        ornek = _ornek_veriyi_yukle(session)
+    motor.dispose()
+    return {"yol": yol, "ornek_veri": ornek}
+
+
+@pytest.fixture(scope="session")
+def isci_veritabani(sablon):
+    """İşçinin testlerinin (geri alınan işlemlerle) paylaştığı şablon kopyası."""
+    yol = sablon["yol"].with_name(sablon["yol"].name.replace("_sablon_", "_isci_"))
+    shutil.copyfile(sablon["yol"], yol)
+    return yol
+
+
+def _savepoint_destegi(motor):
+    """pysqlite/aiosqlite'ın kendi örtük BEGIN'ini kapatır; SAVEPOINT'ler ancak böyle doğru çalışır.
+
+    Bkz. SQLAlchemy belgeleri, "Serializable isolation / Savepoints / Transactional DDL".
+    """
+
+    @event.listens_for(motor.sync_engine, "connect")
+    def _surucu_islemini_kapat(dbapi_conn, _kayit):
+        dbapi_conn.isolation_level = None
+
+    @event.listens_for(motor.sync_engine, "begin")
+    def _begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+
+# --- Test Başına Fikstürler ---
+
+@pytest_asyncio.fixture
+async def test_motoru(request, sablon, tmp_path):
+    if request.node.get_closest_marker("ayri_veritabani"):
+        yol = tmp_path / "kitaplik.db"
+        shutil.copyfile(sablon["yol"], yol)
+    else:
+        yol = request.getfixturevalue("isci_veritabani")
+    motor = motor_olustur(f"sqlite+aiosqlite:///{yol}")
+    _savepoint_destegi(motor)
+    yield motor
+    await motor.dispose()
+
+
+@pytest_asyncio.fixture
+async def session_fabrikasi(request, test_motoru):
+    if request.node.get_closest_marker("ayri_veritabani"):
+        yield async_sessionmaker(
+            test_motoru, class_=AsyncSession, sync_session_class=YazmaOturumu, expire_on_commit=False
+        )
+        return
+
+    async with test_motoru.connect() as baglanti:
+        dis_islem = await baglanti.begin()
+        # Oturumlar dış işleme katılır; commit/rollback yalnızca kendi savepoint'lerini etkiler
+        yield async_sessionmaker(
+            bind=baglanti, class_=AsyncSession, sync_session_class=YazmaOturumu, expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
+        await dis_islem.rollback()
+
+
+@pytest_asyncio.fixture
+async def kitap_onbellegi():
+    return KitapOnbellegi(Onbellek(YerelLRUArkaUcu(kapasite=1_000)))
+
+
+@pytest_asyncio.fixture
+async def istemci(session_fabrikasi, kitap_onbellegi):
+    async def test_session():
+        async with session_fabrikasi() as session:
+            yield session
+
+    app.dependency_overrides[get_session] = test_session
+    app.dependency_overrides[get_okuma_session] = test_session
+    app.dependency_overrides[get_oturum_fabrikasi] = lambda: session_fabrikasi
+    app.dependency_overrides[get_kitap_onbellegi] = lambda: kitap_onbellegi
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def sorgu_sayaci(test_motoru):
+    sayac = SorguSayaci(test_motoru)
+    yield sayac
+    sayac.kaldir()
+
+
+@pytest.fixture
+def ornek_veri(sablon):
+    """Şablondaki örnek verinin id'leri: 5 yazar, her birinin 4 kitabı ve bir kullanıcının 10 okuma kaydı."""
+    return sablon["ornek_veri"]
@@ -0,0 +1,118 @@
+"""
+NDJSON akış uç noktaları için testler.
+
+Akış, sayfalı uç noktalarla aynı veriyi aynı sırada vermeli; sonuç büyüdükçe
+isteğin tepe belleği ve ilk bayta kadar geçen süre büyümemelidir.
+"""
+
+import asyncio
+import json
+import sys
+import time
+
+import pytest
+
+from backend.api import v1
+from backend.main import app
+
+pytestmark = pytest.mark.asyncio
+
+
+def _satirlar(yanit):
+    return [json.loads(satir) for satir in yanit.text.splitlines()]
+
+
+async def test_kitap_akisi_sayfali_liste_ile_ayni(istemci, ornek_veri, monkeypatch):
+    # Küçük sayfa: keyset sınırları birkaç kez aşılsın
+    monkeypatch.setattr(v1, "AKIS_SAYFASI", 3)
+    yanit = await istemci.get("/api/v1/kitaplar/akis")
+    assert yanit.status_code == 200
+    assert yanit.headers["content-type"] == v1.NDJSON
+    sayfali = (await istemci.get("/api/v1/kitaplar", params={"limit": 500})).json()
+    assert _satirlar(yanit) == sayfali
+
+
+async def test_kitap_akisi_kaldigi_yerden_surer(istemci, ornek_veri):
+    ortadaki = ornek_veri["kitaplar"][9]
+    kitaplar = _satirlar(await istemci.get("/api/v1/kitaplar/akis", params={"son_id": ortadaki}))
+    assert [k["id"] for k in kitaplar] == ornek_veri["kitaplar"][10:]
+
+
+async def test_okuma_gecmisi_akisi_sayfali_liste_ile_ayni(istemci, ornek_veri, monkeypatch):
+    monkeypatch.setattr(v1, "AKIS_SAYFASI", 4)
+    yol = f"/api/v1/kullanicilar/{ornek_veri['kullanici']}/okuma-gecmisi"
+    akis = _satirlar(await istemci.get(f"{yol}/akis"))
+    sayfali = (await istemci.get(yol, params={"limit": 500})).json()
+    assert [(k["id"], k["kitap"]) for k in akis] == [(k["id"], k["kitap"]) for k in sayfali]
+
+
+async def _akisi_tuket(yol):
+    """Uygulamayı doğrudan ASGI ile çağırır ve gövdeyi biriktirmeden sayar.
+
+    httpx'in `ASGITransport`'u yanıt gövdesinin tamamını belleğe aldığı için
+    bellek ölçümünde kullanılamaz. Bellek, her parçada canlı Python bellek
+    bloklarının sayısına bakılarak izlenir (`tracemalloc` 1M satırda testi
+    on kat yavaşlatır); yanıtı biriktiren bir uç nokta satır başına birkaç blok tutardı.
+    """
+    olcum = {"bayt": 0, "satir": 0, "ilk_bayt_sn": None, "son_satir": b"", "tepe_blok": 0}
+    istek_gonderildi = False
+
+    async def receive():
+        nonlocal istek_gonderildi
+        if not istek_gonderildi:
+            istek_gonderildi = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await asyncio.Event().wait()  # İstemci bağlantıyı hiç koparmaz
+
+    async def send(mesaj):
+        if mesaj["type"] == "http.response.start":
+            assert mesaj["status"] == 200
+        elif mesaj["type"] == "http.response.body" and mesaj.get("body"):
+            if olcum["ilk_bayt_sn"] is None:
+                olcum["ilk_bayt_sn"] = time.perf_counter() - baslangic
+            govde = mesaj["body"]
+            olcum["bayt"] += len(govde)
+            olcum["satir"] += govde.count(b"\n")
+            olcum["son_satir"] = govde.rstrip(b"\n").rsplit(b"\n", 1)[-1]
+            olcum["tepe_blok"] = max(olcum["tepe_blok"], sys.getallocatedblocks() - baslangic_blok)
+
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": yol, "raw_path": yol.encode(), "root_path": "", "query_string": b"",
+        "headers": [(b"host", b"test")], "server": ("test", 80), "client": ("test", 1234),
+    }
+    baslangic_blok = sys.getallocatedblocks()
+    baslangic = time.perf_counter()
+    await app(scope, receive, send)
+    olcum["toplam_sn"] = time.perf_counter() - baslangic
+    return olcum
+
+
+async def _kitaplari_doldur(motor, sayi):
+    async with motor.begin() as conn:
+        await conn.exec_driver_sql("DELETE FROM kitaplar")
+        await conn.exec_driver_sql("INSERT OR IGNORE INTO yazarlar (id, ad) VALUES (1, 'Yazar')")
+        # Python'da 1M'luk liste kurmadan, SQLite içinde üret
+        await conn.exec_driver_sql(
+            "WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n WHERE i < ?) "
+            "INSERT INTO kitaplar (id, baslik, yazar_id) SELECT i, 'Kitap ' || i, 1 FROM n",
+            (sayi,),
+        )
+
+
+@pytest.mark.slow
+@pytest.mark.ayri_veritabani
+async def test_kitap_akisi_bellegi_1m_satirda_sabit(istemci, test_motoru):
+    await _kitaplari_doldur(test_motoru, 20_000)
+    kucuk = await _akisi_tuket("/api/v1/kitaplar/akis")
+    await _kitaplari_doldur(test_motoru, 1_000_000)
+    buyuk = await _akisi_tuket("/api/v1/kitaplar/akis")
+
+    assert kucuk["satir"] == 20_000
+    assert buyuk["satir"] == 1_000_000
+    assert json.loads(buyuk["son_satir"])["id"] == 1_000_000
+    # 50 kat veri, aynı tepe bellek: canlı blok sayısı satır sayısıyla büyümez
+    assert buyuk["tepe_blok"] < 2 * kucuk["tepe_blok"] + 10_000, (kucuk, buyuk)
+    assert buyuk["tepe_blok"] < buyuk["satir"] / 20, buyuk
+    # İlk bayt, tüm sonucun okunmasını beklemez
+    assert buyuk["ilk_bayt_sn"] < buyuk["toplam_sn"] / 20, buyuk
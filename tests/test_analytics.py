@@ -0,0 +1,136 @@
+"""
+Sütunlu dışa aktarma ve partili okuma istatistikleri için testler.
+
+Küçük bir `parti_boyutu` ile her sonuç birkaç partiye bölünür; sayımlar düz bir
+GROUP BY ile, dışa aktarılan dosyalar geri okunarak veritabanıyla karşılaştırılır.
+"""
+
+import csv
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import func, select
+
+from backend.core.analytics import OKUMA_SORGUSU, OkumaIstatistikleri, disa_aktar, sutun_partileri
+from backend.models import KullaniciDB, OkumaKaydiDB
+
+pytestmark = pytest.mark.asyncio
+
+PARTI = 4
+
+
+@pytest_asyncio.fixture
+async def baglanti(ornek_veri, session_fabrikasi):
+    """Örnek veriye ikinci bir kullanıcı ve farklı günlere düşen okumalar ekler (test sonunda geri alınır)."""
+    async with session_fabrikasi() as session:
+        kullanici = KullaniciDB(email="ikinci@example.com", parola_hash="x")
+        session.add(kullanici)
+        await session.flush()
+        gun = datetime(2025, 3, 1, 23, 30, tzinfo=timezone.utc)
+        session.add_all(
+            OkumaKaydiDB(kullanici_id=kullanici.id, kitap_id=kitap_id, okuma_tarihi=gun + timedelta(days=i % 3))
+            for i, kitap_id in enumerate(ornek_veri["kitaplar"][5:12])
+        )
+        await session.flush()
+        yield await session.connection()
+
+
+async def _group_by(conn, sutun):
+    return dict((await conn.execute(select(sutun, func.count()).group_by(sutun))).all())
+
+
+async def _beklenen(conn):
+    gunler = await _group_by(conn, func.date(OkumaKaydiDB.okuma_tarihi))
+    return {
+        "kitap": await _group_by(conn, OkumaKaydiDB.kitap_id),
+        "kullanici": await _group_by(conn, OkumaKaydiDB.kullanici_id),
+        "gun": {date.fromisoformat(g): n for g, n in gunler.items()},
+    }
+
+
+def _sayimlar(istatistikler):
+    return {
+        "kitap": dict(istatistikler.kitap_basina),
+        "kullanici": dict(istatistikler.kullanici_basina),
+        "gun": dict(istatistikler.gun_basina),
+    }
+
+
+@pytest.mark.parametrize("arrow", [False, True], ids=["sozluk", "arrow"])
+async def test_partili_istatistikler_group_by_ile_ayni(baglanti, arrow):
+    istatistikler = OkumaIstatistikleri()
+    boyutlar = []
+    async for parti in sutun_partileri(baglanti, OKUMA_SORGUSU, parti_boyutu=PARTI, arrow=arrow):
+        boyutlar.append(parti.num_rows if arrow else len(parti["id"]))
+        istatistikler.ekle(parti)
+
+    toplam = await baglanti.scalar(select(func.count()).select_from(OkumaKaydiDB))
+    assert toplam == 17 and sum(boyutlar) == toplam
+    assert len(boyutlar) > 1 and max(boyutlar) <= PARTI
+    assert istatistikler.toplam == toplam
+    assert _sayimlar(istatistikler) == await _beklenen(baglanti)
+    assert len(istatistikler.gun_basina) == 4  # Örnek verinin günü + 1, 2 ve 3 Mart
+
+
+def _csv_oku(hedef):
+    with open(hedef, encoding="utf-8", newline="") as dosya:
+        satirlar = list(csv.DictReader(dosya))
+    return [
+        (int(s["id"]), int(s["kullanici_id"]), int(s["kitap_id"]), datetime.fromisoformat(s["okuma_tarihi"]))
+        for s in satirlar
+    ]
+
+
+def _arrow_oku(hedef):
+    import pyarrow as pa
+
+    with pa.OSFile(str(hedef), "rb") as dosya:
+        return pa.ipc.open_file(dosya).read_all()
+
+
+def _parquet_oku(hedef):
+    import pyarrow.parquet as pq
+
+    return pq.read_table(str(hedef))
+
+
+def _tablo_satirlari(tablo):
+    # Arrow zaman damgaları UTC'dir; veritabanının saat dilimsiz değerleriyle karşılaştırmak için düşürülür
+    return [
+        (s["id"], s["kullanici_id"], s["kitap_id"], s["okuma_tarihi"].replace(tzinfo=None))
+        for s in tablo.to_pylist()
+    ]
+
+
+@pytest.mark.parametrize("bicim", ["csv", "arrow", "parquet"])
+async def test_disa_aktarma_geri_okununca_veritabani_ile_ayni(baglanti, tmp_path, bicim):
+    if bicim != "csv":
+        pytest.importorskip("pyarrow")
+    hedef = tmp_path / f"okumalar.{bicim}"
+    toplayici = OkumaIstatistikleri()
+    rapor = await disa_aktar(baglanti, OKUMA_SORGUSU, hedef, parti_boyutu=PARTI, toplayici=toplayici)
+
+    beklenen = [tuple(s) for s in (await baglanti.execute(OKUMA_SORGUSU)).all()]
+    assert rapor["bicim"] == bicim and rapor["satir"] == len(beklenen)
+    assert rapor["parti"] == -(-len(beklenen) // PARTI)
+    if bicim == "csv":
+        okunan = _csv_oku(hedef)
+    else:
+        tablo = _arrow_oku(hedef) if bicim == "arrow" else _parquet_oku(hedef)
+        assert tablo.schema.names == ["id", "kullanici_id", "kitap_id", "okuma_tarihi"]
+        okunan = _tablo_satirlari(tablo)
+    assert okunan == [(i, k, b, t.replace(tzinfo=None)) for i, k, b, t in beklenen]
+
+    if bicim == "parquet":
+        import pyarrow.parquet as pq
+
+        # Her parti ayrı bir satır grubu olarak yazılır
+        assert pq.ParquetFile(str(hedef)).num_row_groups == rapor["parti"]
+    # Dışa aktarırken aynı geçişte toplanan sayımlar da GROUP BY ile aynı
+    assert _sayimlar(toplayici) == await _beklenen(baglanti)
+
+
+async def test_bilinmeyen_bicim_reddedilir(baglanti, tmp_path):
+    with pytest.raises(ValueError, match="Desteklenmeyen biçim"):
+        await disa_aktar(baglanti, OKUMA_SORGUSU, tmp_path / "okumalar.xlsx")
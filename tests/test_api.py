@@ -0,0 +1,103 @@
+"""
+API v1 uç noktaları için testler.
+
+Liste uç noktalarının çalıştırdığı SQL ifadesi sayısı satır sayısından bağımsız
+olmalıdır; bir ilişki yanlışlıkla tembel (lazy) yüklenirse `sorgu_sayaci` testi düşürür.
+"""
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.exc import InvalidRequestError
+
+from backend.models import KitapDB
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_kitap_listesi_tek_sorgu(istemci, ornek_veri, sorgu_sayaci):
+    with sorgu_sayaci.en_fazla(1):
+        yanit = await istemci.get("/api/v1/kitaplar", params={"limit": 100})
+    assert yanit.status_code == 200
+    kitaplar = yanit.json()
+    assert len(kitaplar) == 20
+    assert kitaplar[0]["yazar"]["ad"] == "Yazar 1"
+
+
+async def test_kitap_listesi_keyset_sayfalama(istemci, ornek_veri):
+    ilk = (await istemci.get("/api/v1/kitaplar", params={"limit": 8})).json()
+    ikinci = (await istemci.get("/api/v1/kitaplar", params={"son_id": ilk[-1]["id"], "limit": 8})).json()
+    assert [k["id"] for k in ilk + ikinci] == ornek_veri["kitaplar"][:16]
+
+
+async def test_yazar_listesi_iki_sorgu(istemci, ornek_veri, sorgu_sayaci):
+    with sorgu_sayaci.en_fazla(2):
+        yanit = await istemci.get("/api/v1/yazarlar")
+    assert yanit.status_code == 200
+    assert all(len(y["kitaplar"]) == 4 for y in yanit.json())
+
+
+async def test_okuma_gecmisi_tek_sorgu(istemci, ornek_veri, sorgu_sayaci):
+    with sorgu_sayaci.en_fazla(1):
+        yanit = await istemci.get(f"/api/v1/kullanicilar/{ornek_veri['kullanici']}/okuma-gecmisi")
+    assert yanit.status_code == 200
+    gecmis = yanit.json()
+    assert len(gecmis) == 10
+    assert all(k["kitap"]["yazar"]["ad"] for k in gecmis)
+
+
+async def test_kitap_detayi_onbellekten(istemci, ornek_veri, sorgu_sayaci):
+    kitap_id = ornek_veri["kitaplar"][0]
+    ilk = await istemci.get(f"/api/v1/kitaplar/{kitap_id}")
+    with sorgu_sayaci.en_fazla(0):
+        ikinci = await istemci.get(f"/api/v1/kitaplar/{kitap_id}")
+    assert ilk.json() == ikinci.json()
+
+
+async def test_olmayan_kitap_404(istemci, ornek_veri):
+    assert (await istemci.get("/api/v1/kitaplar/9999")).status_code == 404
+
+
+async def test_guncelleme_onbellegi_gecersiz_kilar(istemci, ornek_veri):
+    kitap_id = ornek_veri["kitaplar"][0]
+    yazar_id = ornek_veri["yazarlar"][0]
+    await istemci.get(f"/api/v1/kitaplar/{kitap_id}")
+    await istemci.get(f"/api/v1/yazarlar/{yazar_id}/kitaplar")
+
+    yanit = await istemci.put(f"/api/v1/kitaplar/{kitap_id}", json={"baslik": "Yeni Başlık"})
+    assert yanit.status_code == 200
+
+    assert (await istemci.get(f"/api/v1/kitaplar/{kitap_id}")).json()["baslik"] == "Yeni Başlık"
+    basliklar = [k["baslik"] for k in (await istemci.get(f"/api/v1/yazarlar/{yazar_id}/kitaplar")).json()]
+    assert "Yeni Başlık" in basliklar
+
+
+async def test_ekleme_bulunamadi_onbellegini_gecersiz_kilar(istemci, ornek_veri):
+    yeni_id = max(ornek_veri["kitaplar"]) + 1
+    assert (await istemci.get(f"/api/v1/kitaplar/{yeni_id}")).status_code == 404
+
+    govde = {"baslik": "Yeni Kitap", "yazar_id": ornek_veri["yazarlar"][0]}
+    kitap = (await istemci.post("/api/v1/kitaplar", json=govde)).json()
+    assert kitap["id"] == yeni_id
+
+    yanit = await istemci.get(f"/api/v1/kitaplar/{yeni_id}")
+    assert yanit.status_code == 200 and yanit.json()["baslik"] == "Yeni Kitap"
+
+
+async def test_ekleme_ve_silme(istemci, ornek_veri, sorgu_sayaci):
+    yazar = (await istemci.post("/api/v1/yazarlar", json={"ad": "Orhan Pamuk"})).json()
+    assert yazar["kitaplar"] == []
+
+    kitap = (await istemci.post("/api/v1/kitaplar", json={"baslik": "Kar", "yazar_id": yazar["id"]})).json()
+    assert kitap["yazar"]["ad"] == "Orhan Pamuk"
+
+    with sorgu_sayaci.en_fazla(1):
+        assert (await istemci.delete(f"/api/v1/kitaplar/{kitap['id']}")).status_code == 204
+    assert (await istemci.get(f"/api/v1/kitaplar/{kitap['id']}")).status_code == 404
+    assert (await istemci.get(f"/api/v1/yazarlar/{yazar['id']}/kitaplar")).json() == []
+
+
+async def test_tembel_iliski_erisimi_hata_verir(session_fabrikasi, ornek_veri):
+    async with session_fabrikasi() as session:
+        kitap = await session.scalar(select(KitapDB).limit(1))
+        with pytest.raises(InvalidRequestError):
+            kitap.yazar
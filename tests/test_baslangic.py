@@ -0,0 +1,49 @@
+"""
+Açılışta şema kurulumunun yalnızca gerektiğinde yapıldığını ve SQLite bağlantı
+ayarlarını doğrulayan testler.
+"""
+
+import pytest
+from sqlalchemy import Column, Integer, MetaData, String, Table, inspect
+
+from backend.core.database import SQLITE_PRAGMALARI, motor_olustur, sema_hazirla
+from backend.models import Base
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_sema_degismediyse_kurulum_atlanir(tmp_path):
+    motor = motor_olustur(f"sqlite+aiosqlite:///{tmp_path / 'acilis.db'}")
+    assert await sema_hazirla(motor, Base.metadata)
+    assert not await sema_hazirla(motor, Base.metadata)
+    async with motor.connect() as conn:
+        tablolar = await conn.run_sync(lambda c: inspect(c).get_table_names())
+    assert set(Base.metadata.tables) <= set(tablolar)
+    await motor.dispose()
+
+
+async def test_model_degisince_sema_yeniden_kurulur(tmp_path):
+    motor = motor_olustur(f"sqlite+aiosqlite:///{tmp_path / 'acilis.db'}")
+    eski, yeni = MetaData(), MetaData()
+    Table("etiket", eski, Column("id", Integer, primary_key=True))
+    Table("etiket", yeni, Column("id", Integer, primary_key=True))
+    Table("raf", yeni, Column("id", Integer, primary_key=True), Column("ad", String(50), index=True))
+
+    assert await sema_hazirla(motor, eski)
+    assert await sema_hazirla(motor, yeni)  # Yeni tablo ve indeks parmak izini değiştirir
+    assert not await sema_hazirla(motor, yeni)
+    async with motor.connect() as conn:
+        assert await conn.run_sync(lambda c: inspect(c).has_table("raf"))
+    await motor.dispose()
+
+
+async def test_sqlite_baglantilari_ortak_pragmalarla_acilir(tmp_path):
+    motor = motor_olustur(f"sqlite+aiosqlite:///{tmp_path / 'acilis.db'}")
+    async with motor.connect() as conn:
+        degerler = {ad: (await conn.exec_driver_sql(f"PRAGMA {ad}")).scalar() for ad in SQLITE_PRAGMALARI}
+    await motor.dispose()
+    # synchronous=NORMAL 1 olarak okunur
+    assert degerler == {
+        "busy_timeout": 5000, "journal_mode": "wal", "synchronous": 1, "mmap_size": 256 * 1024 * 1024,
+        "foreign_keys": 1,
+    }
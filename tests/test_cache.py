@@ -0,0 +1,121 @@
+"""
+Okuma önbelleğinin izdiham korumasına (single-flight) ait testler.
+"""
+
+import asyncio
+
+import pytest
+
+from backend.core.cache import Onbellek, YerelLRUArkaUcu
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_eszamanli_iskalar_tek_yuklemede_birlesir():
+    onbellek = Onbellek(YerelLRUArkaUcu())
+    yuklemeler = []
+
+    async def yukle():
+        yuklemeler.append(1)
+        await asyncio.sleep(0.01)
+        return {"baslik": "Kar"}
+
+    sonuclar = await asyncio.gather(*(onbellek.getir_veya_yukle("kitap", 1, yukle) for _ in range(10)))
+    assert sonuclar == [{"baslik": "Kar"}] * 10 and yuklemeler == [1]
+    assert await onbellek.getir_veya_yukle("kitap", 1, yukle) == {"baslik": "Kar"}
+    assert onbellek.istatistikler() == {
+        "isabet": 1, "iska": 1, "birlesen": 9, "tahliye": 0, "isabet_orani": 10 / 11,
+    }
+
+
+async def test_bulunamayan_deger_de_onbellege_alinir():
+    onbellek = Onbellek(YerelLRUArkaUcu())
+    yuklemeler = []
+
+    async def yukle():
+        yuklemeler.append(1)
+
+    assert await onbellek.getir_veya_yukle("kitap", 404, yukle) is None
+    assert await onbellek.getir_veya_yukle("kitap", 404, yukle) is None
+    assert yuklemeler == [1]
+
+
+async def test_yukleme_sirasinda_gecersiz_kilinan_deger_yazilmaz():
+    onbellek = Onbellek(YerelLRUArkaUcu())
+    basladi, birak = asyncio.Event(), asyncio.Event()
+
+    async def eski_yukle():
+        basladi.set()
+        await birak.wait()
+        return "eski"
+
+    async def yeni_yukle():
+        return "yeni"
+
+    ilk = asyncio.create_task(onbellek.getir_veya_yukle("kitap", 1, eski_yukle))
+    await basladi.wait()
+    await onbellek.gecersiz_kil("kitap", 1)
+    birak.set()
+    assert await ilk == "eski"
+    assert await onbellek.getir_veya_yukle("kitap", 1, yeni_yukle) == "yeni"
+
+
+async def test_ilk_yukleyen_iptal_edilirse_bekleyen_kendisi_yukler():
+    onbellek = Onbellek(YerelLRUArkaUcu())
+    basladi, yuklemeler = asyncio.Event(), []
+
+    async def yavas_yukle():
+        yuklemeler.append("ilk")
+        basladi.set()
+        await asyncio.sleep(10)
+
+    async def yukle():
+        yuklemeler.append("bekleyen")
+        return {"baslik": "Kar"}
+
+    ilk = asyncio.create_task(onbellek.getir_veya_yukle("kitap", 1, yavas_yukle))
+    await basladi.wait()
+    bekleyen = asyncio.create_task(onbellek.getir_veya_yukle("kitap", 1, yukle))
+    await asyncio.sleep(0)
+    ilk.cancel()
+
+    assert await bekleyen == {"baslik": "Kar"}
+    with pytest.raises(asyncio.CancelledError):
+        await ilk
+    assert yuklemeler == ["ilk", "bekleyen"]
+    assert await onbellek.getir_veya_yukle("kitap", 1, yavas_yukle) == {"baslik": "Kar"}
+
+
+async def test_bekleyenin_kendi_iptali_yayilir_ilk_yukleme_surer():
+    onbellek = Onbellek(YerelLRUArkaUcu())
+    basladi, birak = asyncio.Event(), asyncio.Event()
+
+    async def yukle():
+        basladi.set()
+        await birak.wait()
+        return 42
+
+    ilk = asyncio.create_task(onbellek.getir_veya_yukle("kitap", 1, yukle))
+    await basladi.wait()
+    bekleyen = asyncio.create_task(onbellek.getir_veya_yukle("kitap", 1, yukle))
+    await asyncio.sleep(0)
+    bekleyen.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await bekleyen
+
+    birak.set()
+    assert await ilk == 42
+
+
+async def test_yukleme_hatasi_bekleyenlere_de_yayilir():
+    onbellek = Onbellek(YerelLRUArkaUcu())
+
+    async def yukle():
+        await asyncio.sleep(0.01)
+        raise LookupError("veritabanı yok")
+
+    sonuclar = await asyncio.gather(
+        *(onbellek.getir_veya_yukle("kitap", 1, yukle) for _ in range(3)), return_exceptions=True
+    )
+    assert [type(s) for s in sonuclar] == [LookupError] * 3
+    assert onbellek.istatistikler()["birlesen"] == 2
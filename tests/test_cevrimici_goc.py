@@ -0,0 +1,225 @@
+"""
+Çevrimiçi (kilit dostu) Alembic göç işlemleri için testler.
+
+Büyük tablo testi göçü gerçek `alembic/env.py` üzerinden, geçici bir sürüm dizinine
+yazılan bir göç dosyasıyla çalıştırır; o sırada ayrı bağlantılardan okuyan ve yazan
+iş parçacıkları engellenmemelidir.
+"""
+
+import random
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+import pytest
+import sqlalchemy as sa
+from alembic import command
+from alembic.config import Config
+
+from backend.core.cevrimici_goc import indeks_olustur, sutun_ekle
+from backend.models import Base
+
+KOK = Path(__file__).resolve().parent.parent
+
+_KAPAK_GOCU = '''
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0001"
+down_revision = None
+
+
+def upgrade():
+    op.cevrimici_sutun_ekle(
+        "kitaplar", sa.Column("kapak_url", sa.String(500)),
+        doldur=sa.literal_column("'/kapaklar/' || id || '.jpg'"),
+    )
+    op.cevrimici_indeks_olustur("ix_kitaplar_kapak_url", "kitaplar", ["kapak_url"])
+'''
+
+
+class _Kesinti(Exception):
+    pass
+
+
+def _kitaplik(yol, satir):
+    """Modellerin şemasını kurar ve `satir` kitap (100 yazara dağılmış) ile bir okuma kaydı ekler."""
+    motor = sa.create_engine(f"sqlite:///{yol}")
+    Base.metadata.create_all(motor)
+    motor.dispose()
+    conn = sqlite3.connect(yol)
+    conn.execute("PRAGMA journal_mode = WAL")
+    with conn:
+        conn.executemany("INSERT INTO yazarlar (id, ad) VALUES (?, ?)", ((i, f"Yazar {i}") for i in range(1, 101)))
+        conn.executemany(
+            "INSERT INTO kitaplar (id, baslik, yazar_id) VALUES (?, ?, ?)",
+            ((i, f"Kitap {i}", i % 100 + 1) for i in range(1, satir + 1)),
+        )
+        conn.execute("INSERT INTO kullanicilar (id, email, parola_hash, aktif) VALUES (1, 'okur@example.com', 'x', 1)")
+        conn.execute("INSERT INTO okuma_kayitlari (kullanici_id, kitap_id, okuma_tarihi) VALUES (1, 7, '2025-01-01')")
+    conn.close()
+
+
+def _baglanti(yol):
+    motor = sa.create_engine(f"sqlite:///{yol}", poolclass=sa.pool.NullPool)
+
+    @sa.event.listens_for(motor, "connect")
+    def _pragmalar(dbapi_conn, _kayit):
+        dbapi_conn.execute("PRAGMA busy_timeout = 5000")
+        dbapi_conn.execute("PRAGMA foreign_keys = ON")
+
+    return motor.connect().execution_options(isolation_level="AUTOCOMMIT")
+
+
+def _isci(yol, dur, is_yap, sonuc):
+    """`dur` kurulana kadar `is_yap(conn)`'u tekrarlar; süreleri ve hataları `sonuc`'a yazar."""
+    conn = sqlite3.connect(yol, timeout=10, isolation_level=None, check_same_thread=False)
+    while not dur.is_set():
+        baslangic = time.perf_counter()
+        try:
+            is_yap(conn)
+        except sqlite3.Error as hata:
+            sonuc["hatalar"].append(repr(hata))
+        sonuc["sureler"].append(time.perf_counter() - baslangic)
+        time.sleep(0.001)
+    conn.close()
+
+
+@pytest.mark.slow
+def test_bir_milyon_satirlik_tablo_okuma_ve_yazmalar_surerken_goc_eder(tmp_path, monkeypatch):
+    yol = tmp_path / "kitaplik.db"
+    satir = 1_000_000
+    _kitaplik(yol, satir)
+    surumler = tmp_path / "surumler"
+    surumler.mkdir()
+    (surumler / "0001_kapak_url.py").write_text(_KAPAK_GOCU)
+
+    rastgele = random.Random(6)
+    yazilan = {}
+
+    def oku(conn):
+        kitap_id = rastgele.randint(1, satir)
+        assert conn.execute("SELECT baslik FROM kitaplar WHERE id = ?", (kitap_id,)).fetchone() is not None
+
+    def yaz(conn):
+        kitap_id = rastgele.randint(1, satir)
+        conn.execute("UPDATE kitaplar SET baslik = ? WHERE id = ?", (f"Yeni {kitap_id}", kitap_id))
+        yazilan[kitap_id] = f"Yeni {kitap_id}"
+        conn.execute("INSERT INTO kitaplar (baslik, yazar_id) VALUES ('Göç sırasında eklendi', 1)")
+
+    dur = threading.Event()
+    okuma = {"sureler": [], "hatalar": []}
+    yazma = {"sureler": [], "hatalar": []}
+    iscler = [threading.Thread(target=_isci, args=(yol, dur, oku, okuma)),
+              threading.Thread(target=_isci, args=(yol, dur, yaz, yazma))]
+
+    ayarlar = Config()
+    ayarlar.set_main_option("script_location", str(KOK / "alembic"))
+    ayarlar.set_main_option("version_locations", str(surumler))
+    ayarlar.set_main_option("path_separator", "os")
+    monkeypatch.setenv("DATABASE_URL_SYNC", f"sqlite:///{yol}")
+    for isci in iscler:
+        isci.start()
+    try:
+        command.upgrade(ayarlar, "head")
+    finally:
+        dur.set()
+        for isci in iscler:
+            isci.join()
+
+    assert okuma["hatalar"] == [] and yazma["hatalar"] == []
+    assert len(okuma["sureler"]) > 100 and max(okuma["sureler"]) < 1.0
+    # Tek işlemli göçte yazıcı tüm göç boyunca (1M satırda saniyeler) beklerdi
+    assert len(yazma["sureler"]) > 100 and max(yazma["sureler"]) < 1.0
+
+    conn = sqlite3.connect(yol)
+    eklenen = len(yazma["sureler"])
+    assert conn.execute("SELECT count(*) FROM kitaplar").fetchone() == (satir + eklenen,)
+    assert conn.execute(
+        "SELECT count(*) FROM kitaplar WHERE id <= ? AND kapak_url = '/kapaklar/' || id || '.jpg'", (satir,)
+    ).fetchone() == (satir,)
+    for kitap_id, baslik in yazilan.items():
+        assert conn.execute("SELECT baslik FROM kitaplar WHERE id = ?", (kitap_id,)).fetchone() == (baslik,)
+
+    indeksler = conn.execute("SELECT name FROM sqlite_schema WHERE type = 'index' AND tbl_name = 'kitaplar'")
+    assert {ad for ad, in indeksler} == {"ix_kitaplar_yazar_id", "ix_kitaplar_kapak_url"}
+    plan = conn.execute("EXPLAIN QUERY PLAN SELECT id FROM kitaplar WHERE kapak_url = '/kapaklar/5.jpg'").fetchall()
+    assert "ix_kitaplar_kapak_url" in plan[0][-1]
+    tablolar = {ad for ad, in conn.execute("SELECT name FROM sqlite_schema WHERE type = 'table'")}
+    assert not any(ad.startswith(("_golge_", "_eski_")) for ad in tablolar)
+    # Çocuk tablonun yabancı anahtarı hâlâ `kitaplar`'ı gösterir ve tutarlıdır
+    assert {fk[2] for fk in conn.execute("PRAGMA foreign_key_list(okuma_kayitlari)")} == {"kullanicilar", "kitaplar"}
+    assert conn.execute("PRAGMA foreign_key_check").fetchall() == []
+    assert conn.execute("SELECT count(*) FROM goc_ilerlemesi").fetchone() == (0,)
+    assert conn.execute("SELECT version_num FROM alembic_version").fetchone() == ("0001",)
+    conn.close()
+
+
+def test_yarida_kalan_doldurma_kaldigi_yerden_surer(tmp_path):
+    yol = tmp_path / "kitaplik.db"
+    _kitaplik(yol, 20_000)
+    bildirimler = []
+
+    def kes(ilerleme):
+        bildirimler.append(ilerleme)
+        if len(bildirimler) == 3:
+            raise _Kesinti
+
+    sabit = {"parti": 1000, "en_az": 1000, "en_fazla": 1000, "bekleme_ms": 0}
+    kapak = sa.Column("kapak_url", sa.String(500))
+    doldur = sa.literal_column("'/kapaklar/' || id || '.jpg'")
+    with _baglanti(yol) as conn:
+        with pytest.raises(_Kesinti):
+            sutun_ekle(conn, "kitaplar", kapak, doldur, bildir=kes, **sabit)
+        # Kesilen parçanın işlemi commit edilmişti; kayıt ve veri aynı noktadadır
+        assert conn.exec_driver_sql("SELECT son_anahtar, islenen FROM goc_ilerlemesi").one() == (3000, 3000)
+        assert conn.exec_driver_sql("SELECT count(kapak_url) FROM kitaplar").scalar() == 3000
+
+        surdurme = []
+        assert sutun_ekle(conn, "kitaplar", kapak, doldur, bildir=surdurme.append, **sabit) == 20_000
+        assert surdurme[0].islenen == 4000 and surdurme[-1].tamamlandi
+        assert len(surdurme) == 17 + 1
+        assert conn.exec_driver_sql("SELECT count(kapak_url) FROM kitaplar").scalar() == 20_000
+        assert conn.exec_driver_sql("SELECT count(*) FROM goc_ilerlemesi").scalar() == 0
+
+
+def test_yarida_kalan_golge_kopya_surer_ve_aradaki_yazmalari_tasir(tmp_path):
+    yol = tmp_path / "kitaplik.db"
+    _kitaplik(yol, 20_000)
+    bildirimler = []
+
+    def kes(ilerleme):
+        bildirimler.append(ilerleme)
+        if ilerleme.adim.endswith(":kopya") and len(bildirimler) == 2:
+            raise _Kesinti
+
+    sabit = {"parti": 1000, "en_az": 1000, "en_fazla": 1000, "bekleme_ms": 0}
+    with _baglanti(yol) as conn:
+        with pytest.raises(_Kesinti):
+            indeks_olustur(conn, "ix_kitaplar_baslik", "kitaplar", ["baslik"], bildir=kes, **sabit)
+        # Kesintiden sonra asıl tabloya yazılanlar tetikleyicilerle gölgeye yansır
+        conn.exec_driver_sql("UPDATE kitaplar SET baslik = 'Güncellendi' WHERE id IN (5, 15000)")
+        conn.exec_driver_sql("DELETE FROM kitaplar WHERE id = 16000")
+        conn.exec_driver_sql("INSERT INTO kitaplar (id, baslik, yazar_id) VALUES (30000, 'Yeni', 1)")
+
+        indeks_olustur(conn, "ix_kitaplar_baslik", "kitaplar", ["baslik"], **sabit)
+        assert conn.exec_driver_sql("SELECT count(*) FROM kitaplar").scalar() == 20_000
+        assert conn.exec_driver_sql(
+            "SELECT id FROM kitaplar WHERE baslik IN ('Güncellendi', 'Yeni') ORDER BY id"
+        ).scalars().all() == [5, 15000, 30000]
+        assert conn.exec_driver_sql("SELECT count(*) FROM kitaplar WHERE id = 16000").scalar() == 0
+        tetikleyiciler = conn.exec_driver_sql("SELECT count(*) FROM sqlite_schema WHERE type = 'trigger'").scalar()
+        assert tetikleyiciler == 0
+        # Bitmiş indeks yeniden istenirse iş yapılmaz
+        onceki = len(bildirimler)
+        indeks_olustur(conn, "ix_kitaplar_baslik", "kitaplar", ["baslik"], bildir=bildirimler.append, **sabit)
+        assert len(bildirimler) == onceki
+
+
+def test_bilesik_birincil_anahtarli_tablo_reddedilir(tmp_path):
+    yol = tmp_path / "kitaplik.db"
+    with _baglanti(yol) as conn:
+        conn.exec_driver_sql("CREATE TABLE etiketler (kitap_id INTEGER, etiket TEXT, PRIMARY KEY (kitap_id, etiket))")
+        with pytest.raises(ValueError, match="tek sütunlu bir birincil anahtar"):
+            indeks_olustur(conn, "ix_etiketler_etiket", "etiketler", ["etiket"])
@@ -0,0 +1,129 @@
+"""
+Okuma özet (sayaç) tabloları, uzlaştırma ve istatistik uç noktaları için testler.
+"""
+
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session
+
+from backend.core.database import motor_olustur
+from backend.core.ozetler import OzetUzlastirici, get_ozet_uzlastirici
+from backend.main import app
+from backend.models import GunlukOkumaDB, KitapOkumaSayaciDB, KullaniciDB, OkumaKaydiDB, YazarOkumaSayaciDB
+
+pytestmark = pytest.mark.asyncio
+
+
+async def _sayaclar(session, model):
+    return dict((await session.execute(select(*model.__table__.c))).all())
+
+
+async def test_ekleme_sayaclari_ayni_transactionda_artirir(istemci, ornek_veri, session_fabrikasi, sorgu_sayaci):
+    kitap_id = ornek_veri["kitaplar"][3]
+    govde = {"kullanici_id": ornek_veri["kullanici"], "kitap_id": kitap_id}
+    # 2 varlık kontrolü + kayıt + özet başına bir upsert
+    with sorgu_sayaci.en_fazla(6):
+        assert (await istemci.post("/api/v1/okuma-kayitlari", json=govde)).status_code == 201
+    await istemci.post("/api/v1/okuma-kayitlari", json=govde)
+
+    yanit = await istemci.get("/api/v1/istatistikler/kitaplar", params={"limit": 3})
+    assert yanit.json()[0] == {"kitap_id": kitap_id, "baslik": "Yazar 1 - Kitap 4", "okuma_sayisi": 3}
+    yazarlar = (await istemci.get("/api/v1/istatistikler/yazarlar")).json()
+    # Örnek veride ilk 10 kitap okunmuş: Yazar 1'in 4, Yazar 2'nin 4, Yazar 3'ün 2 kitabı
+    assert [(y["ad"], y["okuma_sayisi"]) for y in yazarlar] == [("Yazar 1", 6), ("Yazar 2", 4), ("Yazar 3", 2)]
+
+    bugun = datetime.now(timezone.utc).date().isoformat()
+    gunluk = (await istemci.get("/api/v1/istatistikler/gunluk", params={"baslangic": bugun})).json()
+    assert gunluk == [{"gun": bugun, "okuma_sayisi": 12}]
+
+
+async def test_geri_alinan_eklemede_sayac_artmaz(ornek_veri, session_fabrikasi):
+    async with session_fabrikasi() as session:
+        session.add(OkumaKaydiDB(kullanici_id=ornek_veri["kullanici"], kitap_id=ornek_veri["kitaplar"][0]))
+        await session.flush()
+        await session.rollback()
+        assert (await _sayaclar(session, KitapOkumaSayaciDB))[ornek_veri["kitaplar"][0]] == 1
+
+
+async def test_yalnizca_uygulama_oturumu_sayac_yazar(ornek_veri, session_fabrikasi):
+    kitap_id = ornek_veri["kitaplar"][0]
+    # Dinleyici global `Session`'a bağlı değildir; başka oturumların flush'ı sayaçlara dokunmaz
+    async with session_fabrikasi(sync_session_class=Session) as session:
+        session.add(OkumaKaydiDB(kullanici_id=ornek_veri["kullanici"], kitap_id=kitap_id))
+        await session.flush()
+        assert (await _sayaclar(session, KitapOkumaSayaciDB))[kitap_id] == 1
+
+
+async def test_uzlastirma_orm_disi_yazmalari_duzeltir(ornek_veri, session_fabrikasi):
+    kitaplar, kullanici_id = ornek_veri["kitaplar"], ornek_veri["kullanici"]
+    async with session_fabrikasi() as session:
+        # ORM'i atlayan toplu ekleme ve CASCADE ile silinen kayıtlar sayaçlara yansımaz
+        await session.execute(insert(OkumaKaydiDB), [{"kullanici_id": kullanici_id, "kitap_id": kitaplar[19]}] * 3)
+        yeni_kullanici = KullaniciDB(email="yeni@example.com", parola_hash="x")
+        session.add(yeni_kullanici)
+        await session.flush()
+        session.add(OkumaKaydiDB(kullanici_id=yeni_kullanici.id, kitap_id=kitaplar[0]))
+        await session.flush()
+        await session.execute(delete(KullaniciDB).where(KullaniciDB.id == yeni_kullanici.id))
+        await session.commit()
+
+    uzlastirici = OzetUzlastirici(session_fabrikasi, aralik=0)
+    assert await uzlastirici.uzlastir() == {"kitap": 2, "yazar": 2, "gun": 1}
+    assert await uzlastirici.uzlastir() == {"kitap": 0, "yazar": 0, "gun": 0}
+
+    async with session_fabrikasi() as session:
+        kitap = await _sayaclar(session, KitapOkumaSayaciDB)
+        assert kitap[kitaplar[19]] == 3 and kitap[kitaplar[0]] == 1
+        assert sum((await _sayaclar(session, YazarOkumaSayaciDB)).values()) == 13
+        assert sum((await _sayaclar(session, GunlukOkumaDB)).values()) == 13
+
+    durum = uzlastirici.durum()
+    assert durum["uzlasma_sayisi"] == 2 and durum["toplam_duzeltme"] == 5
+    assert durum["son_duzeltme"] == {"kitap": 0, "yazar": 0, "gun": 0}
+    assert "kitaplik_okuma_ozeti_duzeltme_total 5" in uzlastirici.prometheus_metni()
+
+
+@pytest.mark.ayri_veritabani
+async def test_ayri_sureclerin_uzlastirmasi_farki_bir_kez_ekler(ornek_veri, session_fabrikasi, test_motoru):
+    kitaplar, kullanici_id = ornek_veri["kitaplar"], ornek_veri["kullanici"]
+    async with session_fabrikasi() as session:
+        await session.execute(insert(OkumaKaydiDB), [{"kullanici_id": kullanici_id, "kitap_id": k} for k in kitaplar])
+        await session.commit()
+
+    # Her biri kendi motoruyla: iki ayrı işçi sürecindeki uzlaştırıcılar gibi
+    ikinci_motor = motor_olustur(str(test_motoru.url))
+    ikinci = async_sessionmaker(ikinci_motor, class_=AsyncSession, expire_on_commit=False)
+    try:
+        sonuclar = await asyncio.gather(*(
+            OzetUzlastirici(fabrika, aralik=0).uzlastir() for fabrika in (session_fabrikasi, ikinci) * 2
+        ))
+    finally:
+        await ikinci_motor.dispose()
+
+    assert sum(s["kitap"] for s in sonuclar) == 20
+    async with session_fabrikasi() as session:
+        kitap = await _sayaclar(session, KitapOkumaSayaciDB)
+        assert [kitap[k] for k in kitaplar] == [2] * 10 + [1] * 10
+        assert sum((await _sayaclar(session, YazarOkumaSayaciDB)).values()) == 30
+        assert sum((await _sayaclar(session, GunlukOkumaDB)).values()) == 30
+
+
+async def test_arka_plan_uzlastirmasi_ve_durum_ucu(istemci, ornek_veri, session_fabrikasi):
+    uzlastirici = OzetUzlastirici(session_fabrikasi, aralik=0.01)
+    app.dependency_overrides[get_ozet_uzlastirici] = lambda: uzlastirici
+    assert (await istemci.get("/api/v1/istatistikler/durum")).json()["son_uzlasma"] is None
+
+    await uzlastirici.baslat()
+    for _ in range(100):
+        if uzlastirici.uzlasma_sayisi >= 2:
+            break
+        await asyncio.sleep(0.01)
+    await uzlastirici.durdur()
+
+    durum = (await istemci.get("/api/v1/istatistikler/durum")).json()
+    assert durum["uzlasma_sayisi"] >= 2 and durum["toplam_duzeltme"] == 0 and durum["hata"] is None
+    assert durum["uzlasmadan_beri_sn"] >= 0
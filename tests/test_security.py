@@ -0,0 +1,132 @@
+"""
+JWT doğrulama önbelleği ve bcrypt yardımcıları için testler.
+"""
+
+import asyncio
+import time
+
+import pytest
+from fastapi import Depends, FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from backend.core.security import (
+    TokenDogrulayici,
+    TokenHatasi,
+    get_token_dogrulayici,
+    parola_dogrula,
+    parola_ozetle,
+    parola_ozetle_senkron,
+    token_yuku,
+)
+
+ANAHTAR = "test-anahtari-en-az-32-bayt-uzunlugunda"
+
+
+def test_token_dogrulanir_ve_ikinci_cagri_onbellekten_gelir():
+    dogrulayici = TokenDogrulayici(ANAHTAR)
+    token = dogrulayici.token_olustur(42, rol="okur")
+
+    yuk = dogrulayici.dogrula(token)
+    assert yuk["sub"] == "42" and yuk["rol"] == "okur"
+    assert dogrulayici.dogrula(token) is yuk
+    assert dogrulayici.istatistikler()["isabet"] == 1
+    with pytest.raises(TypeError):
+        yuk["sub"] = "1"  # Paylaşılan yük salt okunurdur
+
+
+def test_onbellek_kaydi_token_suresiyle_biter():
+    simdi = [time.time()]
+    dogrulayici = TokenDogrulayici(ANAHTAR, saat=lambda: simdi[0])
+    token = dogrulayici.token_olustur(1, sure=60)
+    dogrulayici.dogrula(token)
+
+    simdi[0] += 61  # Önbelleğin saatine göre token'ın süresi doldu
+    dogrulayici.dogrula(token)
+    assert dogrulayici.istatistikler()["isabet"] == 0
+    assert dogrulayici.istatistikler()["iska"] == 2
+
+
+@pytest.mark.parametrize("bozuk", ["abc", "a.b.c"])
+def test_bozuk_token_reddedilir(bozuk):
+    with pytest.raises(TokenHatasi):
+        TokenDogrulayici(ANAHTAR).dogrula(bozuk)
+
+
+def test_suresi_dolmus_ve_baska_anahtarla_imzalanmis_token_reddedilir():
+    dogrulayici = TokenDogrulayici(ANAHTAR)
+    with pytest.raises(TokenHatasi):
+        dogrulayici.dogrula(dogrulayici.token_olustur(1, sure=-10))
+    with pytest.raises(TokenHatasi):
+        dogrulayici.dogrula(TokenDogrulayici("baska-bir-anahtar-baska-bir-anahtar").token_olustur(1))
+    assert dogrulayici.istatistikler()["boyut"] == 0
+
+
+def test_onbellek_kapasitesi_asilmaz():
+    dogrulayici = TokenDogrulayici(ANAHTAR, kapasite=3)
+    for i in range(5):
+        dogrulayici.dogrula(dogrulayici.token_olustur(i))
+    assert dogrulayici.istatistikler()["boyut"] == 3
+    assert dogrulayici.istatistikler()["tahliye"] == 2
+
+
+@pytest.mark.asyncio
+async def test_bearer_bagimliligi():
+    dogrulayici = TokenDogrulayici(ANAHTAR)
+    uygulama = FastAPI()
+
+    @uygulama.get("/ben")
+    async def ben(yuk=Depends(token_yuku)):
+        return {"id": int(yuk["sub"])}
+
+    uygulama.dependency_overrides[get_token_dogrulayici] = lambda: dogrulayici
+    async with AsyncClient(transport=ASGITransport(app=uygulama), base_url="http://test") as istemci:
+        assert (await istemci.get("/ben")).status_code == 401
+        yanit = await istemci.get("/ben", headers={"Authorization": "Bearer bozuk"})
+        assert yanit.status_code == 401 and yanit.headers["www-authenticate"] == "Bearer"
+        yetkili = {"Authorization": f"Bearer {dogrulayici.token_olustur(7)}"}
+        assert (await istemci.get("/ben", headers=yetkili)).json() == {"id": 7}
+
+
+@pytest.mark.asyncio
+async def test_parola_ozetleme_ve_dogrulama():
+    ozet = await parola_ozetle("gizli-parola", tur=4)
+    assert ozet.startswith("$2b$04$")
+    assert await parola_dogrula("gizli-parola", ozet)
+    assert not await parola_dogrula("yanlis-parola", ozet)
+    assert not await parola_dogrula("gizli-parola", "bozuk-ozet")
+    assert not await parola_dogrula("gizli-parola", None)  # Kullanıcı yok
+
+
+def test_72_bayttan_uzun_parola_kesilir():
+    uzun = "ş" * 64  # 128 bayt
+    ozet = parola_ozetle_senkron(uzun, tur=4)
+    assert ozet.startswith("$2b$")
+    # bcrypt'in kullandığı ilk 72 bayt aynıysa parola eşleşir (passlib davranışı)
+    assert asyncio.run(parola_dogrula("ş" * 36 + "x", ozet))
+
+
+@pytest.mark.asyncio
+async def test_bcrypt_olay_dongusunu_bloklamaz():
+    await parola_ozetle("x", tur=4)  # Havuzun thread'i ölçümden önce başlasın
+    baslangic = time.perf_counter()
+    parola_ozetle_senkron("x", tur=10)
+    tek_ozet = time.perf_counter() - baslangic
+
+    takilma = 0.0
+    bitti = False
+
+    async def nabiz():
+        nonlocal takilma
+        while not bitti:
+            once = time.perf_counter()
+            await asyncio.sleep(0.001)
+            takilma = max(takilma, time.perf_counter() - once - 0.001)
+
+    gozcu = asyncio.create_task(nabiz())
+    await asyncio.sleep(0.01)  # Nabız ölçülen iş başlamadan önce birkaç tur atsın
+    await asyncio.gather(*(parola_ozetle("x", tur=10) for _ in range(4)))
+    bitti = True
+    await gozcu
+    # Döngüde çalışsaydı dört özet boyunca (~4 x tek_ozet) hiç tur atamazdı. Tek
+    # çekirdekli makinede işletim sistemi döngü thread'ini bir süre bekletebilir.
+    assert takilma < 2 * tek_ozet, (takilma, tek_ozet)
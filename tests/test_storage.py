@@ -0,0 +1,220 @@
+"""
+Parçalı video yükleme hattı ve yükleme uç noktası için testler.
+"""
+
+import asyncio
+import hashlib
+import os
+import tracemalloc
+
+import httpx
+import pytest
+from sqlalchemy import event
+
+from backend.core.storage import (
+    MB,
+    AkisOkuyucu,
+    BunnyStreamArkaUcu,
+    YerelDepolamaArkaUcu,
+    YuklemeHatasi,
+    get_depolama,
+    parcali_yukle,
+)
+from backend.main import app
+
+pytestmark = pytest.mark.asyncio
+
+
+async def _parcalar(veri, boyut=7_777):
+    """Gövdeyi, ağdan geliyormuş gibi düzensiz boyutlu parçalarla verir."""
+    for i in range(0, len(veri), boyut):
+        yield veri[i:i + boyut]
+
+
+class SayanArkaUc(YerelDepolamaArkaUcu):
+    """Aynı anda yolda olan parçaları sayar; istenen parçaları bozar ya da düşürür."""
+
+    def __init__(self, *args, dusen=(), bozulan=(), **kwargs):
+        super().__init__(*args, **kwargs)
+        self.dusen, self.bozulan = set(dusen), set(bozulan)
+        self.yolda = self.en_fazla_yolda = 0
+        self.gonderilen = []
+
+    async def parca_yukle(self, yukleme_id, no, konum, veri):
+        self.yolda += 1
+        self.en_fazla_yolda = max(self.en_fazla_yolda, self.yolda)
+        try:
+            await asyncio.sleep(0.001)
+            if no in self.dusen:
+                raise ConnectionError("bağlantı koptu")
+            if no in self.bozulan:
+                self.bozulan.discard(no)  # Yalnızca ilk gönderim yolda bozulur
+                veri = veri[:-1] + bytes([veri[-1] ^ 1])
+            self.gonderilen.append(no)
+            return await super().parca_yukle(yukleme_id, no, konum, veri)
+        finally:
+            self.yolda -= 1
+
+
+async def test_yukleme_dosyayi_birebir_ve_sinirli_eszamanlilikla_yazar(tmp_path):
+    veri = os.urandom(10 * 64 * 1024 + 123)
+    arka_uc = SayanArkaUc(tmp_path)
+    sonuc = await parcali_yukle(
+        arka_uc, AkisOkuyucu(_parcalar(veri)), "kitaplar/1/video.mp4", len(veri), parca_boyutu=64 * 1024, eszamanli=3
+    )
+    assert sonuc.url == "/medya/kitaplar/1/video.mp4"
+    assert (tmp_path / "kitaplar/1/video.mp4").read_bytes() == veri
+    assert sonuc.sha256 == hashlib.sha256(veri).hexdigest()
+    assert sonuc.parca_sayisi == sonuc.gonderilen_parca == 11
+    assert arka_uc.en_fazla_yolda == 3
+    assert not any((tmp_path / ".yuklemeler").iterdir())  # Parça klasörü temizlendi
+
+
+async def test_ozeti_tutmayan_parca_yeniden_gonderilir(tmp_path):
+    veri = os.urandom(4 * 1024)
+    arka_uc = SayanArkaUc(tmp_path, bozulan={1})
+    await parcali_yukle(arka_uc, AkisOkuyucu(_parcalar(veri)), "v.mp4", len(veri), parca_boyutu=1024)
+    assert sorted(arka_uc.gonderilen) == [0, 1, 1, 2, 3]
+    assert (tmp_path / "v.mp4").read_bytes() == veri
+
+
+async def test_yarida_kalan_yukleme_kaldigi_yerden_surer(tmp_path):
+    veri = os.urandom(8 * 1024)
+    arka_uc = SayanArkaUc(tmp_path, dusen={5})
+    with pytest.raises(YuklemeHatasi) as hata:
+        await parcali_yukle(arka_uc, AkisOkuyucu(_parcalar(veri)), "v.mp4", len(veri), parca_boyutu=1024, deneme=2)
+    yukleme_id = hata.value.yukleme_id
+    assert yukleme_id and not (tmp_path / "v.mp4").exists()
+
+    arka_uc.dusen.clear()
+    arka_uc.gonderilen.clear()
+    sonuc = await parcali_yukle(
+        arka_uc, AkisOkuyucu(_parcalar(veri)), "v.mp4", len(veri), yukleme_id=yukleme_id, parca_boyutu=1024
+    )
+    # İlk denemede doğrulanmış parçalar tekrar gönderilmez
+    assert 5 in arka_uc.gonderilen and 0 not in arka_uc.gonderilen
+    assert sonuc.gonderilen_parca == len(arka_uc.gonderilen) < sonuc.parca_sayisi
+    assert (tmp_path / "v.mp4").read_bytes() == veri
+
+
+async def test_kisa_kaynak_ve_gecersiz_kimlik_reddedilir(tmp_path):
+    arka_uc = YerelDepolamaArkaUcu(tmp_path)
+    with pytest.raises(YuklemeHatasi, match="kısa"):
+        await parcali_yukle(arka_uc, AkisOkuyucu(_parcalar(b"x" * 100)), "v.mp4", 200, parca_boyutu=64)
+    with pytest.raises(YuklemeHatasi, match="Geçersiz"):
+        await parcali_yukle(arka_uc, AkisOkuyucu(_parcalar(b"x")), "v.mp4", 1, yukleme_id="../../etc")
+    with pytest.raises(ValueError):
+        await arka_uc.baslat("../disari.mp4", 1)
+
+
+async def test_bellek_dosya_boyutundan_bagimsiz(tmp_path):
+    boyut, parca = 64 * MB, 1 * MB
+
+    async def uret():
+        for _ in range(boyut // (64 * 1024)):
+            yield os.urandom(64 * 1024)
+
+    tracemalloc.start()
+    try:
+        await parcali_yukle(
+            YerelDepolamaArkaUcu(tmp_path), AkisOkuyucu(uret()), "buyuk.bin", boyut, parca_boyutu=parca, eszamanli=4
+        )
+        _, tepe = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert (tmp_path / "buyuk.bin").stat().st_size == boyut
+    # Yolda en fazla 4 parça + okunmakta olan parça ve tamponu; 64 MB'ın tamamı asla
+    assert tepe < 10 * parca, tepe / MB
+
+
+@pytest.mark.ayri_veritabani
+async def test_uc_nokta_yukleme_surerken_baglanti_tutmaz(istemci, ornek_veri, test_motoru, tmp_path):
+    acik_baglanti = 0
+
+    def say(fark):
+        nonlocal acik_baglanti
+        acik_baglanti += fark
+
+    event.listen(test_motoru.sync_engine, "checkout", lambda *_: say(1))
+    event.listen(test_motoru.sync_engine, "checkin", lambda *_: say(-1))
+
+    class DenetleyenArkaUc(YerelDepolamaArkaUcu):
+        yukleme_sirasinda = []
+
+        async def parca_yukle(self, *args):
+            self.yukleme_sirasinda.append(acik_baglanti)
+            return await super().parca_yukle(*args)
+
+    arka_uc = DenetleyenArkaUc(tmp_path)
+    app.dependency_overrides[get_depolama] = lambda: arka_uc
+    kitap_id = ornek_veri["kitaplar"][0]
+    veri = os.urandom(20_000)
+
+    yanit = await istemci.put(f"/api/v1/kitaplar/{kitap_id}/video", content=veri)
+    assert yanit.status_code == 200, yanit.text
+    govde = yanit.json()
+    assert govde["sha256"] == hashlib.sha256(veri).hexdigest() and govde["boyut"] == len(veri)
+    assert arka_uc.yukleme_sirasinda and set(arka_uc.yukleme_sirasinda) == {0}
+    assert (await istemci.get(f"/api/v1/kitaplar/{kitap_id}")).json()["video_url"] == govde["video_url"]
+
+    yanit = await istemci.put("/api/v1/kitaplar/999999/video", content=veri)
+    assert yanit.status_code == 404
+
+
+async def test_video_degisince_eski_dosya_silinir(istemci, ornek_veri, tmp_path):
+    app.dependency_overrides[get_depolama] = lambda: YerelDepolamaArkaUcu(tmp_path)
+    kitap_id = ornek_veri["kitaplar"][1]
+
+    eski = (await istemci.put(f"/api/v1/kitaplar/{kitap_id}/video", content=os.urandom(1000))).json()
+    yeni = (await istemci.put(f"/api/v1/kitaplar/{kitap_id}/video", content=os.urandom(1000))).json()
+    assert eski["video_url"] != yeni["video_url"]
+    dosyalar = [p for p in (tmp_path / "kitaplar" / str(kitap_id)).iterdir() if p.is_file()]
+    assert [f"/medya/kitaplar/{kitap_id}/{p.name}" for p in dosyalar] == [yeni["video_url"]]
+
+
+class SahteTUS:
+    """Bunny Stream API'sinin ve TUS uç noktasının bellek içi, asgari bir taklidi."""
+
+    def __init__(self, dusen_konum=None):
+        self.dosyalar = {}
+        self.dusen_konum = dusen_konum
+
+    def __call__(self, istek):
+        yol = istek.url.path
+        if istek.method == "POST" and yol.endswith("/videos"):
+            return httpx.Response(200, json={"guid": "0f8fad5b-d9cb-469f-a165-70867728950e"})
+        if istek.method == "OPTIONS":
+            return httpx.Response(204, headers={"Tus-Extension": "creation"})
+        if istek.method == "POST" and yol == "/tusupload":
+            assert istek.headers["AuthorizationSignature"] and istek.headers["VideoId"]
+            self.dosyalar["abc"] = bytearray()
+            return httpx.Response(201, headers={"Location": "/tusupload/abc"})
+        dosya = self.dosyalar[yol.rsplit("/", 1)[-1]]
+        if istek.method == "HEAD":
+            return httpx.Response(200, headers={"Upload-Offset": str(len(dosya))})
+        if istek.method == "PATCH":
+            assert int(istek.headers["Upload-Offset"]) == len(dosya)
+            if self.dusen_konum == len(dosya):
+                self.dusen_konum = None
+                raise httpx.ConnectError("bağlantı koptu")
+            dosya += istek.content
+            return httpx.Response(204, headers={"Upload-Offset": str(len(dosya))})
+        return httpx.Response(404)
+
+
+async def test_bunny_tus_yuklemesi_surdurulebilir():
+    veri = os.urandom(5 * 1024 + 10)
+    sunucu = SahteTUS(dusen_konum=3 * 1024)
+    istemci = httpx.AsyncClient(transport=httpx.MockTransport(sunucu), base_url=BunnyStreamArkaUcu.API)
+    arka_uc = BunnyStreamArkaUcu("42", "anahtar", istemci=istemci)
+
+    with pytest.raises(YuklemeHatasi) as hata:
+        await parcali_yukle(arka_uc, AkisOkuyucu(_parcalar(veri)), "ders.mp4", len(veri), parca_boyutu=1024, deneme=1)
+    sonuc = await parcali_yukle(
+        arka_uc, AkisOkuyucu(_parcalar(veri)), "ders.mp4", len(veri),
+        yukleme_id=hata.value.yukleme_id, parca_boyutu=1024,
+    )
+    assert bytes(sunucu.dosyalar["abc"]) == veri
+    assert sonuc.gonderilen_parca == 3  # 3, 4 ve 5. parçalar (son parça 10 bayt)
+    assert sonuc.url == "https://iframe.mediadelivery.net/embed/42/0f8fad5b-d9cb-469f-a165-70867728950e"
+    await istemci.aclose()
@@ -0,0 +1,165 @@
+"""
+Okuma kopyası (read replica) yönlendirmesi için testler.
+
+Birincil ve kopyalar ayrı SQLite dosyalarıdır. Çoğaltma, birincil dosyanın
+kopyalara `sqlite3` yedekleme API'siyle kopyalanmasıyla taklit edilir; kopya
+dosyası yeniden kopyalanana kadar "geride kalmış" olur.
+"""
+
+import sqlite3
+import time
+
+import pytest
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.exc import InvalidRequestError, OperationalError
+
+from backend.core.database import (
+    YAZMA_CEREZI,
+    OkumaYonlendirici,
+    get_yonlendirici,
+    motor_olustur,
+)
+from backend.main import app
+from backend.models import Base, YazarDB
+
+pytestmark = pytest.mark.asyncio
+
+
+def _cogalt(kaynak, hedefler):
+    with sqlite3.connect(kaynak) as k:
+        for hedef in hedefler:
+            with sqlite3.connect(hedef) as h:
+                k.backup(h)
+
+
+@pytest_asyncio.fixture
+async def kume(tmp_path):
+    """Bir birincil + iki kopya; kopyalar birincilin o anki hâlini taşır."""
+    birincil_yolu = tmp_path / "birincil.db"
+    kopya_yollari = [tmp_path / "kopya1.db", tmp_path / "kopya2.db"]
+    birincil = motor_olustur(f"sqlite+aiosqlite:///{birincil_yolu}")
+    async with birincil.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(YazarDB.__table__.insert().values(id=1, ad="Yazar"))
+    await birincil.dispose()  # WAL içeriği ana dosyaya yazılsın
+    _cogalt(birincil_yolu, kopya_yollari)
+
+    gecikmeler = {}
+
+    async def gecikme_olcer(motor):
+        deger = gecikmeler.get(motor.url.database, 0.0)
+        if isinstance(deger, Exception):
+            raise deger
+        return deger
+
+    yonlendirici = OkumaYonlendirici(
+        birincil,
+        [motor_olustur(f"sqlite+aiosqlite:///{yol}") for yol in kopya_yollari],
+        gecikme_olcer=gecikme_olcer,
+    )
+    await yonlendirici.saglik_kontrolu()
+    yield {"yonlendirici": yonlendirici, "gecikmeler": gecikmeler, "kopya_yollari": kopya_yollari}
+    await yonlendirici.durdur()
+    await birincil.dispose()
+
+
+@pytest_asyncio.fixture
+async def kume_istemcisi(kume):
+    app.dependency_overrides[get_yonlendirici] = lambda: kume["yonlendirici"]
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+    app.dependency_overrides.clear()
+
+
+async def test_okumalar_saglikli_kopyalara_sirayla_dagitilir(kume):
+    yonlendirici = kume["yonlendirici"]
+    secilenler = [yonlendirici.okuma_motoru() for _ in range(4)]
+    kopyalar = [k.motor for k in yonlendirici.kopyalar]
+    assert set(secilenler) == set(kopyalar)
+    assert [k["okuma_sayisi"] for k in yonlendirici.durum()["kopyalar"]] == [2, 2]
+
+
+async def test_gecikmeli_ve_sagliksiz_kopyalar_atlanir(kume):
+    yonlendirici, gecikmeler = kume["yonlendirici"], kume["gecikmeler"]
+    ilk, ikinci = (str(yol) for yol in kume["kopya_yollari"])
+
+    gecikmeler[ilk] = yonlendirici.en_fazla_gecikme + 1
+    await yonlendirici.saglik_kontrolu()
+    assert {yonlendirici.okuma_motoru() for _ in range(3)} == {yonlendirici.kopyalar[1].motor}
+
+    gecikmeler[ikinci] = ConnectionError("kopya kapalı")
+    await yonlendirici.saglik_kontrolu()
+    assert yonlendirici.okuma_motoru() is yonlendirici.birincil
+    assert yonlendirici.durum()["birincile_dusen"] == 1
+    assert "kopya kapalı" in yonlendirici.durum()["kopyalar"][1]["hata"]
+
+    # Kopya düzelince bir sonraki kontrolde geri döner
+    gecikmeler.clear()
+    await yonlendirici.saglik_kontrolu()
+    assert yonlendirici.okuma_motoru() is not yonlendirici.birincil
+
+
+async def test_yazmadan_sonra_yalniz_yaziyi_uygulamis_kopya_secilir(kume):
+    yonlendirici, gecikmeler = kume["yonlendirici"], kume["gecikmeler"]
+    for yol in kume["kopya_yollari"]:
+        gecikmeler[str(yol)] = 2.0
+    await yonlendirici.saglik_kontrolu()
+
+    assert yonlendirici.okuma_motoru(son_yazma=time.time()) is yonlendirici.birincil
+    # 2 sn geride olan kopya, 2 + güvenlik payı sn önceki yazıyı görmüştür
+    eski_yazma = time.time() - 2.0 - yonlendirici.guvenlik_payi - 0.5
+    assert yonlendirici.okuma_motoru(son_yazma=eski_yazma) is not yonlendirici.birincil
+
+
+async def test_yazan_istemci_kendi_yazisini_gorur(kume, kume_istemcisi):
+    yanit = await kume_istemcisi.post("/api/v1/kitaplar", json={"baslik": "Yeni Kitap", "yazar_id": 1})
+    assert yanit.status_code == 201
+    assert YAZMA_CEREZI in yanit.cookies
+
+    # Çerezi taşıyan istemci birincilden okur: kopyalar henüz çoğaltılmadı
+    basliklar = [k["baslik"] for k in (await kume_istemcisi.get("/api/v1/kitaplar")).json()]
+    assert basliklar == ["Yeni Kitap"]
+
+    # Çerezi olmayan (ya da eski çerezli) istemci geride kalmış kopyadan okur
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as baska:
+        assert (await baska.get("/api/v1/kitaplar")).json() == []
+        baska.cookies.set(YAZMA_CEREZI, str(time.time() - 60))
+        assert (await baska.get("/api/v1/kitaplar")).json() == []
+
+
+async def test_okuma_yapan_istek_cerez_almaz(kume_istemcisi):
+    yanit = await kume_istemcisi.get("/api/v1/yazarlar")
+    assert yanit.status_code == 200
+    assert YAZMA_CEREZI not in yanit.cookies
+
+
+async def test_sorguda_hata_veren_kopya_devre_disi_kalir(kume, kume_istemcisi):
+    yonlendirici = kume["yonlendirici"]
+    # Kopya dosyalarını yok et: bağlantı yeni, boş bir dosya açar ve tablo bulunamaz
+    for kopya, yol in zip(yonlendirici.kopyalar, kume["kopya_yollari"]):
+        await kopya.motor.dispose()
+        yol.unlink()
+
+    for _ in yonlendirici.kopyalar:
+        with pytest.raises(OperationalError):
+            await kume_istemcisi.get("/api/v1/kitaplar")
+    assert not any(k.saglikli for k in yonlendirici.kopyalar)
+    # Sonraki istekler birincile düşer
+    assert (await kume_istemcisi.get("/api/v1/kitaplar")).status_code == 200
+
+
+async def test_okuma_oturumunda_yazma_reddedilir(kume):
+    yonlendirici = kume["yonlendirici"]
+    kopya = yonlendirici.kopyalar[0].motor
+    async with yonlendirici.oturum_fabrikasi(kopya)() as session:
+        session.add(YazarDB(ad="Kopyaya yazılmamalı"))
+        with pytest.raises(InvalidRequestError):
+            await session.commit()
+
+
+async def test_kopya_yoksa_her_sey_birincile_gider():
+    birincil = object()
+    yonlendirici = OkumaYonlendirici(birincil)
+    assert yonlendirici.okuma_motoru() is birincil
+    assert yonlendirici.okuma_motoru(son_yazma=time.time()) is birincil